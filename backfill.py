@@ -0,0 +1,59 @@
+#!/usr/bin/python
+"""
+Backfill every Platypus Review issue from the archive.
+
+Safe to interrupt and restart: progress is kept in the crawl_frontier
+table and finished issues are not fetched again.
+
+    BACKFILL_CONCURRENCY=4 python backfill.py
+"""
+
+import asyncio
+import sys
+import os
+from dotenv import load_dotenv
+
+# Import logging configuration FIRST
+from src.logging_config import setup_logging, get_logger
+
+load_dotenv()
+
+def setup_logging_from_env():
+    """Setup logging from environment variables."""
+    setup_logging(
+        level=os.getenv("LOG_LEVEL", "INFO"),
+        log_file=os.getenv("LOG_FILE", "backfill.log"),
+        log_to_console=os.getenv("LOG_TO_CONSOLE", "true").lower() == "true",
+        log_to_file=os.getenv("LOG_TO_FILE", "true").lower() == "true",
+        json_format=os.getenv("LOG_JSON_FORMAT", "false").lower() == "true",
+    )
+
+# Get logger for this module
+logger = get_logger(__name__)
+
+
+from src.backfill_crawler import BackfillCrawler
+from src.telegraph_manager import telegraph_manager
+from src.run_stats import log_run_stats
+
+async def main():
+    """Entry point for the archive backfill."""
+    crawler = BackfillCrawler()
+    try:
+        counts = await crawler.run()
+    finally:
+        log_run_stats(telegraph_manager)
+        await telegraph_manager.close()
+    if counts.get("failed"):
+        logger.warning(f"{counts['failed']} issue(s) failed after {crawler.max_attempts} attempts, see crawl_frontier.last_error")
+
+if __name__ == "__main__":
+    setup_logging_from_env()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        logger.info("Backfill interrupted, re-run to resume")
+    except Exception as e:
+        logger.critical(f"Fatal error in backfill: {e}", exc_info=True)
+        sys.exit(1)
@@ -26,6 +26,8 @@ logger = get_logger(__name__)
 
 
 from src.bot_handler import BotHandler
+from src.telegraph_manager import telegraph_manager
+from src.run_stats import log_run_stats
 from src.version import __version__
 
 async def main():
@@ -49,6 +51,8 @@ async def main():
         logger.critical(f"Fatal error in main: {e}", exc_info=True)
         sys.exit(1)
     finally:
+        log_run_stats(telegraph_manager)
+        await telegraph_manager.close()
         logger.info("Bot shutdown complete")
 
 if __name__ == "__main__":
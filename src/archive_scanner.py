@@ -1,12 +1,14 @@
 """
 Service class for scanning the Review archive.
 Identifies new reviews by comparing archive URLs with database.
-Does NOT handle scraping details (delegates to ArchiveScraper).
+Does NOT handle scraping details (delegates to ArchiveScraper/FeedScraper).
 """
 
+import asyncio
 from typing import Dict, List, Optional, Set
 from src.dao import review_repository
 from src.scraping.archive_scraper import ArchiveScraper
+from src.scraping.feed_scraper import FeedScraper
 
 from src.logging_config import get_logger
 
@@ -25,6 +27,11 @@ class ArchiveScanner:
     3. Return lists of new vs existing review URLs
     
     2. Check which reviews exist in database
+    
+    When DISCOVERY_FEED_URL is set, new issues are discovered from the
+    site's sitemap/feed instead, walking it from the newest issue down to
+    the newest one already in the database. The archive page is only
+    scraped when the feed cannot be read or does not reach back that far.
     """
     
     
@@ -32,6 +39,8 @@ class ArchiveScanner:
         """Initialize with archive page URL"""
         self.archive_url: str = archive_url or os.getenv("ARCHIVE_URL", "")
         self.archive_scraper: ArchiveScraper =  ArchiveScraper(self.archive_url)
+        self.feed_url: str = os.getenv("DISCOVERY_FEED_URL", "")
+        self.feed_scraper: Optional[FeedScraper] = FeedScraper(self.feed_url) if self.feed_url else None
         logger.info(f"ArchiveScanner initialized for: {self.archive_url}")
         
     async def get_new_reviews(self) -> Set[str]:
@@ -53,9 +62,15 @@ class ArchiveScanner:
                 'total_count': int
             }
         """
-        # Get all URLs from archive
+        if self.feed_scraper:
+            feed_result = await self._scan_feed()
+            if feed_result is not None:
+                return feed_result
+            logger.info("Falling back to archive page scan")
+        
+        # Get all URLs from archive (the scraper blocks, so keep it off the event loop)
         logger.info("Starting archive scan for new reviews")
-        archive_urls: Set[str] = self.archive_scraper.get_listing_urls()
+        archive_urls: Set[str] = await asyncio.to_thread(self.archive_scraper.get_listing_urls)
         logger.info(f"Found {len(archive_urls)} review URLs in archive")
         
         # Check which ones exist in database
@@ -78,6 +93,45 @@ class ArchiveScanner:
             }
     
     
+    async def _scan_feed(self) -> Optional[Dict[str, Set[str]]]:
+        """
+        Discover new reviews from the issue feed.
+        
+        Walks the feed from the newest issue and stops at the first issue
+        that is already in the database; everything before it is new.
+        
+        Returns:
+            Same shape as scan_for_new_reviews, or None when the archive page
+            has to be scanned instead (feed unavailable, empty database, or
+            the feed does not reach back to a known issue)
+        """
+        logger.info(f"Starting feed scan for new reviews: {self.feed_url}")
+        try:
+            feed_issues: Dict[int, str] = await asyncio.to_thread(self.feed_scraper.get_issue_urls)
+        except Exception as e:
+            logger.warning(f"Feed scan failed for {self.feed_url}: {e}")
+            return None
+        
+        database_review_urls: Set[str] = await review_repository.get_all_source_urls()
+        if not database_review_urls:
+            logger.info("No reviews in database yet, full archive scan required")
+            return None
+        
+        new_reviews: Set[str] = set()
+        for issue_number, issue_url in feed_issues.items():  # newest first
+            if issue_url in database_review_urls:
+                logger.info(f"Feed scan complete: {len(new_reviews)} new, newest known issue is {issue_number}")
+                feed_urls: Set[str] = set(feed_issues.values())
+                return {
+                    'new_reviews': new_reviews,
+                    'existing_reviews': feed_urls & database_review_urls,
+                    'total_count': len(feed_urls)
+                }
+            new_reviews.add(issue_url)
+        
+        logger.info("Feed does not reach back to a known issue")
+        return None
+    
     async def get_review_by_criteria(self, review_id: Optional[int] = None, month: Optional[str] = None) -> Optional[str]:
         """
         Find review URL by ID or month.
@@ -0,0 +1,141 @@
+"""
+Resumable backfill of the whole Review archive.
+
+Every issue URL found on the archive page is recorded in the persistent
+crawl frontier (crawl_frontier table) and moves through the states
+pending -> in_progress -> done/failed. Issues are processed by a
+configurable number of concurrent workers. After a crash the crawler is
+simply started again: entries left in progress go back to pending,
+finished issues are never fetched again and failed issues are retried
+until they run out of attempts. An issue only counts as finished when
+every one of its articles was fetched and published.
+"""
+
+import asyncio
+import os
+from typing import Dict, Optional
+
+from dotenv import load_dotenv
+
+from src.dao import crawl_frontier_repository
+from src.review_orchestrator import ReviewOrchestrator
+from src.scraping.archive_scraper import ArchiveScraper
+from src.scraping.review_scraper import ReviewScraper
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+load_dotenv()
+
+
+class BackfillCrawler:
+    """
+    Crawls every Review issue in the archive, checkpointing progress in the database.
+
+    Usage:
+        crawler = BackfillCrawler()
+        counts = await crawler.run()  # {'done': 170, 'failed': 2}
+    """
+
+    def __init__(
+        self,
+        archive_url: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+    ):
+        """
+        Args:
+            archive_url: Archive page URL (defaults to ARCHIVE_URL env var)
+            concurrency: Number of issues processed at the same time (BACKFILL_CONCURRENCY, default 2)
+            max_attempts: Attempts per issue before it stays failed (BACKFILL_MAX_ATTEMPTS, default 3)
+        """
+        self.archive_url: str = archive_url or os.getenv("ARCHIVE_URL", "")
+        self.concurrency: int = concurrency or int(os.getenv("BACKFILL_CONCURRENCY", 2))
+        self.max_attempts: int = max_attempts or int(os.getenv("BACKFILL_MAX_ATTEMPTS", 3))
+        self.archive_scraper: ArchiveScraper = ArchiveScraper(self.archive_url)
+        self.frontier = crawl_frontier_repository
+        self._claim_lock = asyncio.Lock()
+        logger.info(
+            f"BackfillCrawler initialized for: {self.archive_url} "
+            f"(concurrency={self.concurrency}, max_attempts={self.max_attempts})"
+        )
+
+    async def seed(self) -> int:
+        """
+        Add every issue URL from the archive page to the frontier.
+
+        Returns:
+            Number of URLs not tracked before
+        """
+        # The archive scraper blocks (it may wait out a Retry-After), so run it off the event loop
+        issue_urls = await asyncio.to_thread(self.archive_scraper.get_listing_urls)
+        logger.info(f"Found {len(issue_urls)} issue URLs in archive")
+        return await self.frontier.add_urls(issue_urls)
+
+    async def run(self) -> Dict[str, int]:
+        """
+        Run (or resume) the backfill until no claimable issue is left.
+
+        Returns:
+            Number of frontier entries per state after the run
+        """
+        logger.info("Starting archive backfill")
+        await self.frontier.reset_in_progress()
+
+        try:
+            await self.seed()
+        except Exception as e:
+            # A resumed run can continue on the frontier it already has
+            counts = await self.frontier.get_state_counts()
+            if not counts:
+                raise
+            logger.warning(f"Could not refresh the frontier from the archive page, resuming: {e}")
+
+        await asyncio.gather(*(self._worker(worker_id) for worker_id in range(self.concurrency)))
+
+        counts = await self.frontier.get_state_counts()
+        logger.info(f"Archive backfill finished: {counts}")
+        return counts
+
+    async def _worker(self, worker_id: int) -> None:
+        """Claim and crawl issues one at a time until the frontier is exhausted"""
+        while True:
+            async with self._claim_lock:
+                claimed = await self.frontier.claim_pending(1, self.max_attempts)
+            if not claimed:
+                logger.debug(f"Backfill worker {worker_id} finished")
+                return
+            await self.crawl_review(claimed[0])
+
+    async def crawl_review(self, review_url: str) -> bool:
+        """
+        Process one issue and record the outcome in the frontier.
+
+        Args:
+            review_url: Issue URL claimed from the frontier
+
+        Returns:
+            True if every article of the issue was processed
+        """
+        logger.info(f"Backfilling review: {review_url}")
+        try:
+            orchestrator = ReviewOrchestrator(ReviewScraper(review_url))
+            result = await orchestrator.process_review_batch()
+        except Exception as e:
+            logger.error(f"Backfill of {review_url} failed: {e}", exc_info=True)
+            await self.frontier.mark_failed(review_url, str(e))
+            return False
+
+        if result is None:
+            await self.frontier.mark_failed(review_url, "Review batch produced no result")
+            return False
+        incomplete = orchestrator.incomplete_urls
+        if incomplete:
+            # A done issue is never claimed again: keep it failed so a later attempt picks up the missing articles
+            logger.warning(f"Backfill of {review_url} incomplete: {len(incomplete)} article(s) missing")
+            await self.frontier.mark_failed(
+                review_url, f"{len(incomplete)} article(s) not fetched or published: {', '.join(incomplete)}"
+            )
+            return False
+        await self.frontier.mark_done(review_url)
+        return True
@@ -11,6 +11,8 @@ from src.dao.core.database_manager import db_manager, DatabaseManager
 from src.dao.repositories.user_repository import user_repository, UserRepository
 from src.dao.repositories.article_repository import article_repository, ArticleRepository
 from src.dao.repositories.review_repository import review_repository, ReviewRepository
+from src.dao.repositories.crawl_frontier_repository import crawl_frontier_repository, CrawlFrontierRepository
+from src.dao.repositories.publish_ledger_repository import publish_ledger_repository, PublishLedgerRepository
 
 __all__ = [
     # Database Manager
@@ -21,11 +23,15 @@ __all__ = [
     "user_repository",
     "article_repository",
     "review_repository",
+    "crawl_frontier_repository",
+    "publish_ledger_repository",
     
     # Repository classes (for custom instantiation if needed)
     "UserRepository",
     "ArticleRepository",
     "ReviewRepository",
+    "CrawlFrontierRepository",
+    "PublishLedgerRepository",
 ]
 
 
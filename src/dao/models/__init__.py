@@ -1,3 +1,5 @@
 from .user import User
 from .article import Article
-from .review import Review
\ No newline at end of file
+from .review import Review
+from .crawl_frontier import CrawlFrontierEntry
+from .publish_ledger import PublishLedgerEntry
@@ -15,6 +15,8 @@ class Article(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str = Field(max_length=255)
     content: str 
+    # Cleaned content compiled to Telegraph Node JSON at parse time (None for rows stored before)
+    content_nodes: Optional[List] = Field(default=None, sa_type=JSON)
     original_url: str = Field(max_length=500, unique=True, index=True)
 
         # Foreign key to reviews.id
@@ -23,5 +25,10 @@ class Article(SQLModel, table=True):
     publication_date: date
     authors: Optional[List[str]] = Field(default_factory=list, sa_type=JSON)
     
+    # Fingerprints of the fetched HTML and of the cleaned content (BLAKE2b hex),
+    # used to skip unchanged articles on later runs
+    html_hash: Optional[str] = Field(default=None, max_length=64)
+    content_hash: Optional[str] = Field(default=None, max_length=64)
+    
     # Relationship: many articles -> one review
     review: Optional["Review"] = Relationship(back_populates="articles")
\ No newline at end of file
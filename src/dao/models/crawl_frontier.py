@@ -0,0 +1,25 @@
+#default libraries
+from typing import Optional
+
+#third party libraries
+from datetime import datetime, timezone
+from sqlmodel import SQLModel, Field
+
+
+# Frontier entry states
+CRAWL_PENDING = "pending"
+CRAWL_IN_PROGRESS = "in_progress"
+CRAWL_DONE = "done"
+CRAWL_FAILED = "failed"
+
+
+class CrawlFrontierEntry(SQLModel, table=True):
+    """A review issue URL queued for the archive backfill, with its crawl state"""
+    __tablename__ = "crawl_frontier"
+    
+    id: Optional[int] = Field(default=None, primary_key=True)
+    url: str = Field(max_length=500, unique=True, index=True)
+    state: str = Field(default=CRAWL_PENDING, max_length=20, index=True)
+    attempts: int = Field(default=0)
+    last_error: Optional[str] = Field(default=None, max_length=1000)
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(tz=timezone.utc))
@@ -0,0 +1,33 @@
+#default libraries
+from typing import Optional
+
+#third party libraries
+from datetime import datetime, timezone
+from sqlalchemy import UniqueConstraint
+from sqlmodel import SQLModel, Field
+
+
+# Ledger entry states, in the order a part goes through them
+PART_PLANNED = "planned"        # the part is known, no page was requested yet
+PART_CREATING = "creating"      # createPage was sent, its answer is not recorded yet
+PART_CREATED = "created"        # the page exists but does not hold the part's final content
+PART_PUBLISHED = "published"    # the page holds the part's final content and navigation
+
+
+class PublishLedgerEntry(SQLModel, table=True):
+    """A part of an article's Telegraph publication, recorded before and after every API call"""
+    __tablename__ = "publish_ledger"
+    __table_args__ = (UniqueConstraint('article_id', 'part_index'),)
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    article_id: int = Field(foreign_key="articles.id", index=True)
+    part_index: int
+    title: str = Field(max_length=255)
+    # Fingerprint of the part as published: title, position, number of parts and content
+    content_hash: str = Field(max_length=64)
+    state: str = Field(default=PART_PLANNED, max_length=20)
+    # Telegraph account (TelegraphAccount.account_id) that created, or is creating, the page
+    account_id: Optional[str] = Field(default=None, max_length=16)
+    path: Optional[str] = Field(default=None, max_length=255)
+    url: Optional[str] = Field(default=None, max_length=500)
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(tz=timezone.utc))
@@ -1,8 +1,9 @@
-from typing import Optional, List, override
+from typing import Optional, List, Dict, override
 from sqlmodel import select
 from datetime import datetime, timedelta
 
 from src.dao.models.article import Article
+from src.dao.models.review import Review
 from src.dao.repositories.base_repository import BaseRepository
 from src.logging_config import get_logger
 
@@ -84,6 +85,37 @@ class ArticleRepository(BaseRepository[Article]):
             logger.error(f"Failed to fetch articles for review_id {review_id}: {e}", exc_info=True)
             raise
     
+    async def get_published_fingerprints(self, review_source_url: str) -> Dict[str, str]:
+        """
+        Get HTML fingerprints of already published articles of a review.
+        
+        Args:
+            review_source_url: Source URL of the review issue
+            
+        Returns:
+            Mapping original_url -> html_hash for articles that have a
+            fingerprint and Telegraph URLs
+        """
+        logger.debug(f"Fetching article fingerprints for review: {review_source_url}")
+        try:
+            async with self.db.get_async_session() as session:
+                result = await session.execute(
+                    select(Article.original_url, Article.html_hash, Article.telegraph_urls)
+                    .join(Review, Article.review_id == Review.id)
+                    .where(Review.source_url == review_source_url)
+                    .where(Article.html_hash != None)
+                )
+                fingerprints = {
+                    url: html_hash
+                    for url, html_hash, telegraph_urls in result.all()
+                    if telegraph_urls
+                }
+                logger.debug(f"Found {len(fingerprints)} published article fingerprints for review: {review_source_url}")
+                return fingerprints
+        except Exception as e:
+            logger.error(f"Failed to fetch article fingerprints for review {review_source_url}: {e}", exc_info=True)
+            raise
+    
     async def get_recent(self, limit: int = 10) -> List[Article]:
         """
         Get most recent articles.
@@ -0,0 +1,193 @@
+from typing import Optional, List, Dict, Iterable, override
+from sqlmodel import select
+from sqlalchemy import func, update, or_, and_
+from datetime import datetime, timezone
+
+from src.dao.models.crawl_frontier import (
+    CrawlFrontierEntry,
+    CRAWL_PENDING,
+    CRAWL_IN_PROGRESS,
+    CRAWL_DONE,
+    CRAWL_FAILED,
+)
+from src.dao.repositories.base_repository import BaseRepository
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class CrawlFrontierRepository(BaseRepository[CrawlFrontierEntry]):
+    """Repository for the persistent crawl frontier of the archive backfill"""
+
+    def __init__(self):
+        super().__init__(CrawlFrontierEntry)
+        logger.info("CrawlFrontierRepository initialized")
+
+    @override
+    def _get_identifier_for_logging(self, obj: CrawlFrontierEntry, existing: CrawlFrontierEntry = None) -> str:
+        """Get meaningful identifier for logging."""
+        target = existing if existing else obj
+        return f"URL={target.url}"
+
+    @override
+    async def get(self, obj: CrawlFrontierEntry) -> Optional[CrawlFrontierEntry]:
+        """
+        Get frontier entry by natural key (url).
+        """
+        if not obj.url:
+            logger.warning("Cannot check natural key for CrawlFrontierEntry without url")
+            return None
+
+        return await self.get_by_url(obj.url)
+
+    async def get_by_url(self, url: str) -> Optional[CrawlFrontierEntry]:
+        """
+        Get frontier entry by URL.
+
+        Args:
+            url: Crawled URL
+
+        Returns:
+            CrawlFrontierEntry instance or None
+        """
+        logger.debug(f"Fetching frontier entry by URL: {url}")
+        try:
+            async with self.db.get_async_session() as session:
+                result = await session.execute(
+                    select(CrawlFrontierEntry).where(CrawlFrontierEntry.url == url)
+                )
+                return result.scalar_one_or_none()
+        except Exception as e:
+            logger.error(f"Failed to fetch frontier entry by URL {url}: {e}", exc_info=True)
+            raise
+
+    async def add_urls(self, urls: Iterable[str]) -> int:
+        """
+        Add URLs to the frontier as pending, skipping URLs that are already tracked.
+
+        Args:
+            urls: URLs to enqueue (duplicates are ignored)
+
+        Returns:
+            Number of newly added URLs
+        """
+        urls = set(urls)
+        logger.debug(f"Adding {len(urls)} URLs to the crawl frontier")
+        try:
+            async with self.db.get_async_session() as session:
+                result = await session.execute(
+                    select(CrawlFrontierEntry.url).where(CrawlFrontierEntry.url.in_(urls))
+                )
+                new_urls = urls - {row[0] for row in result.all()}
+                session.add_all(CrawlFrontierEntry(url=url) for url in sorted(new_urls))
+                await session.commit()
+                logger.info(f"Added {len(new_urls)} new URLs to the crawl frontier")
+                return len(new_urls)
+        except Exception as e:
+            logger.error(f"Failed to add URLs to the crawl frontier: {e}", exc_info=True)
+            raise
+
+    async def reset_in_progress(self) -> int:
+        """
+        Return entries left in progress by an interrupted run to the pending state.
+
+        Returns:
+            Number of entries reset
+        """
+        try:
+            async with self.db.get_async_session() as session:
+                result = await session.execute(
+                    update(CrawlFrontierEntry)
+                    .where(CrawlFrontierEntry.state == CRAWL_IN_PROGRESS)
+                    .values(state=CRAWL_PENDING, updated_at=datetime.now(tz=timezone.utc))
+                )
+                await session.commit()
+                if result.rowcount:
+                    logger.info(f"Reset {result.rowcount} interrupted frontier entries to pending")
+                return result.rowcount
+        except Exception as e:
+            logger.error(f"Failed to reset interrupted frontier entries: {e}", exc_info=True)
+            raise
+
+    async def claim_pending(self, limit: int, max_attempts: int) -> List[str]:
+        """
+        Claim the next URLs to crawl and mark them in progress.
+
+        Pending entries are claimed first, then failed entries that have
+        attempts left, oldest first.
+
+        Args:
+            limit: Maximum number of URLs to claim
+            max_attempts: Failed entries with this many attempts are not retried
+
+        Returns:
+            Claimed URLs
+        """
+        try:
+            async with self.db.get_async_session() as session:
+                result = await session.execute(
+                    select(CrawlFrontierEntry)
+                    .where(or_(
+                        CrawlFrontierEntry.state == CRAWL_PENDING,
+                        and_(CrawlFrontierEntry.state == CRAWL_FAILED,
+                             CrawlFrontierEntry.attempts < max_attempts),
+                    ))
+                    .order_by(CrawlFrontierEntry.state.desc(), CrawlFrontierEntry.id)
+                    .limit(limit)
+                )
+                entries = result.scalars().all()
+                now = datetime.now(tz=timezone.utc)
+                for entry in entries:
+                    entry.state = CRAWL_IN_PROGRESS
+                    entry.attempts += 1
+                    entry.updated_at = now
+                await session.commit()
+                logger.debug(f"Claimed {len(entries)} frontier entries")
+                return [entry.url for entry in entries]
+        except Exception as e:
+            logger.error(f"Failed to claim frontier entries: {e}", exc_info=True)
+            raise
+
+    async def mark_done(self, url: str) -> None:
+        """Mark a URL as successfully crawled"""
+        await self._set_state(url, CRAWL_DONE, None)
+
+    async def mark_failed(self, url: str, error: str) -> None:
+        """Mark a URL as failed, keeping the error for inspection"""
+        await self._set_state(url, CRAWL_FAILED, error[:1000])
+
+    async def _set_state(self, url: str, state: str, error: Optional[str]) -> None:
+        try:
+            async with self.db.get_async_session() as session:
+                await session.execute(
+                    update(CrawlFrontierEntry)
+                    .where(CrawlFrontierEntry.url == url)
+                    .values(state=state, last_error=error, updated_at=datetime.now(tz=timezone.utc))
+                )
+                await session.commit()
+                logger.debug(f"Frontier entry {url} -> {state}")
+        except Exception as e:
+            logger.error(f"Failed to set frontier state of {url} to {state}: {e}", exc_info=True)
+            raise
+
+    async def get_state_counts(self) -> Dict[str, int]:
+        """
+        Count frontier entries per state.
+
+        Returns:
+            State -> number of entries
+        """
+        try:
+            async with self.db.get_async_session() as session:
+                result = await session.execute(
+                    select(CrawlFrontierEntry.state, func.count()).group_by(CrawlFrontierEntry.state)
+                )
+                return {state: count for state, count in result.all()}
+        except Exception as e:
+            logger.error(f"Failed to count frontier entries: {e}", exc_info=True)
+            raise
+
+
+# Singleton instance
+crawl_frontier_repository: CrawlFrontierRepository = CrawlFrontierRepository()
+logger.info("CrawlFrontierRepository singleton instance created")
@@ -0,0 +1,232 @@
+from typing import Optional, List, Set, Tuple, override
+from sqlmodel import select
+from sqlalchemy import String, cast, or_, update
+from datetime import datetime, timezone
+
+from src.dao.models.article import Article
+from src.dao.models.publish_ledger import (
+    PublishLedgerEntry,
+    PART_PLANNED,
+    PART_CREATING,
+    PART_CREATED,
+    PART_PUBLISHED,
+)
+from src.dao.repositories.base_repository import BaseRepository
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class PublishLedgerRepository(BaseRepository[PublishLedgerEntry]):
+    """Repository for the ledger of Telegraph pages planned and created per article"""
+
+    def __init__(self):
+        super().__init__(PublishLedgerEntry)
+        logger.info("PublishLedgerRepository initialized")
+
+    @override
+    def _get_identifier_for_logging(self, obj: PublishLedgerEntry, existing: PublishLedgerEntry = None) -> str:
+        """Get meaningful identifier for logging."""
+        target = existing if existing else obj
+        return f"article_id={target.article_id}, part={target.part_index}"
+
+    @override
+    async def get(self, obj: PublishLedgerEntry) -> Optional[PublishLedgerEntry]:
+        """
+        Get ledger entry by natural key (article_id, part_index).
+        """
+        if obj.article_id is None or obj.part_index is None:
+            logger.warning("Cannot check natural key for PublishLedgerEntry without article_id and part_index")
+            return None
+
+        try:
+            async with self.db.get_async_session() as session:
+                result = await session.execute(
+                    select(PublishLedgerEntry).where(
+                        PublishLedgerEntry.article_id == obj.article_id,
+                        PublishLedgerEntry.part_index == obj.part_index,
+                    )
+                )
+                return result.scalar_one_or_none()
+        except Exception as e:
+            logger.error(f"Failed to fetch ledger entry {self._get_identifier_for_logging(obj)}: {e}", exc_info=True)
+            raise
+
+    async def get_parts(self, article_id: int) -> List[PublishLedgerEntry]:
+        """
+        Get the ledger entries of an article.
+
+        Args:
+            article_id: Article ID
+
+        Returns:
+            Entries ordered by part index
+        """
+        try:
+            async with self.db.get_async_session() as session:
+                result = await session.execute(
+                    select(PublishLedgerEntry)
+                    .where(PublishLedgerEntry.article_id == article_id)
+                    .order_by(PublishLedgerEntry.part_index)
+                )
+                return list(result.scalars().all())
+        except Exception as e:
+            logger.error(f"Failed to fetch ledger entries of article_id {article_id}: {e}", exc_info=True)
+            raise
+
+    async def get_account_for_url(self, url: str) -> Optional[str]:
+        """
+        Get the account that created a page recorded in the ledger.
+
+        Args:
+            url: Telegraph page URL
+
+        Returns:
+            Account ID, or None if the page is not in the ledger
+        """
+        try:
+            async with self.db.get_async_session() as session:
+                result = await session.execute(
+                    select(PublishLedgerEntry.account_id).where(
+                        PublishLedgerEntry.url == url,
+                        PublishLedgerEntry.account_id.is_not(None),
+                    ).limit(1)
+                )
+                return result.scalar_one_or_none()
+        except Exception as e:
+            logger.error(f"Failed to look up the account of {url}: {e}", exc_info=True)
+            raise
+
+    async def get_claimed_urls(self, urls: List[str]) -> Set[str]:
+        """
+        Page URLs among the given ones that already belong to an article part:
+        recorded in the ledger or saved in articles.telegraph_urls.
+
+        Args:
+            urls: Telegraph page URLs
+
+        Returns:
+            The URLs that are taken
+        """
+        urls = set(urls)
+        if not urls:
+            return set()
+        try:
+            async with self.db.get_async_session() as session:
+                result = await session.execute(
+                    select(PublishLedgerEntry.url).where(PublishLedgerEntry.url.in_(urls))
+                )
+                claimed = set(result.scalars().all())
+                unclaimed = urls - claimed
+                if unclaimed:
+                    # JSON lists are matched as text first, then checked exactly
+                    result = await session.execute(
+                        select(Article.telegraph_urls).where(
+                            or_(*(cast(Article.telegraph_urls, String).contains(url) for url in unclaimed))
+                        )
+                    )
+                    for telegraph_urls in result.scalars().all():
+                        claimed.update(unclaimed.intersection(telegraph_urls or []))
+                return claimed
+        except Exception as e:
+            logger.error(f"Failed to look up claimed Telegraph URLs: {e}", exc_info=True)
+            raise
+
+    async def plan(self, article_id: int, parts: List[Tuple[str, str]]) -> List[PublishLedgerEntry]:
+        """
+        Record the parts an article is about to be published in.
+
+        Entries of an earlier run are kept with their pages: a part whose
+        fingerprint is unchanged keeps its state, a changed part that was
+        already published goes back to created (its page must be rewritten).
+        Entries beyond the new number of parts are dropped.
+
+        Args:
+            article_id: Article ID
+            parts: (title, content fingerprint) of every part, in order
+
+        Returns:
+            Entries of all parts ordered by part index
+        """
+        try:
+            async with self.db.get_async_session() as session:
+                result = await session.execute(
+                    select(PublishLedgerEntry).where(PublishLedgerEntry.article_id == article_id)
+                )
+                existing = {entry.part_index: entry for entry in result.scalars().all()}
+                now = datetime.now(tz=timezone.utc)
+
+                entries = []
+                for index, (title, content_hash) in enumerate(parts):
+                    entry = existing.pop(index, None)
+                    if entry is None:
+                        entry = PublishLedgerEntry(
+                            article_id=article_id, part_index=index, title=title, content_hash=content_hash
+                        )
+                        session.add(entry)
+                    elif entry.content_hash != content_hash or entry.title != title:
+                        entry.title = title
+                        entry.content_hash = content_hash
+                        if entry.state == PART_PUBLISHED:
+                            entry.state = PART_CREATED
+                        entry.updated_at = now
+                    entries.append(entry)
+
+                for entry in existing.values():
+                    logger.info(f"Dropping ledger entry of part {entry.part_index + 1} of article_id {article_id} ({entry.url})")
+                    await session.delete(entry)
+
+                await session.commit()
+                resumed = sum(1 for entry in entries if entry.state != PART_PLANNED)
+                logger.debug(f"Planned {len(entries)} part(s) of article_id {article_id}, {resumed} resumed")
+                return entries
+        except Exception as e:
+            logger.error(f"Failed to plan ledger entries of article_id {article_id}: {e}", exc_info=True)
+            raise
+
+    async def mark_creating(self, entry: PublishLedgerEntry, account_id: str) -> None:
+        """Record that createPage is about to be sent for a part with an account"""
+        await self._set_state(entry, PART_CREATING, account_id=account_id)
+
+    async def mark_created(self, entry: PublishLedgerEntry, path: str, url: str) -> None:
+        """Record the page created for a part (content not final yet)"""
+        await self._set_state(entry, PART_CREATED, path=path, url=url)
+
+    async def mark_published(
+        self,
+        entry: PublishLedgerEntry,
+        path: Optional[str] = None,
+        url: Optional[str] = None,
+        account_id: Optional[str] = None,
+    ) -> None:
+        """Record that a part's page holds its final content (and, for a page adopted from elsewhere, its account)"""
+        values = {'path': path, 'url': url} if path else {}
+        if account_id:
+            values['account_id'] = account_id
+        await self._set_state(entry, PART_PUBLISHED, **values)
+
+    async def reset(self, entry: PublishLedgerEntry) -> None:
+        """Forget the page of a part (it cannot be edited any more), so that a new one is created"""
+        await self._set_state(entry, PART_PLANNED, account_id=None, path=None, url=None)
+
+    async def _set_state(self, entry: PublishLedgerEntry, state: str, **values) -> None:
+        values = {'state': state, 'updated_at': datetime.now(tz=timezone.utc), **values}
+        try:
+            async with self.db.get_async_session() as session:
+                await session.execute(
+                    update(PublishLedgerEntry)
+                    .where(PublishLedgerEntry.id == entry.id)
+                    .values(**values)
+                )
+                await session.commit()
+            for key, value in values.items():
+                setattr(entry, key, value)
+            logger.debug(f"Ledger entry {self._get_identifier_for_logging(entry)} -> {state}")
+        except Exception as e:
+            logger.error(f"Failed to set ledger state of {self._get_identifier_for_logging(entry)} to {state}: {e}", exc_info=True)
+            raise
+
+
+# Singleton instance
+publish_ledger_repository: PublishLedgerRepository = PublishLedgerRepository()
+logger.info("PublishLedgerRepository singleton instance created")
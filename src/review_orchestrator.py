@@ -1,5 +1,9 @@
 #standard libraries
-from typing import List, Dict, Any
+import asyncio
+import os
+import time
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional
 
 #third party libraries
 
@@ -8,22 +12,58 @@ from src.scraping.review_scraper import ReviewScraper
 from src.telegraph_manager import TelegraphManager
 from src.dao.models import Review, Article
 from src.logging_config import get_logger
-from src.dao import article_repository, review_repository
+from src.dao import article_repository, review_repository, publish_ledger_repository
 from src.article_factory import article_factory
+from src.scraping.fingerprint import fingerprint
 
 logger = get_logger(__name__)
 
+# Articles of a review published at the same time
+DEFAULT_PUBLISH_CONCURRENCY = 4
+
+# Seconds an article may take to publish before it is given up (it resumes
+# from the publish ledger the next time it is processed)
+DEFAULT_ARTICLE_TIMEOUT = 300.0
+
+
+@dataclass
+class ArticlePublishResult:
+    """Outcome of publishing one article of a review"""
+    article: Article
+    updated_article: Optional[Article] = None
+    error: Optional[str] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
 
 class ReviewOrchestrator:
-    def __init__(self, review_scraper: ReviewScraper, telegraph_manager: TelegraphManager = None):
+    def __init__(
+        self,
+        review_scraper: ReviewScraper,
+        telegraph_manager: TelegraphManager = None,
+        publish_concurrency: Optional[int] = None,
+        article_timeout: Optional[float] = None,
+    ):
         """
         Initialize the ReviewOrchestrator.
         
         Args:
             review_scraper: ReviewScraper instance for scraping review data
             telegraph_manager: TelegraphManager instance. If None, uses singleton instance.
+            publish_concurrency: Articles published at the same time
+                (PUBLISH_CONCURRENCY, default 4)
+            article_timeout: Seconds allowed per article (PUBLISH_ARTICLE_TIMEOUT, default 300)
         """
         self.scraper: ReviewScraper = review_scraper
+        self.publish_concurrency: int = publish_concurrency or int(os.getenv("PUBLISH_CONCURRENCY", DEFAULT_PUBLISH_CONCURRENCY))
+        self.article_timeout: float = article_timeout or float(os.getenv("PUBLISH_ARTICLE_TIMEOUT", DEFAULT_ARTICLE_TIMEOUT))
+        # Results of the last process_articles call
+        self.publish_results: List[ArticlePublishResult] = []
+        # Articles of the last batch not fetched, saved or published (retried by a later run)
+        self.incomplete_urls: List[str] = []
         # Use provided instance or fall back to singleton
         if telegraph_manager is None:
             from src.telegraph_manager import telegraph_manager as singleton_instance
@@ -44,9 +84,10 @@ class ReviewOrchestrator:
         5. Save the review to the data base
         """
         try:
-            # 1. Scrape all articles from review site
+            # 1. Scrape all articles from review site, skipping those unchanged since the last run
+            await self.load_known_fingerprints()
             logger.info("Step 1: Scraping articles from review site")
-            raw_review_data: Dict[str, Any] = self.scraper.scrape_review_batch()
+            raw_review_data: Dict[str, Any] = await self.scraper.scrape_review_batch_async()
             
             if not raw_review_data:
                 logger.warning("No articles found to process")
@@ -81,11 +122,62 @@ class ReviewOrchestrator:
 
 
 
+    async def load_known_fingerprints(self) -> None:
+        """
+        Hand the fingerprints of already published articles of this review to the scraper,
+        so articles whose HTML has not changed are neither parsed, saved nor published again.
+        """
+        try:
+            fingerprints = await article_repository.get_published_fingerprints(self.scraper.base_url)
+            self.scraper.set_known_fingerprints(fingerprints)
+            logger.info(f"Loaded {len(fingerprints)} known article fingerprints")
+        except Exception as e:
+            logger.warning(f"Could not load article fingerprints, scraping everything: {e}")
+
+    async def refresh_existing_article(self, existing: Article, scraped: Article) -> tuple[Article, bool]:
+        """
+        Bring a stored article in line with a fresh scrape.
+        The row is only written when a fingerprint changed or its Telegraph nodes are missing.
+        
+        Args:
+            existing: Article as stored in the database
+            scraped: Article built from the fresh scrape
+            
+        Returns:
+            Tuple of (stored article, needs_publishing)
+        """
+        stored_content_hash = existing.content_hash or fingerprint(existing.content)
+        content_changed = stored_content_hash != scraped.content_hash
+        if content_changed:
+            logger.info(f"Content of article '{existing.title}' changed since last run")
+            existing.title = scraped.title
+            existing.content = scraped.content
+            existing.content_nodes = scraped.content_nodes
+            existing.authors = scraped.authors
+            existing.publication_date = scraped.publication_date
+        
+        # Rows stored before nodes were compiled at parse time get them on the next scrape
+        nodes_missing = existing.content_nodes is None and scraped.content_nodes is not None
+        if nodes_missing:
+            existing.content_nodes = scraped.content_nodes
+        
+        if (content_changed or nodes_missing or existing.html_hash != scraped.html_hash
+                or existing.content_hash is None):
+            existing.html_hash = scraped.html_hash
+            existing.content_hash = scraped.content_hash
+            existing = await article_repository.update(existing)
+        
+        return existing, content_changed or not existing.telegraph_urls
+
     async def process_articles(self, raw_review_data: Dict[str, Any]) -> List[Article]:
         """
-        Process multiple articles by calling process_single_article for each one.
+        Save the scraped articles and publish the new or changed ones concurrently.
+        Per-article outcomes are kept in publish_results, the URLs of articles
+        that did not make it (fetch, validation, save or publish failed) in incomplete_urls.
         """
         
+        self.incomplete_urls = list(raw_review_data.get('failed_urls', []))
+        
         # Create article schemas from raw data
         logger.info("Step 2: Creating validated article schemas")
         articles: List[Article] = article_factory.from_scraper_data(raw_review_data)
@@ -93,32 +185,97 @@ class ReviewOrchestrator:
         # Save articles to database first
         logger.info("Step 3: Saving articles to database")
         saved_articles: List[Article] = []
+        articles_to_publish: List[Article] = []
         for article in articles:
             try:
                 saved_article, was_created = await article_repository.save_if_not_exists(article)
+                needs_publishing = was_created
+                if not was_created:
+                    saved_article, needs_publishing = await self.refresh_existing_article(saved_article, article)
                 saved_articles.append(saved_article)
+                if needs_publishing:
+                    articles_to_publish.append(saved_article)
                 status = "created" if was_created else "already exists"
                 logger.debug(f"Saved article ID: {saved_article.id} ({status})")
             except Exception as e:
                 logger.error(f"Error saving article '{article.title}': {e}", exc_info=True)
                 continue
         
-        # Process each article (create Telegraph pages, update with URLs)
-        logger.info("Step 4: Processing articles (creating Telegraph pages)")
-        for article in saved_articles:
-            try:
-                await self.process_single_article(article)
-            except Exception as e:
-                logger.error(f"Error processing article '{article.title}': {e}", exc_info=True)
-                continue
+        # Process each new or changed article (create Telegraph pages, update with URLs)
+        logger.info(f"Step 4: Processing articles (creating Telegraph pages for "
+                    f"{len(articles_to_publish)}/{len(saved_articles)} articles)")
+        self.publish_results = await self.publish_articles(articles_to_publish)
+        
+        saved_urls = {article.original_url for article in saved_articles}
+        self.incomplete_urls += [
+            article_data.get('original_url') for article_data in raw_review_data.get('articles', [])
+            if article_data.get('original_url') not in saved_urls
+        ]
+        self.incomplete_urls += [result.article.original_url for result in self.publish_results if not result.ok]
+        if self.incomplete_urls:
+            logger.warning(f"{len(self.incomplete_urls)} article(s) of the review were not fetched, saved or published")
         
         return saved_articles
 
+    async def publish_articles(self, articles: List[Article]) -> List[ArticlePublishResult]:
+        """
+        Publish articles concurrently, at most publish_concurrency at a time.
+        
+        Every article gets its own timeout and result, so a slow or failing
+        article does not hold up or fail the others.
+        
+        Args:
+            articles: Saved articles to publish
+            
+        Returns:
+            One result per article, in the same order
+        """
+        if not articles:
+            return []
+        
+        semaphore = asyncio.Semaphore(self.publish_concurrency)
+        
+        async def publish_with_limit(article: Article) -> ArticlePublishResult:
+            async with semaphore:
+                return await self._publish_with_timeout(article)
+        
+        start = time.monotonic()
+        results = await asyncio.gather(*(publish_with_limit(article) for article in articles))
+        failed = [result for result in results if not result.ok]
+        logger.info(
+            f"Published {len(results) - len(failed)}/{len(results)} articles in {time.monotonic() - start:.1f}s "
+            f"(concurrency={self.publish_concurrency})"
+        )
+        for result in failed:
+            logger.warning(f"Article '{result.article.title}' not published: {result.error}")
+        return results
+
+    async def _publish_with_timeout(self, article: Article) -> ArticlePublishResult:
+        """Publish one article within article_timeout, turning any failure into its result"""
+        start = time.monotonic()
+        result = ArticlePublishResult(article=article)
+        try:
+            result.updated_article = await asyncio.wait_for(self._publish_article(article), self.article_timeout)
+            if result.updated_article is None:
+                result.error = "no Telegraph pages created"
+        except asyncio.TimeoutError:
+            result.error = f"timed out after {self.article_timeout:.0f}s"
+            logger.error(f"Publishing article '{article.title}' timed out after {self.article_timeout:.0f}s")
+        except Exception as e:
+            result.error = str(e) or type(e).__name__
+            logger.error(f"Error processing article '{article.title}': {e}", exc_info=True)
+        result.elapsed = time.monotonic() - start
+        return result
+
     async def process_single_article(self, article: Article) -> Article:
         """
         Process a single article with validated schema:
         1. Create Telegraph article
         2. Update article in DB with Telegraph URLs
+        
+        Pages are recorded in the publish ledger as they are created, so
+        processing an article again after a failure resumes its publication
+        instead of creating duplicate pages.
         """
         try:
             # 1. Check article_schema
@@ -126,20 +283,24 @@ class ReviewOrchestrator:
                 logger.warning("No article schema provided")
                 return None
             
-            # 2. Create Telegraph article
-            logger.info(f"Creating Telegraph article for '{article.title}'")
-            telegraph_urls = await self.telegraph_manager.create_telegraph_articles(article)
-
-            if telegraph_urls:
-                # 3. Update the article with telegraph URLs
-                logger.debug("Updating article with Telegraph URLs")
-                updated_article = await article_repository.update_telegraph_urls(article.id, telegraph_urls)
-                logger.info(f"Successfully processed article: {article.title}")
-                return updated_article
-            else:
-                logger.warning("Failed to create Telegraph article")
-                return None
+            return await self._publish_article(article)
                 
         except Exception as e:
             logger.error(f"Error processing single article '{article.title if article else 'Unknown'}': {e}", exc_info=True)
             return None
+
+    async def _publish_article(self, article: Article) -> Optional[Article]:
+        """Create the Telegraph pages of an article and save their URLs; errors are raised"""
+        # 2. Create Telegraph article
+        logger.info(f"Creating Telegraph article for '{article.title}'")
+        telegraph_urls = await self.telegraph_manager.create_telegraph_articles(article, ledger=publish_ledger_repository)
+
+        if telegraph_urls:
+            # 3. Update the article with telegraph URLs
+            logger.debug("Updating article with Telegraph URLs")
+            updated_article = await article_repository.update_telegraph_urls(article.id, telegraph_urls)
+            logger.info(f"Successfully processed article: {article.title}")
+            return updated_article
+        else:
+            logger.warning("Failed to create Telegraph article")
+            return None
@@ -0,0 +1,66 @@
+"""
+Summary of the fetch and publish counters of a run.
+Logged when the bot or the backfill shuts down, so every run leaves a record
+of its retries, cache efficiency, host throttling, article splitting and
+Telegraph account usage.
+"""
+
+from src.scraping.host_scheduler import get_host_scheduler
+from src.scraping.response_cache import get_response_cache
+from src.scraping.retry import get_retry_engine
+from src.telegraph_manager import TelegraphManager
+
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+def log_run_stats(telegraph_manager: TelegraphManager) -> None:
+    """
+    Log the counters collected during the run.
+
+    Args:
+        telegraph_manager: Manager that published the run's articles
+    """
+    try:
+        metrics = get_retry_engine().get_metrics()
+        logger.info(
+            f"Fetch retries: {metrics['attempts']} attempts, {metrics['successes']} successes, "
+            f"retries {metrics['retries']}, give-ups {metrics['giveups']}, "
+            f"{metrics['short_circuited']} short-circuited"
+        )
+        for host, breaker in metrics['breakers'].items():
+            if breaker['times_opened']:
+                logger.info(f"Circuit for {host}: {breaker['state']}, opened {breaker['times_opened']} time(s)")
+
+        cache = get_response_cache()
+        if cache is not None:
+            cache_stats = cache.get_stats()
+            logger.info(
+                f"Response cache: {cache_stats['hits']} hits, {cache_stats['revalidated']} revalidated, "
+                f"{cache_stats['misses']} misses, {cache_stats['entries']} entries ({cache_stats['size_bytes']} bytes)"
+            )
+
+        for host, host_stats in get_host_scheduler().get_stats().items():
+            logger.info(
+                f"Host {host}: {host_stats['requests']} requests, {host_stats['throttled']} throttled, "
+                f"queue wait avg {host_stats['avg_wait']:.2f}s max {host_stats['max_wait']:.2f}s, "
+                f"rate {host_stats['rate']:.2f} req/s"
+            )
+
+        split_stats = telegraph_manager.get_split_stats()
+        publish_stats = telegraph_manager.get_publish_stats()
+        logger.info(
+            f"Telegraph: {publish_stats['articles']} articles published with {publish_stats['calls']} calls "
+            f"({publish_stats['bytes_sent']} bytes); {split_stats['articles']} articles split into "
+            f"{split_stats['parts']} parts ({split_stats['parts_saved']} parts saved by exact sizing)"
+        )
+        if telegraph_manager.pool is not None:
+            for account_id, account_stats in telegraph_manager.get_pool_stats().items():
+                logger.info(
+                    f"Telegraph account {account_id}: {account_stats['state']}, {account_stats['pages']} pages, "
+                    f"{account_stats['calls']} calls, {account_stats['failures']} failures"
+                )
+    except Exception as e:
+        # Statistics must never get in the way of shutting down
+        logger.error(f"Could not collect run statistics: {e}", exc_info=True)
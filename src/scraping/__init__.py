@@ -1,5 +1,6 @@
 from .scraper import Scraper
 from .fetcher import Fetcher
+from .async_fetcher import AsyncFetcher
 from .parser import Parser
 from .review_scraper import ReviewScraper
 from .review_parser import ReviewParser
@@ -8,6 +9,7 @@ from .constants import MIN_TITLE_LENGTH, ALLOWED_TAGS, REQUIRED_FIELDS, IRRELEVA
 __all__ = [
     'Scraper',
     'Fetcher', 
+    'AsyncFetcher',
     'Parser',
     'ReviewScraper',
     'ReviewParser',
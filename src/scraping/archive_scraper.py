@@ -9,6 +9,10 @@ from src.scraping.fetcher import Fetcher
 
 from src.scraping.fetcher import Fetcher
 from src.scraping.archive_parser import ArchiveParser
+from src.scraping.response_cache import get_response_cache
+from src.scraping.host_scheduler import get_host_scheduler
+from src.scraping.retry import get_retry_engine
+from src.scraping.page_archive import get_page_archive
 
 import os
 from dotenv import load_dotenv
@@ -25,7 +29,13 @@ class ArchiveScraper():
     
     def __init__(self, archive_url: str) :
         self.archive_url = archive_url
-        self.fetcher: Fetcher = Fetcher(archive_url)
+        self.fetcher: Fetcher = Fetcher(
+            archive_url,
+            cache=get_response_cache(),
+            retry_engine=get_retry_engine(),
+            archive=get_page_archive(),
+            scheduler=get_host_scheduler(),
+        )
         
         # Load selectors from environment
         selectors_str = os.getenv('ARCHIVE_LINK_SELECTORS', '')
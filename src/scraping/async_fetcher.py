@@ -0,0 +1,283 @@
+"""
+Asynchronous fetcher built on aiohttp.
+
+Unlike Fetcher (blocking requests.Session), AsyncFetcher runs requests
+concurrently on the event loop while capping the number of in-flight
+requests per host, so a whole review issue is fetched in roughly the
+time of its slowest page.
+"""
+
+import asyncio
+import os
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+import aiohttp
+
+from src.scraping.fetcher import Fetcher
+from src.scraping.response_cache import ResponseCache, CachedResponse
+from src.scraping.host_scheduler import HostScheduler
+from src.scraping.retry import RetryEngine
+from src.scraping.page_archive import PageArchive
+from src.scraping.fetched_page import (
+    BoundedBody,
+    FetchedPage,
+    STREAM_CHUNK_SIZE,
+    detect_encoding,
+    get_max_response_bytes,
+)
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Default number of simultaneous requests allowed against a single host
+DEFAULT_MAX_PER_HOST = 4
+
+# Default size of the shared connection pool (all hosts together)
+DEFAULT_MAX_CONNECTIONS = 20
+
+# Default total timeout for a single request (seconds)
+DEFAULT_TIMEOUT = 10
+
+
+class AsyncFetcher:
+    """
+    Fetch pages concurrently with a pooled aiohttp.ClientSession.
+
+    Usage:
+        async with AsyncFetcher(base_url) as fetcher:
+            index_html = await fetcher.fetch_page()
+            pages = await fetcher.fetch_many(article_urls)
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        max_per_host: Optional[int] = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        timeout: Optional[float] = None,
+        cache: Optional[ResponseCache] = None,
+        scheduler: Optional[HostScheduler] = None,
+        retry_engine: Optional[RetryEngine] = None,
+        max_bytes: Optional[int] = None,
+        archive: Optional[PageArchive] = None,
+    ):
+        """
+        Args:
+            base_url: URL fetched when fetch_page() is called without arguments
+            max_per_host: Maximum concurrent requests per host
+                (defaults to FETCH_MAX_PER_HOST env var or DEFAULT_MAX_PER_HOST)
+            max_connections: Size of the shared connection pool
+            timeout: Total timeout for a single request in seconds
+                (defaults to FETCH_TIMEOUT env var or DEFAULT_TIMEOUT)
+            cache: Optional on-disk response cache shared with other fetchers
+            scheduler: Optional per-host politeness scheduler pacing requests
+            retry_engine: Optional retry engine (backoff and per-host circuit breaker)
+            max_bytes: Maximum accepted body size
+                (defaults to FETCH_MAX_BYTES env var or DEFAULT_MAX_RESPONSE_BYTES)
+            archive: Optional page archive to record responses into or replay them from
+        """
+        logger.info(f"Initializing AsyncFetcher for: {base_url}")
+        self.base_url = base_url
+        self.max_per_host = max_per_host or int(os.getenv('FETCH_MAX_PER_HOST', DEFAULT_MAX_PER_HOST))
+        self.max_connections = max_connections
+        self.timeout = aiohttp.ClientTimeout(total=timeout or float(os.getenv('FETCH_TIMEOUT', DEFAULT_TIMEOUT)))
+        self.cache = cache
+        self.scheduler = scheduler
+        self.retry_engine = retry_engine
+        self.max_bytes = max_bytes or get_max_response_bytes()
+        self.archive = archive
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        logger.debug(f"AsyncFetcher limits: {self.max_per_host} per host, {self.max_connections} total")
+
+    async def __aenter__(self) -> 'AsyncFetcher':
+        self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Create the pooled session lazily (it must be created inside a running loop)"""
+        if self.session is None or self.session.closed:
+            logger.debug("Creating aiohttp session for connection pooling")
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_per_host,
+            )
+            self.session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+        return self.session
+
+    def _get_host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """Get (or create) the semaphore bounding concurrency for the URL's host"""
+        host = urlparse(url).netloc
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.max_per_host)
+        return self._host_semaphores[host]
+
+    async def fetch_page(self, url: Optional[str] = None) -> str:
+        """Fetch raw HTML content from a URL
+
+        Args:
+            url: The URL to fetch. If None, uses the base_url.
+
+        Returns:
+            str: The raw HTML content of the page.
+        """
+        return (await self.fetch_raw(url)).text
+
+    async def fetch_raw(self, url: Optional[str] = None) -> FetchedPage:
+        """Fetch a page as undecoded bytes with its detected charset
+
+        The body is streamed in chunks and aborted with ResponseTooLargeError
+        once it exceeds max_bytes.
+
+        Args:
+            url: The URL to fetch. If None, uses the base_url.
+
+        Returns:
+            FetchedPage: Raw body, detected encoding and status.
+        """
+        if url is None:
+            url = self.base_url
+
+        logger.debug(f"Fetching page: {url}")
+
+        if not self.validate_url(url):
+            error_msg = f"Invalid URL format: {url}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+
+        if self.archive is not None and self.archive.replaying:
+            return self.archive.replay(url)
+
+        page = await self._fetch_live(url)
+        if self.archive is not None and self.archive.recording:
+            self.archive.record(page)
+        return page
+
+    async def _fetch_live(self, url: str) -> FetchedPage:
+        """Fetch a validated URL from the cache or the network, with retries"""
+        cached = self.cache.get(url) if self.cache else None
+        if cached and self.cache.is_fresh(cached):
+            logger.debug(f"Serving fresh cached response for: {url}")
+            self.cache.record_hit()
+            return FetchedPage(url, cached.body, cached.encoding)
+
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.retry_engine:
+                self.retry_engine.before_request(url)
+            try:
+                page = await self._send(url, cached)
+            except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+                delay = None
+                if self.retry_engine:
+                    self.retry_engine.record_failure(url, e)
+                    delay = self.retry_engine.next_delay(e, attempt)
+                if delay is None:
+                    if isinstance(e, asyncio.TimeoutError):
+                        logger.error(f"Timeout while fetching: {url}", exc_info=True)
+                    else:
+                        logger.error(f"Request failed for {url}: {e}", exc_info=True)
+                    raise
+                logger.warning(f"Attempt {attempt} failed for {url}: {e!r}")
+                await asyncio.sleep(delay)
+                continue
+            except Exception as e:
+                # Errors retrying cannot help (oversized body, decoding, ...) still settle a half-open probe
+                if self.retry_engine:
+                    self.retry_engine.record_failure(url, e)
+                raise
+            except BaseException:
+                # Abandoned before the host answered (cancelled): free the probe without judging the host
+                if self.retry_engine:
+                    self.retry_engine.release(url)
+                raise
+            if self.retry_engine:
+                self.retry_engine.record_success(url)
+            return page
+
+    async def _send(self, url: str, cached: Optional[CachedResponse]) -> FetchedPage:
+        """
+        Send a GET request within the host's concurrency limit, revalidating
+        the cached entry if there is one. A throttled response (429/503) parks
+        the host in the scheduler and is raised like any HTTP error; the retry
+        engine re-sends it once the scheduler allows.
+        """
+        headers = self.cache.conditional_headers(cached) if cached else None
+        session = self._get_session()
+        async with self._get_host_semaphore(url):
+            if self.scheduler:
+                await self.scheduler.acquire(url)
+            logger.debug(f"Sending GET request to: {url}")
+            async with session.get(url, headers=headers) as response:
+                if self.scheduler:
+                    self.scheduler.record_response(url, response.status, response.headers.get('Retry-After'))
+                if cached and response.status == 304:
+                    logger.debug(f"Not modified, serving cached response for: {url}")
+                    self.cache.refresh(url, response.headers)
+                    self.cache.record_revalidation()
+                    return FetchedPage(url, cached.body, cached.encoding, response.status)
+                response.raise_for_status()
+                body = BoundedBody(url, self.max_bytes)
+                body.check_content_length(response.headers)
+                async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                    body.feed(chunk)
+                data = body.getvalue()
+                encoding = detect_encoding(response.headers.get('Content-Type'), data)
+                logger.debug(f"Response received: status={response.status}, size={len(data)} bytes, encoding={encoding}")
+                if self.cache:
+                    self.cache.store(url, data, encoding, response.headers)
+                    self.cache.record_miss()
+                return FetchedPage(url, data, encoding, response.status, dict(response.headers))
+
+    async def fetch_many(self, urls: List[str]) -> Dict[str, str]:
+        """
+        Fetch multiple pages concurrently and return URL -> HTML mapping.
+        Invalid or failed URLs are logged and left out of the result.
+        The result preserves the order of the input URLs.
+        """
+        pages = await self.fetch_many_raw(urls)
+        return {url: page.text for url, page in pages.items()}
+
+    async def fetch_many_raw(self, urls: List[str]) -> Dict[str, FetchedPage]:
+        """
+        Fetch multiple pages concurrently and return URL -> FetchedPage mapping
+        without decoding the bodies. Same skipping and ordering rules as fetch_many.
+        """
+        logger.info(f"Fetching {len(urls)} pages concurrently")
+        valid_urls = []
+        for url in urls:
+            if self.validate_url(url):
+                valid_urls.append(url)
+            else:
+                logger.warning(f"Skipping invalid URL: {url}")
+
+        responses = await asyncio.gather(
+            *(self.fetch_raw(url) for url in valid_urls),
+            return_exceptions=True,
+        )
+
+        results = {}
+        for url, response in zip(valid_urls, responses):
+            if isinstance(response, BaseException):
+                self.handle_request_error(response, url)
+            else:
+                results[url] = response
+
+        logger.info(f"Successfully fetched {len(results)}/{len(urls)} pages")
+        return results
+
+    async def close(self) -> None:
+        """Close the pooled session"""
+        if self.session is not None and not self.session.closed:
+            logger.debug("Closing aiohttp session")
+            await self.session.close()
+        self.session = None
+
+    # URL validation and error handling are shared with the blocking Fetcher
+    validate_url = Fetcher.validate_url
+    handle_request_error = Fetcher.handle_request_error
@@ -8,6 +8,9 @@ ALLOWED_TAGS = {
     'code', 'pre', 'p', 'ul', 'ol', 'li', 'br', 'hr', 'img',
 }
 
+# Inline tags that are wrapped in a paragraph when they appear at the top level of cleaned content
+INLINE_TAGS = {'strong', 'b', 'i', 'em', 'u', 's', 'a', 'code'}
+
 # CSS selectors for irrelevant content that should be removed
 IRRELEVANT_INFO_TAGS = 'nav, footer, .sidebar, script, style, .comments'
 
@@ -18,4 +21,16 @@ REQUIRED_FIELDS = ['title', 'content', 'original_url']
 MIN_TITLE_LENGTH = 5
 
 # Minimum content length for validation
-MIN_CONTENT_LENGTH = 100
\ No newline at end of file
+MIN_CONTENT_LENGTH = 100
+
+# URL pattern of individual article pages (e.g. https://platypus1917.org/2025/10/01/slug/).
+# Article pages are effectively immutable once published, unlike archive/issue listings.
+ARTICLE_URL_PATTERN = r'/\d{4}/\d{2}/\d{2}/'
+
+# URL pattern of review issue pages (e.g. https://platypus1917.org/category/pr/issue-179/).
+# The captured group is the issue number, which is also the Review id.
+ISSUE_URL_PATTERN = r'/category/pr/issue-(\d+)/?$'
+
+# Version of the article parsing rules (ReviewParser.parse_content_page and content cleaning).
+# Bump it whenever a change alters the parsed output; cached parse results of other versions are ignored.
+PARSER_VERSION = 2
@@ -0,0 +1,105 @@
+"""
+Single-pass cleaning of article HTML for Telegraph.
+
+Works directly on the parsed content subtree, without serialising and
+re-parsing it, and applies all cleaning rules in one walk:
+
+- elements matching the removal selector are dropped with their subtree,
+- tags outside the whitelist are unwrapped (their children take their place),
+- inline elements left at the top level are wrapped in paragraphs,
+  merging into a directly preceding paragraph.
+"""
+
+from typing import Iterable, Union
+
+import soupsieve
+from bs4 import BeautifulSoup, Tag
+
+from .constants import ALLOWED_TAGS, INLINE_TAGS, IRRELEVANT_INFO_TAGS
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class ContentCleaner:
+    """
+    Cleans a content subtree in place and serialises the result.
+
+    Usage:
+        cleaner = ContentCleaner()
+        html = cleaner.clean(soup.find('div', class_='bpf-content'))
+    """
+
+    def __init__(
+        self,
+        allowed_tags: Iterable[str] = ALLOWED_TAGS,
+        remove_selector: str = IRRELEVANT_INFO_TAGS,
+        inline_tags: Iterable[str] = INLINE_TAGS,
+    ):
+        """
+        Args:
+            allowed_tags: Tags kept in the output; all others are unwrapped
+            remove_selector: CSS selector of elements removed with their content
+            inline_tags: Allowed tags that must not appear outside a block at the top level
+        """
+        self.allowed_tags = frozenset(allowed_tags)
+        self.inline_tags = frozenset(inline_tags)
+        self.remove_selector = soupsieve.compile(remove_selector)
+
+    def clean(self, container: Union[Tag, BeautifulSoup]) -> str:
+        """
+        Clean the children of a container and return them as HTML.
+
+        The container's subtree is modified in place; the container tag
+        itself is not part of the output.
+
+        Args:
+            container: Content element (or a whole soup)
+
+        Returns:
+            Cleaned HTML of the container's children
+        """
+        if not isinstance(container, BeautifulSoup) and self.remove_selector.match(container):
+            return ''
+        soup = container
+        while soup.parent is not None:
+            soup = soup.parent
+        self._clean_children(container, soup, top_level=True)
+        return ''.join(str(child) for child in container.contents)
+
+    def _clean_children(self, parent: Tag, soup: BeautifulSoup, top_level: bool) -> None:
+        """Walk the children of a tag once, applying every rule to each node"""
+        node = parent.contents[0] if parent.contents else None
+        while node is not None:
+            if not isinstance(node, Tag):
+                node = node.next_sibling
+                continue
+
+            if self.remove_selector.match(node):
+                next_node = node.next_sibling
+                node.decompose()
+                node = next_node
+                continue
+
+            if node.name not in self.allowed_tags:
+                # The unwrapped children move into this position and are visited next
+                next_node = node.contents[0] if node.contents else node.next_sibling
+                node.unwrap()
+                node = next_node
+                continue
+
+            self._clean_children(node, soup, top_level=False)
+            next_node = node.next_sibling
+            if top_level and node.name in self.inline_tags:
+                self._wrap_in_paragraph(node, soup)
+            node = next_node
+
+    def _wrap_in_paragraph(self, element: Tag, soup: BeautifulSoup) -> None:
+        """Move a top-level inline element into the preceding paragraph or a new one"""
+        previous = element.previous_sibling
+        if isinstance(previous, Tag) and previous.name == 'p':
+            previous.append(element)
+            return
+        paragraph = soup.new_tag('p')
+        element.insert_before(paragraph)
+        paragraph.append(element)
@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Union
 
 from bs4 import BeautifulSoup
 
@@ -9,8 +9,8 @@ class ContentParser(Parser):
     """Base parser for content pages (articles, reviews, etc.)"""
     
     @abstractmethod
-    def parse_content_page(self, html: str, url: str) -> Dict[str, Any]:
-        """Parse a content page to extract structured data"""
+    def parse_content_page(self, html: Union[str, bytes], url: str, encoding: Optional[str] = None) -> Dict[str, Any]:
+        """Parse a content page (text or raw bytes) to extract structured data"""
         pass
     
     @abstractmethod
@@ -0,0 +1,126 @@
+"""
+Raw page bodies as produced by the streaming fetch path.
+
+Bodies are read in chunks up to a size cap and kept as bytes. The charset
+is detected once (Content-Type header, then <meta charset>) and travels
+with the body, so parsers can decode it themselves and no decoded copy
+of the page has to exist outside the parse tree.
+"""
+
+import codecs
+import os
+import re
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Dict, Iterable, Mapping, Optional
+
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Default maximum accepted body size (bytes); larger responses are aborted
+DEFAULT_MAX_RESPONSE_BYTES = 10 * 1024 * 1024
+
+# Size of the chunks the body is streamed in
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# How far into the body a <meta charset> declaration is looked for
+CHARSET_SNIFF_BYTES = 4096
+
+_HEADER_CHARSET_RE = re.compile(r'charset=["\']?([\w.:-]+)', re.IGNORECASE)
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([\w.:-]+)', re.IGNORECASE)
+
+
+class ResponseTooLargeError(Exception):
+    """Raised when a response body exceeds the configured size cap"""
+
+
+@dataclass
+class FetchedPage:
+    """Undecoded response body together with its detected charset"""
+    url: str
+    body: bytes
+    encoding: Optional[str] = None
+    status: int = 200
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @cached_property
+    def text(self) -> str:
+        """Body decoded once with the detected charset (UTF-8 if unknown)"""
+        return self.body.decode(self.encoding or 'utf-8', errors='replace')
+
+
+def get_max_response_bytes() -> int:
+    """Size cap from FETCH_MAX_BYTES env var or DEFAULT_MAX_RESPONSE_BYTES"""
+    return int(os.getenv('FETCH_MAX_BYTES', DEFAULT_MAX_RESPONSE_BYTES))
+
+
+class BoundedBody:
+    """
+    Accumulates streamed chunks and aborts once the size cap is exceeded.
+
+    Usage:
+        body = BoundedBody(url, max_bytes)
+        body.check_content_length(response.headers)
+        for chunk in chunks:
+            body.feed(chunk)
+        data = body.getvalue()
+    """
+
+    def __init__(self, url: str, max_bytes: int):
+        self.url = url
+        self.max_bytes = max_bytes
+        self._buffer = bytearray()
+
+    def check_content_length(self, headers: Mapping[str, str]) -> None:
+        """Reject the response up front when Content-Length already exceeds the cap"""
+        length = headers.get('Content-Length')
+        if length and length.isdigit() and int(length) > self.max_bytes:
+            self._too_large(int(length))
+
+    def feed(self, chunk: bytes) -> None:
+        self._buffer.extend(chunk)
+        if len(self._buffer) > self.max_bytes:
+            self._too_large(len(self._buffer))
+
+    def getvalue(self) -> bytes:
+        return bytes(self._buffer)
+
+    def _too_large(self, size: int) -> None:
+        error_msg = f"Response too large for {self.url}: {size} bytes exceeds limit of {self.max_bytes}"
+        logger.error(error_msg)
+        raise ResponseTooLargeError(error_msg)
+
+
+def read_limited(url: str, chunks: Iterable[bytes], headers: Mapping[str, str], max_bytes: int) -> bytes:
+    """Read a streamed body into bytes, raising ResponseTooLargeError past max_bytes"""
+    body = BoundedBody(url, max_bytes)
+    body.check_content_length(headers)
+    for chunk in chunks:
+        body.feed(chunk)
+    return body.getvalue()
+
+
+def detect_encoding(content_type: Optional[str], body: bytes) -> Optional[str]:
+    """
+    Detect the charset of a body once.
+
+    Args:
+        content_type: Value of the Content-Type response header
+        body: Raw response body
+
+    Returns:
+        Normalized codec name, or None if the page does not declare one
+    """
+    candidates = []
+    if content_type and (match := _HEADER_CHARSET_RE.search(content_type)):
+        candidates.append(match.group(1))
+    if match := _META_CHARSET_RE.search(body[:CHARSET_SNIFF_BYTES]):
+        candidates.append(match.group(1).decode('ascii'))
+
+    for candidate in candidates:
+        try:
+            return codecs.lookup(candidate).name
+        except LookupError:
+            logger.warning(f"Unknown charset declared: {candidate}")
+    return None
@@ -1,5 +1,18 @@
+import os
+import time
 from abc import ABC, abstractmethod
 from typing import List, Optional, Dict, Any
+from src.scraping.response_cache import ResponseCache, CachedResponse
+from src.scraping.host_scheduler import HostScheduler
+from src.scraping.retry import RetryEngine
+from src.scraping.page_archive import PageArchive
+from src.scraping.fetched_page import (
+    FetchedPage,
+    STREAM_CHUNK_SIZE,
+    detect_encoding,
+    get_max_response_bytes,
+    read_limited,
+)
 from src.logging_config import get_logger
 import requests
 
@@ -9,10 +22,25 @@ logger = get_logger(__name__)
 
 class Fetcher():
     
-    def __init__(self, base_url: str):
+    def __init__(
+        self,
+        base_url: str,
+        cache: Optional[ResponseCache] = None,
+        timeout: Optional[float] = None,
+        retry_engine: Optional[RetryEngine] = None,
+        max_bytes: Optional[int] = None,
+        archive: Optional[PageArchive] = None,
+        scheduler: Optional[HostScheduler] = None,
+    ):
         logger.info(f"Initializing Fetcher for: {base_url}")
         self.base_url = base_url
         self.session = requests.Session()  # Reuse connections
+        self.cache = cache  # Optional on-disk response cache
+        self.timeout = timeout or float(os.getenv('FETCH_TIMEOUT', 10))
+        self.retry_engine = retry_engine  # Optional retries with backoff and per-host circuit breaker
+        self.max_bytes = max_bytes or get_max_response_bytes()  # Bodies above this are aborted
+        self.archive = archive  # Optional record/replay page archive
+        self.scheduler = scheduler  # Optional per-host politeness scheduler (shared with AsyncFetcher)
         logger.debug("HTTP session created for connection pooling")
         
     def fetch_page(self, url: Optional[str] = None) -> str:
@@ -24,6 +52,21 @@ class Fetcher():
         Returns:
             str: The raw HTML content of the page.
         """
+        return self.fetch_raw(url).text
+    
+    def fetch_raw(self, url: Optional[str] = None) -> FetchedPage:
+        """Fetch a page as undecoded bytes with its detected charset
+        
+        The body is streamed in chunks and aborted with ResponseTooLargeError
+        once it exceeds max_bytes. Parsers accept the bytes directly, so the
+        page is decoded only once, while building the parse tree.
+        
+        Args:
+            url: The URL to fetch. If None, uses the base_url.
+            
+        Returns:
+            FetchedPage: Raw body, detected encoding and status.
+        """
         if url is None:
             url = self.base_url
             
@@ -34,19 +77,92 @@ class Fetcher():
             logger.error(error_msg)
             raise ValueError(error_msg)
         
+        if self.archive is not None and self.archive.replaying:
+            return self.archive.replay(url)
+        
+        page = self._fetch_live(url)
+        if self.archive is not None and self.archive.recording:
+            self.archive.record(page)
+        return page
+    
+    def _fetch_live(self, url: str) -> FetchedPage:
+        """Fetch a validated URL from the cache or the network, with retries"""
+        cached = self.cache.get(url) if self.cache else None
+        if cached and self.cache.is_fresh(cached):
+            logger.debug(f"Serving fresh cached response for: {url}")
+            self.cache.record_hit()
+            return FetchedPage(url, cached.body, cached.encoding)
+        
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.retry_engine:
+                self.retry_engine.before_request(url)
+            try:
+                page = self._send(url, cached)
+            except requests.exceptions.RequestException as e:
+                delay = None
+                if self.retry_engine:
+                    self.retry_engine.record_failure(url, e)
+                    delay = self.retry_engine.next_delay(e, attempt)
+                if delay is None:
+                    if isinstance(e, requests.exceptions.Timeout):
+                        logger.error(f"Timeout while fetching: {url}", exc_info=True)
+                    else:
+                        logger.error(f"Request failed for {url}: {e}", exc_info=True)
+                    raise
+                logger.warning(f"Attempt {attempt} failed for {url}: {e}")
+                time.sleep(delay)
+                continue
+            except Exception as e:
+                # Errors retrying cannot help (oversized body, decoding, ...) still settle a half-open probe
+                if self.retry_engine:
+                    self.retry_engine.record_failure(url, e)
+                raise
+            except BaseException:
+                # Abandoned before the host answered (cancelled): free the probe without judging the host
+                if self.retry_engine:
+                    self.retry_engine.release(url)
+                raise
+            if self.retry_engine:
+                self.retry_engine.record_success(url)
+            return page
+    
+    def _send(self, url: str, cached: Optional[CachedResponse]) -> FetchedPage:
+        """
+        Send a single streaming GET request, revalidating the cached entry if
+        there is one. A throttled response (429/503) parks the host in the
+        scheduler and is raised like any HTTP error; the retry engine re-sends
+        it, and the scheduler holds that attempt back until Retry-After has passed.
+        """
+        request_kwargs = {'timeout': self.timeout, 'stream': True}
+        if cached:
+            request_kwargs['headers'] = self.cache.conditional_headers(cached)
+        
+        if self.scheduler:
+            self.scheduler.wait(url)
         logger.debug(f"Sending GET request to: {url}")
+        response = self.session.get(url, **request_kwargs)
         try:
-            response = self.session.get(url, timeout=10)
-            logger.debug(f"Response received: status={response.status_code}, size={len(response.text)} chars")
+            if self.scheduler:
+                self.scheduler.record_response(url, response.status_code, response.headers.get('Retry-After'))
+            if cached and response.status_code == 304:
+                logger.debug(f"Not modified, serving cached response for: {url}")
+                self.cache.refresh(url, response.headers)
+                self.cache.record_revalidation()
+                return FetchedPage(url, cached.body, cached.encoding, response.status_code)
             response.raise_for_status()
-            logger.debug(f"Successfully fetched page from: {url}")
-            return response.text
-        except requests.exceptions.Timeout:
-            logger.error(f"Timeout while fetching: {url}", exc_info=True)
-            raise
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed for {url}: {e}", exc_info=True)
-            raise
+            body = read_limited(
+                url, response.iter_content(chunk_size=STREAM_CHUNK_SIZE), response.headers, self.max_bytes
+            )
+            encoding = detect_encoding(response.headers.get('Content-Type'), body)
+            logger.debug(f"Response received: status={response.status_code}, size={len(body)} bytes, encoding={encoding}")
+            if self.cache:
+                self.cache.store(url, body, encoding, response.headers)
+                self.cache.record_miss()
+            return FetchedPage(url, body, encoding, response.status_code, dict(response.headers))
+        finally:
+            response.close()
     
     def fetch_multiple_pages(self, urls: List[str]) -> Dict[str, str]:
         """Fetch multiple pages and return URL -> HTML mapping"""
@@ -0,0 +1,28 @@
+"""
+Content fingerprints for change detection between runs.
+
+The fetched HTML and the cleaned article content are hashed with BLAKE2b
+and stored next to each Article row, so an unchanged page can be skipped
+before it is parsed, written to the database or published again.
+"""
+
+import hashlib
+from typing import Union
+
+# 16-byte digests: 32 hex characters, ample for change detection
+FINGERPRINT_DIGEST_SIZE = 16
+
+
+def fingerprint(data: Union[str, bytes]) -> str:
+    """
+    Hex BLAKE2b fingerprint of a page body or of cleaned content.
+
+    Args:
+        data: Raw bytes, or text (hashed as UTF-8)
+
+    Returns:
+        Hex digest string
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.blake2b(data, digest_size=FINGERPRINT_DIGEST_SIZE).hexdigest()
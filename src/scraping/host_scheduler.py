@@ -0,0 +1,264 @@
+"""
+Per-host politeness scheduler for the fetch layer.
+
+Every host gets its own token bucket. Requests wait for a token before
+they are sent, so parallel fetches never exceed the host's rate. When a
+host answers 429/503 the scheduler honours Retry-After by parking the
+host and halves its rate; successful responses raise the rate again
+step by step (AIMD), so throughput settles at the highest rate the
+origin tolerates.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional
+from urllib.parse import urlparse
+
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Default (and maximum) request rate per host, requests per second
+DEFAULT_RATE_PER_HOST = 2.0
+
+# Number of requests that may be sent back-to-back after an idle period
+DEFAULT_BURST = 4
+
+# The rate never drops below this, however often the host throttles us
+MIN_RATE_PER_HOST = 0.1
+
+# Multiplicative decrease applied to the rate on 429/503
+THROTTLE_BACKOFF_FACTOR = 0.5
+
+# Additive increase applied to the rate on every successful response
+RATE_RECOVERY_STEP = 0.1
+
+# Pause applied on 429/503 when the response carries no Retry-After
+DEFAULT_THROTTLE_PAUSE = 5.0
+
+# Status codes that signal the origin wants us to slow down
+THROTTLE_STATUS_CODES = {429, 503}
+
+
+class TokenBucket:
+    """
+    Token bucket with reservations.
+
+    reserve() takes a token immediately and returns how long the caller
+    has to wait before using it, so concurrent callers are served in the
+    order they arrived without polling.
+    """
+
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of stored tokens (burst size)
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.tokens = capacity
+        self.updated_at = clock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self.updated_at)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated_at = now
+
+    def reserve(self) -> float:
+        """Take one token and return the delay (seconds) before it may be used"""
+        self._refill(self.clock())
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+    def set_rate(self, rate: float) -> None:
+        """Change the refill rate, keeping tokens accrued so far"""
+        self._refill(self.clock())
+        self.rate = rate
+
+
+class HostState:
+    """Rate limiting state and statistics for a single host"""
+
+    def __init__(self, rate: float, burst: float, clock: Callable[[], float]):
+        self.bucket = TokenBucket(rate, burst, clock)
+        self.blocked_until = 0.0
+        self.requests = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+
+class HostScheduler:
+    """
+    Paces requests per host with token buckets and Retry-After handling.
+
+    Usage:
+        wait = await scheduler.acquire(url)   # sleeps until the host allows a request
+                                              # (scheduler.wait(url) in synchronous code)
+        ...                                   # send the request
+        scheduler.record_response(url, status, response.headers.get('Retry-After'))
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: float = DEFAULT_BURST,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            rate: Maximum requests per second per host
+                (defaults to FETCH_RATE_PER_HOST env var or DEFAULT_RATE_PER_HOST)
+            burst: Bucket capacity per host
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.max_rate = rate or float(os.getenv('FETCH_RATE_PER_HOST', DEFAULT_RATE_PER_HOST))
+        self.burst = burst
+        self.clock = clock
+        self._hosts: Dict[str, HostState] = {}
+        # Synchronous fetchers run in worker threads next to the event loop
+        self._lock = threading.RLock()
+        logger.info(f"HostScheduler initialized: {self.max_rate} req/s per host, burst {burst}")
+
+    def _get_host(self, url: str) -> HostState:
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._hosts:
+                self._hosts[host] = HostState(self.max_rate, self.burst, self.clock)
+            return self._hosts[host]
+
+    def reserve(self, url: str) -> float:
+        """Reserve a request slot for the URL's host and return the required wait"""
+        state = self._get_host(url)
+        with self._lock:
+            delay = state.bucket.reserve()
+            parked_for = state.blocked_until - self.clock()
+        return max(delay, parked_for, 0.0)
+
+    async def acquire(self, url: str) -> float:
+        """
+        Wait until a request to the URL's host is allowed.
+
+        Returns:
+            Time in seconds the request spent waiting in the queue
+        """
+        state = self._get_host(url)
+        started = self.clock()
+        waited = 0.0
+        delay = self.reserve(url)
+        while delay > 0:
+            await asyncio.sleep(delay)
+            waited = self.clock() - started
+            # The host may have been parked by a 429 while we were waiting
+            delay = state.blocked_until - self.clock()
+
+        self._record_wait(state, url, waited)
+        return waited
+
+    def wait(self, url: str) -> float:
+        """
+        Blocking counterpart of acquire() for synchronous fetchers.
+
+        Returns:
+            Time in seconds the request spent waiting in the queue
+        """
+        state = self._get_host(url)
+        started = self.clock()
+        waited = 0.0
+        delay = self.reserve(url)
+        while delay > 0:
+            time.sleep(delay)
+            waited = self.clock() - started
+            delay = state.blocked_until - self.clock()
+
+        self._record_wait(state, url, waited)
+        return waited
+
+    def _record_wait(self, state: HostState, url: str, waited: float) -> None:
+        with self._lock:
+            state.requests += 1
+            state.total_wait += waited
+            state.max_wait = max(state.max_wait, waited)
+        if waited > 0:
+            logger.debug(f"Queue wait for {url}: {waited:.3f}s")
+
+    def record_response(self, url: str, status: int, retry_after: Optional[str] = None) -> None:
+        """
+        Adapt the host's rate to a response.
+        429/503 park the host (honouring Retry-After) and halve its rate;
+        any other response recovers the rate towards the maximum.
+        """
+        state = self._get_host(url)
+        if status in THROTTLE_STATUS_CODES:
+            pause = self.parse_retry_after(retry_after)
+            if pause is None:
+                pause = DEFAULT_THROTTLE_PAUSE
+            with self._lock:
+                state.blocked_until = max(state.blocked_until, self.clock() + pause)
+                state.throttled += 1
+                new_rate = max(MIN_RATE_PER_HOST, state.bucket.rate * THROTTLE_BACKOFF_FACTOR)
+                state.bucket.set_rate(new_rate)
+            logger.warning(
+                f"Host {urlparse(url).netloc} throttled us (HTTP {status}): "
+                f"pausing {pause:.1f}s, rate lowered to {new_rate:.2f} req/s"
+            )
+        else:
+            with self._lock:
+                if state.bucket.rate < self.max_rate:
+                    state.bucket.set_rate(min(self.max_rate, state.bucket.rate + RATE_RECOVERY_STEP))
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Parse a Retry-After header (delay in seconds or HTTP date) into seconds"""
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            logger.warning(f"Unparseable Retry-After header: {value}")
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-host statistics: current rate, requests, throttles and queue wait times"""
+        with self._lock:
+            hosts = list(self._hosts.items())
+        return {
+            host: {
+                'rate': state.bucket.rate,
+                'requests': state.requests,
+                'throttled': state.throttled,
+                'total_wait': state.total_wait,
+                'max_wait': state.max_wait,
+                'avg_wait': state.total_wait / state.requests if state.requests else 0.0,
+            }
+            for host, state in hosts
+        }
+
+
+_default_scheduler: Optional[HostScheduler] = None
+
+
+def get_host_scheduler() -> HostScheduler:
+    """
+    Get the process-wide host scheduler.
+    All fetchers share it so concurrent scrapes of the same host are paced together.
+    """
+    global _default_scheduler
+    if _default_scheduler is None:
+        _default_scheduler = HostScheduler()
+    return _default_scheduler
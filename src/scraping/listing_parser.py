@@ -1,38 +1,86 @@
 #standard libraries
+import re
 from typing import List, Optional
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve
 from src.scraping.parser import Parser
 
+# Leading type selector of a CSS selector (e.g. 'h4' in 'h4 > a[href^="/20"]')
+_LEADING_TYPE_RE = re.compile(r'^\s*([a-zA-Z][\w-]*)')
+# Quoted attribute values, removed before looking for unsupported syntax
+_QUOTED_RE = re.compile(r'"[^"]*"|\'[^\']*\'')
+
+
+def strainer_tag_for(selector: str) -> Optional[str]:
+    """
+    Tag whose subtrees contain every match of a selector, or None if there is none.
+
+    A selector can be answered from a partial parse of its leading element
+    type only if it never looks outside that subtree: no sibling
+    combinators, no pseudo-classes and no selector lists.
+    """
+    unquoted = _QUOTED_RE.sub('', selector)
+    if any(char in unquoted for char in '+~:,'):
+        return None
+    match = _LEADING_TYPE_RE.match(unquoted)
+    return match.group(1).lower() if match else None
+
+
 class ListingParser(Parser):
-    def __init__(self, base_url: str, link_selectors: List[str]):
+    def __init__(self, base_url: str, link_selectors: List[str], partial_parse: bool = True):
         """
         Args:
             base_url: Base URL for normalizing relative links
             link_selectors: CSS selectors to find links (tried in order)
+            partial_parse: Only build the subtrees the selectors can match
+                (SoupStrainer) when parsing a listing page on its own
         """
         self.base_url = base_url
+        self.partial_parse = partial_parse
         self.link_selectors = link_selectors
-        
+
+    @property
+    def link_selectors(self) -> List[str]:
+        return self._link_selectors
+
+    @link_selectors.setter
+    def link_selectors(self, selectors: List[str]) -> None:
+        """Compile the selectors once and derive the strainer for partial parsing"""
+        self._link_selectors = selectors
+        self.compiled_selectors = [soupsieve.compile(selector) for selector in selectors]
+
+        tags = [strainer_tag_for(selector) for selector in selectors]
+        if tags and all(tags):
+            self.strainer: Optional[SoupStrainer] = SoupStrainer(list(dict.fromkeys(tags)))
+        else:
+            self.strainer = None
+
     def parse_listing_page(self, html: str) -> List[str]:
         """
         Parse listing page HTML to extract URLs using configured selectors.
         Default implementation - can be overridden if needed.
         """
-        soup = self.create_soup(html)
+        parse_only = self.strainer if self.partial_parse else None
+        return self.extract_listing_urls(self.create_soup(html, parse_only=parse_only))
+
+    def extract_listing_urls(self, soup: BeautifulSoup) -> List[str]:
+        """Extract URLs from an already parsed listing page"""
         urls = []
-        
-        for selector in self.link_selectors:
-            links = soup.select(selector)
+
+        for selector in self.compiled_selectors:
+            links = selector.select(soup)
             extracted = [url for link in links if (url := self.extract_link(link))]
             urls.extend(extracted)
-        
+
         # Remove duplicates while preserving order
         return list(dict.fromkeys(urls))
+
     def extract_link(self, link) -> Optional[str]:
         """Extract and normalize href from link element"""
         href = link.get('href')
         if href:
             return self.normalize_url(href, self.base_url)
         return None
-    
-    
-    
\ No newline at end of file
+
+
+
@@ -0,0 +1,158 @@
+"""
+Record/replay archive of fetched pages.
+
+In record mode every page a fetcher returns (URL, status, headers, body)
+is appended to a gzip-compressed JSON Lines file. In replay mode the
+fetchers serve pages from that file and never touch the network, which
+makes parser and pipeline runs on real pages deterministic and suitable
+for profiling.
+
+Configured with FETCH_MODE (live, record or replay) and FETCH_ARCHIVE_PATH.
+"""
+
+import base64
+import gzip
+import json
+import os
+import threading
+from typing import Dict, List, Optional
+
+from src.scraping.fetched_page import FetchedPage
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+FETCH_MODE_LIVE = 'live'
+FETCH_MODE_RECORD = 'record'
+FETCH_MODE_REPLAY = 'replay'
+
+
+class ArchiveMissError(LookupError):
+    """Raised in replay mode when a URL was never recorded"""
+
+
+class PageArchive:
+    """
+    Gzip-compressed JSON Lines archive of fetched pages.
+
+    Usage:
+        archive = PageArchive("fixtures/issue-179.jsonl.gz", FETCH_MODE_RECORD)
+        archive.record(page)                 # done by the fetchers
+
+        archive = PageArchive("fixtures/issue-179.jsonl.gz", FETCH_MODE_REPLAY)
+        page = archive.replay(url)           # no network access
+    """
+
+    def __init__(self, path: str, mode: str):
+        """
+        Args:
+            path: Archive file (created on first record)
+            mode: FETCH_MODE_RECORD or FETCH_MODE_REPLAY
+        """
+        if mode not in (FETCH_MODE_RECORD, FETCH_MODE_REPLAY):
+            raise ValueError(f"Invalid page archive mode: {mode}")
+        self.path = path
+        self.mode = mode
+        self._pages: Dict[str, FetchedPage] = {}
+        self._lock = threading.Lock()
+        self.recorded = 0
+        self.replayed = 0
+
+        if mode == FETCH_MODE_REPLAY:
+            self._load()
+        else:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        logger.info(f"PageArchive opened in {mode} mode: {path} ({len(self._pages)} pages)")
+
+    @classmethod
+    def from_env(cls) -> Optional['PageArchive']:
+        """
+        Create an archive from FETCH_MODE and FETCH_ARCHIVE_PATH.
+        Returns None in live mode (the default).
+        """
+        mode = os.getenv('FETCH_MODE', FETCH_MODE_LIVE).lower()
+        if mode == FETCH_MODE_LIVE:
+            return None
+        path = os.getenv('FETCH_ARCHIVE_PATH')
+        if not path:
+            raise ValueError(f"FETCH_MODE={mode} requires FETCH_ARCHIVE_PATH to be set")
+        return cls(path, mode)
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == FETCH_MODE_RECORD
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == FETCH_MODE_REPLAY
+
+    def _load(self) -> None:
+        """Read all recorded pages; later records of a URL replace earlier ones"""
+        with gzip.open(self.path, 'rt', encoding='utf-8') as archive_file:
+            for line in archive_file:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                self._pages[record['url']] = FetchedPage(
+                    url=record['url'],
+                    body=base64.b64decode(record['body']),
+                    encoding=record.get('encoding'),
+                    status=record.get('status', 200),
+                    headers=record.get('headers', {}),
+                )
+
+    def record(self, page: FetchedPage) -> None:
+        """Append a fetched page to the archive"""
+        line = json.dumps({
+            'url': page.url,
+            'status': page.status,
+            'encoding': page.encoding,
+            'headers': dict(page.headers),
+            'body': base64.b64encode(page.body).decode('ascii'),
+        })
+        with self._lock:
+            # Every record is its own gzip member, so an interrupted run keeps what it recorded
+            with gzip.open(self.path, 'at', encoding='utf-8') as archive_file:
+                archive_file.write(line + '\n')
+            self._pages[page.url] = page
+            self.recorded += 1
+        logger.debug(f"Recorded {page.url} ({len(page.body)} bytes)")
+
+    def replay(self, url: str) -> FetchedPage:
+        """Return the recorded page for a URL, raising ArchiveMissError if there is none"""
+        page = self._pages.get(url)
+        if page is None:
+            error_msg = f"No archived response for {url} in {self.path}"
+            logger.error(error_msg)
+            raise ArchiveMissError(error_msg)
+        self.replayed += 1
+        logger.debug(f"Replaying {url} from archive")
+        return page
+
+    def urls(self) -> List[str]:
+        """All URLs available in the archive"""
+        return list(self._pages)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._pages
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+
+_default_archive: Optional[PageArchive] = None
+_default_archive_loaded: bool = False
+
+
+def get_page_archive() -> Optional[PageArchive]:
+    """
+    Get the process-wide page archive configured from the environment.
+    Returns None in live mode.
+    """
+    global _default_archive, _default_archive_loaded
+    if not _default_archive_loaded:
+        _default_archive = PageArchive.from_env()
+        _default_archive_loaded = True
+    return _default_archive
@@ -0,0 +1,195 @@
+"""
+Persistent cache of parsed article pages.
+
+ReviewParser.parse_content_page output is stored in a SQLite file keyed
+by (original_url, html_hash, parser_version). As long as neither the
+fetched page nor the parsing rules change, re-runs get the article dict
+without building a BeautifulSoup tree. The parser version combines
+PARSER_VERSION with the parser backend, so bumping the constant (or
+switching backends) invalidates exactly the entries produced by the old
+rules.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import date
+from typing import Any, Dict, Optional
+
+from src.scraping.constants import PARSER_VERSION
+from src.scraping.parser_backend import get_parser_backend
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+def current_parser_version() -> str:
+    """Version key of the active parsing rules: PARSER_VERSION and parser backend"""
+    return f"{PARSER_VERSION}:{get_parser_backend()}"
+
+
+def _encode_value(value: Any) -> Any:
+    """JSON encoding of values json cannot store natively"""
+    if isinstance(value, date):
+        return {'__date__': value.isoformat()}
+    raise TypeError(f"Cannot store {type(value).__name__} in the parse cache")
+
+
+def _decode_object(obj: Dict[str, Any]) -> Any:
+    """Inverse of _encode_value"""
+    if obj.keys() == {'__date__'}:
+        return date.fromisoformat(obj['__date__'])
+    return obj
+
+
+class ParseCache:
+    """
+    SQLite-backed memo of parsed article data.
+
+    Usage:
+        cache = ParseCache("cache/parsed.sqlite")
+        content_data = cache.get(url, html_hash)
+        if content_data is None:
+            content_data = parser.parse_content_page(html, url)
+            cache.store(url, html_hash, content_data)
+    """
+
+    def __init__(self, path: str, parser_version: Optional[str] = None):
+        """
+        Args:
+            path: Path of the SQLite cache file (':memory:' for a throwaway cache)
+            parser_version: Version key of stored and served entries (defaults to current_parser_version())
+        """
+        self.path = path
+        self.parser_version = parser_version or current_parser_version()
+        logger.info(f"Initializing ParseCache at: {path} (parser version {self.parser_version})")
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        if path != ':memory:' and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS parse_results (
+                url TEXT NOT NULL,
+                html_hash TEXT NOT NULL,
+                parser_version TEXT NOT NULL,
+                data TEXT NOT NULL,
+                stored_at REAL NOT NULL,
+                PRIMARY KEY (url, html_hash, parser_version)
+            )
+            """
+        )
+        self._conn.commit()
+
+    @classmethod
+    def from_env(cls) -> Optional['ParseCache']:
+        """
+        Create a cache configured from environment variables.
+        Entries of other parser versions are purged on start.
+        Returns None when PARSE_CACHE_PATH is not set (caching disabled).
+        """
+        path = os.getenv('PARSE_CACHE_PATH', '')
+        if not path:
+            logger.debug("PARSE_CACHE_PATH not set, parse result caching disabled")
+            return None
+        cache = cls(path)
+        cache.purge_stale()
+        return cache
+
+    def get(self, url: str, html_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the parsed data of a page, or None if this version of the page was not parsed yet.
+
+        Args:
+            url: Article URL
+            html_hash: Fingerprint of the fetched HTML
+
+        Returns:
+            A fresh copy of the stored article dict, or None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM parse_results WHERE url = ? AND html_hash = ? AND parser_version = ?",
+                (url, html_hash, self.parser_version),
+            ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        logger.debug(f"Parse cache hit for {url}")
+        return json.loads(row[0], object_hook=_decode_object)
+
+    def store(self, url: str, html_hash: str, content_data: Dict[str, Any]) -> None:
+        """
+        Store the parsed data of a page.
+
+        Args:
+            url: Article URL
+            html_hash: Fingerprint of the fetched HTML
+            content_data: Output of parse_content_page
+        """
+        data = json.dumps(content_data, default=_encode_value)
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO parse_results (url, html_hash, parser_version, data, stored_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (url, html_hash, self.parser_version, data, time.time()),
+            )
+            self._conn.commit()
+        logger.debug(f"Cached parse result for {url}")
+
+    def purge_stale(self) -> int:
+        """
+        Delete entries produced by other parser versions.
+
+        Returns:
+            Number of deleted entries
+        """
+        with self._lock:
+            deleted = self._conn.execute(
+                "DELETE FROM parse_results WHERE parser_version != ?", (self.parser_version,)
+            ).rowcount
+            self._conn.commit()
+        if deleted:
+            logger.info(f"Purged {deleted} parse result(s) of other parser versions")
+        return deleted
+
+    def get_stats(self) -> Dict[str, int]:
+        """Hit/miss counters for monitoring"""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM parse_results").fetchone()[0]
+        return {'hits': self.hits, 'misses': self.misses, 'entries': entries}
+
+    def clear(self) -> None:
+        """Remove all cached parse results"""
+        with self._lock:
+            self._conn.execute("DELETE FROM parse_results")
+            self._conn.commit()
+        logger.info("Parse cache cleared")
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection"""
+        self._conn.close()
+
+
+_default_cache: Optional[ParseCache] = None
+_default_cache_loaded: bool = False
+
+
+def get_parse_cache() -> Optional[ParseCache]:
+    """
+    Get the process-wide parse cache configured from the environment.
+    Returns None when caching is disabled.
+    """
+    global _default_cache, _default_cache_loaded
+    if not _default_cache_loaded:
+        _default_cache = ParseCache.from_env()
+        _default_cache_loaded = True
+    return _default_cache
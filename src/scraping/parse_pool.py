@@ -0,0 +1,150 @@
+"""
+Optional process pool for CPU-bound article parsing.
+
+Building and cleaning the BeautifulSoup tree of an article page takes
+long enough to stall the event loop (and with it the bot's update
+handling) during a scrape. With PARSE_WORKERS > 0 article pages are
+handed to worker processes as raw bytes and come back as the parsed
+article dict. Pages smaller than PARSE_POOL_MIN_BYTES are parsed in
+process, where the round trip to a worker would cost more than it saves.
+"""
+
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Union
+
+from src.scraping.parser_backend import get_parser_backend
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Pages below this size are parsed in process
+DEFAULT_MIN_POOL_BYTES = 32 * 1024
+
+
+@lru_cache(maxsize=None)
+def _worker_parser(base_url: str, article_selectors: Tuple[str, ...], streaming: bool, backend: str):
+    """ReviewParser of a worker process, created once per parser configuration"""
+    from src.scraping.review_parser import ReviewParser
+    parser = ReviewParser(base_url, list(article_selectors), streaming=streaming)
+    parser.backend = backend
+    return parser
+
+
+def _parser_config(parser) -> Tuple[str, Tuple[str, ...], bool, str]:
+    """Everything a worker needs to build a parser equivalent to the caller's"""
+    backend = parser.backend or get_parser_backend()
+    return parser.base_url, tuple(parser.link_selectors), parser.streaming, backend
+
+
+def _parse_in_worker(
+    config: Tuple[str, Tuple[str, ...], bool, str], html: bytes, url: str, encoding: Optional[str]
+) -> Dict[str, Any]:
+    """Entry point executed in the worker process"""
+    return _worker_parser(*config).parse_content_page(html, url, encoding)
+
+
+class ParsePool:
+    """
+    Parses article pages in worker processes without blocking the event loop.
+
+    Usage:
+        pool = ParsePool(workers=2)
+        content_data = await pool.parse(parser, page.body, url, page.encoding)
+    """
+
+    def __init__(self, workers: int, min_pool_bytes: int = DEFAULT_MIN_POOL_BYTES):
+        """
+        Args:
+            workers: Number of worker processes
+            min_pool_bytes: Pages smaller than this are parsed in process
+        """
+        self.workers = workers
+        self.min_pool_bytes = min_pool_bytes
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self.pooled = 0
+        self.in_process = 0
+        logger.info(f"ParsePool configured with {workers} workers (min {min_pool_bytes} bytes)")
+
+    @classmethod
+    def from_env(cls) -> Optional['ParsePool']:
+        """Create a pool from PARSE_WORKERS / PARSE_POOL_MIN_BYTES, or None if PARSE_WORKERS is 0 or unset"""
+        workers = int(os.getenv('PARSE_WORKERS', 0))
+        if workers <= 0:
+            return None
+        return cls(workers, int(os.getenv('PARSE_POOL_MIN_BYTES', DEFAULT_MIN_POOL_BYTES)))
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Start the worker processes on first use"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    async def parse(
+        self,
+        parser,
+        html: Union[str, bytes],
+        url: str,
+        encoding: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Parse an article page, in a worker process if it is large enough.
+
+        Args:
+            parser: ReviewParser used for in-process parsing; workers build one with the same
+                base URL, article selectors, streaming setting and backend
+            html: Article HTML (raw bytes are sent to the workers as is)
+            url: Article URL
+            encoding: Charset of raw bytes, if known
+
+        Returns:
+            Parsed article data, as returned by ReviewParser.parse_content_page
+        """
+        if len(html) < self.min_pool_bytes:
+            self.in_process += 1
+            return parser.parse_content_page(html, url, encoding)
+
+        if isinstance(html, str):
+            html, encoding = html.encode('utf-8'), 'utf-8'
+        loop = asyncio.get_running_loop()
+        try:
+            result = await loop.run_in_executor(
+                self._get_executor(), _parse_in_worker, _parser_config(parser), html, url, encoding
+            )
+        except BrokenProcessPool:
+            logger.warning(f"Parse worker died, parsing {url} in process and restarting the pool")
+            self.shutdown()
+            self.in_process += 1
+            return parser.parse_content_page(html, url, encoding)
+        self.pooled += 1
+        return result
+
+    def shutdown(self) -> None:
+        """Stop the worker processes (they are started again on next use)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def get_stats(self) -> Dict[str, int]:
+        """Number of pages parsed in worker processes and in process"""
+        return {'workers': self.workers, 'pooled': self.pooled, 'in_process': self.in_process}
+
+
+_default_pool: Optional[ParsePool] = None
+_default_pool_loaded = False
+
+
+def get_parse_pool() -> Optional[ParsePool]:
+    """
+    Get the process-wide parse pool configured from the environment.
+    All scrapers share its worker processes.
+    Returns None when process-pool parsing is disabled.
+    """
+    global _default_pool, _default_pool_loaded
+    if not _default_pool_loaded:
+        _default_pool = ParsePool.from_env()
+        _default_pool_loaded = True
+    return _default_pool
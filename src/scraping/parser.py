@@ -1,14 +1,28 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
-from bs4 import BeautifulSoup
+from typing import List, Optional, Dict, Any, Union
+from bs4 import BeautifulSoup, SoupStrainer
+from src.scraping.parser_backend import make_soup
 
 class Parser(ABC):
     """Base parser contract - minimal required interface"""
     
+    # Tree builder for this parser; None uses HTML_PARSER_BACKEND
+    backend: Optional[str] = None
+    
     # Optional: methods that might have default implementations
-    def create_soup(self, html: str) -> BeautifulSoup:
-        """Create BeautifulSoup object - standard implementation"""
-        return BeautifulSoup(html, 'html.parser')
+    def create_soup(
+        self,
+        html: Union[str, bytes],
+        encoding: Optional[str] = None,
+        parse_only: Optional[SoupStrainer] = None,
+    ) -> BeautifulSoup:
+        """Create BeautifulSoup object - standard implementation
+        
+        Raw bytes are decoded by BeautifulSoup itself, using the encoding
+        detected by the fetcher when given. With parse_only, only the
+        matching subtrees are built.
+        """
+        return make_soup(html, encoding, self.backend, parse_only)
     
     def normalize_url(self, url: str, base_url: str) -> str:
         """Normalize relative URLs to absolute"""
@@ -0,0 +1,102 @@
+"""
+Configurable BeautifulSoup tree builder shared by all parsers.
+
+The backend is chosen with HTML_PARSER_BACKEND (lxml, html5lib or
+html.parser, the default). A backend that is not installed falls back to
+html.parser with a warning, so the setting is safe to use everywhere.
+
+lxml and html5lib wrap markup in <html>/<body>; make_fragment_soup
+removes that wrapper again so HTML fragments (cleaned article content,
+Telegraph chunks) keep the same structure with every backend.
+"""
+
+import os
+from functools import lru_cache
+from typing import Optional, Union
+
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer
+from bs4.builder import builder_registry
+
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+PARSER_BACKENDS = ('lxml', 'html5lib', 'html.parser')
+DEFAULT_PARSER_BACKEND = 'html.parser'
+
+
+@lru_cache(maxsize=None)
+def resolve_parser_backend(name: str) -> str:
+    """
+    Validate a backend name and check that it is installed.
+
+    Args:
+        name: One of PARSER_BACKENDS
+
+    Returns:
+        The backend to use (DEFAULT_PARSER_BACKEND if the requested one is not installed)
+    """
+    if name not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown HTML parser backend: {name} (expected one of {', '.join(PARSER_BACKENDS)})")
+    if builder_registry.lookup(name) is None:
+        logger.warning(f"HTML parser backend '{name}' is not installed, using {DEFAULT_PARSER_BACKEND}")
+        return DEFAULT_PARSER_BACKEND
+    return name
+
+
+def get_parser_backend() -> str:
+    """Backend from HTML_PARSER_BACKEND env var or DEFAULT_PARSER_BACKEND"""
+    return resolve_parser_backend(os.getenv('HTML_PARSER_BACKEND', DEFAULT_PARSER_BACKEND))
+
+
+def make_soup(
+    markup: Union[str, bytes],
+    encoding: Optional[str] = None,
+    backend: Optional[str] = None,
+    parse_only: Optional[SoupStrainer] = None,
+) -> BeautifulSoup:
+    """
+    Parse a full HTML document.
+
+    Args:
+        markup: HTML text or raw bytes
+        encoding: Charset of raw bytes, if known
+        backend: Parser backend (defaults to the configured one)
+        parse_only: Only build the subtrees matched by this strainer
+    """
+    backend = resolve_parser_backend(backend) if backend else get_parser_backend()
+    if isinstance(markup, bytes):
+        return BeautifulSoup(markup, backend, from_encoding=encoding, parse_only=parse_only)
+    return BeautifulSoup(markup, backend, parse_only=parse_only)
+
+
+def make_fragment_soup(markup: str, backend: Optional[str] = None) -> BeautifulSoup:
+    """
+    Parse an HTML fragment so that the soup's children are the fragment's top-level nodes.
+
+    Args:
+        markup: HTML fragment
+        backend: Parser backend (defaults to the configured one)
+    """
+    soup = make_soup(markup, backend=backend)
+    if soup.html is None or '<html' in markup[:1024].lower():
+        return soup
+    
+    for wrapper in ('head', 'body', 'html'):
+        tag = soup.find(wrapper)
+        if tag is not None:
+            tag.unwrap()
+    # lxml drops whitespace in front of the first tag, which matters when a
+    # fragment is appended to existing text (e.g. ' <em>...</em>'); restore it
+    # collapsed the way BeautifulSoup collapses whitespace-only strings
+    stripped = markup.lstrip()
+    leading = markup[:len(markup) - len(stripped)]
+    first = soup.contents[0] if soup.contents else None
+    if not leading or (isinstance(first, NavigableString) and first.startswith(leading)):
+        return soup
+    if stripped.startswith('<'):
+        if not (isinstance(first, NavigableString) and first.isspace()):
+            soup.insert(0, NavigableString('\n' if '\n' in leading else ' '))
+    elif isinstance(first, NavigableString):
+        first.replace_with(leading + first.lstrip())
+    return soup
@@ -0,0 +1,266 @@
+"""
+Persistent on-disk HTTP response cache for the fetch layer.
+
+Responses are stored in a SQLite file keyed by URL together with their
+ETag/Last-Modified validators. Fresh entries are served without touching
+the network; stale entries are revalidated with a conditional GET and a
+304 answer is served from disk. The cache is bounded in size and evicts
+the least recently used entries first.
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Mapping, Optional
+
+from src.scraping.constants import ARTICLE_URL_PATTERN
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Default cache size limit (bytes of stored bodies)
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+
+# Archive and issue listing pages change when a new issue is published
+DEFAULT_ARCHIVE_TTL = 60 * 60
+
+# Article pages are effectively immutable once published
+DEFAULT_ARTICLE_TTL = 30 * 24 * 60 * 60
+
+
+@dataclass
+class CachedResponse:
+    """A response body stored in the cache along with its validators"""
+    url: str
+    body: bytes
+    encoding: Optional[str]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+
+    @property
+    def text(self) -> str:
+        """Body decoded with the encoding reported by the origin"""
+        return self.body.decode(self.encoding or 'utf-8', errors='replace')
+
+
+class ResponseCache:
+    """
+    SQLite-backed response cache with conditional revalidation.
+
+    Usage:
+        cache = ResponseCache("cache/http.sqlite")
+        entry = cache.get(url)
+        if entry and cache.is_fresh(entry):
+            ...  # serve entry.text
+        headers = cache.conditional_headers(entry)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        archive_ttl: float = DEFAULT_ARCHIVE_TTL,
+        article_ttl: float = DEFAULT_ARTICLE_TTL,
+    ):
+        """
+        Args:
+            path: Path of the SQLite cache file (':memory:' for a throwaway cache)
+            max_bytes: Maximum total size of stored bodies before LRU eviction
+            archive_ttl: Seconds an archive/listing page is served without revalidation
+            article_ttl: Seconds an article page is served without revalidation
+        """
+        logger.info(f"Initializing ResponseCache at: {path}")
+        self.path = path
+        self.max_bytes = max_bytes
+        self.archive_ttl = archive_ttl
+        self.article_ttl = article_ttl
+        self._article_pattern = re.compile(ARTICLE_URL_PATTERN)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+        if path != ':memory:' and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                body BLOB NOT NULL,
+                encoding TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                stored_at REAL NOT NULL,
+                last_accessed REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_responses_last_accessed ON responses (last_accessed)"
+        )
+        self._conn.commit()
+        logger.debug(f"ResponseCache ready: max {max_bytes} bytes, TTL archive={archive_ttl}s, article={article_ttl}s")
+
+    @classmethod
+    def from_env(cls) -> Optional['ResponseCache']:
+        """
+        Create a cache configured from environment variables.
+        Returns None when HTTP_CACHE_PATH is not set (caching disabled).
+        """
+        path = os.getenv('HTTP_CACHE_PATH', '')
+        if not path:
+            logger.debug("HTTP_CACHE_PATH not set, response caching disabled")
+            return None
+        return cls(
+            path,
+            max_bytes=int(os.getenv('HTTP_CACHE_MAX_BYTES', DEFAULT_MAX_BYTES)),
+            archive_ttl=float(os.getenv('HTTP_CACHE_ARCHIVE_TTL', DEFAULT_ARCHIVE_TTL)),
+            article_ttl=float(os.getenv('HTTP_CACHE_ARTICLE_TTL', DEFAULT_ARTICLE_TTL)),
+        )
+
+    def ttl_for(self, url: str) -> float:
+        """Time-to-live for a URL depending on its class (article vs archive page)"""
+        if self._article_pattern.search(url):
+            return self.article_ttl
+        return self.archive_ttl
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Get the cached response for a URL (fresh or stale), or None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, encoding, etag, last_modified, stored_at FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE responses SET last_accessed = ? WHERE url = ?", (time.time(), url)
+            )
+            self._conn.commit()
+        body, encoding, etag, last_modified, stored_at = row
+        return CachedResponse(url, body, encoding, etag, last_modified, stored_at)
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        """Check whether an entry can be served without revalidation"""
+        return time.time() - entry.stored_at < self.ttl_for(entry.url)
+
+    def conditional_headers(self, entry: Optional[CachedResponse]) -> Dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers for revalidating an entry"""
+        headers = {}
+        if entry is None:
+            return headers
+        if entry.etag:
+            headers['If-None-Match'] = entry.etag
+        if entry.last_modified:
+            headers['If-Modified-Since'] = entry.last_modified
+        return headers
+
+    def store(self, url: str, body: bytes, encoding: Optional[str], headers: Mapping[str, str]) -> None:
+        """Store a fresh 200 response and evict old entries if over the size limit"""
+        size = len(body)
+        if size > self.max_bytes:
+            logger.debug(f"Response for {url} ({size} bytes) exceeds cache size, not cached")
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO responses
+                    (url, body, encoding, etag, last_modified, stored_at, last_accessed, size)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (url, body, encoding, headers.get('ETag'), headers.get('Last-Modified'), now, now, size),
+            )
+            self._conn.commit()
+            self._evict()
+        logger.debug(f"Cached response for {url}: {size} bytes")
+
+    def refresh(self, url: str, headers: Mapping[str, str]) -> None:
+        """Mark an entry as fresh again after a 304 Not Modified answer"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                """
+                UPDATE responses
+                SET stored_at = ?, last_accessed = ?,
+                    etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified)
+                WHERE url = ?
+                """,
+                (now, now, headers.get('ETag'), headers.get('Last-Modified'), url),
+            )
+            self._conn.commit()
+        logger.debug(f"Revalidated cached response for {url}")
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until the cache fits max_bytes"""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        evicted = 0
+        for url, size in self._conn.execute(
+            "SELECT url, size FROM responses ORDER BY last_accessed ASC"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+            total -= size
+            evicted += 1
+        self._conn.commit()
+        logger.debug(f"Evicted {evicted} cached response(s), cache size now {total} bytes")
+
+    def record_hit(self) -> None:
+        self.hits += 1
+
+    def record_revalidation(self) -> None:
+        self.revalidated += 1
+
+    def record_miss(self) -> None:
+        self.misses += 1
+
+    def get_stats(self) -> Dict[str, int]:
+        """Hit/miss counters for monitoring"""
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return {
+            'hits': self.hits,
+            'revalidated': self.revalidated,
+            'misses': self.misses,
+            'entries': entries,
+            'size_bytes': size,
+        }
+
+    def clear(self) -> None:
+        """Remove all cached responses"""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+        logger.info("Response cache cleared")
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection"""
+        self._conn.close()
+
+
+_default_cache: Optional[ResponseCache] = None
+_default_cache_loaded: bool = False
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    Get the process-wide response cache configured from the environment.
+    All scrapers share it so hit/miss counters cover the whole run.
+    Returns None when caching is disabled.
+    """
+    global _default_cache, _default_cache_loaded
+    if not _default_cache_loaded:
+        _default_cache = ResponseCache.from_env()
+        _default_cache_loaded = True
+    return _default_cache
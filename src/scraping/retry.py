@@ -0,0 +1,294 @@
+"""
+Retry engine and per-host circuit breaker for the fetch layer.
+
+Failed requests are classified (timeout, connection, server error,
+throttled); each class has its own RetryPolicy with jittered exponential
+backoff. Errors that retrying cannot fix (4xx, invalid URLs) are raised
+immediately. A circuit breaker per host stops sending requests to a host
+that keeps failing and lets a single half-open probe through after a
+cool-down, so a dead host fails fast instead of timing out URL by URL.
+"""
+
+import asyncio
+import os
+import random
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+from urllib.parse import urlparse
+
+import aiohttp
+import requests
+
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Consecutive failures that open a host's circuit
+DEFAULT_FAILURE_THRESHOLD = 5
+
+# Seconds an open circuit waits before letting a half-open probe through
+DEFAULT_RESET_TIMEOUT = 30.0
+
+
+@dataclass
+class RetryPolicy:
+    """How often and how patiently a class of errors is retried"""
+    max_attempts: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+
+    def backoff(self, attempt: int, rng: random.Random = random) -> float:
+        """
+        Delay before the next attempt using exponential backoff with full jitter.
+
+        Args:
+            attempt: Number of the attempt that just failed (1-based)
+        """
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return rng.uniform(0, ceiling)
+
+
+# Retry policy per error class
+DEFAULT_RETRY_POLICIES: Dict[str, RetryPolicy] = {
+    'timeout': RetryPolicy(max_attempts=3, base_delay=1.0, max_delay=10.0),
+    'connection': RetryPolicy(max_attempts=3, base_delay=1.0, max_delay=10.0),
+    'server_error': RetryPolicy(max_attempts=3, base_delay=2.0, max_delay=30.0),
+    'throttled': RetryPolicy(max_attempts=2, base_delay=5.0, max_delay=60.0),
+}
+
+# Error classes that indicate the host itself is unhealthy
+HOST_FAILURE_CLASSES = {'timeout', 'connection', 'server_error'}
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request to a host whose circuit is open"""
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for a single host.
+
+    closed    -> requests flow; consecutive failures are counted
+    open      -> requests fail fast until reset_timeout has passed
+    half_open -> one probe request is let through; success closes the
+                 circuit, failure opens it again
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+        self.times_opened = 0
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent now"""
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN:
+            if self.clock() - self.opened_at < self.reset_timeout:
+                return False
+            self.state = self.HALF_OPEN
+            self.probe_in_flight = False
+        # Half-open: only a single probe at a time
+        if self.probe_in_flight:
+            return False
+        self.probe_in_flight = True
+        return True
+
+    def record_success(self) -> None:
+        self.state = self.CLOSED
+        self.failures = 0
+        self.probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """Free the half-open probe slot without judging the host (the request was abandoned)"""
+        self.probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self.probe_in_flight = False
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.times_opened += 1
+            self.state = self.OPEN
+            self.opened_at = self.clock()
+
+
+class RetryEngine:
+    """
+    Decides whether and when a failed request is retried, and tracks
+    host health with one circuit breaker per host.
+
+    Usage:
+        engine.before_request(url)          # raises CircuitOpenError when the host is down
+        try:
+            ...                             # send the request
+            engine.record_success(url)
+        except Exception as e:
+            engine.record_failure(url, e)
+            delay = engine.next_delay(e, attempt)
+            if delay is None:
+                raise
+            sleep(delay)
+        except BaseException:
+            engine.release(url)             # cancelled: never leave a probe in flight
+            raise
+    """
+
+    def __init__(
+        self,
+        policies: Optional[Dict[str, RetryPolicy]] = None,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+        rng: random.Random = random,
+    ):
+        """
+        Args:
+            policies: Retry policy per error class (defaults to DEFAULT_RETRY_POLICIES)
+            failure_threshold: Consecutive host failures that open its circuit
+            reset_timeout: Seconds before an open circuit lets a probe through
+            clock: Monotonic time source (injectable for tests)
+            rng: Random source for jitter (injectable for tests)
+        """
+        self.policies = {**DEFAULT_RETRY_POLICIES, **(policies or {})}
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.rng = rng
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self.attempts = 0
+        self.successes = 0
+        self.short_circuited = 0
+        self.retries: Dict[str, int] = {}
+        self.giveups: Dict[str, int] = {}
+        logger.info(f"RetryEngine initialized: breaker threshold={failure_threshold}, reset={reset_timeout}s")
+
+    @classmethod
+    def from_env(cls) -> 'RetryEngine':
+        """Create an engine configured from environment variables"""
+        attempts = os.getenv('FETCH_RETRY_ATTEMPTS')
+        policies = None
+        if attempts:
+            policies = {
+                name: RetryPolicy(int(attempts), policy.base_delay, policy.max_delay)
+                for name, policy in DEFAULT_RETRY_POLICIES.items()
+            }
+        return cls(
+            policies=policies,
+            failure_threshold=int(os.getenv('FETCH_BREAKER_THRESHOLD', DEFAULT_FAILURE_THRESHOLD)),
+            reset_timeout=float(os.getenv('FETCH_BREAKER_RESET', DEFAULT_RESET_TIMEOUT)),
+        )
+
+    @staticmethod
+    def classify(error: Exception) -> Optional[str]:
+        """Map an exception to a retryable error class, or None if retrying cannot help"""
+        if isinstance(error, (requests.exceptions.Timeout, asyncio.TimeoutError)):
+            return 'timeout'
+        if isinstance(error, (requests.exceptions.ConnectionError, aiohttp.ClientConnectionError)):
+            return 'connection'
+
+        status = None
+        if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+            status = error.response.status_code
+        elif isinstance(error, aiohttp.ClientResponseError):
+            status = error.status
+        if status == 429:
+            return 'throttled'
+        if status is not None and status >= 500:
+            return 'server_error'
+        return None
+
+    def get_breaker(self, url: str) -> CircuitBreaker:
+        host = urlparse(url).netloc
+        if host not in self._breakers:
+            self._breakers[host] = CircuitBreaker(self.failure_threshold, self.reset_timeout, self.clock)
+        return self._breakers[host]
+
+    def before_request(self, url: str) -> None:
+        """Count the attempt, or raise CircuitOpenError if the host's circuit is open"""
+        if not self.get_breaker(url).allow_request():
+            self.short_circuited += 1
+            raise CircuitOpenError(f"Circuit open for host {urlparse(url).netloc}, not fetching: {url}")
+        self.attempts += 1
+
+    def record_success(self, url: str) -> None:
+        self.successes += 1
+        self.get_breaker(url).record_success()
+
+    def record_failure(self, url: str, error: Exception) -> None:
+        """Register a failed attempt; only host-level failures count against the breaker"""
+        breaker = self.get_breaker(url)
+        if self.classify(error) in HOST_FAILURE_CLASSES:
+            was_open = breaker.state == CircuitBreaker.OPEN
+            breaker.record_failure()
+            if breaker.state == CircuitBreaker.OPEN and not was_open:
+                logger.warning(f"Circuit opened for host {urlparse(url).netloc} after {breaker.failures} failure(s)")
+        else:
+            # The host answered, it is alive even if the request was bad
+            breaker.record_success()
+
+    def release(self, url: str) -> None:
+        """Settle an attempt abandoned before the host answered (e.g. cancelled), so a half-open probe is not left in flight"""
+        self.get_breaker(url).release_probe()
+
+    def next_delay(self, error: Exception, attempt: int) -> Optional[float]:
+        """
+        Delay before retrying after the given failed attempt.
+
+        Returns:
+            Seconds to wait, or None if the error must be raised
+        """
+        error_class = self.classify(error)
+        policy = self.policies.get(error_class) if error_class else None
+        if policy is None:
+            return None
+        if attempt >= policy.max_attempts:
+            self.giveups[error_class] = self.giveups.get(error_class, 0) + 1
+            return None
+        self.retries[error_class] = self.retries.get(error_class, 0) + 1
+        delay = policy.backoff(attempt, self.rng)
+        logger.info(f"Retrying after {error_class} error (attempt {attempt}/{policy.max_attempts}) in {delay:.2f}s")
+        return delay
+
+    def get_metrics(self) -> Dict[str, object]:
+        """Retry and circuit breaker metrics for monitoring"""
+        return {
+            'attempts': self.attempts,
+            'successes': self.successes,
+            'retries': dict(self.retries),
+            'giveups': dict(self.giveups),
+            'short_circuited': self.short_circuited,
+            'breakers': {
+                host: {'state': breaker.state, 'failures': breaker.failures, 'times_opened': breaker.times_opened}
+                for host, breaker in self._breakers.items()
+            },
+        }
+
+
+_default_engine: Optional[RetryEngine] = None
+
+
+def get_retry_engine() -> RetryEngine:
+    """
+    Get the process-wide retry engine.
+    All fetchers share it so a host's circuit state is known to every scraper.
+    """
+    global _default_engine
+    if _default_engine is None:
+        _default_engine = RetryEngine.from_env()
+    return _default_engine
@@ -0,0 +1,55 @@
+"""
+Parsed index page of a single review issue.
+
+The issue page carries both the review ID and the list of article links,
+so it is fetched and parsed exactly once per issue and everything the
+scrapers need is read from that single tree.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Union
+
+from src.scraping.review_parser import ReviewParser
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class ReviewIndexPage:
+    """Review ID, article URLs and issue metadata extracted from one issue page"""
+    url: str
+    review_id: int
+    article_urls: List[str]
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_html(
+        cls,
+        html: Union[str, bytes],
+        url: str,
+        parser: ReviewParser,
+        encoding: Optional[str] = None,
+    ) -> 'ReviewIndexPage':
+        """
+        Build the index page model from raw HTML with a single parse.
+
+        Args:
+            html: HTML of the issue page, as text or raw bytes
+            url: URL the page was fetched from
+            parser: ReviewParser providing the extraction rules
+            encoding: Charset of raw bytes, if known
+
+        Returns:
+            ReviewIndexPage for the issue
+        """
+        logger.debug(f"Parsing review index page: {url} ({len(html)} characters/bytes)")
+        soup = parser.create_soup(html, encoding)
+        page = cls(
+            url=url,
+            review_id=parser.extract_review_id_from_soup(soup),
+            article_urls=parser.extract_listing_urls(soup),
+            metadata=parser.extract_issue_metadata(soup),
+        )
+        logger.info(f"Parsed review index page: review {page.review_id}, {len(page.article_urls)} article URLs")
+        return page
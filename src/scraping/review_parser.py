@@ -1,10 +1,14 @@
-from typing import List, Dict, Any
+import re
+from typing import List, Dict, Any, Optional, Union
 from datetime import date
 from bs4 import BeautifulSoup
 from src.scraping.listing_parser import ListingParser
 from src.scraping.content_parser import ContentParser
+from src.scraping.content_cleaner import ContentCleaner
+from src.scraping.parser_backend import get_parser_backend, resolve_parser_backend
+from src.scraping.streaming_extractor import LayoutMismatch, StreamingArticleExtractor
+from src.scraping.telegraph_nodes import Node, compile_nodes
 
-from .constants import ALLOWED_TAGS, IRRELEVANT_INFO_TAGS
 from src.logging_config import get_logger
 import requests
 
@@ -12,7 +16,14 @@ logger = get_logger(__name__)
 
 
 class ReviewParser(ListingParser, ContentParser):
-    def __init__(self, base_url: str, article_selectors: List[str] = None):
+    def __init__(self, base_url: str, article_selectors: List[str] = None, streaming: bool = True):
+        """
+        Args:
+            base_url: URL of the review issue page
+            article_selectors: CSS selectors of article links on the issue page
+            streaming: Extract articles in one pass without building the page tree
+                (html.parser backend only; other layouts fall back to BeautifulSoup)
+        """
         logger.info(f"Initializing ReviewParser for: {base_url}")
         
         # Default selectors for article links
@@ -24,38 +35,84 @@ class ReviewParser(ListingParser, ContentParser):
         if article_selectors is None:
             selectors = default_selectors
         ListingParser.__init__(self, base_url=base_url, link_selectors=selectors)
+        self.content_cleaner = ContentCleaner()
+        self.streaming = streaming
+        self.streaming_extractor = StreamingArticleExtractor()
         logger.debug("ReviewParser initialized")
         
     
-    def parse_content_page(self, html: str, url: str) -> Dict[str, Any]:
-        """Parse single article HTML to extract structured data"""
+    def parse_content_page(self, html: Union[str, bytes], url: str, encoding: Optional[str] = None) -> Dict[str, Any]:
+        """Parse single article HTML (text or raw bytes) to extract structured data"""
         logger.debug(f"Parsing content page: {url}")
-        logger.debug(f"HTML length: {len(html)} characters")
+        logger.debug(f"HTML length: {len(html)} {'bytes' if isinstance(html, bytes) else 'characters'}")
         
-        soup = self.create_soup(html)
+        if self.use_streaming():
+            try:
+                return self.parse_content_page_streaming(html, url, encoding)
+            except LayoutMismatch as e:
+                logger.debug(f"Streaming extraction not possible for {url}: {e}")
+        
+        soup = self.create_soup(html, encoding)
         logger.debug("BeautifulSoup object created for content page")
         
         logger.debug("Extracting title")
         title = self.extract_title(soup)
         logger.debug(f"Title extracted: '{title}'")
         
+        # Metadata is read before the content, whose cleaning modifies the soup
+        logger.debug("Extracting metadata")
+        metadata = self.extract_metadata(soup, url)
+        logger.debug(f"Metadata extracted: {list(metadata.keys())}")
+        
         logger.debug("Extracting content")
         content = self.extract_content(soup)
         logger.debug(f"Content extracted: {len(content)} characters")
         
-        logger.debug("Extracting metadata")
-        metadata = self.extract_metadata(soup, url)
-        logger.debug(f"Metadata extracted: {list(metadata.keys())}")
+        # The cleaned tree is compiled to Telegraph nodes while it is still in memory
+        content_nodes = self.extract_content_nodes(soup) if content else []
+        logger.debug(f"Content compiled to {len(content_nodes)} Telegraph nodes")
         
         result = {
             'title': title,
             'content': content,
+            'content_nodes': content_nodes,
             'original_url': url,
             **metadata
         }
         logger.info(f"Successfully parsed content page: '{title}' ({len(content)} chars)")
         return result
         
+    def use_streaming(self) -> bool:
+        """Whether articles go through the streaming extractor (it reproduces html.parser trees only)"""
+        if not self.streaming:
+            return False
+        backend = resolve_parser_backend(self.backend) if self.backend else get_parser_backend()
+        return backend == 'html.parser'
+    
+    def parse_content_page_streaming(self, html: Union[str, bytes], url: str, encoding: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Parse an article in one forward pass, without building the page tree.
+        
+        Produces the same result as the BeautifulSoup path of parse_content_page.
+        
+        Raises:
+            LayoutMismatch: If the page is not a .bpf-content article
+        """
+        fields = self.streaming_extractor.extract(html, encoding)
+        title = self.clean_text(fields['title']) if fields['title'] is not None else "Untitled"
+        content = fields['content']
+        
+        result = {
+            'title': title,
+            'content': content,
+            'content_nodes': fields['content_nodes'],
+            'original_url': url,
+            'authors': self._parse_authors(fields['byline']),
+            'publication_date': self._parse_date(url, fields['date_line']),
+        }
+        logger.info(f"Successfully parsed content page (streaming): '{title}' ({len(content)} chars)")
+        return result
+    
     def extract_metadata(self, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
         """Extract metadata from Platypus article"""
         return {
@@ -66,20 +123,21 @@ class ReviewParser(ListingParser, ContentParser):
         
     def extract_review_id(self, html: str) -> int:
         """Extract review ID from HTML span or URL"""
+        return self.extract_review_id_from_soup(self.create_soup(html))
+    
+    def extract_review_id_from_soup(self, soup: BeautifulSoup) -> int:
+        """Extract review ID from an already parsed issue page (span or URL)"""
         
         # Method 1: Try HTML span first
-        soup = self.create_soup(html)
         span = soup.select_one('span.selected')
         if span:
             text = span.get_text(strip=True)
-            import re
             match = re.search(r'Issue #(\d+)', text)
             if match:
                 return int(match.group(1))
         
         # Method 2: Fallback to base_url if it contains the pattern
         if hasattr(self, 'base_url') and self.base_url:
-            import re
             match = re.search(r'/issue-(\d+)/?', self.base_url)
             if match:
                 return int(match.group(1))
@@ -87,6 +145,15 @@ class ReviewParser(ListingParser, ContentParser):
         # Final fallback
         return hash(self.base_url) % 1000000
     
+    def extract_issue_metadata(self, soup: BeautifulSoup) -> Dict[str, Any]:
+        """Extract descriptive metadata of a review issue from its index page"""
+        span = soup.select_one('span.selected')
+        title_tag = soup.find('title')
+        return {
+            'issue_label': self.clean_text(span.get_text()) if span else None,
+            'page_title': self.clean_text(title_tag.get_text()) if title_tag else None,
+        }
+    
 
     def extract_title(self, soup: BeautifulSoup) -> str:
         """Extract title from Platypus article"""
@@ -103,66 +170,39 @@ class ReviewParser(ListingParser, ContentParser):
     
     def extract_content(self, soup: BeautifulSoup) -> str:
         """Extract main content from Platypus article"""
+        return self.clean_content_for_publishing(self._find_content_container(soup))
+    
+    def extract_content_nodes(self, soup: BeautifulSoup) -> List[Node]:
+        """Compile the content cleaned by extract_content into Telegraph nodes"""
+        return compile_nodes(self._find_content_container(soup))
+    
+    def _find_content_container(self, soup: BeautifulSoup):
+        """Main content element of a Platypus article, or the whole page if it has none"""
         MAIN_CONTENT_TAG_CLASS = 'bpf-content'
         
         content_div = soup.find('div', class_= MAIN_CONTENT_TAG_CLASS)
         if not content_div:
             content_div = soup
-        
-        return self.clean_content_for_publishing(content_div)
+        return content_div
     
     def clean_content_for_publishing(self, content_div) -> str:
-        """Clean HTML content for Telegraph compatibility"""
-        content_copy = BeautifulSoup(str(content_div), 'html.parser')
+        """Clean HTML content for Telegraph compatibility
         
-        # Apply cleaning operations
-        self._remove_unwanted_elements(content_copy)
-        self._clean_disallowed_tags(content_copy)
-        self._wrap_orphaned_inline_elements(content_copy)
-        
-        return ''.join(str(child) for child in content_copy.contents)
-    
-    def _remove_unwanted_elements(self, soup: BeautifulSoup) -> None:
-        """Remove unwanted elements from the soup"""
-        for unwanted in soup.select(IRRELEVANT_INFO_TAGS):
-            unwanted.decompose()
-    
-    def _clean_disallowed_tags(self, soup: BeautifulSoup) -> None:
-        """Remove disallowed tags while preserving their content"""
-        for tag in soup.find_all():
-            if tag.name not in ALLOWED_TAGS:
-                tag.unwrap()
-                
-    def _wrap_orphaned_inline_elements(self, soup: BeautifulSoup) -> None:
-        """Wrap orphaned inline elements in paragraph tags"""
-        inline_tags = {'strong', 'b', 'i', 'em', 'u', 's', 'a', 'code'}
-        
-        # Find direct children of the soup that are inline elements
-        for element in list(soup.children):
-            if (hasattr(element, 'name') and 
-                element.name in inline_tags and 
-                element.parent == soup):
-                
-                # Check if there's already a paragraph wrapper
-                prev_sibling = element.previous_sibling
-                if (prev_sibling and hasattr(prev_sibling, 'name') and 
-                    prev_sibling.name == 'p'):
-                    # Move this element into the previous paragraph
-                    prev_sibling.append(element)
-                else:
-                    # Create a new paragraph wrapper
-                    new_p = soup.new_tag('p')
-                    element.insert_before(new_p)
-                    new_p.append(element)
+        The content subtree is cleaned in place in a single pass, so the
+        soup it belongs to is modified.
+        """
+        return self.content_cleaner.clean(content_div)
 
     
     def _extract_authors(self, soup: BeautifulSoup) -> List[str]:
         """Extract authors from article"""
-        authors = []
         byline = soup.select_one('.bpf-content h2')
-        if byline:
-            text = byline.get_text(strip=True)  # Keep original case
-            
+        return self._parse_authors(byline.get_text(strip=True) if byline else None)
+    
+    def _parse_authors(self, text: Optional[str]) -> List[str]:
+        """Split the byline text of an article into author names"""
+        authors = []
+        if text:
             # Check if it contains "by" prefix
             if 'by ' in text.lower():
                 # Extract part after "by"
@@ -190,8 +230,23 @@ class ReviewParser(ListingParser, ContentParser):
         Raises:
             ValueError: If publication date cannot be extracted
         """
-        import re
+        container = soup.select_one('.bpf-content .has-text-align-right')
+        return self._parse_date(url, container.get_text(strip=True) if container else None)
+    
+    def _parse_date(self, url: str, date_line: Optional[str]) -> date:
+        """
+        Publication date from the article URL, or else from its date line.
         
+        Args:
+            url: Article URL
+            date_line: Text of the date line (e.g. "Platypus Review 173 | February 2025"), if any
+            
+        Returns:
+            date object representing publication date
+            
+        Raises:
+            ValueError: If publication date cannot be extracted
+        """
         # Method 1: Extract from URL pattern (e.g., /2025/10/01/)
         if (url_match := re.search(r'/(\d{4})/(\d{2})/(\d{2})/', url)):
             year, month, day = map(int, url_match.groups())
@@ -201,26 +256,24 @@ class ReviewParser(ListingParser, ContentParser):
                 logger.warning(f"Invalid date from URL: {year}/{month}/{day}: {e}")
         
         # Method 2: Fallback to HTML pattern "| February 2025" or "| July–August 2025"
-        if (container := soup.select_one('.bpf-content .has-text-align-right')):
-            text = container.get_text(strip=True)
-            # Split on "|" and take the date part
-            if "|" in text:
-                date_part = text.split("|")[1].strip()
-                
-                # Parse month name and year (e.g., "February 2025" or "July–August 2025")
-                # Take first month if range, set day to 1
-                if (month_year_match := re.match(r'(\w+)(?:–\w+)?\s+(\d{4})', date_part)):
-                    month_name, year = month_year_match.groups()
-                    month_map = {
-                        'January': 1, 'February': 2, 'March': 3, 'April': 4,
-                        'May': 5, 'June': 6, 'July': 7, 'August': 8,
-                        'September': 9, 'October': 10, 'November': 11, 'December': 12
-                    }
-                    if (month_num := month_map.get(month_name)):
-                        try:
-                            return date(int(year), month_num, 1)
-                        except ValueError as e:
-                            logger.warning(f"Invalid date from HTML: {year}/{month_num}/1: {e}")
+        # Split on "|" and take the date part
+        if date_line and "|" in date_line:
+            date_part = date_line.split("|")[1].strip()
+            
+            # Parse month name and year (e.g., "February 2025" or "July–August 2025")
+            # Take first month if range, set day to 1
+            if (month_year_match := re.match(r'(\w+)(?:–\w+)?\s+(\d{4})', date_part)):
+                month_name, year = month_year_match.groups()
+                month_map = {
+                    'January': 1, 'February': 2, 'March': 3, 'April': 4,
+                    'May': 5, 'June': 6, 'July': 7, 'August': 8,
+                    'September': 9, 'October': 10, 'November': 11, 'December': 12
+                }
+                if (month_num := month_map.get(month_name)):
+                    try:
+                        return date(int(year), month_num, 1)
+                    except ValueError as e:
+                        logger.warning(f"Invalid date from HTML: {year}/{month_num}/1: {e}")
         
         # Final fallback: raise exception as publication_date is required
         error_msg = f"Could not extract publication date from URL: {url}"
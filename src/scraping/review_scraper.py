@@ -1,7 +1,17 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Union
 from .scraper import Scraper
 from .fetcher import Fetcher
+from .async_fetcher import AsyncFetcher
+from .fetched_page import FetchedPage
+from .fingerprint import fingerprint
+from .response_cache import get_response_cache
+from .host_scheduler import get_host_scheduler
+from .retry import get_retry_engine
+from .page_archive import get_page_archive
+from .parse_pool import ParsePool, get_parse_pool
+from .parse_cache import ParseCache, get_parse_cache
 from .review_parser import ReviewParser
+from .review_index_page import ReviewIndexPage
 from .constants import MIN_TITLE_LENGTH, MIN_CONTENT_LENGTH
 from src.logging_config import get_logger
 
@@ -17,24 +27,72 @@ class ReviewScraper(Scraper):
     def __init__(self, base_url: str):
         logger.info(f"Initializing ReviewScraper for: {base_url}")
         self.base_url: str = base_url
-        self.fetcher: Fetcher = Fetcher(base_url)
+        cache = get_response_cache()
+        retry_engine = get_retry_engine()
+        archive = get_page_archive()
+        scheduler = get_host_scheduler()
+        self.fetcher: Fetcher = Fetcher(
+            base_url, cache=cache, retry_engine=retry_engine, archive=archive, scheduler=scheduler
+        )
+        self.async_fetcher: AsyncFetcher = AsyncFetcher(
+            base_url, cache=cache, scheduler=scheduler, retry_engine=retry_engine, archive=archive
+        )
         self.parser: ReviewParser = ReviewParser(base_url)
+        self.parse_pool: Optional[ParsePool] = get_parse_pool()  # None: parse on the event loop thread
+        self.parse_cache: Optional[ParseCache] = get_parse_cache()  # None: always parse
+        self._index_page: Optional[ReviewIndexPage] = None  # Parsed issue page, fetched once
+        self.known_fingerprints: Dict[str, str] = {}  # original_url -> html_hash of published articles
+        self.unchanged_urls: List[str] = []  # Articles skipped because their HTML did not change
+        self.failed_urls: List[str] = []  # Articles of the last batch that could not be fetched or scraped
         logger.debug(f"ReviewScraper initialized with fetcher and parser")
         
 
     
+    def get_index_page(self) -> ReviewIndexPage:
+        """
+        Fetch and parse the review issue page.
+        The page is fetched and parsed only once per scraper; review ID,
+        article URLs and issue metadata are all read from that single tree.
+        """
+        if self._index_page is None:
+            logger.debug(f"Fetching review index page: {self.base_url}")
+            page = self.fetcher.fetch_raw()
+            logger.debug(f"Received HTML content: {len(page.body)} bytes")
+            self._index_page = ReviewIndexPage.from_html(page.body, self.base_url, self.parser, page.encoding)
+        return self._index_page
+    
+    def set_known_fingerprints(self, fingerprints: Dict[str, str]) -> None:
+        """
+        Register HTML fingerprints of articles published on earlier runs.
+        Articles whose fetched HTML still has the same fingerprint are not parsed again.
+        
+        Args:
+            fingerprints: Mapping original_url -> html_hash
+        """
+        logger.debug(f"Registered {len(fingerprints)} known article fingerprints")
+        self.known_fingerprints = dict(fingerprints)
+    
+    def is_unchanged(self, article_url: str, html_hash: str) -> bool:
+        """Check whether an article's HTML matches the fingerprint of its last run"""
+        if self.known_fingerprints.get(article_url) == html_hash:
+            logger.info(f"Article unchanged since last run, skipping: {article_url}")
+            self.unchanged_urls.append(article_url)
+            return True
+        return False
+    
+    def add_fingerprints(self, content_data: Dict[str, Any], html_hash: str) -> Dict[str, Any]:
+        """Attach the HTML and cleaned-content fingerprints to parsed article data"""
+        content_data['html_hash'] = html_hash
+        content_data['content_hash'] = fingerprint(content_data.get('content', ''))
+        return content_data
+    
     def get_listing_urls(self) -> List[str]:
         """
         Get all article URLs from the review listing page.
         """
-        logger.info(f"Fetching listing URLs from: {self.base_url}")
+        logger.info(f"Getting listing URLs from: {self.base_url}")
         try:
-            logger.debug("Fetching HTML from listing page")
-            html = self.fetcher.fetch_page()
-            logger.debug(f"Received HTML content: {len(html)} characters")
-            
-            logger.debug("Parsing listing page for article URLs")
-            urls = self.parser.parse_listing_page(html)
+            urls = list(self.get_index_page().article_urls)
             logger.info(f"Found {len(urls)} article URLs on listing page")
             return urls
         except Exception as e:
@@ -57,24 +115,26 @@ class ReviewScraper(Scraper):
         
         # Fetch and parse content
         logger.debug("Fetching HTML content")
-        html: str = self.fetcher.fetch_page(article_url)
-        logger.debug(f"Received {len(html)} characters of HTML")
+        page: FetchedPage = self.fetcher.fetch_raw(article_url)
+        logger.debug(f"Received {len(page.body)} bytes of HTML")
         
+        html_hash = fingerprint(page.body)
+        if self.is_unchanged(article_url, html_hash):
+            return None
+        
+        # Raw bytes go straight to the parser, which decodes them once
         logger.debug("Parsing content page")
-        content_data = self.parser.parse_content_page(html, article_url)
+        content_data = self.parse_content(page.body, article_url, page.encoding, html_hash)
+        self.add_fingerprints(content_data, html_hash)
         logger.debug(f"Extracted content: title='{content_data.get('title', 'N/A')[:50]}...', content_length={len(content_data.get('content', ''))}")
         
         return content_data
 
     def get_review_id(self) -> Optional[int]:
         """Get review ID, returns None if extraction fails"""
-        logger.info("Extracting review ID from base URL")
+        logger.info("Extracting review ID from review index page")
         try:
-            logger.debug(f"Fetching HTML from: {self.base_url}")
-            html = self.fetcher.fetch_page()
-            
-            logger.debug("Parsing review ID from HTML")
-            review_id: int = self.parser.extract_review_id(html)
+            review_id: int = self.get_index_page().review_id
             logger.info(f"Extracted review ID: {review_id}")
             return review_id
         except Exception as e:
@@ -85,6 +145,7 @@ class ReviewScraper(Scraper):
         """
         Scrape a single article by URL.
         Complete workflow: fetch → parse → validate → return article data.
+        Returns None if scraping fails or the article is unchanged since the last run.
         
         Returns:
             Dict with keys:
@@ -93,6 +154,8 @@ class ReviewScraper(Scraper):
                 - original_url (str): Source URL
                 - authors (List[str]): List of author names
                 - publication_date (str): Publication date
+                - html_hash (str): Fingerprint of the fetched HTML
+                - content_hash (str): Fingerprint of the cleaned content
         """
         try:
             logger.info(f"Scraping article: {article_url}")
@@ -105,6 +168,8 @@ class ReviewScraper(Scraper):
                 logger.info(f"Successfully scraped: {content_data['title']}")
                 # 1.2.3 Return dictionary representing an article
                 return content_data
+            elif article_url in self.unchanged_urls:
+                return None
             else:
                 logger.warning(f"Failed to scrape valid content from {article_url}")
                 return None
@@ -117,22 +182,22 @@ class ReviewScraper(Scraper):
         """
         Main scraping method: scrape all review articles.
         Workflow:
-        1. Get URLs of each article
+        1. Fetch and parse the review index page once (review ID and article URLs)
         2. Scrape each article (using scrape_single_article)
         3. Return list of dictionaries representing review as a list of articles
         """
         try:
             logger.info(f"Starting review batch scraping from {self.base_url}")
             logger.info("=" * 60)
+            self.unchanged_urls = []
+            self.failed_urls = []
             
-            # 1.1 Get the id of a review
-            logger.info("Step 1/4: Extracting review ID")
-            review_id: int = self.get_review_id()
+            # 1.1 Get the id of a review and the URLs of each article from one index page
+            logger.info("Step 1/3: Parsing review index page")
+            index_page: ReviewIndexPage = self.get_index_page()
+            review_id: int = index_page.review_id
+            article_urls: List[str] = index_page.article_urls
             logger.info(f"Review ID: {review_id}")
-            
-            # 1.2 Get URLs of each article
-            logger.info("Step 2/4: Getting article URLs from listing page")
-            article_urls: List[str] = self.get_listing_urls()
             if not article_urls:
                 logger.warning("No article URLs found on listing page")
                 return []
@@ -140,8 +205,8 @@ class ReviewScraper(Scraper):
             logger.info(f"Found {len(article_urls)} articles to scrape")
             logger.debug(f"Article URLs: {article_urls}")
             
-            # 1.3 Scrape each article
-            logger.info("Step 3/4: Scraping individual articles")
+            # 1.2 Scrape each article
+            logger.info("Step 2/3: Scraping individual articles")
             scraped_articles: List[Dict[str, Any]] = []
             for idx, url in enumerate(article_urls, 1):
                 logger.info(f"Processing article {idx}/{len(article_urls)}: {url}")
@@ -149,17 +214,23 @@ class ReviewScraper(Scraper):
                 if article_data:
                     scraped_articles.append(article_data)
                     logger.debug(f"Article {idx} scraped successfully")
+                elif url in self.unchanged_urls:
+                    logger.debug(f"Article {idx} unchanged")
                 else:
                     logger.warning(f"Article {idx} failed to scrape")
+                    self.failed_urls.append(url)
             
-            logger.info(f"Step 4/4: Finalizing batch scraping")
-            logger.info(f"Successfully scraped {len(scraped_articles)}/{len(article_urls)} articles")
+            logger.info(f"Step 3/3: Finalizing batch scraping")
+            logger.info(f"Successfully scraped {len(scraped_articles)}/{len(article_urls)} articles "
+                        f"({len(self.unchanged_urls)} unchanged)")
             
-            # 1.4 Return a dictionary representing review as a list of articles
+            # 1.3 Return a dictionary representing review as a list of articles
             result = {
                 "source_url": self.base_url,
                 "articles" : scraped_articles,
-                "review_id": review_id
+                "review_id": review_id,
+                "unchanged_urls": list(self.unchanged_urls),
+                "failed_urls": list(self.failed_urls)
             }
             logger.info("=" * 60)
             logger.info(f"Review batch scraping complete: {len(scraped_articles)} articles")
@@ -169,6 +240,154 @@ class ReviewScraper(Scraper):
             self.handle_scraping_error(e, "review batch scraping")
             return []
     
+    async def scrape_review_batch_async(self) -> Dict[str, Any]:
+        """
+        Non-blocking variant of scrape_review_batch.
+        Fetches the listing page once, then fetches all article pages
+        concurrently with the AsyncFetcher before parsing them.
+        """
+        try:
+            logger.info(f"Starting async review batch scraping from {self.base_url}")
+            logger.info("=" * 60)
+            self.unchanged_urls = []
+            self.failed_urls = []
+            
+            async with self.async_fetcher:
+                # 1.1 Fetch the listing page once for both review ID and article URLs
+                logger.info("Step 1/3: Fetching listing page")
+                if self._index_page is None:
+                    page = await self.async_fetcher.fetch_raw()
+                    self._index_page = ReviewIndexPage.from_html(page.body, self.base_url, self.parser, page.encoding)
+                review_id: int = self._index_page.review_id
+                article_urls: List[str] = self._index_page.article_urls
+                logger.info(f"Review ID: {review_id}")
+                if not article_urls:
+                    logger.warning("No article URLs found on listing page")
+                    return []
+                
+                # 1.2 Fetch all article pages concurrently
+                logger.info(f"Step 2/3: Fetching {len(article_urls)} articles concurrently")
+                pages: Dict[str, FetchedPage] = await self.async_fetcher.fetch_many_raw(article_urls)
+            
+            # 1.3 Parse and validate each article, keeping listing order
+            logger.info("Step 3/3: Parsing fetched articles")
+            scraped_articles: List[Dict[str, Any]] = []
+            for idx, url in enumerate(article_urls, 1):
+                if url not in pages:
+                    logger.warning(f"Article {idx} failed to fetch: {url}")
+                    self.failed_urls.append(url)
+                    continue
+                html_hash = fingerprint(pages[url].body)
+                if self.is_unchanged(url, html_hash):
+                    continue
+                article_data = await self.parse_article_async(pages[url].body, url, pages[url].encoding, html_hash)
+                if article_data:
+                    scraped_articles.append(article_data)
+                else:
+                    logger.warning(f"Article {idx} failed to scrape")
+                    self.failed_urls.append(url)
+            
+            logger.info("=" * 60)
+            logger.info(f"Async review batch scraping complete: {len(scraped_articles)}/{len(article_urls)} articles "
+                        f"({len(self.unchanged_urls)} unchanged)")
+            return {
+                "source_url": self.base_url,
+                "articles": scraped_articles,
+                "review_id": review_id,
+                "unchanged_urls": list(self.unchanged_urls),
+                "failed_urls": list(self.failed_urls)
+            }
+            
+        except Exception as e:
+            self.handle_scraping_error(e, "async review batch scraping")
+            return []
+    
+    def parse_article(
+        self,
+        html: Union[str, bytes],
+        article_url: str,
+        encoding: Optional[str] = None,
+        html_hash: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Parse and validate already fetched article HTML (text or raw bytes).
+        Returns the article data (with fingerprints) or None if parsing or validation fails.
+        """
+        try:
+            html_hash = html_hash or fingerprint(html)
+            content_data = self.parse_content(html, article_url, encoding, html_hash)
+            return self.finish_article(content_data, html, article_url, html_hash)
+        except Exception as e:
+            self.handle_scraping_error(e, f"parsing article {article_url}")
+            return None
+    
+    async def parse_article_async(
+        self,
+        html: Union[str, bytes],
+        article_url: str,
+        encoding: Optional[str] = None,
+        html_hash: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Variant of parse_article that parses in the parse pool's worker processes when it is enabled.
+        Returns the article data (with fingerprints) or None if parsing or validation fails.
+        """
+        if self.parse_pool is None:
+            return self.parse_article(html, article_url, encoding, html_hash)
+        try:
+            html_hash = html_hash or fingerprint(html)
+            content_data = self.get_cached_parse(article_url, html_hash)
+            if content_data is None:
+                content_data = await self.parse_pool.parse(self.parser, html, article_url, encoding)
+                self.store_parse(article_url, html_hash, content_data)
+            return self.finish_article(content_data, html, article_url, html_hash)
+        except Exception as e:
+            self.handle_scraping_error(e, f"parsing article {article_url}")
+            return None
+    
+    def parse_content(
+        self,
+        html: Union[str, bytes],
+        article_url: str,
+        encoding: Optional[str],
+        html_hash: str,
+    ) -> Dict[str, Any]:
+        """
+        Parse article HTML, or take the result from the parse cache if this
+        version of the page was already parsed with the current parsing rules.
+        """
+        content_data = self.get_cached_parse(article_url, html_hash)
+        if content_data is None:
+            content_data = self.parser.parse_content_page(html, article_url, encoding)
+            self.store_parse(article_url, html_hash, content_data)
+        return content_data
+    
+    def get_cached_parse(self, article_url: str, html_hash: str) -> Optional[Dict[str, Any]]:
+        """Parsed article data from the parse cache, or None on a miss or when caching is disabled"""
+        if self.parse_cache is None:
+            return None
+        return self.parse_cache.get(article_url, html_hash)
+    
+    def store_parse(self, article_url: str, html_hash: str, content_data: Dict[str, Any]) -> None:
+        """Store freshly parsed article data (before fingerprints are attached) in the parse cache"""
+        if self.parse_cache is not None:
+            self.parse_cache.store(article_url, html_hash, content_data)
+    
+    def finish_article(
+        self,
+        content_data: Dict[str, Any],
+        html: Union[str, bytes],
+        article_url: str,
+        html_hash: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Attach fingerprints to parsed article data and validate it; None if it is not valid"""
+        self.add_fingerprints(content_data, html_hash or fingerprint(html))
+        if self.validate_content_data(content_data):
+            logger.info(f"Successfully scraped: {content_data['title']}")
+            return content_data
+        logger.warning(f"Failed to scrape valid content from {article_url}")
+        return None
+    
     def validate_content_data(self, content_data: Dict[str, Any]) -> bool:
         """
         Validate content data for review articles.
@@ -0,0 +1,372 @@
+"""
+Streaming extraction of Platypus articles without a document tree.
+
+For the known article layout (.bpf-title, .bpf-content, a .bpf-content h2
+byline and a .has-text-align-right date line) the whole page does not
+need to be built as a BeautifulSoup tree. StreamingArticleExtractor runs
+html.parser once over the page and keeps only a stack of open elements,
+the text of the few metadata elements and the cleaned content. Only the
+cleaned content is built as a tree, so peak memory per article is about
+the size of the output rather than of the page.
+
+The tag stack mirrors BeautifulSoup's html.parser tree builder (same
+decoding, implicit end tags, whitespace collapsing and string classes),
+and the content rules are those of ContentCleaner, so the result equals
+what ReviewParser's BeautifulSoup path produces for the same page.
+Pages without a .bpf-content container raise LayoutMismatch and are left
+to that path.
+
+Driving html.parser through BeautifulSoup's own handler relies on
+internals of bs4 (its private _htmlparser module and the tree builder
+callbacks). If an installed BeautifulSoup release no longer provides
+them, extract() raises LayoutMismatch as well, so pages are still parsed,
+only without the streaming speed-up.
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
+from bs4.builder import HTMLParserTreeBuilder, ParserRejectedMarkup
+
+try:
+    from bs4.builder._htmlparser import BeautifulSoupHTMLParser
+except ImportError:
+    # Private module of BeautifulSoup; without it every page takes the BeautifulSoup path
+    BeautifulSoupHTMLParser = None
+
+from .constants import ALLOWED_TAGS, INLINE_TAGS, IRRELEVANT_INFO_TAGS
+from .telegraph_nodes import Node, compile_nodes
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+CONTENT_CLASS = 'bpf-content'
+TITLE_CLASS = 'bpf-title'
+DATE_LINE_CLASS = 'has-text-align-right'
+
+# Same splitting of class attributes as BeautifulSoup's tree builders
+_CLASS_TOKEN_RE = re.compile(r'\S+')
+_TAG_SELECTOR_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9-]*$')
+_CLASS_SELECTOR_RE = re.compile(r'^\.(-?[_a-zA-Z][_a-zA-Z0-9-]*)$')
+
+# Strings BeautifulSoup's get_text() returns for ordinary elements
+_TEXT_STRING_TYPES = (NavigableString, CData)
+
+
+class LayoutMismatch(Exception):
+    """The page does not have the layout the streaming extractor handles"""
+    pass
+
+
+def parse_simple_selector(selector: str) -> Tuple[frozenset, frozenset]:
+    """
+    Split a selector list of bare tag names and single classes.
+
+    Args:
+        selector: CSS selector list such as 'nav, footer, .sidebar'
+
+    Returns:
+        (tag names, class names) matched by the selector
+
+    Raises:
+        ValueError: If a selector is anything but a tag name or a single class
+    """
+    tags, classes = set(), set()
+    for part in selector.split(','):
+        part = part.strip()
+        if _TAG_SELECTOR_RE.match(part):
+            tags.add(part.lower())
+        elif (match := _CLASS_SELECTOR_RE.match(part)):
+            classes.add(match.group(1))
+        else:
+            raise ValueError(f"Selector not supported by the streaming extractor: {part!r}")
+    return frozenset(tags), frozenset(classes)
+
+
+class _Element:
+    """An open element of the source page"""
+    __slots__ = ('name', 'out', 'in_content', 'is_empty_element')
+
+    def __init__(self, name: str, out: Optional[Tag], in_content: int, is_empty_element: bool = False):
+        self.name = name
+        # Output element that receives this element's children (None: children are dropped)
+        self.out = out
+        # Number of open elements carrying CONTENT_CLASS, this one included
+        self.in_content = in_content
+        # Read by BeautifulSoupHTMLParser to close void elements itself
+        self.is_empty_element = is_empty_element
+
+
+class _TextCapture:
+    """Strings collected from one source element for get_text()"""
+    __slots__ = ('element', 'types', 'strings')
+
+    def __init__(self, element: _Element, types: Tuple[type, ...]):
+        self.element = element
+        self.types = types
+        self.strings: List[str] = []
+
+    def text(self, strip: bool = False) -> str:
+        if strip:
+            return ''.join(s for s in (s.strip() for s in self.strings) if s)
+        return ''.join(self.strings)
+
+
+class _ExtractionSink:
+    """
+    Stand-in for the BeautifulSoup object BeautifulSoupHTMLParser feeds.
+
+    Implements the tree builder callbacks with the same stack semantics
+    as BeautifulSoup, but instead of building the page it routes strings
+    to the metadata captures and builds only the cleaned content.
+    """
+
+    ASCII_SPACES = BeautifulSoup.ASCII_SPACES
+
+    def __init__(self, extractor: 'StreamingArticleExtractor', builder: HTMLParserTreeBuilder, original_encoding: Optional[str]):
+        self.extractor = extractor
+        self.builder = builder
+        self.original_encoding = original_encoding
+        self.output = BeautifulSoup('', 'html.parser')
+
+        root = _Element(BeautifulSoup.ROOT_TAG_NAME, None, 0)
+        self.stack: List[_Element] = [root]
+        self.open_counts: Dict[str, int] = {}
+        self.preserve_whitespace_stack: List[_Element] = []
+        self.string_container_stack: List[_Element] = []
+        self.current_data: List[str] = []
+
+        self.container_found = False
+        self.container_removed = False
+        self.title: Optional[_TextCapture] = None
+        self.heading: Optional[_TextCapture] = None
+        self.byline: Optional[_TextCapture] = None
+        self.date_line: Optional[_TextCapture] = None
+        self.captures: List[_TextCapture] = []
+
+    # Tree builder callbacks
+
+    def handle_starttag(self, name, namespace, nsprefix, attrs, sourceline=None, sourcepos=None, namespaces=None):
+        self.endData()
+        parent = self.stack[-1]
+        class_attr = attrs.get('class')
+        classes = _CLASS_TOKEN_RE.findall(class_attr) if class_attr else ()
+
+        element = _Element(
+            name,
+            self._output_parent(name, attrs, classes, parent),
+            parent.in_content + (CONTENT_CLASS in classes),
+            self.builder.can_be_empty_element(name),
+        )
+        self._start_captures(element, classes, parent)
+
+        self.stack.append(element)
+        self.open_counts[name] = self.open_counts.get(name, 0) + 1
+        if name in self.builder.preserve_whitespace_tags:
+            self.preserve_whitespace_stack.append(element)
+        if name in self.builder.string_containers:
+            self.string_container_stack.append(element)
+        return element
+
+    def handle_endtag(self, name, nsprefix=None):
+        self.endData()
+        if name == BeautifulSoup.ROOT_TAG_NAME:
+            return
+        for _ in range(len(self.stack) - 1):
+            if not self.open_counts.get(name):
+                break
+            if self.stack[-1].name == name:
+                self.pop()
+                break
+            self.pop()
+
+    def handle_data(self, data):
+        self.current_data.append(data)
+
+    def endData(self, containerClass=None):
+        if not self.current_data:
+            return
+        current_data = ''.join(self.current_data)
+        if not self.preserve_whitespace_stack:
+            if all(char in self.ASCII_SPACES for char in current_data):
+                current_data = '\n' if '\n' in current_data else ' '
+        self.current_data = []
+
+        container = containerClass or NavigableString
+        if self.string_container_stack and container is NavigableString:
+            container = self.builder.string_containers.get(self.string_container_stack[-1].name, container)
+        string = container(current_data)
+
+        for capture in self.captures:
+            if type(string) in capture.types:
+                capture.strings.append(string)
+        out = self.stack[-1].out
+        if out is not None:
+            out.append(string)
+
+    def pop(self) -> None:
+        element = self.stack.pop()
+        self.open_counts[element.name] -= 1
+        if self.preserve_whitespace_stack and self.preserve_whitespace_stack[-1] is element:
+            self.preserve_whitespace_stack.pop()
+        if self.string_container_stack and self.string_container_stack[-1] is element:
+            self.string_container_stack.pop()
+        if self.captures:
+            self.captures = [capture for capture in self.captures if capture.element is not element]
+
+    def close(self) -> None:
+        """Close everything still open at the end of the document"""
+        self.endData()
+        while len(self.stack) > 1:
+            self.pop()
+
+    # Content and metadata
+
+    def _output_parent(self, name: str, attrs: Dict[str, Any], classes: Iterable[str], parent: _Element) -> Optional[Tag]:
+        """Output element for the children of a new source element, following ContentCleaner's rules"""
+        extractor = self.extractor
+        if parent.out is None:
+            if self.container_found or name != 'div' or CONTENT_CLASS not in classes:
+                return None
+            # The first div.bpf-content is the content container
+            self.container_found = True
+            if extractor.matches_removal(name, classes):
+                self.container_removed = True
+                return None
+            return self.output
+
+        if extractor.matches_removal(name, classes):
+            return None
+        if name not in extractor.allowed_tags:
+            return parent.out
+
+        tag = self.output.new_tag(name, attrs=attrs)
+        target = parent.out
+        if target is self.output and name in extractor.inline_tags:
+            # Inline elements at the top level go into the preceding paragraph or a new one
+            previous = target.contents[-1] if target.contents else None
+            if isinstance(previous, Tag) and previous.name == 'p':
+                target = previous
+            else:
+                paragraph = self.output.new_tag('p')
+                target.append(paragraph)
+                target = paragraph
+        target.append(tag)
+        return tag
+
+    def _start_captures(self, element: _Element, classes: Iterable[str], parent: _Element) -> None:
+        """Start collecting the text of the first title, heading, byline and date line"""
+        types = self.builder.string_containers.get(element.name)
+        types = (types,) if types else _TEXT_STRING_TYPES
+
+        if self.title is None and TITLE_CLASS in classes:
+            self.title = self._capture(element, types)
+        if self.heading is None and element.name == 'h1':
+            self.heading = self._capture(element, types)
+        if self.byline is None and element.name == 'h2' and parent.in_content:
+            self.byline = self._capture(element, types)
+        if self.date_line is None and parent.in_content and DATE_LINE_CLASS in classes:
+            self.date_line = self._capture(element, types)
+
+    def _capture(self, element: _Element, types: Tuple[type, ...]) -> _TextCapture:
+        capture = _TextCapture(element, types)
+        self.captures.append(capture)
+        return capture
+
+
+class StreamingArticleExtractor:
+    """
+    Single-pass extractor of title, byline, date line and cleaned content.
+
+    Usage:
+        extractor = StreamingArticleExtractor()
+        try:
+            fields = extractor.extract(html, encoding)
+        except LayoutMismatch:
+            ...  # parse the page with BeautifulSoup
+    """
+
+    def __init__(
+        self,
+        allowed_tags: Iterable[str] = ALLOWED_TAGS,
+        remove_selector: str = IRRELEVANT_INFO_TAGS,
+        inline_tags: Iterable[str] = INLINE_TAGS,
+    ):
+        """
+        Args:
+            allowed_tags: Tags kept in the content; all others are unwrapped
+            remove_selector: Tag names and classes of elements removed with their content
+            inline_tags: Allowed tags that must not appear outside a block at the top level
+
+        Raises:
+            ValueError: If remove_selector uses more than tag names and single classes
+        """
+        self.allowed_tags = frozenset(allowed_tags)
+        self.inline_tags = frozenset(inline_tags)
+        self.remove_tags, self.remove_classes = parse_simple_selector(remove_selector)
+
+    def matches_removal(self, name: str, classes: Iterable[str]) -> bool:
+        """Whether an element is removed from the content with its subtree"""
+        return name in self.remove_tags or any(cls in self.remove_classes for cls in classes)
+
+    def extract(self, html: Union[str, bytes], encoding: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Extract the article fields in one forward pass.
+
+        Args:
+            html: Article HTML text or raw bytes
+            encoding: Charset of raw bytes, if known
+
+        Returns:
+            Dict with 'title' (text of the first .bpf-title, else of the first h1, else None),
+            'byline' and 'date_line' (stripped text or None), 'content' (cleaned HTML)
+            and 'content_nodes' (the content as Telegraph nodes)
+
+        Raises:
+            LayoutMismatch: If the page has no div.bpf-content, or the installed
+                BeautifulSoup cannot be driven without building a tree
+        """
+        sink = self._run_parser(html, encoding)
+
+        if not sink.container_found:
+            raise LayoutMismatch(f"No div.{CONTENT_CLASS} in page")
+
+        root = sink.output
+        content = ''.join(str(child) for child in root.contents)
+        content_nodes: List[Node] = compile_nodes(root) if content else []
+        title = sink.title or sink.heading
+        return {
+            'title': title.text() if title else None,
+            'byline': sink.byline.text(strip=True) if sink.byline else None,
+            'date_line': sink.date_line.text(strip=True) if sink.date_line else None,
+            'content': content,
+            'content_nodes': content_nodes,
+        }
+
+    def _run_parser(self, html: Union[str, bytes], encoding: Optional[str]) -> _ExtractionSink:
+        """
+        Feed the page to BeautifulSoup's html.parser handler with the sink in place of the soup.
+
+        Raises:
+            LayoutMismatch: If this BeautifulSoup release does not expose the internals used here
+        """
+        if BeautifulSoupHTMLParser is None:
+            raise LayoutMismatch("BeautifulSoup's html.parser handler is not available")
+        try:
+            builder = HTMLParserTreeBuilder()
+            markup, original_encoding = next(builder.prepare_markup(html, encoding))[:2]
+            sink = _ExtractionSink(self, builder, original_encoding)
+            args, kwargs = builder.parser_args
+            parser = BeautifulSoupHTMLParser(*args, **kwargs)
+            parser.soup = sink
+            try:
+                parser.feed(markup)
+            except AssertionError as e:
+                raise ParserRejectedMarkup(e)
+            parser.close()
+            sink.close()
+        except (AttributeError, TypeError) as e:
+            logger.warning(f"Streaming extraction is incompatible with the installed BeautifulSoup: {e}")
+            raise LayoutMismatch(f"Unsupported BeautifulSoup internals: {e}") from e
+        return sink
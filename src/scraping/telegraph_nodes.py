@@ -0,0 +1,151 @@
+"""
+Compiler from cleaned article HTML to Telegraph's Node JSON structure.
+
+Telegraph pages are stored as a list of Nodes: a string is a text node,
+a dict {'tag': ..., 'attrs': {...}, 'children': [...]} an element. The
+parser compiles the cleaned content subtree into nodes once, while the
+tree is still in memory, so the publishing side can split, stamp and
+link pages on plain lists and send them as content= without any further
+HTML parsing.
+
+Whitespace is normalised exactly as telegraph.utils.html_to_nodes does
+it (runs collapse to one space outside <pre>, leading spaces after a
+block start or a space are dropped), except that whitespace-only strings
+between top-level blocks are left out. Only the href and src attributes,
+the ones the Telegraph API accepts, are kept.
+"""
+
+import json
+import re
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from bs4 import BeautifulSoup, Tag
+from bs4.element import PreformattedString
+
+from .constants import ALLOWED_TAGS
+from .parser_backend import make_fragment_soup
+
+# A Telegraph Node: text or element
+Node = Union[str, Dict[str, Any]]
+
+# Attributes the Telegraph API accepts on elements
+NODE_ATTRIBUTES = ('href', 'src')
+
+# Elements without children
+VOID_TAGS = {'br', 'hr', 'img'}
+
+# Elements that start a new line of text (whitespace in front of their text is dropped)
+BLOCK_TAGS = {'blockquote', 'hr', 'li', 'ol', 'p', 'pre', 'ul'}
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+class _NodeCompiler:
+    """Single forward walk over a subtree, carrying the whitespace state between text nodes"""
+
+    def __init__(self, allowed_tags: Iterable[str]):
+        self.allowed_tags = frozenset(allowed_tags)
+        self.last_text: Optional[str] = None
+        self.in_pre = 0
+
+    def compile_children(self, parent: Tag, nodes: List[Node]) -> List[Node]:
+        """Append the nodes of a tag's children to a node list"""
+        for child in parent.children:
+            if isinstance(child, Tag):
+                self.compile_tag(child, nodes)
+            elif not isinstance(child, PreformattedString):  # comments, doctype, CDATA
+                self.add_text(str(child), nodes)
+        return nodes
+
+    def compile_tag(self, tag: Tag, nodes: List[Node]) -> None:
+        """Append a tag as an element node, or its children if the tag is not allowed"""
+        if tag.name not in self.allowed_tags:
+            self.compile_children(tag, nodes)
+            return
+
+        if tag.name in BLOCK_TAGS:
+            self.last_text = None
+        node: Dict[str, Any] = {'tag': tag.name}
+        attrs = {name: tag[name] for name in NODE_ATTRIBUTES if tag.has_attr(name)}
+        if attrs:
+            node['attrs'] = attrs
+        nodes.append(node)
+        if tag.name in VOID_TAGS:
+            return
+
+        if tag.name == 'pre':
+            self.in_pre += 1
+        children = self.compile_children(tag, [])
+        if tag.name == 'pre':
+            self.in_pre -= 1
+        if children:
+            node['children'] = children
+
+    def add_text(self, text: str, nodes: List[Node]) -> None:
+        """Append text, merging it into a directly preceding text node"""
+        if not text:
+            return
+        if not self.in_pre:
+            text = _WHITESPACE_RE.sub(' ', text)
+            if self.last_text is None or self.last_text.endswith(' '):
+                text = text.lstrip(' ')
+            if not text:
+                self.last_text = None
+                return
+            self.last_text = text
+
+        if nodes and isinstance(nodes[-1], str):
+            nodes[-1] += text
+        else:
+            nodes.append(text)
+
+
+def compile_nodes(container: Union[Tag, BeautifulSoup], allowed_tags: Iterable[str] = ALLOWED_TAGS) -> List[Node]:
+    """
+    Compile the children of a cleaned content element into Telegraph nodes.
+
+    Args:
+        container: Content element (or a whole soup); the element itself is not part of the output
+        allowed_tags: Tags emitted as elements; other tags are replaced by their children
+
+    Returns:
+        Top-level Telegraph nodes
+    """
+    nodes = _NodeCompiler(allowed_tags).compile_children(container, [])
+    return [node for node in nodes if not (isinstance(node, str) and node.isspace())]
+
+
+def html_to_nodes(html: str, allowed_tags: Iterable[str] = ALLOWED_TAGS) -> List[Node]:
+    """
+    Compile an HTML fragment into Telegraph nodes.
+    Used for content stored before nodes were compiled at parse time.
+
+    Args:
+        html: Cleaned content HTML
+        allowed_tags: Tags emitted as elements
+
+    Returns:
+        Top-level Telegraph nodes
+    """
+    return compile_nodes(make_fragment_soup(html), allowed_tags)
+
+
+def node_text(node: Node) -> str:
+    """Concatenated text of a node and its descendants"""
+    if isinstance(node, str):
+        return node
+    return ''.join(node_text(child) for child in node.get('children', ()))
+
+
+def node_size(node: Node) -> int:
+    """UTF-8 size in bytes of a node serialised as Telegraph content JSON"""
+    return _json_size(node)
+
+
+def nodes_size(nodes: List[Node]) -> int:
+    """UTF-8 size in bytes of a node list serialised as Telegraph content JSON"""
+    return _json_size(nodes)
+
+
+def _json_size(value: Any) -> int:
+    return len(json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
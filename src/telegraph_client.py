@@ -0,0 +1,298 @@
+"""
+Asynchronous Telegraph API client built on aiohttp.
+
+The telegraph library's client is blocking (requests.Session), so every
+createPage/editPage call made from async code stalls the event loop, bot
+polling included, for a whole HTTP round-trip. AsyncTelegraphClient
+sends the same API calls on a pooled aiohttp.ClientSession instead, so
+several articles can be published concurrently over shared connections.
+
+Errors are raised as the telegraph library's exceptions (TelegraphException,
+RetryAfterError for FLOOD_WAIT_<seconds>), so callers handle both clients
+the same way.
+"""
+
+import asyncio
+import os
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+from telegraph.exceptions import RetryAfterError, TelegraphException
+from telegraph.utils import json_dumps
+
+from src.telegraph_scheduler import TelegraphScheduler
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_API_URL = 'https://api.telegra.ph'
+
+# Default size of the shared connection pool
+DEFAULT_MAX_CONNECTIONS = 10
+
+# Default total timeout for a single API call (seconds)
+DEFAULT_TIMEOUT = 30
+
+FLOOD_WAIT_PREFIX = 'FLOOD_WAIT_'
+
+
+class AsyncTelegraphClient:
+    """
+    Non-blocking client for the Telegraph API.
+
+    Usage:
+        async with AsyncTelegraphClient(access_token) as client:
+            page = await client.create_page(title, content_nodes)
+            await client.edit_page(page['path'], title, new_nodes)
+    """
+
+    def __init__(
+        self,
+        access_token: Optional[str] = None,
+        api_url: str = DEFAULT_API_URL,
+        max_connections: Optional[int] = None,
+        timeout: Optional[float] = None,
+        scheduler: Optional[TelegraphScheduler] = None,
+    ):
+        """
+        Args:
+            access_token: Telegraph account token sent with every call that needs one
+            api_url: Base URL of the API
+            max_connections: Size of the shared connection pool
+                (defaults to TELEGRAPH_MAX_CONNECTIONS env var or DEFAULT_MAX_CONNECTIONS)
+            timeout: Total timeout for a single call in seconds
+                (defaults to TELEGRAPH_TIMEOUT env var or DEFAULT_TIMEOUT)
+            scheduler: Optional scheduler pacing the calls and retrying them through FLOOD_WAIT
+        """
+        self.access_token = access_token
+        self.api_url = api_url.rstrip('/')
+        self.max_connections = max_connections or int(os.getenv('TELEGRAPH_MAX_CONNECTIONS', DEFAULT_MAX_CONNECTIONS))
+        self.timeout = aiohttp.ClientTimeout(total=timeout or float(os.getenv('TELEGRAPH_TIMEOUT', DEFAULT_TIMEOUT)))
+        self.scheduler = scheduler
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def __aenter__(self) -> 'AsyncTelegraphClient':
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Create the pooled session lazily inside the running loop.
+
+        A client that outlives its event loop (e.g. the process-wide
+        TelegraphManager) closes the old session and gets a new one in
+        the next loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self.session is not None and not self.session.closed and self._session_loop is not loop:
+            logger.debug("Closing aiohttp session of a previous event loop")
+            await self.close()
+        if self.session is None or self.session.closed:
+            logger.debug("Creating aiohttp session for Telegraph API calls")
+            connector = aiohttp.TCPConnector(limit=self.max_connections)
+            self.session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+            self._session_loop = loop
+        return self.session
+
+    async def close(self) -> None:
+        """Close the pooled session"""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+        self._session_loop = None
+
+    async def method(self, method: str, values: Optional[Dict[str, Any]] = None, path: str = '') -> Any:
+        """
+        Call a Telegraph API method.
+
+        Args:
+            method: API method name (e.g. 'createPage')
+            values: Parameters; None values are left out
+            path: Page path for methods that take one in the URL
+
+        Returns:
+            The 'result' field of the response
+
+        Raises:
+            RetryAfterError: If Telegraph answers FLOOD_WAIT_<seconds>
+                (and the scheduler, if any, gives up waiting)
+            TelegraphException: For any other API error
+        """
+        values = dict(values or {})
+        if 'access_token' not in values and self.access_token:
+            values['access_token'] = self.access_token
+        data = {key: self._form_value(value) for key, value in values.items() if value is not None}
+
+        url = f"{self.api_url}/{method}/{path}"
+        if self.scheduler is None:
+            return await self._send(url, data)
+        return await self.scheduler.call(method, lambda: self._send(url, data))
+
+    async def _send(self, url: str, data: Dict[str, str]) -> Any:
+        """Send one API request and unwrap its result"""
+        session = await self._get_session()
+        async with session.post(url, data=data) as response:
+            if response.status >= 500:
+                response.raise_for_status()
+            payload = await response.json(content_type=None)
+
+        if payload.get('ok'):
+            return payload['result']
+
+        error = payload.get('error')
+        if isinstance(error, str) and error.startswith(FLOOD_WAIT_PREFIX):
+            raise RetryAfterError(int(error.rsplit('_', 1)[-1]))
+        raise TelegraphException(error)
+
+    @staticmethod
+    def _form_value(value: Any) -> str:
+        """Encode a parameter as a form field (booleans as true/false)"""
+        if isinstance(value, bool):
+            return 'true' if value else 'false'
+        return str(value)
+
+    async def create_account(
+        self,
+        short_name: str,
+        author_name: Optional[str] = None,
+        author_url: Optional[str] = None,
+        replace_token: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Create a Telegraph account.
+
+        Args:
+            short_name: Account name, shown to the user above the "Edit/Publish" button
+            author_name: Default author name of new pages
+            author_url: Default profile link of new pages
+            replace_token: Use the new account's token for the following calls
+
+        Returns:
+            Account with short_name, author_name, author_url, access_token and auth_url
+        """
+        account = await self.method('createAccount', {
+            'short_name': short_name,
+            'author_name': author_name,
+            'author_url': author_url,
+        })
+        if replace_token:
+            self.access_token = account.get('access_token')
+        return account
+
+    async def create_page(
+        self,
+        title: str,
+        content: List[Any],
+        author_name: Optional[str] = None,
+        author_url: Optional[str] = None,
+        return_content: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Create a Telegraph page.
+
+        Args:
+            title: Page title
+            content: Content as a list of Telegraph nodes
+            author_name: Author name shown below the title
+            author_url: Profile link opened from the author name
+            return_content: Include the content in the returned page
+
+        Returns:
+            Page with path, url, title, description and views
+        """
+        return await self.method('createPage', {
+            'title': title,
+            'author_name': author_name,
+            'author_url': author_url,
+            'content': json_dumps(content),
+            'return_content': return_content,
+        })
+
+    async def edit_page(
+        self,
+        path: str,
+        title: str,
+        content: List[Any],
+        author_name: Optional[str] = None,
+        author_url: Optional[str] = None,
+        return_content: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Replace the title and content of an existing Telegraph page.
+
+        Args:
+            path: Page path (everything after https://telegra.ph/)
+            title: Page title
+            content: Content as a list of Telegraph nodes
+            author_name: Author name shown below the title
+            author_url: Profile link opened from the author name
+            return_content: Include the content in the returned page
+
+        Returns:
+            The edited page
+        """
+        return await self.method('editPage', {
+            'title': title,
+            'author_name': author_name,
+            'author_url': author_url,
+            'content': json_dumps(content),
+            'return_content': return_content,
+        }, path=path)
+
+    async def get_page(self, path: str, return_content: bool = True) -> Dict[str, Any]:
+        """
+        Get a Telegraph page.
+
+        Args:
+            path: Page path
+            return_content: Include the content (as Telegraph nodes)
+
+        Returns:
+            The page
+        """
+        return await self.method('getPage', {'return_content': return_content}, path=path)
+
+    async def get_page_list(self, offset: int = 0, limit: int = 50) -> Dict[str, Any]:
+        """
+        Get the pages of the account, most recent first.
+
+        Args:
+            offset: Number of pages to skip
+            limit: Number of pages to return (0-200)
+
+        Returns:
+            Dict with total_count and pages (without content)
+        """
+        return await self.method('getPageList', {'offset': offset, 'limit': limit})
+
+    async def get_views(
+        self,
+        path: str,
+        year: Optional[int] = None,
+        month: Optional[int] = None,
+        day: Optional[int] = None,
+        hour: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get the number of views of a Telegraph page, in total or for a period.
+
+        Args:
+            path: Page path
+            year: Count views of this year (required with month)
+            month: Count views of this month (required with day)
+            day: Count views of this day (required with hour)
+            hour: Count views of this hour
+
+        Returns:
+            Dict with a views field
+        """
+        return await self.method('getViews', {
+            'year': year,
+            'month': month,
+            'day': day,
+            'hour': hour,
+        }, path=path)
@@ -2,20 +2,75 @@
 import asyncio
 import json
 import os
-from typing import List, Optional
-from bs4 import BeautifulSoup
+import re
+from typing import TYPE_CHECKING, List, Optional, Tuple
 from dotenv import load_dotenv
 
 #third party libraries
 from telegraph import Telegraph
+from telegraph.exceptions import RetryAfterError, TelegraphException
 
 #local 
 from src.dao.models import Article
-from src.scraping.constants import ALLOWED_TAGS
+from src.dao.models.publish_ledger import PART_CREATING, PART_PLANNED, PART_PUBLISHED
+from src.telegraph_pool import TelegraphAccount, TelegraphTokenPool, page_path, tokens_from_env
+from src.scraping.fingerprint import fingerprint
+from src.scraping.telegraph_nodes import Node, html_to_nodes, node_text, nodes_size
 from src.logging_config import get_logger
 
+if TYPE_CHECKING:
+    from src.dao.repositories.publish_ledger_repository import PublishLedgerRepository
+
 logger = get_logger(__name__)
 
+# Text of the publication info line at the top of an article ("Platypus Review 179 | September 2025")
+PUBLICATION_INFO_RE = re.compile(r'Platypus Review[^|]*\|')
+
+# Telegraph rejects pages whose content, the Node JSON the telegraph library
+# sends (compact separators, UTF-8), is larger than 64 KB
+MAX_CONTENT_BYTES = 64 * 1024
+
+TELEGRAPH_URL_PREFIX = 'https://telegra.ph/'
+
+# Page paths are the transliterated title (up to 4 characters per title
+# character), the date ("-10-18") and a counter for repeated titles
+PATH_BYTES_PER_TITLE_CHAR = 4
+PATH_SUFFIX_BYTES = len('-12-31-999999')
+
+# Budgets of the fixed-size heuristic the splitter used before exact sizes,
+# kept to report how many parts exact accounting saves
+HEURISTIC_LIMIT_BYTES = 64000
+HEURISTIC_OVERHEAD_BYTES = 2000
+HEURISTIC_BYTES_PER_CHAR = 1.2
+
+# Multipart publish modes: 'reserve' creates placeholder pages for parts 2..N
+# first so every part is sent once with its links, 'edit' creates all parts
+# and then edits each one to add the links
+PUBLISH_MODE_RESERVE = 'reserve'
+PUBLISH_MODE_EDIT = 'edit'
+
+# Content of a placeholder page, replaced as soon as its part is published
+PLACEHOLDER_CONTENT = [{'tag': 'p', 'children': ['…']}]
+
+# Most recent pages of an account searched for a page whose createPage
+# answer was lost (the process stopped while the call was in flight)
+RECOVERY_PAGE_LIST_LIMIT = 50
+
+
+class _PartState:
+    """A part of an article being published: its page and whether it holds its final content"""
+
+    __slots__ = ('index', 'title', 'content', 'url', 'published', 'entry')
+
+    def __init__(self, index: int, title: str, content: List[Node]):
+        self.index = index
+        self.title = title
+        self.content = content
+        self.url: Optional[str] = None
+        self.published = False
+        # Ledger entry of the part, when publishing with a ledger
+        self.entry = None
+
 
 load_dotenv()
 
@@ -23,15 +78,12 @@ class TelegraphManager:
     
     _instance: Optional['TelegraphManager'] = None
     _initialized: bool = False
-    _lock: asyncio.Lock = None
     
     def __new__(cls, *args, **kwargs):
         """Create singleton instance, accepting but ignoring init arguments."""
         if cls._instance is None:
             logger.info("Creating new TelegraphManager singleton instance")
             cls._instance = super().__new__(cls)
-            # Initialize lock for the instance
-            cls._lock = asyncio.Lock()
         return cls._instance
     
     def __init__(self, access_token: str = None):
@@ -43,11 +95,15 @@ class TelegraphManager:
         logger.info("Initializing TelegraphManager singleton")
         self.TOKEN_FILE = 'graph_bot.json'  # Keep for backward compatibility
         self.telegraph = None
-        # Use provided token or get from environment
-        self.access_token = access_token or os.getenv('TELEGRAPH_ACCESS_TOKEN')
+        self.pool: Optional[TelegraphTokenPool] = None
+        # Use provided token or get from environment (the first token of the pool if only that is set)
+        self.access_token = access_token or os.getenv('TELEGRAPH_ACCESS_TOKEN') or next(iter(tokens_from_env()), None)
         self.short_name = os.getenv('TELEGRAPH_SHORT_NAME', 'konstantinopolka')
         self.author_name = os.getenv('TELEGRAPH_AUTHOR_NAME', 'Platypus Review')
         self.author_url = os.getenv('TELEGRAPH_AUTHOR_URL', 'https://platypus1917.org/platypus-review/')
+        self.publish_mode = os.getenv('TELEGRAPH_PUBLISH_MODE', PUBLISH_MODE_RESERVE)
+        self.split_stats = {'articles': 0, 'parts': 0, 'parts_saved': 0}
+        self.publish_stats = {'articles': 0, 'calls': 0, 'bytes_sent': 0}
         self.__setup_telegraph()
         
         self._initialized = True
@@ -92,7 +148,7 @@ class TelegraphManager:
             with open(self.TOKEN_FILE, 'w', encoding='utf-8') as f:
                 json.dump(account_data, f, ensure_ascii=False, indent=4)
             logger.info("Account credentials saved to file")
-            
+
         logger.info("Telegraph setup complete")
     
     @classmethod
@@ -101,149 +157,467 @@ class TelegraphManager:
         logger.warning("Resetting TelegraphManager singleton instance")
         cls._instance = None
         cls._initialized = False
-        cls._lock = None
 
 
-    async def create_telegraph_articles(self, article: Article) -> List[str]:
+    async def create_telegraph_articles(self, article: Article, ledger: Optional['PublishLedgerRepository'] = None) -> List[str]:
         """
         Create one or more Telegraph articles if the content exceeds limits.
         Returns list of Telegraph URLs.
+        
+        With a ledger every part is recorded before and after each API call.
+        Calling this again for the same article (after a crash, or when the
+        URLs could not be saved) resumes from the ledger: pages that exist
+        are reused and only parts not yet published are written.
+        
+        Args:
+            article: Article to publish (must have an id when a ledger is given)
+            ledger: Optional publish ledger (see PublishLedgerRepository)
         """
         logger.info("=" * 60)
         logger.info(f"Creating Telegraph article: '{article.title}'")
         logger.debug(f"Original URL: {article.original_url}")
         
         title = article.title
-        content = article.content
-        logger.debug(f"Original content length: {len(content)} characters")
+        content = self.get_content_nodes(article)
+        logger.debug(f"Original content: {len(content)} nodes")
         
         logger.debug("Adding reposting date to content")
-        content = self._add_reposting_date(article.content)  # Modify content first
-        logger.debug(f"Content length after adding date: {len(content)} characters")
-        
-        # Check if article will be split into multiple parts
-        # We need to know this beforehand to reserve space for navigation links
-        estimated_chunks = self._estimate_chunks_count(content, title)
-        will_be_multipart = estimated_chunks > 1
-        
-        chunks = self.split_content(content, title, reserve_space_for_nav=will_be_multipart)
+        content = self._add_reposting_date(content)  # Modify content first
+        
+        # Parts are packed with their exact size, navigation links included
+        chunks = self.split_content(content, title)
+        parts = [_PartState(i, self._part_title(title, i), chunk) for i, chunk in enumerate(chunks)]
+        
+        usage = {'calls': 0, 'bytes_sent': 0}
+        try:
+            account_id = await self._plan_in_ledger(ledger, article, parts)
+            rewritten = account_id is None and await self._rewrite_untracked_pages(article, parts, title, usage, ledger)
+            if not rewritten:
+                # All parts go to one account so that it can edit them
+                async with self._get_pool().account(account_id) as account:
+                    logger.debug(f"Publishing with Telegraph account {account.account_id}")
+                    await self._resume_from_ledger(ledger, account, parts, usage)
+                    if all(part.published for part in parts):
+                        logger.info(f"All {len(parts)} part(s) already published according to the ledger")
+                    elif len(parts) > 1 and self.publish_mode == PUBLISH_MODE_RESERVE:
+                        await self._publish_with_reserved_pages(account, parts, title, usage, ledger)
+                    else:
+                        await self._publish_then_link(account, parts, title, usage, ledger)
+        except Exception as e:
+            logger.error(f"Telegraph API error: {str(e)}", exc_info=True)
+            # If we get a content too large error, try with smaller chunks
+            if "content too large" in str(e).lower() or "too long" in str(e).lower():
+                logger.warning("Content still too large, need smaller chunks")
+                # Could implement recursive splitting here
+            raise e
+
+        telegraph_urls = [part.url for part in parts]
+        self.publish_stats['articles'] += 1
+        self.publish_stats['calls'] += usage['calls']
+        self.publish_stats['bytes_sent'] += usage['bytes_sent']
+        logger.info(
+            f"Created {len(telegraph_urls)} Telegraph article(s) with {usage['calls']} API call(s), "
+            f"{usage['bytes_sent']} content bytes sent"
+        )
+        return telegraph_urls
+
+    def get_publish_stats(self) -> dict:
+        """Articles published, Telegraph API calls made and content bytes sent for them"""
+        return dict(self.publish_stats)
+
+    def _get_pool(self) -> TelegraphTokenPool:
+        """
+        Create the token pool on first use.
+        Pages are published through non-blocking clients, spread over the accounts
+        of TELEGRAPH_ACCESS_TOKENS or with the account set up above alone.
+        """
+        if self.pool is None:
+            self.pool = TelegraphTokenPool.from_env(self.telegraph.get_access_token())
+        return self.pool
+
+    async def close(self) -> None:
+        """Close the connections of the pool's clients (call before the event loop ends)"""
+        if self.pool is not None:
+            await self.pool.close()
+            logger.debug("Telegraph clients closed")
+
+    def get_pool_stats(self) -> dict:
+        """Per-account statistics of the token pool"""
+        return self._get_pool().get_stats()
+
+    async def edit_telegraph_page(
+        self, url: str, title: str, content: List[Node], ledger: Optional['PublishLedgerRepository'] = None
+    ) -> dict:
+        """
+        Replace the title and content of a published page.
+
+        The call is sent with the token of the account that created the page,
+        looked up in the ledger if this process did not create it.
+
+        Args:
+            url: Page URL
+            title: Page title
+            content: Content as Telegraph nodes
+            ledger: Optional publish ledger (see PublishLedgerRepository)
+
+        Returns:
+            The edited page
+        """
+        return await self._get_pool().edit_page(url, title, content, ledger=ledger, author_name=self.author_name)
+
+    async def _rewrite_untracked_pages(
+        self, article: Article, parts: List['_PartState'], title: str, usage: dict, ledger
+    ) -> bool:
+        """
+        Rewrite in place the pages of an article published before the ledger tracked it.
+
+        Used when the article's saved URLs are unknown to the ledger and its new
+        content splits into as many parts as it has pages, so that a changed
+        article does not get a second set of pages. Each page is edited with
+        the account that owns it, which is then recorded in the ledger.
+
+        Returns:
+            Whether the pages were rewritten (False: new pages have to be created)
+        """
+        existing_urls = list(article.telegraph_urls or [])
+        if ledger is None or len(existing_urls) != len(parts) or any(part.entry.url for part in parts):
+            return False
+
+        for part, url in zip(parts, existing_urls):
+            part.url = url
+        try:
+            for part in parts:
+                content = self._with_navigation(parts, part.index, title) if len(parts) > 1 else part.content
+                usage['calls'] += 1
+                usage['bytes_sent'] += nodes_size(content)
+                await self.edit_telegraph_page(part.url, part.title, content, ledger=ledger)
+        except RetryAfterError:
+            raise
+        except TelegraphException as e:
+            logger.warning(f"Cannot rewrite the existing pages of '{title}', creating new ones: {e}")
+            for part in parts:
+                part.url = None
+            return False
+
+        pool = self._get_pool()
+        for part in parts:
+            part.published = True
+            owner = pool.owner_of(part.url)
+            await ledger.mark_published(
+                part.entry, page_path(part.url), part.url, account_id=owner.account_id if owner else None
+            )
+        logger.info(f"Rewrote the {len(parts)} existing page(s) of '{title}'")
+        return True
+
+    @staticmethod
+    def _part_fingerprint(part: '_PartState', total: int) -> str:
+        """Fingerprint of a part as published: its title, position, the number of parts and its content"""
+        return fingerprint(json.dumps(
+            [part.title, part.index, total, part.content], ensure_ascii=False, separators=(',', ':')
+        ))
+
+    async def _plan_in_ledger(self, ledger, article: Article, parts: List['_PartState']) -> Optional[str]:
+        """
+        Record the parts in the ledger and take over the pages of an earlier run.
+
+        Returns:
+            Account that owns the article's existing pages, if any
+        """
+        if ledger is None:
+            return None
+        entries = await ledger.plan(article.id, [(part.title, self._part_fingerprint(part, len(parts))) for part in parts])
+        for part, entry in zip(parts, entries):
+            part.entry = entry
+        owners = [entry.account_id for entry in entries if entry.account_id]
+        if not owners:
+            return None
+        if self._get_pool().get_account(owners[0]) is None:
+            logger.warning(f"Telegraph account {owners[0]} of earlier pages is not in the pool, creating new pages")
+            return None
+        return owners[0]
+
+    async def _resume_from_ledger(self, ledger, account: TelegraphAccount, parts: List['_PartState'], usage: dict) -> None:
+        """Restore the pages and progress of parts recorded by an earlier run"""
+        if ledger is None:
+            return
+        recent_pages = None
+        for part in parts:
+            entry = part.entry
+            if entry.state == PART_PLANNED:
+                continue
+            if entry.account_id != account.account_id:
+                # Pages of an account that left the pool cannot be edited any more
+                await ledger.reset(entry)
+                continue
+            if entry.state == PART_CREATING:
+                # The process stopped while createPage was in flight: the page may exist
+                if recent_pages is None:
+                    usage['calls'] += 1
+                    recent_pages = (await account.client.get_page_list(limit=RECOVERY_PAGE_LIST_LIMIT))['pages']
+                    # Pages of other articles, or of other parts of this one, are never adopted
+                    claimed = await ledger.get_claimed_urls([page['url'] for page in recent_pages])
+                    recent_pages = [page for page in recent_pages if page['url'] not in claimed]
+                page = self._find_interrupted_page(parts, part, recent_pages)
+                if page is None:
+                    await ledger.reset(entry)
+                    continue
+                recent_pages.remove(page)
+                logger.info(f"Recovered page of part {part.index + 1} created before an interruption: {page['url']}")
+                await ledger.mark_created(entry, page['path'], page['url'])
+            part.url = entry.url
+            part.published = entry.state == PART_PUBLISHED
+            self._get_pool().record_page(account, part.url)
+
+    def _find_interrupted_page(self, parts: List['_PartState'], part: '_PartState', pages: List[dict]) -> Optional[dict]:
+        """
+        Page that the lost createPage call of a part may have created.
+
+        A page qualifies when it has the part's title and its description
+        (the start of its text, generated by Telegraph) matches one of the
+        contents the part could have been created with. Titles are not
+        unique, so nothing is adopted unless exactly one page qualifies.
+        """
+        title = parts[0].title
+        total = len(parts)
+        contents = [
+            part.content,
+            self._add_nav_to_content(
+                part.content, self._create_navigation_links(part.index, total, [''] * total, title), part.index == 0
+            ),
+        ]
+        if part.index > 0:
+            contents.append(PLACEHOLDER_CONTENT)
+        texts = {self._description_key(''.join(node_text(node) for node in content)) for content in contents}
+
+        matches = []
+        for page in pages:
+            if page['title'] != part.title:
+                continue
+            description = self._description_key(page.get('description', ''))
+            if any(text.startswith(description) if description else not text for text in texts):
+                matches.append(page)
+        if len(matches) > 1:
+            logger.warning(f"{len(matches)} pages could belong to part {part.index + 1} of '{title}', creating a new one")
+            return None
+        return matches[0] if matches else None
+
+    @staticmethod
+    def _description_key(text: str) -> str:
+        """Text compared between a page description and a part: no whitespace, no trailing ellipsis"""
+        return re.sub(r'\s+', '', text).rstrip('….')
+
+    async def _send_part(
+        self,
+        account: TelegraphAccount,
+        usage: dict,
+        part: '_PartState',
+        content: List[Node],
+        final: bool,
+        ledger=None,
+    ) -> None:
+        """
+        Write a part's page, creating it if the part has none yet.
+        Counts the call and the content bytes sent, and records the part in the ledger.
         
-        # --- Create Telegraph pages ---
-        telegraph_urls = []
-        for i, chunk in enumerate(chunks):
-            chunk_title = title if i == 0 else f"{title} (part {i+1})"
-            
-            try:
-                logger.info(f"Creating Telegraph page {i+1}/{len(chunks)}: {chunk_title}")
-                logger.debug(f"Content: {len(chunk)} chars, {len(chunk.encode('utf-8'))} bytes")
-                
-                page = self.telegraph.create_page(
-                    title=chunk_title,
-                    html_content=chunk,
-                    author_name=self.author_name
-                )
-                telegraph_urls.append(page['url'])
-                logger.info(f"Created Telegraph page: {page['url']}")
-                
-            except Exception as e:
-                logger.error(f"Telegraph API error: {str(e)}", exc_info=True)
-                # If we get a content too large error, try with smaller chunks
-                if "content too large" in str(e).lower() or "too long" in str(e).lower():
-                    logger.warning("Content still too large, need smaller chunks")
-                    # Could implement recursive splitting here
-                raise e
+        Args:
+            content: Content written to the page
+            final: Whether content is the part's final content (with navigation)
+        """
+        usage['calls'] += 1
+        usage['bytes_sent'] += nodes_size(content)
+        if part.url is not None:
+            await account.client.edit_page(
+                path=page_path(part.url), title=part.title, content=content, author_name=self.author_name
+            )
+        else:
+            if ledger is not None:
+                await ledger.mark_creating(part.entry, account.account_id)
+            page = await account.client.create_page(title=part.title, content=content, author_name=self.author_name)
+            part.url = page['url']
+            self._get_pool().record_page(account, part.url)
+            if ledger is not None and not final:
+                await ledger.mark_created(part.entry, page_path(part.url), part.url)
+        if final:
+            part.published = True
+            if ledger is not None:
+                await ledger.mark_published(part.entry, page_path(part.url), part.url)
+
+    async def _publish_then_link(
+        self,
+        account: TelegraphAccount,
+        parts: List['_PartState'],
+        title: str,
+        usage: dict,
+        ledger=None,
+    ) -> None:
+        """
+        Create every part in order, then edit each one to add navigation links.
+
+        Sends the content of a multipart article twice (2N calls). Used for
+        single parts and in the 'edit' publish mode.
+        """
+        single = len(parts) == 1
+        for part in parts:
+            if part.url is None or (single and not part.published):
+                logger.info(f"Creating Telegraph page {part.index + 1}/{len(parts)}: {part.title}")
+                logger.debug(f"Content: {len(part.content)} nodes, {nodes_size(part.content)} bytes")
+                await self._send_part(account, usage, part, part.content, final=single, ledger=ledger)
+                logger.info(f"Created Telegraph page: {part.url}")
 
         # If multi-part article, add navigation links
-        if len(telegraph_urls) > 1:
-            logger.info(f"Adding navigation links to {len(telegraph_urls)} parts")
-            await self._add_navigation_links(telegraph_urls, chunks, title)
+        if not single:
+            logger.info(f"Adding navigation links to {len(parts)} parts")
+            await self._add_navigation_links(account, parts, title, usage, ledger)
 
-        logger.info(f"Created {len(telegraph_urls)} Telegraph article(s)")
-        return telegraph_urls
-        
-        
-        
+    async def _publish_with_reserved_pages(
+        self,
+        account: TelegraphAccount,
+        parts: List['_PartState'],
+        title: str,
+        usage: dict,
+        ledger=None,
+    ) -> None:
+        """
+        Publish a multipart article sending the content of every part once.
+
+        Telegraph's editPage replaces the whole page, so a link cannot be
+        patched into a page without sending its content again. Instead the
+        URLs are reserved first: parts 2..N are created concurrently as
+        placeholder pages of a few bytes, the first part is created with its
+        content and its "Next" link, and parts 2..N are then filled in
+        concurrently with both links known. That is 2N-1 calls of which
+        only N carry content, in three rounds of requests instead of 2N
+        sequential ones. Parts that already have a page (resumed from the
+        ledger) are not reserved again, published ones are not rewritten.
+        """
+        total = len(parts)
+        unreserved = [part for part in parts[1:] if part.url is None]
+        if unreserved:
+            logger.info(f"Reserving pages for {len(unreserved)} of parts 2-{total} of '{title}'")
+            await asyncio.gather(*(
+                self._send_part(account, usage, part, PLACEHOLDER_CONTENT, final=False, ledger=ledger)
+                for part in unreserved
+            ))
+
+        first = parts[0]
+        if not first.published:
+            logger.info(f"Creating Telegraph page 1/{total}: {title}")
+            await self._send_part(account, usage, first, self._with_navigation(parts, 0, title), final=True, ledger=ledger)
+            logger.info(f"Created Telegraph page: {first.url}")
+
+        logger.info(f"Filling in parts 2-{total}")
+        await asyncio.gather(*(
+            self._send_part(account, usage, part, self._with_navigation(parts, part.index, title), final=True, ledger=ledger)
+            for part in parts[1:]
+            if not part.published
+        ))
+
+    def get_content_nodes(self, article: Article) -> List[Node]:
+        """
+        Telegraph nodes of an article's content.
+        Nodes are compiled by the parser; articles stored before that are compiled from their HTML.
+        """
+        if article.content_nodes is not None:
+            return article.content_nodes
+        logger.debug("Article has no compiled content nodes, compiling from HTML")
+        return html_to_nodes(article.content)
 
-    def _add_reposting_date(self, content: str) -> str:
-        """Find existing publication info and add repost date to it."""
-        from bs4 import BeautifulSoup
+    def _find_publication_info(self, content: List[Node]) -> Optional[int]:
+        """Index of the top-level publication info paragraph ("Platypus Review 179 | September 2025")"""
+        for index, node in enumerate(content):
+            if isinstance(node, dict) and node['tag'] == 'p' and PUBLICATION_INFO_RE.search(node_text(node)):
+                return index
+        return None
+
+    def _add_reposting_date(self, content: List[Node]) -> List[Node]:
+        """
+        Find existing publication info and add repost date to it.
+        Returns a new node list; the given nodes are not modified.
+        """
         from datetime import datetime
         
-        # Parse the content
-        soup = BeautifulSoup(content, 'html.parser')
-        
         # Get current date for reposting
         current_date = datetime.now()
         reposting_date = current_date.strftime("%Y-%m-%d")
         
-        # Look for the publication info paragraph
-        # Find p tag with class "has-text-align-right" containing "Platypus Review"
-        pub_paragraph = soup.find('p', class_='has-text-align-right')
+        content = list(content)
+        pub_index = self._find_publication_info(content)
         
-        if pub_paragraph and 'Platypus Review' in pub_paragraph.get_text():
+        if pub_index is not None:
             # Add repost date to the existing paragraph
-            repost_text = f' <em>(Reposted on: {reposting_date})</em>'
-            pub_paragraph.append(BeautifulSoup(repost_text, 'html.parser'))
+            pub_paragraph = dict(content[pub_index])
+            children = list(pub_paragraph.get('children', []))
+            if children and isinstance(children[-1], str):
+                children[-1] += ' '
+            else:
+                children.append(' ')
+            children.append({'tag': 'em', 'children': [f'(Reposted on: {reposting_date})']})
+            pub_paragraph['children'] = children
+            content[pub_index] = pub_paragraph
         else:
             # If no existing publication info found, create a new one with repost date
             month_year = current_date.strftime("%B %Y")
             issue_number = "179"  # Update this logic as needed
             
-            pub_info_html = f'''<p class="has-text-align-right"><a href="https://platypus1917.org/category/pr/issue-{issue_number}/"><em>Platypus Review</em> {issue_number}</a> | {month_year} <em>Reposted on: {reposting_date}</em></p>'''
-            
-            pub_info_soup = BeautifulSoup(pub_info_html, 'html.parser')
+            pub_info = {'tag': 'p', 'children': [
+                {'tag': 'a', 'attrs': {'href': f'https://platypus1917.org/category/pr/issue-{issue_number}/'},
+                 'children': [{'tag': 'em', 'children': ['Platypus Review']}, f' {issue_number}']},
+                f' | {month_year} ',
+                {'tag': 'em', 'children': [f'Reposted on: {reposting_date}']},
+            ]}
             
             # Insert at the beginning
-            first_element = soup.find()
-            if first_element:
-                first_element.insert_before(pub_info_soup.p)
-            else:
-                # If no elements found, just add it as the first content
-                soup.append(pub_info_soup.p)
+            content.insert(0, pub_info)
         
-        return str(soup)
+        return content
 
-    def _estimate_chunks_count(self, content: str, title: str) -> int:
-        """Estimate how many chunks the content will be split into."""
-        # Use a quick estimation without actually processing all blocks
-        content_bytes = len(content.encode('utf-8'))
-        title_bytes = len(title.encode('utf-8'))
-        overhead_bytes = 2000
-        max_content_bytes = 65536 - title_bytes - overhead_bytes
-        
-        estimated_chunks = max(1, (content_bytes + max_content_bytes - 1) // max_content_bytes)
-        return estimated_chunks
+    def _estimate_chunks_count(self, content: List[Node], title: str) -> int:
+        """Number of parts the content will be split into."""
+        blocks = self._get_blocks(content)
+        return len(self._plan_parts([self._measure_block(block)[0] for block in blocks], title))
+
+    @staticmethod
+    def _part_title(title: str, index: int) -> str:
+        """Page title of a part of a multipart article"""
+        return title if index == 0 else f"{title} (part {index + 1})"
 
-    async def _add_navigation_links(self, telegraph_urls: List[str], original_chunks: List[str], title: str):
+    def _with_navigation(self, parts: List['_PartState'], index: int, title: str) -> List[Node]:
+        """Content of a part with its navigation links"""
+        urls = [part.url for part in parts]
+        nav_links = self._create_navigation_links(index, len(parts), urls, title)
+        content = self._add_nav_to_content(parts[index].content, nav_links, index == 0)
+        if nodes_size(content) > MAX_CONTENT_BYTES:
+            logger.warning(f"Part {index+1} exceeds {MAX_CONTENT_BYTES} bytes with navigation links ({title})")
+        return content
+
+    async def _add_navigation_links(
+        self,
+        account: TelegraphAccount,
+        parts: List['_PartState'],
+        title: str,
+        usage: dict,
+        ledger=None,
+    ):
         """Add navigation links to multi-part Telegraph articles."""
-        for i, url in enumerate(telegraph_urls):
-            # Get the page path from URL for editing
-            page_path = url.split('/')[-1]
-            
-            # Create navigation links
-            nav_links = self._create_navigation_links(i, len(telegraph_urls), telegraph_urls, title)
-            
+        for part in parts:
+            if part.published:
+                continue
             # Add navigation to the existing content
-            updated_content = self._add_nav_to_content(original_chunks[i], nav_links, i == 0)
+            updated_content = self._with_navigation(parts, part.index, title)
             
             try:
                 # Update the Telegraph page with navigation links
-                self.telegraph.edit_page(
-                    path=page_path,
-                    title=title if i == 0 else f"{title} (part {i+1})",
-                    html_content=updated_content,
-                    author_name=self.author_name
-                )
-                logger.debug(f"Added navigation to part {i+1}")
+                await self._send_part(account, usage, part, updated_content, final=True, ledger=ledger)
+                logger.debug(f"Added navigation to part {part.index + 1}")
                 
             except Exception as e:
-                logger.error(f"Failed to add navigation to part {i+1}: {str(e)}", exc_info=True)
+                logger.error(f"Failed to add navigation to part {part.index + 1}: {str(e)}", exc_info=True)
 
     def _create_navigation_links(self, current_index: int, total_parts: int, urls: List[str], title: str) -> dict:
-        """Create navigation link HTML for current part."""
+        """Create navigation link nodes for current part."""
         nav = {
-            'top': '',
-            'bottom': ''
+            'top': [],
+            'bottom': []
         }
         
         links = []
@@ -251,169 +625,181 @@ class TelegraphManager:
         # Previous part link
         if current_index > 0:
             prev_url = urls[current_index - 1]
-            prev_title = title if current_index == 1 else f"{title} (part {current_index})"
-            links.append(f'<br><a href="{prev_url}">← Previous: {prev_title}</a>')
+            prev_title = self._part_title(title, current_index - 1)
+            links.append({'tag': 'a', 'attrs': {'href': prev_url}, 'children': [f'← Previous: {prev_title}']})
         
         # Next part link
         if current_index < total_parts - 1:
             next_url = urls[current_index + 1]
-            next_title = f"{title} (part {current_index + 2})"
-            links.append(f'<br><a href="{next_url}">Next: {next_title} →</a>')
+            next_title = self._part_title(title, current_index + 1)
+            links.append({'tag': 'a', 'attrs': {'href': next_url}, 'children': [f'Next: {next_title} →']})
         
         if links:
-            # Create navigation HTML
-            nav_html = f'<p><strong>Navigation:</strong> {"  ".join(links)}</p><hr>'
-            nav['top'] = nav_html
-            nav['bottom'] = f'<hr>{nav_html}'
+            # Create navigation nodes: each link on its own line
+            children = [{'tag': 'strong', 'children': ['Navigation:']}]
+            for link in links:
+                children.extend([' ', {'tag': 'br'}, link])
+            nav_paragraph = {'tag': 'p', 'children': children}
+            nav['top'] = [nav_paragraph, {'tag': 'hr'}]
+            nav['bottom'] = [{'tag': 'hr'}, nav_paragraph]
         
         return nav
 
-    def _add_nav_to_content(self, content: str, nav_links: dict, is_first_part: bool) -> str:
+    def _add_nav_to_content(self, content: List[Node], nav_links: dict, is_first_part: bool) -> List[Node]:
         """Add navigation links to content at the beginning and end."""
         if not nav_links['top']:
             return content
         
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(content, 'html.parser')
-        
         # Add navigation at the top (after reposting date if it's the first part)
-        top_nav_soup = BeautifulSoup(nav_links['top'], 'html.parser')
-        
+        insert_at = 0
         if is_first_part:
-            # Find the reposting date paragraph and insert after it
-            pub_paragraph = soup.find('p', class_='has-text-align-right')
-            if pub_paragraph:
+            pub_index = self._find_publication_info(content)
+            if pub_index is not None:
                 # Insert after the publication info
-                for element in reversed(top_nav_soup.contents):
-                    if hasattr(element, 'name'):
-                        pub_paragraph.insert_after(element)
-            else:
-                # Insert at the very beginning
-                first_element = soup.find()
-                if first_element:
-                    for element in reversed(top_nav_soup.contents):
-                        if hasattr(element, 'name'):
-                            first_element.insert_before(element)
-        else:
-            # For subsequent parts, add at the very beginning
-            first_element = soup.find()
-            if first_element:
-                for element in reversed(top_nav_soup.contents):
-                    if hasattr(element, 'name'):
-                        first_element.insert_before(element)
+                insert_at = pub_index + 1
         
         # Add navigation at the bottom
-        bottom_nav_soup = BeautifulSoup(nav_links['bottom'], 'html.parser')
-        # Add all elements from bottom navigation
-        for element in bottom_nav_soup.find_all():
-            soup.append(element)
-        
-        return str(soup)
+        return content[:insert_at] + nav_links['top'] + content[insert_at:] + nav_links['bottom']
 
 
-    def split_content(self, content: str, title: str = "", reserve_space_for_nav: bool = False) -> List[str]:
-        """Split HTML content string safely into chunks that fit Telegraph's limits."""
-        from bs4 import BeautifulSoup
-        
-        def _get_blocks(content_soup: BeautifulSoup) -> List[BeautifulSoup]: 
-                
-            # Get all top-level elements that could be meaningful chunks
-            # This includes block-level elements and standalone inline elements
-            blocks = []
-            
-            
-            # First, get traditional block-level elements
-            block_elements = content_soup.find_all(['p', 'ul', 'ol', 'blockquote', 'pre', 'hr'])
-            blocks.extend(block_elements)
-            
-            # Then handle standalone img tags (they might not be in paragraphs)
-            standalone_imgs = content_soup.find_all('img')
-            for img in standalone_imgs:
-                # Only add if it's not already inside a block element we found
-                if not any(img in block.find_all('img') if hasattr(block, 'find_all') else False for block in block_elements):
-                    blocks.append(img)
-            
-            # Handle any remaining text or inline elements that aren't wrapped in blocks
-            for element in content_soup.children:
-                if hasattr(element, 'name') and element.name in ALLOWED_TAGS:
-                    # Check if this element is inline and not already captured
-                    if element.name in ['a', 'b', 'i', 'em', 'strong', 'u', 's', 'code', 'br']:
-                        # Only add if it's not already inside a block we found
-                        if not any(element in block.descendants if hasattr(block, 'descendants') else False for block in blocks):
-                            blocks.append(element)
-                elif hasattr(element, 'string') and element.string and element.string.strip():  # Text nodes
-                    # Wrap standalone text in a paragraph for proper handling
-                    text_content = element.string.strip()
-                    if text_content and not any(text_content in str(block) for block in blocks):
-                        # Create a temporary paragraph wrapper for text
-                        temp_p = content_soup.new_tag('p')
-                        temp_p.string = text_content
-                        blocks.append(temp_p)
-            
-            # Sort blocks by their position in the original document
-            def get_position(element):
-                try:
-                    return list(content_soup.descendants).index(element)
-                except ValueError:
-                    return 999999  # Put new elements at the end
+    def split_content(self, content: List[Node], title: str = "") -> List[List[Node]]:
+        """
+        Split content nodes into the fewest parts that fit Telegraph's limits.
+        
+        Sizes are exact: every block is serialised once as the Node JSON the
+        telegraph library sends, and each part is packed up to
+        MAX_CONTENT_BYTES including the navigation links it will get (the
+        only estimate left is the length of page URLs, see _page_url_bound).
+        Runs in linear time: blocks are taken in document order and the size
+        of the current part is a running total.
+        
+        Args:
+            content: Top-level content nodes
+            title: Article title, used in the navigation links of multipart articles
             
-            blocks.sort(key=get_position)
-            return blocks
+        Returns:
+            Parts as lists of top-level nodes (empty for empty content)
+        """
+        blocks = self._get_blocks(content)
+        measured = [self._measure_block(block) for block in blocks]
+        block_bytes = [size for size, _ in measured]
+        
+        parts = self._plan_parts(block_bytes, title)
+        chunks = [blocks[start:end] for start, end in parts]
+        
+        heuristic_parts = self._heuristic_parts_count(measured, title, multipart=len(chunks) > 1)
+        saved = max(heuristic_parts - len(chunks), 0)
+        self.split_stats['articles'] += 1
+        self.split_stats['parts'] += len(chunks)
+        self.split_stats['parts_saved'] += saved
+        for number, chunk in enumerate(chunks, 1):
+            logger.debug(f"Chunk {number}: {len(chunk)} nodes, {nodes_size(chunk)} bytes")
+        logger.info(f"Split into {len(chunks)} chunk(s), {saved} fewer than with fixed budgets ({heuristic_parts})")
+        return chunks
+    
+    def get_split_stats(self) -> dict:
+        """Articles split, parts produced and parts saved by exact size accounting"""
+        return dict(self.split_stats)
+    
+    @staticmethod
+    def _get_blocks(content: List[Node]) -> List[Node]:
+        """Every top-level node is a block; standalone text is wrapped in a paragraph"""
+        blocks = []
+        for node in content:
+            if isinstance(node, str):
+                if node.strip():
+                    blocks.append({'tag': 'p', 'children': [node.strip()]})
+            else:
+                blocks.append(node)
+        return blocks
+    
+    @staticmethod
+    def _measure_block(block: Node) -> Tuple[int, int]:
+        """UTF-8 bytes and characters of a block's Node JSON"""
+        block_json = json.dumps(block, ensure_ascii=False, separators=(',', ':'))
+        return len(block_json.encode('utf-8')), len(block_json)
+    
+    def _page_url_bound(self, title: str, index: int) -> str:
+        """Placeholder at least as long as the URL Telegraph will give a part"""
+        part_title = self._part_title(title, index)
+        path_bytes = PATH_BYTES_PER_TITLE_CHAR * len(part_title) + PATH_SUFFIX_BYTES
+        return TELEGRAPH_URL_PREFIX + 'x' * path_bytes
+    
+    def _navigation_bytes(self, title: str, index: int, is_last: bool) -> int:
+        """Bytes the navigation links add to a part's content"""
+        total_parts = index + 1 if is_last else index + 2
+        urls = [self._page_url_bound(title, i) for i in range(total_parts)]
+        nav_links = self._create_navigation_links(index, total_parts, urls, title)
+        nav_nodes = nav_links['top'] + nav_links['bottom']
+        # Joining two node lists drops one pair of brackets and adds a comma
+        return nodes_size(nav_nodes) - 1 if nav_nodes else 0
+    
+    def _plan_parts(self, block_bytes: List[int], title: str) -> List[Tuple[int, int]]:
+        """
+        Pack blocks greedily into parts of at most MAX_CONTENT_BYTES.
         
+        A part's content is [block, ...] plus, in multipart articles, its
+        navigation links; its size is 2 bytes of brackets, the blocks and one
+        comma between each two nodes. Every part except the last reserves a
+        next link, and a part is the last one as soon as all remaining blocks
+        fit into it.
         
-        def _get_chunks(blocks, title: str) -> List[str]:
-            # Conservative limit: Reserve space for title and overhead
-            title_bytes = len(title.encode('utf-8'))
-            overhead_bytes = 2000  # Conservative overhead estimate
+        Args:
+            block_bytes: JSON size of each block
+            title: Article title
             
-            # Reserve additional space for navigation links if needed
-            nav_overhead = 0
-            if reserve_space_for_nav:
-                # Estimate space needed for navigation links
-                # Example: "Navigation: ← Previous: Title | Next: Title (part 2) →" + HR tags
-                estimated_nav_size = len(title.encode('utf-8')) * 2 + 200  # Conservative estimate
-                nav_overhead = estimated_nav_size * 2  # Top and bottom navigation
-                
-            MAX_CONTENT_BYTES = 64000 - title_bytes - overhead_bytes - nav_overhead  # More conservative limit
-            
-            # Convert to character limit (assume average 1.2 bytes per char for safety with UTF-8)
-            MAX_CHARS = int(MAX_CONTENT_BYTES / 1.2) 
+        Returns:
+            (start, end) block index ranges of the parts
+        """
+        count = len(block_bytes)
+        if not count:
+            return []
+        
+        total = 2 + sum(block_bytes) + count - 1
+        if total <= MAX_CONTENT_BYTES:
+            return [(0, count)]
+        
+        parts = []
+        start = 0
+        remaining = total
+        while start < count:
+            index = len(parts)
+            if index > 0 and remaining + self._navigation_bytes(title, index, is_last=True) <= MAX_CONTENT_BYTES:
+                parts.append((start, count))
+                break
             
-            reserved_info = f", Nav reserved: {nav_overhead}B" if reserve_space_for_nav else ""
-            logger.debug(f"Split limits: Title={title_bytes}B, Max content={MAX_CHARS} chars{reserved_info}")
+            limit = MAX_CONTENT_BYTES - self._navigation_bytes(title, index, is_last=False)
+            size = 2 + block_bytes[start]
+            if size > limit:
+                logger.warning(f"Block {start} alone is {block_bytes[start]} bytes, over the page limit")
+            end = start + 1
+            while end < count and size + 1 + block_bytes[end] <= limit:
+                size += 1 + block_bytes[end]
+                end += 1
             
-            chunks = []
-            current_chunk = ""
-
-            for block in blocks:
-                block_html = str(block)
-                block_bytes = len(block_html.encode('utf-8'))
-                current_bytes = len(current_chunk.encode('utf-8'))
-                
-                # Check both character and byte limits
-                if (current_bytes + block_bytes > MAX_CONTENT_BYTES or 
-                    len(current_chunk) + len(block_html) > MAX_CHARS):
-                    
-                    if current_chunk:  # Don't add empty chunks
-                        chunks.append(current_chunk)
-                        logger.debug(f"Chunk {len(chunks)}: {len(current_chunk)} chars, {len(current_chunk.encode('utf-8'))} bytes")
-                    current_chunk = block_html
-                else:
-                    current_chunk += block_html
-
-            # Add the last chunk
-            if current_chunk:
-                chunks.append(current_chunk)
-                logger.debug(f"Chunk {len(chunks)}: {len(current_chunk)} chars, {len(current_chunk.encode('utf-8'))} bytes")
-                
-            logger.info(f"Split into {len(chunks)} chunk(s)")
-            return chunks
-
-        
-        content_soup = BeautifulSoup(content, 'html.parser')
-        blocks = _get_blocks(content_soup)
-        chunks = _get_chunks(blocks, title)
-        return chunks
+            parts.append((start, end))
+            # The remaining blocks lose the bytes of this part and the comma after it
+            remaining -= size - 2 + 1
+            start = end
+        return parts
+    
+    def _heuristic_parts_count(self, measured: List[Tuple[int, int]], title: str, multipart: bool) -> int:
+        """Parts the fixed-budget heuristic (byte limit, overhead, 1.2 bytes/char, nav estimate) would produce"""
+        title_bytes = len(title.encode('utf-8'))
+        nav_overhead = (title_bytes * 2 + 200) * 2 if multipart else 0
+        max_bytes = HEURISTIC_LIMIT_BYTES - title_bytes - HEURISTIC_OVERHEAD_BYTES - nav_overhead
+        max_chars = int(max_bytes / HEURISTIC_BYTES_PER_CHAR)
+        
+        parts = 0
+        current_bytes = current_chars = 0
+        for block_bytes, block_chars in measured:
+            if parts and current_bytes + block_bytes <= max_bytes and current_chars + block_chars <= max_chars:
+                current_bytes += block_bytes
+                current_chars += block_chars
+            else:
+                parts += 1
+                current_bytes, current_chars = block_bytes, block_chars
+        return parts
 
 
 telegraph_manager: TelegraphManager = TelegraphManager()
@@ -0,0 +1,296 @@
+"""
+Pool of Telegraph accounts for sharded publishing.
+
+Telegraph rate limits apply per account, so one access token caps how
+fast a bulk run can publish. TelegraphTokenPool holds several accounts
+(TELEGRAPH_ACCESS_TOKENS), each with its own client, scheduler and
+circuit breaker, and hands every article to the least-loaded healthy
+account. A page can only be edited with the token that created it, so
+the pool records which account owns each page (in memory, and across
+runs through the publish ledger) and routes later edits to that account.
+"""
+
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+from telegraph.exceptions import RetryAfterError, TelegraphException
+
+from src.scraping.fingerprint import fingerprint
+from src.scraping.retry import HOST_FAILURE_CLASSES, CircuitBreaker, CircuitOpenError, RetryEngine
+from src.telegraph_client import AsyncTelegraphClient
+from src.telegraph_scheduler import TelegraphScheduler, get_telegraph_scheduler
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Length of the account id derived from the token (the token itself is never logged)
+ACCOUNT_ID_LENGTH = 8
+
+# Consecutive account failures that take an account out of rotation
+DEFAULT_FAILURE_THRESHOLD = 3
+
+# Seconds before an account taken out of rotation is tried again
+DEFAULT_RESET_TIMEOUT = 60.0
+
+# API errors that mean the account itself cannot publish
+ACCOUNT_ERRORS = {'ACCESS_TOKEN_INVALID', 'ACCOUNT_BANNED'}
+
+
+def tokens_from_env() -> List[str]:
+    """Access tokens listed in TELEGRAPH_ACCESS_TOKENS (comma-separated)"""
+    return [token.strip() for token in os.getenv('TELEGRAPH_ACCESS_TOKENS', '').split(',') if token.strip()]
+
+
+def page_path(url: str) -> str:
+    """Page path of a Telegraph URL (a path is returned unchanged)"""
+    return url.rstrip('/').rsplit('/', 1)[-1]
+
+
+class TelegraphAccount:
+    """A Telegraph account of the pool with its own rate limit and health state"""
+
+    def __init__(
+        self,
+        access_token: str,
+        client: Optional[AsyncTelegraphClient] = None,
+        scheduler: Optional[TelegraphScheduler] = None,
+        breaker: Optional[CircuitBreaker] = None,
+    ):
+        """
+        Args:
+            access_token: Token of the account
+            client: Client sending the account's calls (created if not given)
+            scheduler: Scheduler pacing the account's calls
+                (defaults to the account's process-wide scheduler)
+            breaker: Circuit breaker tracking the account's health
+        """
+        self.access_token = access_token
+        self.account_id = fingerprint(access_token)[:ACCOUNT_ID_LENGTH]
+        self.scheduler = scheduler or get_telegraph_scheduler(self.account_id)
+        self.client = client or AsyncTelegraphClient(access_token, scheduler=self.scheduler)
+        self.breaker = breaker or CircuitBreaker(DEFAULT_FAILURE_THRESHOLD, DEFAULT_RESET_TIMEOUT)
+        self.in_flight = 0
+        self.pages = 0
+        self.failures = 0
+
+    def is_available(self) -> bool:
+        """Whether the account may be handed out, without changing its breaker state"""
+        breaker = self.breaker
+        if breaker.state == CircuitBreaker.CLOSED:
+            return True
+        if breaker.state == CircuitBreaker.OPEN:
+            return breaker.clock() - breaker.opened_at >= breaker.reset_timeout
+        return not breaker.probe_in_flight
+
+    def load(self) -> tuple:
+        """Sort key of the least-loaded selection: work in flight, then time parked by FLOOD_WAIT, then pages owned"""
+        parked_for = max(0.0, self.scheduler.blocked_until - self.scheduler.clock())
+        return (self.in_flight, parked_for, self.pages)
+
+
+class TelegraphTokenPool:
+    """
+    Spreads publishing across Telegraph accounts.
+
+    Usage:
+        async with pool.account() as account:
+            page = await account.client.create_page(title, content)
+            pool.record_page(account, page['url'])
+        await pool.edit_page(page['url'], title, new_content)
+    """
+
+    def __init__(self, accounts: List[TelegraphAccount]):
+        """
+        Args:
+            accounts: Accounts of the pool (at least one)
+        """
+        if not accounts:
+            raise ValueError("A Telegraph token pool needs at least one account")
+        self.accounts = accounts
+        self._by_id = {account.account_id: account for account in accounts}
+        self.owners: Dict[str, str] = {}
+        logger.info(f"TelegraphTokenPool initialized with {len(accounts)} account(s): {', '.join(self._by_id)}")
+
+    @classmethod
+    def from_tokens(
+        cls,
+        tokens: List[str],
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> 'TelegraphTokenPool':
+        """Create a pool with one account per distinct token"""
+        distinct = list(dict.fromkeys(tokens))
+        return cls([
+            TelegraphAccount(token, breaker=CircuitBreaker(failure_threshold, reset_timeout, clock))
+            for token in distinct
+        ])
+
+    @classmethod
+    def from_env(cls, default_token: str) -> 'TelegraphTokenPool':
+        """
+        Create the pool from TELEGRAPH_ACCESS_TOKENS, or of default_token alone if it is not set.
+        TELEGRAPH_ACCOUNT_FAILURES and TELEGRAPH_ACCOUNT_RESET tune the per-account breakers.
+        """
+        return cls.from_tokens(
+            tokens_from_env() or [default_token],
+            failure_threshold=int(os.getenv('TELEGRAPH_ACCOUNT_FAILURES', DEFAULT_FAILURE_THRESHOLD)),
+            reset_timeout=float(os.getenv('TELEGRAPH_ACCOUNT_RESET', DEFAULT_RESET_TIMEOUT)),
+        )
+
+    def get_account(self, account_id: str) -> Optional[TelegraphAccount]:
+        """Account of the pool with the given id, if it is in the pool"""
+        return self._by_id.get(account_id)
+
+    def acquire(self, account_id: Optional[str] = None) -> TelegraphAccount:
+        """
+        Hand out the least-loaded healthy account, or a given one.
+
+        Args:
+            account_id: Account that must be used (it owns pages that will be edited)
+
+        Raises:
+            CircuitOpenError: If every account (or the given one) is out of rotation
+        """
+        if account_id is not None and account_id in self._by_id:
+            account = self._by_id[account_id]
+            if not account.is_available():
+                raise CircuitOpenError(f"Telegraph account {account_id} is out of rotation")
+        else:
+            candidates = [account for account in self.accounts if account.is_available()]
+            if not candidates:
+                raise CircuitOpenError("All Telegraph accounts are out of rotation")
+            account = min(candidates, key=TelegraphAccount.load)
+        account.breaker.allow_request()
+        account.in_flight += 1
+        return account
+
+    def release(self, account: TelegraphAccount, error: Optional[Exception] = None) -> None:
+        """Return an account, counting an error against it if the account is at fault"""
+        account.in_flight -= 1
+        if error is None or not self.is_account_failure(error):
+            # The account answered, it is healthy even if the request was bad
+            account.breaker.record_success()
+            return
+        account.failures += 1
+        was_open = account.breaker.state == CircuitBreaker.OPEN
+        account.breaker.record_failure()
+        if account.breaker.state == CircuitBreaker.OPEN and not was_open:
+            logger.warning(f"Telegraph account {account.account_id} taken out of rotation after {account.breaker.failures} failure(s)")
+
+    def abandon(self, account: TelegraphAccount) -> None:
+        """Return an account whose work was cancelled, freeing a half-open probe without recording success"""
+        account.in_flight -= 1
+        account.breaker.release_probe()
+
+    @staticmethod
+    def is_account_failure(error: Exception) -> bool:
+        """Whether an error says the account (rather than the page) cannot publish right now"""
+        if isinstance(error, RetryAfterError):
+            return True
+        if isinstance(error, TelegraphException):
+            return str(error) in ACCOUNT_ERRORS
+        return RetryEngine.classify(error) in HOST_FAILURE_CLASSES
+
+    @asynccontextmanager
+    async def account(self, account_id: Optional[str] = None) -> AsyncIterator[TelegraphAccount]:
+        """Hold the least-loaded healthy account (or the given one) for a unit of work, such as all parts of an article"""
+        account = self.acquire(account_id)
+        try:
+            yield account
+        except Exception as e:
+            self.release(account, e)
+            raise
+        except BaseException:
+            # Cancelled (e.g. an article timing out): no verdict on the account's health
+            self.abandon(account)
+            raise
+        else:
+            self.release(account)
+
+    def record_page(self, account: TelegraphAccount, url: str) -> None:
+        """Record that a page was created by an account"""
+        self.owners[page_path(url)] = account.account_id
+        account.pages += 1
+
+    def owner_of(self, url: str) -> Optional[TelegraphAccount]:
+        """Account that created a page, if it was recorded"""
+        account_id = self.owners.get(page_path(url))
+        return self._by_id.get(account_id) if account_id else None
+
+    async def find_owner(self, url: str, ledger=None) -> Optional[TelegraphAccount]:
+        """
+        Account that created a page: recorded by this process, else looked up in the publish ledger.
+
+        Args:
+            url: Page URL or path
+            ledger: Optional publish ledger (see PublishLedgerRepository)
+        """
+        owner = self.owner_of(url)
+        if owner is None and ledger is not None:
+            account_id = await ledger.get_account_for_url(url)
+            owner = self._by_id.get(account_id) if account_id else None
+            if owner is not None:
+                self.owners[page_path(url)] = owner.account_id
+        return owner
+
+    async def edit_page(self, url: str, title: str, content: List[Any], ledger=None, **kwargs) -> Dict[str, Any]:
+        """
+        Edit a page with the token of the account that created it.
+
+        The owner is the account recorded by this process or, for pages of an
+        earlier process, the one recorded in the publish ledger. Pages known to
+        neither are tried with each account in turn; the first one allowed to
+        edit the page is recorded as its owner.
+
+        Args:
+            url: Page URL or path
+            title: Page title
+            content: Content as a list of Telegraph nodes
+            ledger: Optional publish ledger to look the owner up in
+            **kwargs: Further editPage parameters (author_name, ...)
+
+        Returns:
+            The edited page
+        """
+        path = page_path(url)
+        owner = await self.find_owner(url, ledger)
+        if owner is not None:
+            return await owner.client.edit_page(path=path, title=title, content=content, **kwargs)
+
+        last_error: Optional[Exception] = None
+        for account in self.accounts:
+            try:
+                page = await account.client.edit_page(path=path, title=title, content=content, **kwargs)
+            except RetryAfterError:
+                raise
+            except TelegraphException as e:
+                logger.debug(f"Account {account.account_id} cannot edit {path}: {e}")
+                last_error = e
+                continue
+            self.owners[path] = account.account_id
+            return page
+        raise last_error
+
+    async def close(self) -> None:
+        """Close the HTTP sessions of every account's client"""
+        for account in self.accounts:
+            try:
+                await account.client.close()
+            except Exception as e:
+                logger.warning(f"Could not close the client of Telegraph account {account.account_id}: {e}")
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-account statistics: health, work in flight, pages owned, failures and call counts"""
+        return {
+            account.account_id: {
+                'state': account.breaker.state,
+                'in_flight': account.in_flight,
+                'pages': account.pages,
+                'failures': account.failures,
+                'calls': sum(method['calls'] for method in account.scheduler.get_stats().values()),
+            }
+            for account in self.accounts
+        }
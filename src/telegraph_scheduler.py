@@ -0,0 +1,231 @@
+"""
+Process-wide schedulers for Telegraph API calls, one per account.
+
+Telegraph throttles per account with FLOOD_WAIT_<seconds> errors rather
+than HTTP 429. Every call made through AsyncTelegraphClient waits for a
+token of its account's bucket (the fetch layer's TokenBucket), so
+concurrent publishing never exceeds the configured rate. A FLOOD_WAIT
+parks the account's queue for the requested seconds and the throttled
+call is sent again: Telegraph rejected it without executing it, so this
+is safe for every method. Like the fetch layer's HostScheduler, the rate
+is halved on every FLOOD_WAIT and raised again step by step on success
+(AIMD), so bulk publishing settles at the highest rate Telegraph
+tolerates. Transport errors (timeouts, dropped connections) are only
+retried for idempotent methods, since a createPage that timed out may
+still have created the page.
+"""
+
+import asyncio
+import os
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from telegraph.exceptions import RetryAfterError
+
+from src.scraping.host_scheduler import (
+    MIN_RATE_PER_HOST,
+    RATE_RECOVERY_STEP,
+    THROTTLE_BACKOFF_FACTOR,
+    TokenBucket,
+)
+from src.scraping.retry import HOST_FAILURE_CLASSES, RetryEngine, RetryPolicy
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Default request rate for all Telegraph API calls together, requests per second
+DEFAULT_RATE = 2.0
+
+# Number of calls that may be sent back-to-back after an idle period
+DEFAULT_BURST = 4
+
+# How many times a call is sent before its error is raised
+DEFAULT_MAX_ATTEMPTS = 5
+
+# Longest FLOOD_WAIT honoured by waiting; longer ones are raised to the caller
+DEFAULT_MAX_FLOOD_WAIT = 300.0
+
+# Methods that give the same result when sent twice
+IDEMPOTENT_METHODS = {'editPage', 'getPage', 'getPageList', 'getViews', 'getAccountInfo', 'editAccountInfo'}
+
+# Backoff between attempts of an idempotent call that failed in transport
+TRANSPORT_RETRY_POLICY = RetryPolicy(max_attempts=DEFAULT_MAX_ATTEMPTS, base_delay=1.0, max_delay=10.0)
+
+
+class MethodStats:
+    """Call counts and queue wait times of one API method"""
+
+    def __init__(self):
+        self.calls = 0
+        self.attempts = 0
+        self.flood_waits = 0
+        self.retries = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+
+class TelegraphScheduler:
+    """
+    Paces Telegraph API calls and retries them through FLOOD_WAIT.
+
+    rate is the maximum; the current rate (bucket.rate) drops on FLOOD_WAIT
+    and recovers towards it on success.
+
+    Usage:
+        result = await scheduler.call('createPage', lambda: send_request(...))
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: float = DEFAULT_BURST,
+        max_attempts: Optional[int] = None,
+        max_flood_wait: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        rng: random.Random = random,
+    ):
+        """
+        Args:
+            rate: Maximum calls per second (defaults to TELEGRAPH_RATE env var or DEFAULT_RATE)
+            burst: Bucket capacity
+            max_attempts: Times a call is sent before giving up
+                (defaults to TELEGRAPH_MAX_ATTEMPTS env var or DEFAULT_MAX_ATTEMPTS)
+            max_flood_wait: Longest FLOOD_WAIT waited out, in seconds
+                (defaults to TELEGRAPH_MAX_FLOOD_WAIT env var or DEFAULT_MAX_FLOOD_WAIT)
+            clock: Monotonic time source (injectable for tests)
+            rng: Random source for backoff jitter (injectable for tests)
+        """
+        self.rate = rate or float(os.getenv('TELEGRAPH_RATE', DEFAULT_RATE))
+        self.max_attempts = max_attempts or int(os.getenv('TELEGRAPH_MAX_ATTEMPTS', DEFAULT_MAX_ATTEMPTS))
+        self.max_flood_wait = max_flood_wait or float(os.getenv('TELEGRAPH_MAX_FLOOD_WAIT', DEFAULT_MAX_FLOOD_WAIT))
+        self.clock = clock
+        self.rng = rng
+        self.bucket = TokenBucket(self.rate, burst, clock)
+        self.blocked_until = 0.0
+        self._methods: Dict[str, MethodStats] = {}
+        logger.info(f"TelegraphScheduler initialized: {self.rate} req/s, burst {burst}, {self.max_attempts} attempts")
+
+    def _get_method(self, method: str) -> MethodStats:
+        if method not in self._methods:
+            self._methods[method] = MethodStats()
+        return self._methods[method]
+
+    async def acquire(self) -> float:
+        """
+        Wait until a call may be sent.
+
+        Returns:
+            Time in seconds spent waiting in the queue
+        """
+        started = self.clock()
+        delay = max(self.bucket.reserve(), self.blocked_until - started, 0.0)
+        while delay > 0:
+            await asyncio.sleep(delay)
+            # The queue may have been parked by a FLOOD_WAIT while we were waiting
+            delay = self.blocked_until - self.clock()
+        return self.clock() - started
+
+    def park(self, seconds: float) -> None:
+        """Hold back every queued call for the given number of seconds"""
+        self.blocked_until = max(self.blocked_until, self.clock() + seconds)
+
+    async def call(self, method: str, send: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Send an API call when the queue allows it, retrying through FLOOD_WAIT.
+
+        Args:
+            method: API method name, used for statistics and to tell idempotent calls
+            send: Coroutine function performing one attempt of the call
+
+        Returns:
+            Whatever send returns
+
+        Raises:
+            RetryAfterError: If the FLOOD_WAIT is longer than max_flood_wait
+                or the call was throttled on every attempt
+            Exception: Errors of the last attempt, or of the first one if
+                retrying cannot help
+        """
+        stats = self._get_method(method)
+        stats.calls += 1
+        waited = 0.0
+        attempt = 0
+        while True:
+            attempt += 1
+            waited += await self.acquire()
+            stats.attempts += 1
+            try:
+                result = await send()
+            except RetryAfterError as e:
+                stats.flood_waits += 1
+                if e.retry_after > self.max_flood_wait or attempt >= self.max_attempts:
+                    self._record_wait(stats, waited)
+                    raise
+                self.park(e.retry_after)
+                self.bucket.set_rate(max(MIN_RATE_PER_HOST, self.bucket.rate * THROTTLE_BACKOFF_FACTOR))
+                logger.warning(
+                    f"Telegraph {method} got FLOOD_WAIT_{e.retry_after}: queue parked, "
+                    f"rate lowered to {self.bucket.rate:.2f} req/s, retrying (attempt {attempt})"
+                )
+            except Exception as e:
+                delay = self._transport_delay(method, e, attempt)
+                if delay is None:
+                    self._record_wait(stats, waited)
+                    raise
+                logger.warning(f"Telegraph {method} failed ({type(e).__name__}), retrying in {delay:.1f}s (attempt {attempt})")
+                await asyncio.sleep(delay)
+                waited += delay
+            else:
+                if self.bucket.rate < self.rate:
+                    self.bucket.set_rate(min(self.rate, self.bucket.rate + RATE_RECOVERY_STEP))
+                self._record_wait(stats, waited)
+                if waited > 0:
+                    logger.debug(f"Telegraph {method} waited {waited:.3f}s over {attempt} attempt(s)")
+                return result
+            stats.retries += 1
+
+    def _transport_delay(self, method: str, error: Exception, attempt: int) -> Optional[float]:
+        """Backoff before retrying a call that failed in transport, or None if it must not be retried"""
+        if method not in IDEMPOTENT_METHODS or attempt >= self.max_attempts:
+            return None
+        if RetryEngine.classify(error) not in HOST_FAILURE_CLASSES:
+            return None
+        return TRANSPORT_RETRY_POLICY.backoff(attempt, self.rng)
+
+    @staticmethod
+    def _record_wait(stats: MethodStats, waited: float) -> None:
+        stats.total_wait += waited
+        stats.max_wait = max(stats.max_wait, waited)
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-method statistics: calls, attempts, FLOOD_WAITs, retries and time spent waiting per call"""
+        return {
+            method: {
+                'calls': stats.calls,
+                'attempts': stats.attempts,
+                'flood_waits': stats.flood_waits,
+                'retries': stats.retries,
+                'total_wait': stats.total_wait,
+                'max_wait': stats.max_wait,
+                'avg_wait': stats.total_wait / stats.calls if stats.calls else 0.0,
+            }
+            for method, stats in self._methods.items()
+        }
+
+
+# Telegraph rate limits apply per account, so each account has its own scheduler
+_account_schedulers: Dict[str, TelegraphScheduler] = {}
+
+
+def get_telegraph_scheduler(account_id: str = 'default') -> TelegraphScheduler:
+    """
+    Get the process-wide scheduler of a Telegraph account.
+    Every client of the account shares it so all its calls are paced against the same limit.
+
+    Args:
+        account_id: Identifier of the account (see TelegraphAccount)
+    """
+    if account_id not in _account_schedulers:
+        _account_schedulers[account_id] = TelegraphScheduler()
+    return _account_schedulers[account_id]
@@ -0,0 +1,96 @@
+"""
+Benchmarks of the BeautifulSoup parser backends, of partial listing
+parses and of the streaming article extractor on the fixture corpus.
+
+    pytest tests/integration/system/test_parser_backend_benchmark.py -s
+
+Compare the timings with the equivalence tests in
+tests/unit/test_scraping/test_parser_backend.py before switching
+HTML_PARSER_BACKEND: only a backend with identical output is a safe choice.
+"""
+
+import re
+import time
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from src.scraping.archive_parser import ArchiveParser
+from src.scraping.review_parser import ReviewParser
+
+FIXTURES_DIR = Path(__file__).parent.parent.parent / "fixtures" / "pages"
+ARTICLE_URL = "https://platypus1917.org/2025/09/01/marxism-and-the-left-today/"
+ROUNDS = 20
+
+pytestmark = [pytest.mark.system, pytest.mark.slow]
+
+
+@pytest.mark.parametrize("backend", ["html.parser", "lxml", "html5lib"])
+def test_parser_backend_benchmark(backend):
+    """Time article, issue and archive parsing with one backend"""
+    if backend != "html.parser":
+        pytest.importorskip(backend)
+    review_parser = ReviewParser("https://platypus1917.org/platypus-review/")
+    archive_parser = ArchiveParser()
+    review_parser.backend = archive_parser.backend = backend
+
+    articles = [path.read_bytes() for path in sorted(FIXTURES_DIR.glob("article*.html"))]
+    issue_html = (FIXTURES_DIR / "issue.html").read_text()
+    archive_html = (FIXTURES_DIR / "archive.html").read_text()
+
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for html in articles:
+            review_parser.parse_content_page(html, ARTICLE_URL, 'utf-8')
+        review_parser.parse_listing_page(issue_html)
+        archive_parser.parse_archive_page(archive_html)
+    elapsed = time.perf_counter() - start
+
+    pages = ROUNDS * (len(articles) + 2)
+    print(f"\n{backend}: {pages} pages in {elapsed:.3f}s ({elapsed / pages * 1000:.2f} ms/page)")
+
+
+@pytest.mark.parametrize("partial_parse", [False, True])
+def test_listing_partial_parse_benchmark(partial_parse):
+    """Time archive and issue listing extraction with and without SoupStrainer"""
+    review_parser = ReviewParser("https://platypus1917.org/platypus-review/")
+    archive_parser = ArchiveParser()
+    review_parser.partial_parse = archive_parser.partial_parse = partial_parse
+
+    issue_html = (FIXTURES_DIR / "issue.html").read_text()
+    archive_html = (FIXTURES_DIR / "archive.html").read_text()
+
+    start = time.perf_counter()
+    for _ in range(ROUNDS * 10):
+        review_parser.parse_listing_page(issue_html)
+        archive_parser.parse_archive_page(archive_html)
+    elapsed = time.perf_counter() - start
+
+    mode = "partial" if partial_parse else "full"
+    print(f"\nListing pages ({mode} parse): {ROUNDS * 20} pages in {elapsed:.3f}s")
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_streaming_extractor_benchmark(streaming):
+    """Time and peak memory of article parsing with and without the streaming extractor"""
+    review_parser = ReviewParser("https://platypus1917.org/platypus-review/")
+    review_parser.streaming = streaming
+
+    # An article inside a page with heavy navigation chrome, as on the live site
+    article = (FIXTURES_DIR / "article.html").read_text()
+    chrome = '<ul class="menu">' + '<li><a href="/category/x/">Menu entry</a></li>' * 2000 + '</ul>'
+    html = re.sub(r'(<body[^>]*>)', lambda m: m.group(1) + '<nav>' + chrome + '</nav>', article, count=1).encode('utf-8')
+
+    tracemalloc.start()
+    review_parser.parse_content_page(html, ARTICLE_URL, 'utf-8')
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        review_parser.parse_content_page(html, ARTICLE_URL, 'utf-8')
+    elapsed = time.perf_counter() - start
+
+    mode = "streaming" if streaming else "BeautifulSoup"
+    print(f"\n{mode}: {len(html)} byte page, {elapsed / ROUNDS * 1000:.2f} ms/page, peak {peak / 1024:.0f} KiB")
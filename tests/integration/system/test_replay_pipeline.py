@@ -0,0 +1,103 @@
+"""
+Deterministic pipeline benchmarks on recorded pages.
+
+Record an archive once against the live site:
+
+    FETCH_MODE=record FETCH_ARCHIVE_PATH=test_data/platypus.jsonl.gz \
+        python tests/integration/system/test_single_review_debug.py
+
+then replay it without network access:
+
+    REPLAY_ARCHIVE_PATH=test_data/platypus.jsonl.gz pytest tests/integration/system/test_replay_pipeline.py -s
+
+The tests are skipped when no archive is configured.
+"""
+
+import os
+import re
+import time
+
+import pytest
+
+from src.scraping.archive_parser import ArchiveParser
+from src.scraping.constants import ARTICLE_URL_PATTERN, ISSUE_URL_PATTERN
+from src.scraping.page_archive import PageArchive, FETCH_MODE_REPLAY
+from src.scraping.review_parser import ReviewParser
+from src.scraping.review_scraper import ReviewScraper
+
+ARCHIVE_PATH = os.getenv('REPLAY_ARCHIVE_PATH')
+
+pytestmark = [
+    pytest.mark.system,
+    pytest.mark.slow,
+    pytest.mark.skipif(
+        not ARCHIVE_PATH or not os.path.exists(ARCHIVE_PATH),
+        reason="REPLAY_ARCHIVE_PATH does not point to a recorded page archive",
+    ),
+]
+
+
+@pytest.fixture(scope="module")
+def archive():
+    return PageArchive(ARCHIVE_PATH, FETCH_MODE_REPLAY)
+
+
+@pytest.fixture(scope="module")
+def article_urls(archive):
+    return [url for url in archive.urls() if re.search(ARTICLE_URL_PATTERN, url)]
+
+
+@pytest.fixture(scope="module")
+def issue_urls(archive):
+    return [url for url in archive.urls() if re.search(ISSUE_URL_PATTERN, url)]
+
+
+class TestReplayPipeline:
+    """Benchmark parsers and the scraping pipeline on replayed pages"""
+
+    def test_review_parser_throughput(self, archive, article_urls):
+        """Benchmark ReviewParser.parse_content_page over all recorded articles"""
+        if not article_urls:
+            pytest.skip("No article pages in the archive")
+        parser = ReviewParser("https://platypus1917.org/platypus-review/")
+
+        start = time.perf_counter()
+        for url in article_urls:
+            page = archive.replay(url)
+            parser.parse_content_page(page.body, url, page.encoding)
+        elapsed = time.perf_counter() - start
+
+        print(f"\nReviewParser: {len(article_urls)} articles in {elapsed:.3f}s "
+              f"({elapsed / len(article_urls) * 1000:.1f} ms/article)")
+
+    def test_archive_parser(self, archive):
+        """Benchmark ArchiveParser on the recorded archive page"""
+        parser = ArchiveParser()
+        if parser.base_url not in archive:
+            pytest.skip("Archive page was not recorded")
+        page = archive.replay(parser.base_url)
+
+        start = time.perf_counter()
+        issue_links = parser.parse_archive_page(page.text)
+        elapsed = time.perf_counter() - start
+
+        assert issue_links
+        print(f"\nArchiveParser: {len(issue_links)} issue links in {elapsed * 1000:.1f} ms")
+
+    async def test_scrape_review_batches(self, archive, issue_urls):
+        """Benchmark the full async scraping pipeline for every recorded issue"""
+        if not issue_urls:
+            pytest.skip("No issue pages in the archive")
+
+        start = time.perf_counter()
+        total_articles = 0
+        for issue_url in issue_urls:
+            scraper = ReviewScraper(issue_url)
+            scraper.fetcher.archive = archive
+            scraper.async_fetcher.archive = archive
+            result = await scraper.scrape_review_batch_async()
+            assert result, f"Replay of {issue_url} produced no articles"
+            total_articles += len(result['articles'])
+        elapsed = time.perf_counter() - start
+
+        print(f"\nPipeline: {len(issue_urls)} issues, {total_articles} articles in {elapsed:.3f}s")
@@ -0,0 +1,50 @@
+"""
+Benchmark of TelegraphManager.split_content on multi-megabyte articles.
+
+    pytest tests/integration/system/test_split_content_benchmark.py -s
+
+The article fixture's nodes are repeated until the content reaches each
+size. Splitting runs in linear time, so the time per megabyte must stay
+about the same as the article grows.
+"""
+
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.scraping.review_parser import ReviewParser
+from src.scraping.telegraph_nodes import nodes_size
+from src.telegraph_manager import TelegraphManager
+
+FIXTURES_DIR = Path(__file__).parent.parent.parent / "fixtures" / "pages"
+ARTICLE_URL = "https://platypus1917.org/2025/09/01/marxism-and-the-left-today/"
+SIZES_MB = (1, 2, 4, 8)
+
+pytestmark = [pytest.mark.system, pytest.mark.slow]
+
+
+def test_split_content_scales_linearly():
+    """Time splitting articles of 1 to 8 MB and compare the time per megabyte"""
+    TelegraphManager.reset_instance()
+    with patch('src.telegraph_manager.Telegraph'):
+        manager = TelegraphManager(access_token='benchmark_token')
+    parser = ReviewParser("https://platypus1917.org/platypus-review/")
+    article_nodes = parser.parse_content_page(
+        (FIXTURES_DIR / "article.html").read_bytes(), ARTICLE_URL, 'utf-8'
+    )['content_nodes']
+    article_bytes = nodes_size(article_nodes)
+
+    per_mb = {}
+    for size_mb in SIZES_MB:
+        content = article_nodes * (size_mb * 1024 * 1024 // article_bytes)
+        start = time.perf_counter()
+        chunks = manager.split_content(content, "Benchmark article")
+        elapsed = time.perf_counter() - start
+        per_mb[size_mb] = elapsed / size_mb
+        print(f"\n{size_mb} MB: {len(chunks)} chunks in {elapsed * 1000:.1f} ms ({per_mb[size_mb] * 1000:.1f} ms/MB)")
+    TelegraphManager.reset_instance()
+
+    # Quadratic behaviour would multiply the time per megabyte by 8
+    assert per_mb[SIZES_MB[-1]] < 3 * per_mb[SIZES_MB[0]]
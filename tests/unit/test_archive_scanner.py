@@ -271,3 +271,62 @@ class TestArchiveScanner:
                 assert "Found 2 review URLs in archive" in caplog.text
                 assert "Found 1 existing reviews in database" in caplog.text
                 assert "Scan complete: 1 new, 1 existing" in caplog.text
+
+
+class TestArchiveScannerFeedDiscovery:
+    """Test ArchiveScanner discovery from the issue feed"""
+    
+    @pytest.fixture
+    def feed_scanner(self, archive_url):
+        with patch('src.archive_scanner.ArchiveScraper'), \
+             patch('src.archive_scanner.FeedScraper'), \
+             patch.dict('os.environ', {'DISCOVERY_FEED_URL': 'https://platypus1917.org/feed/'}):
+            return ArchiveScanner(archive_url)
+    
+    @pytest.fixture
+    def feed_issues(self):
+        return {
+            179: "https://platypus1917.org/category/pr/issue-179/",
+            178: "https://platypus1917.org/category/pr/issue-178/",
+            177: "https://platypus1917.org/category/pr/issue-177/",
+            176: "https://platypus1917.org/category/pr/issue-176/",
+        }
+    
+    @pytest.mark.asyncio
+    async def test_feed_scan_stops_at_newest_known_issue(self, feed_scanner, feed_issues, mock_db_urls):
+        """Test issues newer than the newest known one are new and the archive page is not scraped"""
+        feed_scanner.feed_scraper.get_issue_urls = Mock(return_value=feed_issues)
+        
+        with patch('src.archive_scanner.review_repository') as mock_repo:
+            mock_repo.get_all_source_urls = AsyncMock(return_value=mock_db_urls)
+            result = await feed_scanner.scan_for_new_reviews()
+        
+        assert result['new_reviews'] == {feed_issues[179], feed_issues[178]}
+        assert result['existing_reviews'] == mock_db_urls
+        feed_scanner.archive_scraper.get_listing_urls.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_feed_scan_falls_back_when_no_known_issue(self, feed_scanner, feed_issues, mock_review_urls):
+        """Test the archive page is scraped when the feed does not reach a known issue"""
+        feed_scanner.feed_scraper.get_issue_urls = Mock(return_value={179: feed_issues[179]})
+        feed_scanner.archive_scraper.get_listing_urls = Mock(return_value=mock_review_urls)
+        db_urls = {"https://platypus1917.org/category/pr/issue-176/"}
+        
+        with patch('src.archive_scanner.review_repository') as mock_repo:
+            mock_repo.get_all_source_urls = AsyncMock(return_value=db_urls)
+            result = await feed_scanner.scan_for_new_reviews()
+        
+        feed_scanner.archive_scraper.get_listing_urls.assert_called_once()
+        assert result['new_reviews'] == mock_review_urls - db_urls
+    
+    @pytest.mark.asyncio
+    async def test_feed_scan_falls_back_on_error(self, feed_scanner, mock_review_urls):
+        """Test the archive page is scraped when the feed cannot be read"""
+        feed_scanner.feed_scraper.get_issue_urls = Mock(side_effect=Exception("feed down"))
+        feed_scanner.archive_scraper.get_listing_urls = Mock(return_value=mock_review_urls)
+        
+        with patch.object(feed_scanner, '_check_reviews_in_db', new_callable=AsyncMock) as mock_check:
+            mock_check.return_value = set()
+            result = await feed_scanner.scan_for_new_reviews()
+        
+        assert result['new_reviews'] == mock_review_urls
@@ -0,0 +1,177 @@
+"""
+Unit tests for BackfillCrawler and the crawl frontier.
+The frontier runs against a temporary SQLite database.
+"""
+
+import threading
+
+import pytest
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlmodel import SQLModel
+
+from src.backfill_crawler import BackfillCrawler
+from src.dao.models.crawl_frontier import CRAWL_DONE, CRAWL_FAILED, CRAWL_IN_PROGRESS, CRAWL_PENDING
+from src.dao.repositories.crawl_frontier_repository import crawl_frontier_repository
+
+ISSUE_URLS = {f"https://platypus1917.org/category/pr/issue-{n}/" for n in range(170, 176)}
+
+
+class TemporaryDatabase:
+    """Stand-in for DatabaseManager backed by a throwaway SQLite file"""
+
+    def __init__(self, path):
+        self.async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        self.AsyncSessionLocal = async_sessionmaker(bind=self.async_engine, class_=AsyncSession, expire_on_commit=False)
+
+    @asynccontextmanager
+    async def get_async_session(self):
+        async with self.AsyncSessionLocal() as session:
+            yield session
+
+
+@pytest.fixture
+async def frontier(tmp_path):
+    db = TemporaryDatabase(tmp_path / "frontier.db")
+    async with db.async_engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    with patch.object(crawl_frontier_repository, 'db', db):
+        yield crawl_frontier_repository
+    await db.async_engine.dispose()
+
+
+@pytest.fixture
+def crawler():
+    with patch('src.backfill_crawler.ArchiveScraper') as mock_scraper_class:
+        mock_scraper_class.return_value.get_listing_urls.return_value = set(ISSUE_URLS)
+        return BackfillCrawler("https://platypus1917.org/platypus-review/", concurrency=3, max_attempts=2)
+
+
+class TestCrawlFrontierRepository:
+    """Test the persistent crawl frontier"""
+
+    async def test_add_urls_deduplicates(self, frontier):
+        """Test URLs already in the frontier are not added again"""
+        assert await frontier.add_urls(["https://a/", "https://b/", "https://a/"]) == 2
+        assert await frontier.add_urls(["https://b/", "https://c/"]) == 1
+        assert await frontier.get_state_counts() == {CRAWL_PENDING: 3}
+
+    async def test_claim_and_mark(self, frontier):
+        """Test claimed URLs move to in_progress and then done/failed"""
+        await frontier.add_urls(["https://a/", "https://b/"])
+
+        claimed = await frontier.claim_pending(2, max_attempts=3)
+        assert await frontier.get_state_counts() == {CRAWL_IN_PROGRESS: 2}
+
+        await frontier.mark_done(claimed[0])
+        await frontier.mark_failed(claimed[1], "boom")
+        entry = await frontier.get_by_url(claimed[1])
+        assert (entry.state, entry.attempts, entry.last_error) == (CRAWL_FAILED, 1, "boom")
+
+    async def test_failed_entries_retried_until_max_attempts(self, frontier):
+        """Test failed entries are claimable only while they have attempts left"""
+        await frontier.add_urls(["https://a/"])
+        for _ in range(2):
+            (url,) = await frontier.claim_pending(1, max_attempts=2)
+            await frontier.mark_failed(url, "boom")
+
+        assert await frontier.claim_pending(1, max_attempts=2) == []
+
+    async def test_reset_in_progress(self, frontier):
+        """Test entries claimed by an interrupted run become pending again"""
+        await frontier.add_urls(["https://a/", "https://b/"])
+        await frontier.claim_pending(1, max_attempts=3)
+
+        assert await frontier.reset_in_progress() == 1
+        assert await frontier.get_state_counts() == {CRAWL_PENDING: 2}
+
+
+class TestBackfillCrawler:
+    """Test BackfillCrawler runs and resumes"""
+
+    async def test_seed_scrapes_the_archive_off_the_event_loop(self, frontier, crawler):
+        """Test the blocking archive scrape runs in a worker thread"""
+        threads = []
+
+        def get_listing_urls():
+            threads.append(threading.current_thread())
+            return set(ISSUE_URLS)
+
+        crawler.archive_scraper.get_listing_urls.side_effect = get_listing_urls
+
+        assert await crawler.seed() == len(ISSUE_URLS)
+        assert threads and threads[0] is not threading.main_thread()
+
+    async def test_run_processes_every_issue(self, frontier, crawler):
+        """Test every archive issue is crawled exactly once"""
+        with patch('src.backfill_crawler.ReviewOrchestrator') as mock_orchestrator_class:
+            mock_orchestrator_class.return_value.process_review_batch = AsyncMock(return_value=(object(), True))
+            mock_orchestrator_class.return_value.incomplete_urls = []
+            with patch('src.backfill_crawler.ReviewScraper') as mock_scraper_class:
+                counts = await crawler.run()
+
+        assert counts == {CRAWL_DONE: len(ISSUE_URLS)}
+        crawled = {call.args[0] for call in mock_scraper_class.call_args_list}
+        assert crawled == ISSUE_URLS
+        assert mock_scraper_class.call_count == len(ISSUE_URLS)
+
+    async def test_resume_skips_finished_issues(self, frontier, crawler):
+        """Test a restarted crawl only processes issues that did not finish"""
+        await frontier.add_urls(ISSUE_URLS)
+        finished = sorted(ISSUE_URLS)[:4]
+        for url in await frontier.claim_pending(5, max_attempts=2):
+            if url in finished:
+                await frontier.mark_done(url)
+        # The fifth claimed issue was left in progress by the "crashed" run
+
+        crawled = []
+
+        async def crawl_review(url):
+            crawled.append(url)
+            await frontier.mark_done(url)
+            return True
+
+        with patch.object(crawler, 'crawl_review', side_effect=crawl_review):
+            counts = await crawler.run()
+
+        assert sorted(crawled) == sorted(ISSUE_URLS - set(finished))
+        assert counts == {CRAWL_DONE: len(ISSUE_URLS)}
+
+    async def test_failing_issue_stops_after_max_attempts(self, frontier, crawler):
+        """Test an issue that keeps failing is recorded as failed"""
+        with patch('src.backfill_crawler.ReviewOrchestrator') as mock_orchestrator_class, \
+             patch('src.backfill_crawler.ReviewScraper'):
+            mock_orchestrator_class.return_value.process_review_batch = AsyncMock(return_value=None)
+            counts = await crawler.run()
+
+        assert counts == {CRAWL_FAILED: len(ISSUE_URLS)}
+        assert mock_orchestrator_class.return_value.process_review_batch.await_count == 2 * len(ISSUE_URLS)
+
+    async def test_issue_with_missing_articles_is_retried(self, frontier, crawler):
+        """Test an issue is not done while some of its articles were not fetched or published"""
+        attempts = {}
+        errors = {}
+
+        def make_orchestrator(scraper):
+            url = scraper.url
+            attempts[url] = attempts.get(url, 0) + 1
+            orchestrator = AsyncMock()
+            # The first attempt of every issue loses an article, the retry gets it
+            orchestrator.incomplete_urls = ["https://platypus1917.org/2025/09/01/lost/"] if attempts[url] == 1 else []
+            orchestrator.process_review_batch.return_value = (object(), True)
+            return orchestrator
+
+        async def mark_done(url):
+            errors[url] = (await frontier.get_by_url(url)).last_error
+            await original_mark_done(url)
+
+        original_mark_done = frontier.mark_done
+        with patch('src.backfill_crawler.ReviewOrchestrator', side_effect=make_orchestrator), \
+             patch('src.backfill_crawler.ReviewScraper', side_effect=lambda url: MagicMock(url=url)), \
+             patch.object(frontier, 'mark_done', side_effect=mark_done):
+            counts = await crawler.run()
+
+        assert counts == {CRAWL_DONE: len(ISSUE_URLS)}
+        assert attempts == {url: 2 for url in ISSUE_URLS}
+        assert all("lost" in error for error in errors.values())
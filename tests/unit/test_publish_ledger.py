@@ -0,0 +1,293 @@
+"""
+Unit tests for the Telegraph publish ledger and resuming interrupted publications.
+The ledger runs against a temporary SQLite database.
+"""
+
+import re
+from contextlib import asynccontextmanager
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from telegraph.exceptions import TelegraphException
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlmodel import SQLModel
+
+from src.dao.models import Article
+from src.dao.models.publish_ledger import PART_CREATED, PART_CREATING, PART_PLANNED, PART_PUBLISHED
+from src.dao.repositories.publish_ledger_repository import publish_ledger_repository
+from src.scraping.telegraph_nodes import node_text
+from src.telegraph_manager import TelegraphManager
+from src.telegraph_pool import TelegraphAccount, TelegraphTokenPool
+
+ARTICLE_ID = 7
+
+
+class TemporaryDatabase:
+    """Stand-in for DatabaseManager backed by a throwaway SQLite file"""
+
+    def __init__(self, path):
+        self.async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        self.AsyncSessionLocal = async_sessionmaker(bind=self.async_engine, class_=AsyncSession, expire_on_commit=False)
+
+    @asynccontextmanager
+    async def get_async_session(self):
+        async with self.AsyncSessionLocal() as session:
+            yield session
+
+
+@pytest.fixture
+async def ledger(tmp_path):
+    db = TemporaryDatabase(tmp_path / "ledger.db")
+    async with db.async_engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    with patch.object(publish_ledger_repository, 'db', db):
+        yield publish_ledger_repository
+    await db.async_engine.dispose()
+
+
+@pytest.fixture
+def client():
+    """Mocked Telegraph client; parts get URLs by part number."""
+    async def create_page(title, **kwargs):
+        match = re.search(r'\(part (\d+)\)$', title)
+        return {'url': f"https://telegra.ph/Part-{match.group(1) if match else 1}"}
+
+    client = MagicMock()
+    client.create_page = AsyncMock(side_effect=create_page)
+    client.edit_page = AsyncMock()
+    client.get_page_list = AsyncMock(return_value={'total_count': 0, 'pages': []})
+    return client
+
+
+@pytest.fixture
+def manager(client):
+    with patch('src.telegraph_manager.Telegraph') as mock_telegraph_class:
+        mock_telegraph_class.return_value = MagicMock()
+        manager = TelegraphManager(access_token='env_token')
+    manager.pool = TelegraphTokenPool([TelegraphAccount('env_token', client=client)])
+    return manager
+
+
+def make_article(parts, text='A'):
+    """Article whose content is split into the given number of parts"""
+    article = MagicMock()
+    article.id = ARTICLE_ID
+    article.title = 'Test Article'
+    article.original_url = 'https://platypus1917.org/2025/09/01/test/'
+    article.content_nodes = [{'tag': 'p', 'children': [text * 40000]} for _ in range(parts)]
+    return article
+
+
+class TestPublishLedgerRepository:
+    """Test recording the parts of a publication"""
+
+    async def test_plan_keeps_progress_of_unchanged_parts(self, ledger):
+        """Test that planning again keeps the state and page of unchanged parts"""
+        first, second = await ledger.plan(ARTICLE_ID, [('Title', 'hash-1'), ('Title (part 2)', 'hash-2')])
+        assert (first.state, second.state) == (PART_PLANNED, PART_PLANNED)
+
+        await ledger.mark_creating(first, 'account')
+        await ledger.mark_published(first, 'Title-10-18', 'https://telegra.ph/Title-10-18')
+
+        first, second = await ledger.plan(ARTICLE_ID, [('Title', 'hash-1'), ('Title (part 2)', 'hash-2')])
+        assert (first.state, first.account_id, first.path) == (PART_PUBLISHED, 'account', 'Title-10-18')
+        assert second.state == PART_PLANNED
+
+    async def test_changed_part_must_be_rewritten(self, ledger):
+        """Test that a published part whose content changed goes back to created, extra parts are dropped"""
+        first, second = await ledger.plan(ARTICLE_ID, [('Title', 'hash-1'), ('Title (part 2)', 'hash-2')])
+        for entry in (first, second):
+            await ledger.mark_published(entry, f"Path-{entry.part_index}", f"https://telegra.ph/Path-{entry.part_index}")
+
+        (first,) = await ledger.plan(ARTICLE_ID, [('Title', 'hash-3')])
+
+        assert (first.state, first.content_hash, first.url) == (PART_CREATED, 'hash-3', 'https://telegra.ph/Path-0')
+        assert [entry.part_index for entry in await ledger.get_parts(ARTICLE_ID)] == [0]
+
+    async def test_account_for_url(self, ledger):
+        """Test that the account of a recorded page is found by its URL"""
+        (entry,) = await ledger.plan(ARTICLE_ID, [('Title', 'hash-1')])
+        await ledger.mark_creating(entry, 'account')
+        await ledger.mark_published(entry, 'Title-10-18', 'https://telegra.ph/Title-10-18')
+
+        assert await ledger.get_account_for_url('https://telegra.ph/Title-10-18') == 'account'
+        assert await ledger.get_account_for_url('https://telegra.ph/Other-10-18') is None
+
+    async def test_reset_forgets_the_page(self, ledger):
+        """Test that a reset part is planned again without a page"""
+        (entry,) = await ledger.plan(ARTICLE_ID, [('Title', 'hash-1')])
+        await ledger.mark_creating(entry, 'account')
+        await ledger.mark_created(entry, 'Title-10-18', 'https://telegra.ph/Title-10-18')
+
+        await ledger.reset(entry)
+
+        (stored,) = await ledger.get_parts(ARTICLE_ID)
+        assert (stored.state, stored.account_id, stored.url) == (PART_PLANNED, None, None)
+
+
+class TestResumablePublishing:
+    """Test that publishing with a ledger never creates a page twice"""
+
+    async def test_every_part_is_recorded_published(self, manager, ledger):
+        """Test that a completed publication leaves every part published with its page"""
+        urls = await manager.create_telegraph_articles(make_article(3), ledger=ledger)
+
+        entries = await ledger.get_parts(ARTICLE_ID)
+        assert [entry.state for entry in entries] == [PART_PUBLISHED] * 3
+        assert [entry.url for entry in entries] == urls
+        assert {entry.account_id for entry in entries} == {manager.pool.accounts[0].account_id}
+
+    async def test_rerun_after_crash_creates_no_duplicates(self, manager, client, ledger):
+        """Test that pages created before a failure are reused by the next run"""
+        original = client.create_page.side_effect
+
+        async def fail_first_part(title, **kwargs):
+            if title == 'Test Article':
+                raise ConnectionError("connection lost")
+            return await original(title, **kwargs)
+
+        client.create_page.side_effect = fail_first_part
+        with pytest.raises(ConnectionError):
+            await manager.create_telegraph_articles(make_article(3), ledger=ledger)
+        assert client.create_page.await_count == 3
+        states = [entry.state for entry in await ledger.get_parts(ARTICLE_ID)]
+        assert states == [PART_CREATING, PART_CREATED, PART_CREATED]
+
+        client.create_page.side_effect = original
+        urls = await manager.create_telegraph_articles(make_article(3), ledger=ledger)
+
+        assert urls == ['https://telegra.ph/Part-1', 'https://telegra.ph/Part-2', 'https://telegra.ph/Part-3']
+        created = [call.kwargs['title'] for call in client.create_page.call_args_list[3:]]
+        assert created == ['Test Article']
+        assert [call.kwargs['path'] for call in client.edit_page.call_args_list] == ['Part-2', 'Part-3']
+
+    async def test_published_article_is_not_sent_again(self, manager, client, ledger):
+        """Test that publishing an article again (its URLs were not saved) makes no page-writing call"""
+        first_urls = await manager.create_telegraph_articles(make_article(2), ledger=ledger)
+        client.create_page.reset_mock()
+        client.edit_page.reset_mock()
+
+        assert await manager.create_telegraph_articles(make_article(2), ledger=ledger) == first_urls
+        assert not client.create_page.called
+        assert not client.edit_page.called
+
+    async def test_changed_content_rewrites_existing_pages(self, manager, client, ledger):
+        """Test that new content is written to the pages already published"""
+        await manager.create_telegraph_articles(make_article(2), ledger=ledger)
+        client.create_page.reset_mock()
+        client.edit_page.reset_mock()
+
+        urls = await manager.create_telegraph_articles(make_article(2, text='B'), ledger=ledger)
+
+        assert urls == ['https://telegra.ph/Part-1', 'https://telegra.ph/Part-2']
+        assert not client.create_page.called
+        assert sorted(call.kwargs['path'] for call in client.edit_page.call_args_list) == ['Part-1', 'Part-2']
+
+
+class TestUntrackedPages:
+    """Test rewriting the pages of an article published before the ledger tracked it"""
+
+    async def test_existing_pages_are_rewritten_with_their_owner(self, manager, client, ledger):
+        """Test that a changed article keeps its pages, edited with the account that owns them"""
+        article = make_article(2)
+        article.telegraph_urls = ['https://telegra.ph/Old-1', 'https://telegra.ph/Old-2']
+
+        urls = await manager.create_telegraph_articles(article, ledger=ledger)
+
+        assert urls == article.telegraph_urls
+        assert not client.create_page.called
+        assert [call.kwargs['path'] for call in client.edit_page.call_args_list] == ['Old-1', 'Old-2']
+        entries = await ledger.get_parts(ARTICLE_ID)
+        assert [entry.state for entry in entries] == [PART_PUBLISHED] * 2
+        assert await ledger.get_account_for_url('https://telegra.ph/Old-2') == manager.pool.accounts[0].account_id
+
+    async def test_pages_no_account_can_edit_are_replaced(self, manager, client, ledger):
+        """Test that new pages are created when the old ones belong to an account not in the pool"""
+        article = make_article(1)
+        article.telegraph_urls = ['https://telegra.ph/Old-1']
+        client.edit_page.side_effect = TelegraphException('PAGE_ACCESS_DENIED')
+
+        assert await manager.create_telegraph_articles(article, ledger=ledger) == ['https://telegra.ph/Part-1']
+        assert client.create_page.called
+
+    async def test_different_number_of_parts_creates_new_pages(self, manager, client, ledger):
+        """Test that pages are only rewritten when the new content fits the same number of pages"""
+        article = make_article(2)
+        article.telegraph_urls = ['https://telegra.ph/Old-1']
+
+        await manager.create_telegraph_articles(article, ledger=ledger)
+
+        assert client.create_page.await_count == 2
+        assert 'Old-1' not in [call.kwargs['path'] for call in client.edit_page.call_args_list]
+
+
+class TestInterruptedCreateRecovery:
+    """Test adopting the page of a createPage call whose answer was lost"""
+
+    @pytest.fixture
+    async def interrupted(self, manager, client, ledger):
+        """Single-part article whose part was left creating; returns the description of its page"""
+        await manager.create_telegraph_articles(make_article(1), ledger=ledger)
+        text = ''.join(node_text(node) for node in client.create_page.call_args.kwargs['content'])
+        (entry,) = await ledger.get_parts(ARTICLE_ID)
+        await ledger.reset(entry)
+        await ledger.mark_creating(entry, manager.pool.accounts[0].account_id)
+        client.create_page.reset_mock()
+        return text[:100] + '…'
+
+    @staticmethod
+    def page(path, description, title='Test Article'):
+        return {'path': path, 'url': f"https://telegra.ph/{path}", 'title': title, 'description': description}
+
+    async def test_page_of_the_part_is_recovered(self, manager, client, ledger, interrupted):
+        """Test that the page with the part's title and text is adopted instead of creating a duplicate"""
+        client.get_page_list.return_value = {'total_count': 2, 'pages': [
+            self.page('Other-1', interrupted, title='Other Article'),
+            self.page('Part-1', interrupted),
+        ]}
+
+        assert await manager.create_telegraph_articles(make_article(1), ledger=ledger) == ['https://telegra.ph/Part-1']
+        assert not client.create_page.called
+        assert client.edit_page.call_args.kwargs['path'] == 'Part-1'
+        assert (await ledger.get_parts(ARTICLE_ID))[0].state == PART_PUBLISHED
+
+    async def test_page_with_other_text_is_not_adopted(self, manager, client, ledger, interrupted):
+        """Test that a page of the same title but different text (another article) is left alone"""
+        client.get_page_list.return_value = {'total_count': 1, 'pages': [
+            self.page('Test-Article-10-18', 'Someone else wrote this'),
+        ]}
+
+        await manager.create_telegraph_articles(make_article(1), ledger=ledger)
+
+        assert client.create_page.called
+        assert not client.edit_page.called
+
+    async def test_ambiguous_pages_are_not_adopted(self, manager, client, ledger, interrupted):
+        """Test that nothing is adopted when several pages match the part"""
+        client.get_page_list.return_value = {'total_count': 2, 'pages': [
+            self.page('Part-1', interrupted),
+            self.page('Test-Article-10-18', interrupted),
+        ]}
+
+        await manager.create_telegraph_articles(make_article(1), ledger=ledger)
+
+        assert client.create_page.called
+        assert not client.edit_page.called
+
+    async def test_page_saved_for_an_article_is_not_adopted(self, manager, client, ledger, interrupted):
+        """Test that a page already in articles.telegraph_urls is never taken over"""
+        async with ledger.db.get_async_session() as session:
+            session.add(Article(
+                title='Test Article', content='<p>Earlier copy</p>', original_url='https://platypus1917.org/earlier/',
+                review_id=1, publication_date=date(2025, 9, 1), telegraph_urls=['https://telegra.ph/Earlier-10-18'],
+            ))
+            await session.commit()
+        client.get_page_list.return_value = {'total_count': 2, 'pages': [
+            self.page('Earlier-10-18', interrupted),
+            self.page('Part-1', interrupted),
+        ]}
+
+        assert await manager.create_telegraph_articles(make_article(1), ledger=ledger) == ['https://telegra.ph/Part-1']
+        assert not client.create_page.called
+        assert client.edit_page.call_args.kwargs['path'] == 'Part-1'
@@ -0,0 +1,163 @@
+"""
+Unit tests for concurrent article publishing in ReviewOrchestrator.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.review_orchestrator import ReviewOrchestrator
+
+
+def make_article(article_id, title=None):
+    article = MagicMock()
+    article.id = article_id
+    article.title = title or f"Article {article_id}"
+    article.original_url = f"https://platypus1917.org/article-{article_id}/"
+    return article
+
+
+@pytest.fixture
+def telegraph_manager():
+    """Telegraph manager whose articles take a short while to publish"""
+    async def create_telegraph_articles(article, ledger=None):
+        await asyncio.sleep(0.01)
+        return [f"https://telegra.ph/Article-{article.id}"]
+
+    manager = MagicMock()
+    manager.create_telegraph_articles = AsyncMock(side_effect=create_telegraph_articles)
+    return manager
+
+
+@pytest.fixture
+def update_urls():
+    async def update_telegraph_urls(article_id, urls):
+        return make_article(article_id)
+
+    with patch('src.review_orchestrator.article_repository.update_telegraph_urls',
+               AsyncMock(side_effect=update_telegraph_urls)) as mock_update:
+        yield mock_update
+
+
+def make_orchestrator(telegraph_manager, concurrency=3, timeout=5.0):
+    return ReviewOrchestrator(MagicMock(), telegraph_manager, publish_concurrency=concurrency, article_timeout=timeout)
+
+
+class TestPublishArticles:
+    """Test bounded-concurrency publishing with per-article results"""
+
+    async def test_concurrency_is_bounded(self, telegraph_manager, update_urls):
+        """Test that articles are published concurrently, never more than the limit at a time"""
+        running = 0
+        peak = 0
+
+        async def create_telegraph_articles(article, ledger=None):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return [f"https://telegra.ph/Article-{article.id}"]
+
+        telegraph_manager.create_telegraph_articles.side_effect = create_telegraph_articles
+        articles = [make_article(i) for i in range(10)]
+
+        results = await make_orchestrator(telegraph_manager, concurrency=3).publish_articles(articles)
+
+        assert peak == 3
+        assert [result.article for result in results] == articles
+        assert all(result.ok for result in results)
+        assert update_urls.await_count == 10
+
+    async def test_failing_article_does_not_stop_the_others(self, telegraph_manager, update_urls):
+        """Test that an error is collected in its article's result only"""
+        original = telegraph_manager.create_telegraph_articles.side_effect
+
+        async def create_telegraph_articles(article, ledger=None):
+            if article.id == 2:
+                raise ConnectionError("connection reset")
+            return await original(article, ledger)
+
+        telegraph_manager.create_telegraph_articles.side_effect = create_telegraph_articles
+
+        results = await make_orchestrator(telegraph_manager).publish_articles([make_article(i) for i in range(4)])
+
+        assert [result.ok for result in results] == [True, True, False, True]
+        assert results[2].error == "connection reset"
+        assert results[3].updated_article.id == 3
+
+    async def test_slow_article_times_out_alone(self, telegraph_manager, update_urls):
+        """Test that an article exceeding the timeout is given up while the others complete"""
+        original = telegraph_manager.create_telegraph_articles.side_effect
+
+        async def create_telegraph_articles(article, ledger=None):
+            if article.id == 0:
+                await asyncio.sleep(10)
+            return await original(article, ledger)
+
+        telegraph_manager.create_telegraph_articles.side_effect = create_telegraph_articles
+        orchestrator = make_orchestrator(telegraph_manager, concurrency=2, timeout=0.1)
+
+        results = await orchestrator.publish_articles([make_article(i) for i in range(5)])
+
+        assert [result.ok for result in results] == [False, True, True, True, True]
+        assert "timed out" in results[0].error
+        assert results[0].elapsed < 1
+
+    async def test_article_without_pages_is_a_failure(self, telegraph_manager, update_urls):
+        """Test that an article for which no page was created is reported as not published"""
+        telegraph_manager.create_telegraph_articles.side_effect = None
+        telegraph_manager.create_telegraph_articles.return_value = []
+
+        (result,) = await make_orchestrator(telegraph_manager).publish_articles([make_article(1)])
+
+        assert not result.ok
+        assert not update_urls.called
+
+    def test_limits_from_env(self, telegraph_manager, monkeypatch):
+        """Test that PUBLISH_CONCURRENCY and PUBLISH_ARTICLE_TIMEOUT configure the limits"""
+        monkeypatch.setenv('PUBLISH_CONCURRENCY', '7')
+        monkeypatch.setenv('PUBLISH_ARTICLE_TIMEOUT', '12.5')
+
+        orchestrator = ReviewOrchestrator(MagicMock(), telegraph_manager)
+
+        assert (orchestrator.publish_concurrency, orchestrator.article_timeout) == (7, 12.5)
+
+
+class TestIncompleteArticles:
+    """Test reporting the articles of a review that did not make it"""
+
+    async def test_unfetched_unsaved_and_unpublished_articles(self, telegraph_manager, update_urls):
+        """Test articles failing to scrape, save or publish are all listed in incomplete_urls"""
+        saved = [make_article(1), make_article(2)]
+        unsaved = make_article(3)
+        raw_review_data = {
+            'review_id': 179,
+            'source_url': 'https://platypus1917.org/category/pr/issue-179/',
+            'articles': [{'original_url': article.original_url} for article in saved + [unsaved]],
+            'failed_urls': ['https://platypus1917.org/unfetched/'],
+        }
+
+        async def save_if_not_exists(article):
+            if article is unsaved:
+                raise ValueError("database is locked")
+            return article, True
+
+        async def create_telegraph_articles(article, ledger=None):
+            if article.id == 2:
+                raise ConnectionError("connection reset")
+            return [f"https://telegra.ph/Article-{article.id}"]
+
+        telegraph_manager.create_telegraph_articles.side_effect = create_telegraph_articles
+        orchestrator = make_orchestrator(telegraph_manager)
+        with patch('src.review_orchestrator.article_factory.from_scraper_data', return_value=saved + [unsaved]), \
+             patch('src.review_orchestrator.article_repository.save_if_not_exists',
+                   AsyncMock(side_effect=save_if_not_exists)):
+            assert await orchestrator.process_articles(raw_review_data) == saved
+
+        assert orchestrator.incomplete_urls == [
+            'https://platypus1917.org/unfetched/',
+            unsaved.original_url,
+            saved[1].original_url,
+        ]
@@ -0,0 +1,61 @@
+"""
+Unit tests for the run statistics summary logged at shutdown.
+"""
+
+from unittest.mock import MagicMock, patch
+
+from src.run_stats import log_run_stats
+from src.scraping.host_scheduler import HostScheduler
+from src.scraping.retry import RetryEngine
+
+HOST_URL = "https://platypus1917.org/2025/10/01/article/"
+
+
+def make_manager():
+    manager = MagicMock()
+    manager.get_split_stats.return_value = {'articles': 2, 'parts': 5, 'parts_saved': 1}
+    manager.get_publish_stats.return_value = {'articles': 3, 'calls': 9, 'bytes_sent': 4096}
+    manager.get_pool_stats.return_value = {
+        'a1b2c3d4': {'state': 'closed', 'in_flight': 0, 'pages': 7, 'failures': 1, 'calls': 12},
+    }
+    return manager
+
+
+class TestLogRunStats:
+    """Test the counters of every layer end up in the log"""
+
+    def test_every_counter_is_logged(self):
+        """Test retry, cache, host scheduler and Telegraph counters are logged"""
+        engine = RetryEngine()
+        engine.before_request(HOST_URL)
+        engine.record_success(HOST_URL)
+        scheduler = HostScheduler(rate=2.0)
+        scheduler.wait(HOST_URL)
+        cache = MagicMock()
+        cache.get_stats.return_value = {'hits': 4, 'revalidated': 1, 'misses': 2, 'entries': 6, 'size_bytes': 100}
+
+        with patch('src.run_stats.get_retry_engine', return_value=engine), \
+             patch('src.run_stats.get_response_cache', return_value=cache), \
+             patch('src.run_stats.get_host_scheduler', return_value=scheduler), \
+             patch('src.run_stats.logger') as mock_logger:
+            log_run_stats(make_manager())
+
+        lines = "\n".join(call.args[0] for call in mock_logger.info.call_args_list)
+        assert "1 attempts, 1 successes" in lines
+        assert "Response cache: 4 hits, 1 revalidated, 2 misses" in lines
+        assert "Host platypus1917.org: 1 requests, 0 throttled" in lines
+        assert "3 articles published with 9 calls" in lines
+        assert "2 articles split into 5 parts" in lines
+        assert "Telegraph account a1b2c3d4: closed, 7 pages, 12 calls, 1 failures" in lines
+
+    def test_failure_is_logged_not_raised(self):
+        """Test a failing statistics source does not interrupt shutdown"""
+        cache = MagicMock()
+        cache.get_stats.side_effect = RuntimeError("database is closed")
+
+        with patch('src.run_stats.get_retry_engine', return_value=RetryEngine()), \
+             patch('src.run_stats.get_response_cache', return_value=cache), \
+             patch('src.run_stats.logger') as mock_logger:
+            log_run_stats(make_manager())
+
+        assert mock_logger.error.called
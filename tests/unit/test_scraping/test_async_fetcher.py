@@ -0,0 +1,144 @@
+import asyncio
+import time
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.scraping.async_fetcher import AsyncFetcher
+from src.scraping.response_cache import ResponseCache
+
+
+PAGE_DELAY = 0.2
+
+
+@pytest.fixture
+async def server():
+    """Local HTTP server with slow pages that tracks concurrent requests"""
+    state = {'in_flight': 0, 'max_in_flight': 0}
+
+    async def slow_page(request):
+        state['in_flight'] += 1
+        state['max_in_flight'] = max(state['max_in_flight'], state['in_flight'])
+        await asyncio.sleep(PAGE_DELAY)
+        state['in_flight'] -= 1
+        return web.Response(text=f"<html><body>{request.match_info['name']}</body></html>",
+                            content_type='text/html')
+
+    async def missing_page(request):
+        return web.Response(status=404, text="Not Found")
+
+    async def versioned_page(request):
+        state['versioned_requests'] = state.get('versioned_requests', 0) + 1
+        if request.headers.get('If-None-Match') == '"v1"':
+            return web.Response(status=304)
+        return web.Response(text="<html>versioned</html>", content_type='text/html',
+                            headers={'ETag': '"v1"'})
+
+    app = web.Application()
+    app.router.add_get('/missing', missing_page)
+    app.router.add_get('/versioned', versioned_page)
+    app.router.add_get('/{name}', slow_page)
+
+    async with TestServer(app) as test_server:
+        test_server.state = state
+        yield test_server
+
+
+class TestAsyncFetcher:
+    """Test the AsyncFetcher class"""
+
+    def test_init(self):
+        """Test AsyncFetcher initialization"""
+        fetcher = AsyncFetcher("https://platypus1917.org/platypus-review/", max_per_host=3)
+        assert fetcher.base_url == "https://platypus1917.org/platypus-review/"
+        assert fetcher.max_per_host == 3
+        assert fetcher.session is None  # Created lazily inside the event loop
+
+    def test_init_max_per_host_from_env(self, monkeypatch):
+        """Test the per-host cap is read from FETCH_MAX_PER_HOST"""
+        monkeypatch.setenv('FETCH_MAX_PER_HOST', '7')
+        fetcher = AsyncFetcher("https://example.com")
+        assert fetcher.max_per_host == 7
+
+    async def test_fetch_page_success(self, server):
+        """Test successful page fetching"""
+        async with AsyncFetcher(str(server.make_url('/'))) as fetcher:
+            html = await fetcher.fetch_page(str(server.make_url('/article')))
+        assert html == "<html><body>article</body></html>"
+
+    async def test_fetch_page_no_url_uses_base(self, server):
+        """Test fetch_page without URL parameter uses base_url"""
+        async with AsyncFetcher(str(server.make_url('/index'))) as fetcher:
+            html = await fetcher.fetch_page()
+        assert "index" in html
+
+    async def test_fetch_page_invalid_url(self):
+        """Test fetch_page with invalid URL"""
+        fetcher = AsyncFetcher("https://example.com")
+        with pytest.raises(ValueError, match="Invalid URL format"):
+            await fetcher.fetch_page("not-a-url")
+
+    async def test_fetch_page_http_error(self, server):
+        """Test fetch_page raises on HTTP error status"""
+        async with AsyncFetcher(str(server.make_url('/'))) as fetcher:
+            with pytest.raises(aiohttp.ClientResponseError):
+                await fetcher.fetch_page(str(server.make_url('/missing')))
+
+    async def test_fetch_many_skips_failures(self, server):
+        """Test fetch_many leaves out invalid and failed URLs and keeps order"""
+        urls = [
+            str(server.make_url('/first')),
+            "not-a-url",
+            str(server.make_url('/missing')),
+            str(server.make_url('/second')),
+        ]
+        async with AsyncFetcher(str(server.make_url('/'))) as fetcher:
+            results = await fetcher.fetch_many(urls)
+
+        assert list(results.keys()) == [urls[0], urls[3]]
+
+    async def test_fetch_many_runs_concurrently(self, server):
+        """Test a batch takes about as long as its slowest page, not the sum"""
+        urls = [str(server.make_url(f'/page{i}')) for i in range(5)]
+        async with AsyncFetcher(str(server.make_url('/')), max_per_host=5) as fetcher:
+            start = time.perf_counter()
+            results = await fetcher.fetch_many(urls)
+            elapsed = time.perf_counter() - start
+
+        assert len(results) == 5
+        assert elapsed < PAGE_DELAY * 3
+
+    async def test_fetch_many_respects_per_host_cap(self, server):
+        """Test no more than max_per_host requests run against one host"""
+        urls = [str(server.make_url(f'/page{i}')) for i in range(6)]
+        async with AsyncFetcher(str(server.make_url('/')), max_per_host=2) as fetcher:
+            results = await fetcher.fetch_many(urls)
+
+        assert len(results) == 6
+        assert server.state['max_in_flight'] == 2
+
+    async def test_close_releases_session(self, server):
+        """Test the pooled session is closed when leaving the context"""
+        fetcher = AsyncFetcher(str(server.make_url('/')))
+        async with fetcher:
+            await fetcher.fetch_page(str(server.make_url('/article')))
+            session = fetcher.session
+        assert session.closed
+        assert fetcher.session is None
+
+    async def test_fetch_page_revalidates_cached_response(self, server, tmp_path):
+        """Test a stale cached page is revalidated and the 304 served from disk"""
+        cache = ResponseCache(str(tmp_path / "cache.sqlite"), archive_ttl=0)
+        url = str(server.make_url('/versioned'))
+        async with AsyncFetcher(url, cache=cache) as fetcher:
+            first = await fetcher.fetch_page()
+            second = await fetcher.fetch_page()
+
+        assert first == second == "<html>versioned</html>"
+        assert server.state['versioned_requests'] == 2
+        stats = cache.get_stats()
+        assert stats['misses'] == 1
+        assert stats['revalidated'] == 1
+        cache.close()
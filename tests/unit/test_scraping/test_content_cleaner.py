@@ -0,0 +1,93 @@
+"""
+Unit tests for ContentCleaner.
+Golden files in tests/fixtures/golden/cleaned hold the cleaned content of
+every page in tests/fixtures/pages as produced by the original
+re-parse-and-three-passes implementation; the output must stay byte-identical.
+"""
+
+import pytest
+from pathlib import Path
+from bs4 import BeautifulSoup
+
+from src.scraping.content_cleaner import ContentCleaner
+from src.scraping.review_parser import ReviewParser
+
+FIXTURES_DIR = Path(__file__).parent.parent.parent / "fixtures"
+PAGES = sorted(path.name for path in (FIXTURES_DIR / "pages").glob("*.html"))
+
+
+@pytest.fixture
+def review_parser():
+    parser = ReviewParser("https://platypus1917.org/platypus-review/")
+    parser.backend = "html.parser"
+    return parser
+
+
+class TestGoldenOutput:
+    """Test cleaned content is byte-identical to the golden files"""
+
+    @pytest.mark.parametrize("page", PAGES)
+    def test_extract_content_matches_golden(self, review_parser, page):
+        """Test extract_content output for every fixture page"""
+        soup = review_parser.create_soup((FIXTURES_DIR / "pages" / page).read_bytes(), 'utf-8')
+        expected = (FIXTURES_DIR / "golden" / "cleaned" / page).read_text(encoding='utf-8')
+
+        assert review_parser.extract_content(soup) == expected
+
+
+class TestContentCleaner:
+    """Test the single-pass cleaning rules"""
+
+    @pytest.fixture
+    def cleaner(self):
+        return ContentCleaner()
+
+    def clean(self, cleaner, html):
+        return cleaner.clean(BeautifulSoup(f'<div>{html}</div>', 'html.parser').div)
+
+    def test_cleans_in_place_without_reparsing(self, cleaner):
+        """Test the existing subtree is cleaned instead of a re-parsed copy"""
+        soup = BeautifulSoup('<div><section><p>Text</p></section><nav>Menu</nav></div>', 'html.parser')
+        paragraph = soup.p
+
+        assert cleaner.clean(soup.div) == '<p>Text</p>'
+        assert soup.div.contents == [paragraph]
+        assert soup.div.p is paragraph
+
+    def test_consecutive_inline_elements_share_a_paragraph(self, cleaner):
+        """Test orphaned inline elements merge into one new paragraph"""
+        assert self.clean(cleaner, '<em>a</em><b>b</b>') == '<p><em>a</em><b>b</b></p>'
+
+    def test_inline_element_joins_preceding_paragraph(self, cleaner):
+        """Test an inline element right after a paragraph is moved into it"""
+        assert self.clean(cleaner, '<p>a</p><i>b</i>') == '<p>a<i>b</i></p>'
+
+    def test_inline_lifted_out_of_unwrapped_tags_is_wrapped(self, cleaner):
+        """Test inline elements that reach the top level through unwrapping are wrapped"""
+        assert self.clean(cleaner, '<section><span><a href="/x">x</a></span></section>') == '<p><a href="/x">x</a></p>'
+
+    def test_removed_elements_inside_unwrapped_tags(self, cleaner):
+        """Test removal applies at any depth, including inside unwrapped tags"""
+        assert self.clean(cleaner, '<section><script>x()</script><p>kept</p></section>') == '<p>kept</p>'
+
+    def test_nested_inline_elements_are_not_wrapped(self, cleaner):
+        """Test only top-level inline elements get a paragraph"""
+        assert self.clean(cleaner, '<blockquote><em>quote</em></blockquote>') == '<blockquote><em>quote</em></blockquote>'
+
+    def test_removed_container(self, cleaner):
+        """Test a container that is itself irrelevant yields no content"""
+        soup = BeautifulSoup('<div class="comments"><p>x</p></div>', 'html.parser')
+        assert cleaner.clean(soup.div) == ''
+
+
+class TestParseContentPageInPlace:
+    """Test metadata survives the in-place content cleaning"""
+
+    def test_authors_and_date_read_before_cleaning(self, review_parser):
+        """Test the byline and publication info are extracted before the content is cleaned"""
+        html = (FIXTURES_DIR / "pages" / "article_legacy.html").read_bytes()
+
+        data = review_parser.parse_content_page(html, "https://platypus1917.org/2009/05/01/lenin/", 'utf-8')
+
+        assert data['authors'] == ['Richard Rubin', 'Pam Nogales']
+        assert '<h2>' not in data['content']
@@ -0,0 +1,67 @@
+"""
+Unit tests for FeedScraper.
+Tests issue discovery from the sitemap/feed with conditional GET.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from src.scraping.feed_scraper import FeedScraper, extract_issue_urls
+
+FEED_URL = "https://platypus1917.org/wp-sitemap-taxonomies-category-1.xml"
+
+SITEMAP = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+    <url><loc>https://platypus1917.org/category/pr/issue-177/</loc></url>
+    <url><loc>https://platypus1917.org/category/pr/issue-179/</loc></url>
+    <url><loc>https://platypus1917.org/category/events/</loc></url>
+    <url><loc>https://platypus1917.org/category/pr/issue-178</loc></url>
+</urlset>
+"""
+
+RSS = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel>
+    <title>Platypus Review</title>
+    <item><title>Issue 180</title><link>https://platypus1917.org/category/pr/issue-180/</link></item>
+    <item><title>Some article</title><link>https://platypus1917.org/2025/10/01/some-article/</link></item>
+</channel></rss>
+"""
+
+
+class TestExtractIssueUrls:
+    """Test issue URL extraction from feed documents"""
+
+    def test_sitemap(self):
+        """Test sitemap <loc> entries are extracted newest first with a trailing slash"""
+        issues = extract_issue_urls(SITEMAP)
+
+        assert list(issues) == [179, 178, 177]
+        assert issues[178] == "https://platypus1917.org/category/pr/issue-178/"
+
+    def test_rss(self):
+        """Test RSS <link> entries are extracted and article links ignored"""
+        assert extract_issue_urls(RSS) == {180: "https://platypus1917.org/category/pr/issue-180/"}
+
+
+class TestFeedScraper:
+    """Test FeedScraper fetching"""
+
+    @pytest.fixture
+    def feed_scraper(self):
+        with patch('src.scraping.feed_scraper.get_response_cache', return_value=None), \
+             patch('src.scraping.feed_scraper.get_retry_engine', return_value=None), \
+             patch('src.scraping.feed_scraper.get_page_archive', return_value=None):
+            return FeedScraper(FEED_URL)
+
+    def test_unchanged_feed_is_revalidated(self, feed_scraper):
+        """Test a second scan sends validators and reuses the body on 304"""
+        first = Mock(status_code=200, headers={'ETag': '"v1"', 'Content-Type': 'application/xml'})
+        first.iter_content.return_value = [SITEMAP]
+        not_modified = Mock(status_code=304, headers={})
+
+        with patch.object(feed_scraper.fetcher.session, 'get', side_effect=[first, not_modified]) as mock_get:
+            assert list(feed_scraper.get_issue_urls()) == [179, 178, 177]
+            assert list(feed_scraper.get_issue_urls()) == [179, 178, 177]
+
+        assert mock_get.call_args_list[1].kwargs['headers'] == {'If-None-Match': '"v1"'}
+        not_modified.iter_content.assert_not_called()
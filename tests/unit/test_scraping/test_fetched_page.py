@@ -0,0 +1,138 @@
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from unittest.mock import Mock, patch
+
+from src.scraping.async_fetcher import AsyncFetcher
+from src.scraping.fetched_page import (
+    BoundedBody,
+    FetchedPage,
+    ResponseTooLargeError,
+    detect_encoding,
+    read_limited,
+)
+from src.scraping.fetcher import Fetcher
+from src.scraping.review_parser import ReviewParser
+
+ARTICLE_URL = "https://platypus1917.org/2025/10/01/some-article/"
+
+
+class TestDetectEncoding:
+    """Test charset detection from headers and markup"""
+
+    @pytest.mark.parametrize("content_type, body, expected", [
+        ("text/html; charset=UTF-8", b"<html></html>", 'utf-8'),
+        ("text/html; charset=\"windows-1252\"", b"<html></html>", 'cp1252'),
+        ("text/html", b'<head><meta charset="iso-8859-1"></head>', 'iso8859-1'),
+        ("text/html", b'<meta http-equiv="Content-Type" content="text/html; charset=utf-8">', 'utf-8'),
+        ("text/html; charset=bogus", b'<meta charset="utf-8">', 'utf-8'),
+        ("text/html", b"<html></html>", None),
+        (None, b"", None),
+    ])
+    def test_detect_encoding(self, content_type, body, expected):
+        """Test the header wins over <meta> and unknown charsets are skipped"""
+        assert detect_encoding(content_type, body) == expected
+
+
+class TestBoundedBody:
+    """Test the streamed body size cap"""
+
+    def test_reads_chunks_within_limit(self):
+        """Test chunks are joined when the body fits"""
+        assert read_limited(ARTICLE_URL, [b"abc", b"def"], {}, max_bytes=6) == b"abcdef"
+
+    def test_aborts_past_limit(self):
+        """Test reading stops as soon as the cap is exceeded"""
+        def chunks():
+            yield b"a" * 4
+            yield b"b" * 4
+            pytest.fail("Body kept streaming after the cap was exceeded")
+
+        with pytest.raises(ResponseTooLargeError):
+            read_limited(ARTICLE_URL, chunks(), {}, max_bytes=6)
+
+    def test_rejects_large_content_length(self):
+        """Test an oversized Content-Length is rejected before reading"""
+        body = BoundedBody(ARTICLE_URL, max_bytes=10)
+        with pytest.raises(ResponseTooLargeError):
+            body.check_content_length({'Content-Length': '11'})
+
+
+class TestFetchedPage:
+    """Test the FetchedPage model"""
+
+    def test_text_decodes_with_detected_encoding(self):
+        """Test the body is decoded with its charset"""
+        page = FetchedPage(ARTICLE_URL, "Première".encode('cp1252'), 'cp1252')
+        assert page.text == "Première"
+
+    def test_parser_accepts_raw_bytes(self):
+        """Test the content parser works on undecoded bytes"""
+        html = ('<html><h1>Über die Linke</h1><div class="bpf-content">'
+                '<p>Text über Geschichte</p></div></html>').encode('cp1252')
+        parser = ReviewParser("https://platypus1917.org/platypus-review/")
+
+        data = parser.parse_content_page(html, ARTICLE_URL, 'cp1252')
+
+        assert data['title'] == "Über die Linke"
+        assert "über" in data['content']
+
+
+class TestStreamingFetch:
+    """Test Fetcher and AsyncFetcher stream bodies up to the size cap"""
+
+    def test_fetch_raw_streams_body(self):
+        """Test Fetcher.fetch_raw returns bytes and the detected charset"""
+        fetcher = Fetcher(ARTICLE_URL)
+        response = Mock(status_code=200, headers={'Content-Type': 'text/html; charset=utf-8'})
+        response.iter_content.return_value = [b"<html>", b"page</html>"]
+
+        with patch.object(fetcher.session, 'get', return_value=response) as mock_get:
+            page = fetcher.fetch_raw()
+
+        mock_get.assert_called_once_with(ARTICLE_URL, timeout=10, stream=True)
+        assert page.body == b"<html>page</html>"
+        assert page.encoding == 'utf-8'
+        response.close.assert_called_once()
+
+    def test_fetch_raw_enforces_cap(self):
+        """Test Fetcher aborts bodies larger than max_bytes"""
+        fetcher = Fetcher(ARTICLE_URL, max_bytes=8)
+        response = Mock(status_code=200, headers={})
+        response.iter_content.return_value = [b"x" * 5, b"x" * 5]
+
+        with patch.object(fetcher.session, 'get', return_value=response):
+            with pytest.raises(ResponseTooLargeError):
+                fetcher.fetch_raw()
+        response.close.assert_called_once()
+
+    @pytest.fixture
+    async def server(self):
+        async def big_page(request):
+            return web.Response(body=b"x" * 5000, content_type='text/html')
+
+        async def latin_page(request):
+            return web.Response(body="<p>Première</p>".encode('latin-1'),
+                                headers={'Content-Type': 'text/html; charset=latin-1'})
+
+        app = web.Application()
+        app.router.add_get('/big', big_page)
+        app.router.add_get('/latin', latin_page)
+        async with TestServer(app) as test_server:
+            yield test_server
+
+    async def test_async_fetch_raw_enforces_cap(self, server):
+        """Test AsyncFetcher aborts bodies larger than max_bytes"""
+        async with AsyncFetcher(str(server.make_url('/big')), max_bytes=1000) as fetcher:
+            with pytest.raises(ResponseTooLargeError):
+                await fetcher.fetch_raw()
+
+    async def test_async_fetch_raw_detects_charset(self, server):
+        """Test AsyncFetcher returns bytes with the charset from the headers"""
+        async with AsyncFetcher(str(server.make_url('/latin'))) as fetcher:
+            page = await fetcher.fetch_raw()
+            html = await fetcher.fetch_page()
+
+        assert page.encoding == 'iso8859-1'
+        assert page.body == "<p>Première</p>".encode('latin-1')
+        assert html == "<p>Première</p>"
@@ -0,0 +1,20 @@
+from src.scraping.fingerprint import fingerprint, FINGERPRINT_DIGEST_SIZE
+
+
+class TestFingerprint:
+    """Test the content fingerprint helper"""
+
+    def test_stable_and_hex(self):
+        """Test the same input always yields the same hex digest"""
+        digest = fingerprint(b"<html>page</html>")
+        assert digest == fingerprint(b"<html>page</html>")
+        assert len(digest) == FINGERPRINT_DIGEST_SIZE * 2
+        int(digest, 16)
+
+    def test_text_hashed_as_utf8(self):
+        """Test text and its UTF-8 bytes share a fingerprint"""
+        assert fingerprint("<p>Über</p>") == fingerprint("<p>Über</p>".encode('utf-8'))
+
+    def test_detects_changes(self):
+        """Test any change in the input changes the fingerprint"""
+        assert fingerprint("<p>one</p>") != fingerprint("<p>one </p>")
@@ -0,0 +1,248 @@
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+import requests
+from unittest.mock import Mock, patch
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.scraping.async_fetcher import AsyncFetcher
+from src.scraping.fetcher import Fetcher
+from src.scraping.host_scheduler import (
+    TokenBucket,
+    HostScheduler,
+    DEFAULT_THROTTLE_PAUSE,
+    MIN_RATE_PER_HOST,
+)
+from src.scraping.retry import RetryEngine, RetryPolicy
+
+HOST_URL = "https://platypus1917.org/2025/10/01/article/"
+OTHER_HOST_URL = "https://example.com/page"
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def scheduler(clock):
+    return HostScheduler(rate=2.0, burst=2, clock=clock)
+
+
+def make_retry_engine():
+    """Retry engine without backoff, so only the scheduler delays a throttled retry"""
+    no_backoff = RetryPolicy(max_attempts=3, base_delay=0.0)
+    return RetryEngine(policies={'throttled': no_backoff, 'server_error': no_backoff})
+
+
+class TestTokenBucket:
+    """Test the TokenBucket reservation logic"""
+
+    def test_burst_then_wait(self, clock):
+        """Test a full bucket serves its burst immediately, then spaces requests"""
+        bucket = TokenBucket(rate=2.0, capacity=2, clock=clock)
+
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(0.5)
+        assert bucket.reserve() == pytest.approx(1.0)
+
+    def test_refill_over_time(self, clock):
+        """Test tokens are refilled at the configured rate"""
+        bucket = TokenBucket(rate=2.0, capacity=2, clock=clock)
+        bucket.reserve()
+        bucket.reserve()
+
+        clock.now += 0.5
+
+        assert bucket.reserve() == 0.0
+
+
+class TestHostScheduler:
+    """Test the HostScheduler pacing and throttling rules"""
+
+    def test_hosts_are_independent(self, scheduler):
+        """Test each host has its own bucket"""
+        for _ in range(2):
+            scheduler.reserve(HOST_URL)
+
+        assert scheduler.reserve(HOST_URL) > 0
+        assert scheduler.reserve(OTHER_HOST_URL) == 0.0
+
+    def test_retry_after_parks_host(self, scheduler, clock):
+        """Test a 429 with Retry-After blocks the host for that long"""
+        scheduler.record_response(HOST_URL, 429, "30")
+
+        assert scheduler.reserve(HOST_URL) == pytest.approx(30.0)
+        assert scheduler.reserve(OTHER_HOST_URL) == 0.0
+
+    def test_throttle_without_retry_after_uses_default_pause(self, scheduler):
+        """Test a 503 without Retry-After still pauses the host"""
+        scheduler.record_response(HOST_URL, 503)
+        assert scheduler.reserve(HOST_URL) == pytest.approx(DEFAULT_THROTTLE_PAUSE)
+
+    def test_throttle_lowers_rate_and_success_recovers(self, scheduler):
+        """Test AIMD: rate halves on throttling and creeps back on success"""
+        scheduler.record_response(HOST_URL, 429, "1")
+        assert scheduler.get_stats()['platypus1917.org']['rate'] == pytest.approx(1.0)
+
+        for _ in range(20):
+            scheduler.record_response(HOST_URL, 200)
+        assert scheduler.get_stats()['platypus1917.org']['rate'] == pytest.approx(2.0)
+
+    def test_rate_never_below_minimum(self, scheduler):
+        """Test repeated throttling does not stall the host completely"""
+        for _ in range(50):
+            scheduler.record_response(HOST_URL, 429, "0")
+        assert scheduler.get_stats()['platypus1917.org']['rate'] == MIN_RATE_PER_HOST
+
+    @pytest.mark.parametrize("value, expected", [
+        (None, None),
+        ("", None),
+        ("120", 120.0),
+        ("not a date", None),
+    ])
+    def test_parse_retry_after(self, value, expected):
+        """Test Retry-After parsing of delay seconds and invalid values"""
+        assert HostScheduler.parse_retry_after(value) == expected
+
+    def test_parse_retry_after_http_date(self):
+        """Test Retry-After given as an HTTP date"""
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=60)
+        seconds = HostScheduler.parse_retry_after(format_datetime(retry_at, usegmt=True))
+        assert 55 <= seconds <= 60
+
+    async def test_acquire_reports_queue_wait(self):
+        """Test acquire sleeps for the reserved delay and records the wait"""
+        scheduler = HostScheduler(rate=20.0, burst=1)
+
+        first = await scheduler.acquire(HOST_URL)
+        second = await scheduler.acquire(HOST_URL)
+
+        assert first == 0.0
+        assert second == pytest.approx(0.05, abs=0.03)
+        stats = scheduler.get_stats()['platypus1917.org']
+        assert stats['requests'] == 2
+        assert stats['max_wait'] == pytest.approx(second)
+
+
+class TestAsyncFetcherWithScheduler:
+    """Test AsyncFetcher honours throttling responses"""
+
+    @pytest.fixture
+    async def throttling_server(self):
+        state = {'requests': 0}
+
+        async def throttled_once(request):
+            state['requests'] += 1
+            if state['requests'] == 1:
+                return web.Response(status=429, headers={'Retry-After': '1'})
+            return web.Response(text="<html>ok</html>", content_type='text/html')
+
+        app = web.Application()
+        app.router.add_get('/page', throttled_once)
+        async with TestServer(app) as server:
+            server.state = state
+            yield server
+
+    async def test_retries_after_retry_after(self, throttling_server):
+        """Test a 429 is retried once the Retry-After pause has passed"""
+        scheduler = HostScheduler(rate=50.0)
+        url = str(throttling_server.make_url('/page'))
+
+        async with AsyncFetcher(url, scheduler=scheduler, retry_engine=make_retry_engine()) as fetcher:
+            start = time.perf_counter()
+            html = await fetcher.fetch_page()
+            elapsed = time.perf_counter() - start
+
+        assert html == "<html>ok</html>"
+        assert throttling_server.state['requests'] == 2
+        assert elapsed >= 0.9
+        host_stats = next(iter(scheduler.get_stats().values()))
+        assert host_stats['throttled'] == 1
+        assert host_stats['max_wait'] >= 0.9
+
+    async def test_throttled_request_is_sent_once_without_retry_engine(self, throttling_server):
+        """Test the fetcher itself never re-sends a 429, retrying is left to the retry engine"""
+        url = str(throttling_server.make_url('/page'))
+
+        async with AsyncFetcher(url, scheduler=HostScheduler(rate=50.0)) as fetcher:
+            with pytest.raises(aiohttp.ClientResponseError):
+                await fetcher.fetch_page()
+
+        assert throttling_server.state['requests'] == 1
+
+
+class TestFetcherWithScheduler:
+    """Test the synchronous Fetcher is paced by the same scheduler"""
+
+    @staticmethod
+    def make_response(status, headers=None, body=b"<html>ok</html>"):
+        response = Mock(status_code=status, headers=headers or {})
+        response.iter_content.return_value = [body]
+        response.raise_for_status.return_value = None
+        return response
+
+    @staticmethod
+    def make_throttled_response(status, headers=None):
+        response = TestFetcherWithScheduler.make_response(status, headers)
+        error_response = Mock(status_code=status)
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(f"{status} error", response=error_response)
+        return response
+
+    def test_retries_after_retry_after(self, scheduler, clock):
+        """Test a 429 parks the host and the retry engine re-sends the request once the pause has passed"""
+        fetcher = Fetcher(HOST_URL, scheduler=scheduler, retry_engine=make_retry_engine())
+        responses = [self.make_throttled_response(429, {'Retry-After': '3'}), self.make_response(200)]
+
+        def advance(seconds):
+            clock.now += seconds
+
+        with patch.object(fetcher.session, 'get', side_effect=responses) as mock_get, \
+             patch('src.scraping.host_scheduler.time.sleep', side_effect=advance) as mock_sleep:
+            assert fetcher.fetch_page() == "<html>ok</html>"
+
+        assert mock_get.call_count == 2
+        assert clock.now == 1003.0
+        assert mock_sleep.call_args_list[-1].args == (3.0,)
+        stats = scheduler.get_stats()['platypus1917.org']
+        assert (stats['requests'], stats['throttled'], stats['max_wait']) == (2, 1, 3.0)
+        assert stats['rate'] < 2.0
+
+    def test_throttled_request_is_retried_by_the_engine_only(self, scheduler, clock):
+        """Test a host that keeps answering 503 gets no more requests than the retry policy allows"""
+        fetcher = Fetcher(HOST_URL, scheduler=scheduler, retry_engine=make_retry_engine())
+
+        def advance(seconds):
+            clock.now += seconds
+
+        with patch.object(fetcher.session, 'get', side_effect=lambda *args, **kwargs: self.make_throttled_response(503)) as mock_get, \
+             patch('src.scraping.host_scheduler.time.sleep', side_effect=advance):
+            with pytest.raises(requests.exceptions.HTTPError):
+                fetcher.fetch_page()
+
+        assert mock_get.call_count == 3
+        assert scheduler.get_stats()['platypus1917.org']['throttled'] == 3
+
+    def test_requests_take_host_tokens(self, scheduler):
+        """Test each request takes a token from the host bucket (burst of 2 used up)"""
+        fetcher = Fetcher(HOST_URL, scheduler=scheduler)
+        with patch.object(fetcher.session, 'get', return_value=self.make_response(200)):
+            fetcher.fetch_page()
+            fetcher.fetch_page()
+
+        assert scheduler.reserve(HOST_URL) > 0
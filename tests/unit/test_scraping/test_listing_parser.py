@@ -1,8 +1,13 @@
 import pytest
-from unittest.mock import Mock
+from pathlib import Path
+from unittest.mock import Mock, patch
 from bs4 import BeautifulSoup
 
-from src.scraping.listing_parser import ListingParser
+from src.scraping.archive_parser import ArchiveParser
+from src.scraping.listing_parser import ListingParser, strainer_tag_for
+from src.scraping.review_parser import ReviewParser
+
+FIXTURES_DIR = Path(__file__).parent.parent.parent / "fixtures" / "pages"
 
 
 @pytest.fixture
@@ -224,3 +229,72 @@ class TestListingParserInheritance:
         """Test that clean_text is inherited"""
         text = listing_parser.clean_text("  Hello   world  ")
         assert text == "Hello world"
+
+
+class TestCompiledSelectors:
+    """Test selectors are compiled once per parser"""
+    
+    def test_selectors_compiled_at_init(self, listing_parser):
+        """Test each selector is compiled once and reused for every page"""
+        with patch('src.scraping.listing_parser.soupsieve.compile') as mock_compile:
+            listing_parser.parse_listing_page('<h4><a href="/2025/01/01/a/">A</a></h4>')
+            listing_parser.parse_listing_page('<h4><a href="/2025/01/02/b/">B</a></h4>')
+        
+        mock_compile.assert_not_called()
+        assert len(listing_parser.compiled_selectors) == 2
+    
+    def test_reassigning_selectors_recompiles(self, listing_parser):
+        """Test assigning new selectors replaces the compiled ones"""
+        listing_parser.link_selectors = ['div > a']
+        
+        urls = listing_parser.parse_listing_page('<div><a href="/x">X</a></div><h4><a href="/2025/y">Y</a></h4>')
+        
+        assert urls == ["https://platypus1917.org/x"]
+
+
+class TestPartialParse:
+    """Test SoupStrainer partial parsing of listing pages"""
+    
+    @pytest.mark.parametrize("selector, expected", [
+        ('h4 > a[href^="/20"]', 'h4'),
+        ('h2 > a[href^="https://platypus1917.org/category/pr/issue-"]', 'h2'),
+        ('a.article-link', 'a'),
+        ('div.archive h2 > a', 'div'),
+        ('.post > a', None),
+        ('h3 + p > a', None),
+        ('li:first-child > a', None),
+        ('h2 > a, h4 > a', None),
+    ])
+    def test_strainer_tag_for(self, selector, expected):
+        """Test the leading tag is used only when the selector stays inside its subtree"""
+        assert strainer_tag_for(selector) == expected
+    
+    def test_unstrainable_selector_disables_partial_parse(self):
+        """Test one selector without a leading tag makes the parser build the full tree"""
+        parser = ListingParser("https://example.com", ['h4 > a', '.post > a'])
+        assert parser.strainer is None
+    
+    @pytest.mark.parametrize("fixture, parser_factory", [
+        ("issue.html", lambda: ReviewParser("https://platypus1917.org/platypus-review/")),
+        ("archive.html", lambda: ArchiveParser()),
+    ])
+    def test_partial_parse_matches_full_parse(self, fixture, parser_factory):
+        """Test the strained tree yields the same URLs as the full tree"""
+        html = (FIXTURES_DIR / fixture).read_text()
+        parser = parser_factory()
+        
+        partial_urls = parser.parse_listing_page(html)
+        parser.partial_parse = False
+        full_urls = parser.parse_listing_page(html)
+        
+        assert partial_urls == full_urls
+        assert partial_urls
+    
+    def test_partial_parse_builds_only_candidate_subtrees(self, listing_parser):
+        """Test tags outside the candidate subtrees are not materialised"""
+        html = (FIXTURES_DIR / "issue.html").read_text()
+        
+        soup = listing_parser.create_soup(html, parse_only=listing_parser.strainer)
+        
+        assert {tag.name for tag in soup.find_all()} <= {'h4', 'a'}
+        assert soup.find('footer') is None
@@ -0,0 +1,116 @@
+import gzip
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from unittest.mock import Mock, patch
+
+from src.scraping.async_fetcher import AsyncFetcher
+from src.scraping.fetched_page import FetchedPage
+from src.scraping.fetcher import Fetcher
+from src.scraping.page_archive import (
+    ArchiveMissError,
+    FETCH_MODE_RECORD,
+    FETCH_MODE_REPLAY,
+    PageArchive,
+)
+
+ARTICLE_URL = "https://platypus1917.org/2025/10/01/some-article/"
+
+
+@pytest.fixture
+def archive_path(tmp_path):
+    return str(tmp_path / "archive" / "pages.jsonl.gz")
+
+
+class TestPageArchive:
+    """Test the PageArchive record/replay storage"""
+
+    def test_record_then_replay(self, archive_path):
+        """Test a recorded page is replayed with body, encoding and headers"""
+        recorder = PageArchive(archive_path, FETCH_MODE_RECORD)
+        recorder.record(FetchedPage(ARTICLE_URL, "<p>Première</p>".encode('cp1252'), 'cp1252', 200,
+                                    {'Content-Type': 'text/html; charset=windows-1252'}))
+
+        player = PageArchive(archive_path, FETCH_MODE_REPLAY)
+        page = player.replay(ARTICLE_URL)
+
+        assert page.text == "<p>Première</p>"
+        assert page.headers == {'Content-Type': 'text/html; charset=windows-1252'}
+        assert ARTICLE_URL in player
+        assert player.replayed == 1
+
+    def test_archive_is_gzip_compressed(self, archive_path):
+        """Test the archive file is valid gzip"""
+        PageArchive(archive_path, FETCH_MODE_RECORD).record(FetchedPage(ARTICLE_URL, b"x" * 1000))
+
+        with gzip.open(archive_path, 'rt') as archive_file:
+            assert ARTICLE_URL in archive_file.read()
+
+    def test_later_record_wins(self, archive_path):
+        """Test re-recording a URL replaces the earlier response on replay"""
+        recorder = PageArchive(archive_path, FETCH_MODE_RECORD)
+        recorder.record(FetchedPage(ARTICLE_URL, b"old"))
+        recorder.record(FetchedPage(ARTICLE_URL, b"new"))
+
+        assert PageArchive(archive_path, FETCH_MODE_REPLAY).replay(ARTICLE_URL).body == b"new"
+
+    def test_replay_miss_raises(self, archive_path):
+        """Test replaying an unrecorded URL fails loudly"""
+        PageArchive(archive_path, FETCH_MODE_RECORD).record(FetchedPage(ARTICLE_URL, b"page"))
+
+        with pytest.raises(ArchiveMissError):
+            PageArchive(archive_path, FETCH_MODE_REPLAY).replay("https://example.com/other")
+
+    def test_invalid_mode(self, archive_path):
+        """Test unknown modes are rejected"""
+        with pytest.raises(ValueError):
+            PageArchive(archive_path, 'live')
+
+    def test_from_env(self, monkeypatch, archive_path):
+        """Test FETCH_MODE and FETCH_ARCHIVE_PATH configuration"""
+        monkeypatch.delenv('FETCH_MODE', raising=False)
+        assert PageArchive.from_env() is None
+
+        monkeypatch.setenv('FETCH_MODE', 'record')
+        monkeypatch.delenv('FETCH_ARCHIVE_PATH', raising=False)
+        with pytest.raises(ValueError):
+            PageArchive.from_env()
+
+        monkeypatch.setenv('FETCH_ARCHIVE_PATH', archive_path)
+        assert PageArchive.from_env().recording
+
+
+class TestFetcherWithArchive:
+    """Test Fetcher and AsyncFetcher in record and replay mode"""
+
+    def test_fetcher_records_and_replays(self, archive_path):
+        """Test a recorded fetch is replayed without network access"""
+        recording = Fetcher(ARTICLE_URL, archive=PageArchive(archive_path, FETCH_MODE_RECORD))
+        response = Mock(status_code=200, headers={'Content-Type': 'text/html; charset=utf-8'})
+        response.iter_content.return_value = [b"<html>recorded</html>"]
+        with patch.object(recording.session, 'get', return_value=response):
+            assert recording.fetch_page() == "<html>recorded</html>"
+
+        replaying = Fetcher(ARTICLE_URL, archive=PageArchive(archive_path, FETCH_MODE_REPLAY))
+        with patch.object(replaying.session, 'get') as mock_get:
+            assert replaying.fetch_page() == "<html>recorded</html>"
+            mock_get.assert_not_called()
+
+    async def test_async_fetcher_records_and_replays(self, archive_path):
+        """Test AsyncFetcher records live pages and replays them after the server is gone"""
+        async def page(request):
+            return web.Response(text="<html>live</html>", content_type='text/html')
+
+        app = web.Application()
+        app.router.add_get('/page', page)
+        async with TestServer(app) as server:
+            url = str(server.make_url('/page'))
+            recorder = PageArchive(archive_path, FETCH_MODE_RECORD)
+            async with AsyncFetcher(url, archive=recorder) as fetcher:
+                assert await fetcher.fetch_page() == "<html>live</html>"
+
+        async with AsyncFetcher(url, archive=PageArchive(archive_path, FETCH_MODE_REPLAY)) as fetcher:
+            results = await fetcher.fetch_many([url])
+
+        assert results == {url: "<html>live</html>"}
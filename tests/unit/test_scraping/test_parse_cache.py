@@ -0,0 +1,135 @@
+"""
+Unit tests for the versioned parse result cache.
+"""
+
+import pytest
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+from src.scraping import parse_cache as parse_cache_module
+from src.scraping.constants import PARSER_VERSION
+from src.scraping.parse_cache import ParseCache, current_parser_version, get_parse_cache
+from src.scraping.review_scraper import ReviewScraper
+
+FIXTURES_DIR = Path(__file__).parent.parent.parent / "fixtures" / "pages"
+ISSUE_URL = "https://platypus1917.org/platypus-review/"
+ARTICLE_URL = "https://platypus1917.org/2025/09/01/marxism-and-the-left-today/"
+
+CONTENT_DATA = {
+    'title': 'Marxism and the Left today',
+    'content': '<p>Text</p>',
+    'original_url': ARTICLE_URL,
+    'authors': ['Jane Doe'],
+    'publication_date': date(2025, 9, 1),
+}
+
+
+@pytest.fixture
+def cache():
+    cache = ParseCache(':memory:', parser_version='1:html.parser')
+    yield cache
+    cache.close()
+
+
+class TestParseCache:
+    """Test storing and looking up parse results"""
+
+    def test_round_trip(self, cache):
+        """Test that stored data comes back unchanged, including dates"""
+        cache.store(ARTICLE_URL, 'hash1', CONTENT_DATA)
+
+        assert cache.get(ARTICLE_URL, 'hash1') == CONTENT_DATA
+        assert cache.get_stats() == {'hits': 1, 'misses': 0, 'entries': 1}
+
+    def test_get_returns_fresh_copy(self, cache):
+        """Test that callers can modify a served dict without touching the cache"""
+        cache.store(ARTICLE_URL, 'hash1', CONTENT_DATA)
+
+        cache.get(ARTICLE_URL, 'hash1')['html_hash'] = 'hash1'
+
+        assert 'html_hash' not in cache.get(ARTICLE_URL, 'hash1')
+
+    def test_changed_html_is_a_miss(self, cache):
+        """Test that a new version of the page is not served the old result"""
+        cache.store(ARTICLE_URL, 'hash1', CONTENT_DATA)
+
+        assert cache.get(ARTICLE_URL, 'hash2') is None
+        assert cache.misses == 1
+
+    def test_parser_version_bump_invalidates_entries(self, tmp_path):
+        """Test that entries of another parser version are ignored and purged selectively"""
+        path = str(tmp_path / "parsed.sqlite")
+        old = ParseCache(path, parser_version='1:html.parser')
+        old.store(ARTICLE_URL, 'hash1', CONTENT_DATA)
+        old.close()
+        lxml = ParseCache(path, parser_version='2:lxml')
+        lxml.store(ARTICLE_URL, 'hash1', CONTENT_DATA)
+        lxml.close()
+
+        cache = ParseCache(path, parser_version='2:html.parser')
+        assert cache.get(ARTICLE_URL, 'hash1') is None
+        cache.store(ARTICLE_URL, 'hash1', CONTENT_DATA)
+
+        assert cache.purge_stale() == 2
+        assert cache.get(ARTICLE_URL, 'hash1') == CONTENT_DATA
+        cache.close()
+
+    def test_current_parser_version(self, monkeypatch):
+        """Test that the version key combines PARSER_VERSION and the parser backend"""
+        monkeypatch.setenv('HTML_PARSER_BACKEND', 'html.parser')
+        assert current_parser_version() == f"{PARSER_VERSION}:html.parser"
+
+
+class TestParseCacheConfiguration:
+    """Test configuring the parse cache from the environment"""
+
+    def test_disabled_by_default(self, monkeypatch):
+        """Test that no cache is created without PARSE_CACHE_PATH"""
+        monkeypatch.delenv('PARSE_CACHE_PATH', raising=False)
+        assert ParseCache.from_env() is None
+
+    def test_get_parse_cache_is_shared(self, monkeypatch, tmp_path):
+        """Test that the process-wide cache is created once"""
+        monkeypatch.setattr(parse_cache_module, '_default_cache', None)
+        monkeypatch.setattr(parse_cache_module, '_default_cache_loaded', False)
+        monkeypatch.setenv('PARSE_CACHE_PATH', str(tmp_path / "parsed.sqlite"))
+
+        cache = get_parse_cache()
+
+        assert cache is get_parse_cache()
+        assert cache.path == str(tmp_path / "parsed.sqlite")
+        cache.close()
+
+
+class TestReviewScraperParseCache:
+    """Test that the scraper skips parsing for pages it already parsed"""
+
+    @pytest.fixture
+    def scraper(self, cache):
+        scraper = ReviewScraper(ISSUE_URL)
+        scraper.parse_cache = cache
+        scraper.parse_pool = None
+        return scraper
+
+    def test_second_parse_is_served_from_cache(self, scraper):
+        """Test that an unchanged page is parsed only once"""
+        html = (FIXTURES_DIR / "article.html").read_bytes()
+        first = scraper.parse_article(html, ARTICLE_URL, 'utf-8')
+
+        with patch.object(scraper.parser, 'parse_content_page') as mock_parse:
+            second = scraper.parse_article(html, ARTICLE_URL, 'utf-8')
+
+        mock_parse.assert_not_called()
+        assert second == first
+        assert second['html_hash'] == first['html_hash']
+
+    async def test_async_path_uses_cache_before_pool(self, scraper):
+        """Test that cached pages are not sent to the parse pool"""
+        scraper.parse_cache.store(ARTICLE_URL, 'hash1', dict(CONTENT_DATA, content='<p>' + 'x' * 200 + '</p>'))
+        scraper.parse_pool = object()  # Any use of the pool would fail
+
+        result = await scraper.parse_article_async(b'<html></html>', ARTICLE_URL, 'utf-8', 'hash1')
+
+        assert result['title'] == CONTENT_DATA['title']
+        assert result['html_hash'] == 'hash1'
@@ -0,0 +1,146 @@
+"""
+Unit tests for the process-pool parsing stage.
+"""
+
+import pytest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from src.scraping import parse_pool as parse_pool_module
+from src.scraping.parse_pool import ParsePool, get_parse_pool
+from src.scraping.review_parser import ReviewParser
+from src.scraping.review_scraper import ReviewScraper
+
+FIXTURES_DIR = Path(__file__).parent.parent.parent / "fixtures" / "pages"
+ISSUE_URL = "https://platypus1917.org/platypus-review/"
+ARTICLE_URL = "https://platypus1917.org/2025/09/01/marxism-and-the-left-today/"
+
+
+@pytest.fixture
+def article_bytes():
+    return (FIXTURES_DIR / "article.html").read_bytes()
+
+
+@pytest.fixture
+def pool():
+    pool = ParsePool(workers=1, min_pool_bytes=0)
+    yield pool
+    pool.shutdown()
+
+
+class TestParsePool:
+    """Test parsing in worker processes and the in-process fallback"""
+
+    async def test_worker_result_matches_in_process_parse(self, pool, article_bytes):
+        """Test that a page parsed in a worker gives the same article dict"""
+        parser = ReviewParser(ISSUE_URL)
+        expected = parser.parse_content_page(article_bytes, ARTICLE_URL, 'utf-8')
+
+        result = await pool.parse(parser, article_bytes, ARTICLE_URL, 'utf-8')
+
+        assert result == expected
+        assert pool.get_stats() == {'workers': 1, 'pooled': 1, 'in_process': 0}
+
+    async def test_text_html_is_sent_as_bytes(self, pool, article_bytes):
+        """Test that decoded HTML is encoded before it is sent to a worker"""
+        parser = ReviewParser(ISSUE_URL)
+        html = article_bytes.decode('utf-8')
+
+        result = await pool.parse(parser, html, ARTICLE_URL)
+
+        assert result == parser.parse_content_page(html, ARTICLE_URL)
+
+    async def test_worker_uses_the_callers_parser_configuration(self, pool, article_bytes):
+        """Test that workers parse with the caller's selectors, streaming setting and backend"""
+        parser = ReviewParser(ISSUE_URL, article_selectors=['h3 > a'], streaming=False)
+        parser.backend = 'html.parser'
+
+        worker_parser = parse_pool_module._worker_parser(*parse_pool_module._parser_config(parser))
+        result = await pool.parse(parser, article_bytes, ARTICLE_URL, 'utf-8')
+
+        assert worker_parser.link_selectors == ['h3 > a']
+        assert (worker_parser.streaming, worker_parser.backend) == (False, 'html.parser')
+        assert result == parser.parse_content_page(article_bytes, ARTICLE_URL, 'utf-8')
+
+    def test_configured_backend_is_sent_to_workers(self, monkeypatch):
+        """Test that a parser without an explicit backend sends the one configured in the caller's process"""
+        monkeypatch.setenv('HTML_PARSER_BACKEND', 'html.parser')
+
+        config = parse_pool_module._parser_config(ReviewParser(ISSUE_URL))
+
+        assert config[2:] == (True, 'html.parser')
+
+    async def test_small_page_is_parsed_in_process(self, article_bytes):
+        """Test that pages below the size threshold never reach the workers"""
+        pool = ParsePool(workers=1, min_pool_bytes=len(article_bytes) + 1)
+        parser = MagicMock()
+        parser.parse_content_page.return_value = {'title': 'Small'}
+
+        result = await pool.parse(parser, article_bytes, ARTICLE_URL, 'utf-8')
+
+        assert result == {'title': 'Small'}
+        parser.parse_content_page.assert_called_once_with(article_bytes, ARTICLE_URL, 'utf-8')
+        assert pool._executor is None
+        assert pool.get_stats()['in_process'] == 1
+
+    async def test_worker_errors_propagate(self, pool):
+        """Test that an exception raised while parsing in a worker reaches the caller"""
+        parser = ReviewParser(ISSUE_URL)
+
+        with patch.object(parse_pool_module, '_parse_in_worker', side_effect=ValueError("bad page")), \
+             patch.object(pool, '_get_executor', return_value=None):
+            with pytest.raises(ValueError, match="bad page"):
+                await pool.parse(parser, b'<html></html>', ARTICLE_URL)
+
+
+class TestParsePoolConfiguration:
+    """Test configuring the parse pool from the environment"""
+
+    def test_disabled_by_default(self, monkeypatch):
+        """Test that no pool is created without PARSE_WORKERS"""
+        monkeypatch.delenv('PARSE_WORKERS', raising=False)
+        assert ParsePool.from_env() is None
+
+    def test_from_env(self, monkeypatch):
+        """Test that worker count and size threshold are read from the environment"""
+        monkeypatch.setenv('PARSE_WORKERS', '3')
+        monkeypatch.setenv('PARSE_POOL_MIN_BYTES', '1000')
+
+        pool = ParsePool.from_env()
+
+        assert pool.workers == 3
+        assert pool.min_pool_bytes == 1000
+
+    def test_get_parse_pool_is_shared(self, monkeypatch):
+        """Test that the process-wide pool is created once"""
+        monkeypatch.setattr(parse_pool_module, '_default_pool', None)
+        monkeypatch.setattr(parse_pool_module, '_default_pool_loaded', False)
+        monkeypatch.setenv('PARSE_WORKERS', '2')
+
+        assert get_parse_pool() is get_parse_pool()
+        assert get_parse_pool().workers == 2
+
+
+class TestReviewScraperParsePool:
+    """Test that the async scraping path parses through the parse pool"""
+
+    async def test_parse_article_async_uses_pool(self, pool, article_bytes):
+        """Test that articles are parsed by the pool and still validated and fingerprinted"""
+        scraper = ReviewScraper(ISSUE_URL)
+        scraper.parse_pool = pool
+
+        result = await scraper.parse_article_async(article_bytes, ARTICLE_URL, 'utf-8')
+
+        assert result == scraper.parse_article(article_bytes, ARTICLE_URL, 'utf-8')
+        assert pool.get_stats()['pooled'] == 1
+
+    async def test_parse_article_async_without_pool(self, article_bytes):
+        """Test that parsing stays in process when the pool is disabled"""
+        scraper = ReviewScraper(ISSUE_URL)
+        scraper.parse_pool = None
+
+        with patch.object(scraper, 'parse_article', return_value={'title': 'T'}) as mock_parse:
+            result = await scraper.parse_article_async(article_bytes, ARTICLE_URL, 'utf-8', 'hash')
+
+        assert result == {'title': 'T'}
+        mock_parse.assert_called_once_with(article_bytes, ARTICLE_URL, 'utf-8', 'hash')
@@ -0,0 +1,149 @@
+import pytest
+from unittest.mock import Mock, patch
+
+from src.scraping.fetcher import Fetcher
+from src.scraping.response_cache import ResponseCache
+
+ARCHIVE_URL = "https://platypus1917.org/platypus-review/"
+ARTICLE_URL = "https://platypus1917.org/2025/10/01/some-article/"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = ResponseCache(str(tmp_path / "http_cache.sqlite"), max_bytes=1000,
+                      archive_ttl=60, article_ttl=3600)
+    yield c
+    c.close()
+
+
+def make_response(status_code=200, content=b"<html>page</html>", headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.iter_content.return_value = [content]
+    response.headers = {'Content-Type': 'text/html; charset=utf-8', **(headers or {})}
+    response.raise_for_status.return_value = None
+    return response
+
+
+class TestResponseCache:
+    """Test the ResponseCache storage and freshness rules"""
+
+    def test_store_and_get_roundtrip(self, cache):
+        """Test a stored response is returned with its validators"""
+        cache.store(ARTICLE_URL, "<p>Ünïcode</p>".encode('utf-8'), 'utf-8',
+                    {'ETag': '"abc"', 'Last-Modified': 'Wed, 01 Oct 2025 10:00:00 GMT'})
+
+        entry = cache.get(ARTICLE_URL)
+
+        assert entry.text == "<p>Ünïcode</p>"
+        assert entry.etag == '"abc"'
+        assert entry.last_modified == 'Wed, 01 Oct 2025 10:00:00 GMT'
+
+    def test_get_missing_returns_none(self, cache):
+        """Test unknown URLs are not in the cache"""
+        assert cache.get(ARTICLE_URL) is None
+
+    def test_ttl_depends_on_url_class(self, cache):
+        """Test article pages live longer than archive pages"""
+        assert cache.ttl_for(ARTICLE_URL) == 3600
+        assert cache.ttl_for(ARCHIVE_URL) == 60
+        assert cache.ttl_for("https://platypus1917.org/category/pr/issue-179/") == 60
+
+    def test_is_fresh(self, cache):
+        """Test freshness is measured against the URL's TTL"""
+        cache.store(ARCHIVE_URL, b"archive", 'utf-8', {})
+        cache.store(ARTICLE_URL, b"article", 'utf-8', {})
+
+        archive_entry = cache.get(ARCHIVE_URL)
+        article_entry = cache.get(ARTICLE_URL)
+
+        with patch('src.scraping.response_cache.time.time') as mock_time:
+            mock_time.return_value = archive_entry.stored_at + 120
+            assert not cache.is_fresh(archive_entry)
+            assert cache.is_fresh(article_entry)
+
+    def test_conditional_headers(self, cache):
+        """Test validators are turned into conditional request headers"""
+        cache.store(ARTICLE_URL, b"body", 'utf-8', {'ETag': '"v1"', 'Last-Modified': 'yesterday'})
+
+        headers = cache.conditional_headers(cache.get(ARTICLE_URL))
+
+        assert headers == {'If-None-Match': '"v1"', 'If-Modified-Since': 'yesterday'}
+        assert cache.conditional_headers(None) == {}
+
+    def test_lru_eviction(self, cache):
+        """Test least recently used entries are evicted past max_bytes"""
+        cache.store("https://example.com/a", b"a" * 400, 'utf-8', {})
+        cache.store("https://example.com/b", b"b" * 400, 'utf-8', {})
+        cache.get("https://example.com/a")  # 'a' is now more recently used than 'b'
+        cache.store("https://example.com/c", b"c" * 400, 'utf-8', {})
+
+        assert cache.get("https://example.com/a") is not None
+        assert cache.get("https://example.com/b") is None
+        assert cache.get("https://example.com/c") is not None
+        assert cache.get_stats()['size_bytes'] == 800
+
+    def test_oversized_response_not_cached(self, cache):
+        """Test a body bigger than the whole cache is not stored"""
+        cache.store(ARTICLE_URL, b"x" * 2000, 'utf-8', {})
+        assert cache.get(ARTICLE_URL) is None
+
+    def test_from_env_disabled_without_path(self, monkeypatch):
+        """Test caching is disabled when HTTP_CACHE_PATH is not set"""
+        monkeypatch.delenv('HTTP_CACHE_PATH', raising=False)
+        assert ResponseCache.from_env() is None
+
+    def test_from_env(self, monkeypatch, tmp_path):
+        """Test cache configuration from environment variables"""
+        monkeypatch.setenv('HTTP_CACHE_PATH', str(tmp_path / "env_cache.sqlite"))
+        monkeypatch.setenv('HTTP_CACHE_ARCHIVE_TTL', '5')
+        c = ResponseCache.from_env()
+        assert c.archive_ttl == 5
+        c.close()
+
+
+class TestFetcherWithCache:
+    """Test Fetcher revalidation against the response cache"""
+
+    @pytest.fixture
+    def fetcher(self, cache):
+        return Fetcher(ARCHIVE_URL, cache=cache)
+
+    def test_miss_stores_response(self, fetcher, cache):
+        """Test a first fetch goes to the network and fills the cache"""
+        with patch.object(fetcher.session, 'get') as mock_get:
+            mock_get.return_value = make_response(headers={'ETag': '"v1"'})
+            assert fetcher.fetch_page(ARTICLE_URL) == "<html>page</html>"
+            mock_get.assert_called_once_with(ARTICLE_URL, timeout=10, stream=True)
+
+        assert cache.get(ARTICLE_URL).etag == '"v1"'
+        assert cache.get_stats()['misses'] == 1
+
+    def test_fresh_hit_skips_network(self, fetcher, cache):
+        """Test a fresh entry is served without a request"""
+        cache.store(ARTICLE_URL, b"<html>cached</html>", 'utf-8', {})
+        with patch.object(fetcher.session, 'get') as mock_get:
+            assert fetcher.fetch_page(ARTICLE_URL) == "<html>cached</html>"
+            mock_get.assert_not_called()
+        assert cache.get_stats()['hits'] == 1
+
+    def test_stale_entry_revalidated_with_304(self, fetcher, cache):
+        """Test a stale entry sends validators and a 304 is served from disk"""
+        cache.store(ARCHIVE_URL, b"<html>archive</html>", 'utf-8', {'ETag': '"v1"'})
+        with patch.object(cache, 'is_fresh', return_value=False), \
+             patch.object(fetcher.session, 'get') as mock_get:
+            mock_get.return_value = make_response(status_code=304, content=b"")
+            assert fetcher.fetch_page() == "<html>archive</html>"
+            mock_get.assert_called_once_with(ARCHIVE_URL, timeout=10, stream=True, headers={'If-None-Match': '"v1"'})
+        assert cache.get_stats()['revalidated'] == 1
+
+    def test_stale_entry_replaced_on_200(self, fetcher, cache):
+        """Test a changed page replaces the stale entry"""
+        cache.store(ARCHIVE_URL, b"<html>old</html>", 'utf-8', {'ETag': '"v1"'})
+        with patch.object(cache, 'is_fresh', return_value=False), \
+             patch.object(fetcher.session, 'get') as mock_get:
+            mock_get.return_value = make_response(content=b"<html>new</html>", headers={'ETag': '"v2"'})
+            assert fetcher.fetch_page() == "<html>new</html>"
+        entry = cache.get(ARCHIVE_URL)
+        assert entry.text == "<html>new</html>"
+        assert entry.etag == '"v2"'
@@ -0,0 +1,278 @@
+import asyncio
+import random
+
+import aiohttp
+import pytest
+import requests
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from unittest.mock import Mock, patch
+
+from src.scraping.async_fetcher import AsyncFetcher
+from src.scraping.fetched_page import ResponseTooLargeError
+from src.scraping.fetcher import Fetcher
+from src.scraping.retry import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryEngine,
+    RetryPolicy,
+)
+
+HOST_URL = "https://platypus1917.org/2025/10/01/article/"
+OTHER_HOST_URL = "https://example.com/page"
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def http_error(status):
+    response = Mock()
+    response.status_code = status
+    return requests.exceptions.HTTPError(f"{status} error", response=response)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def engine(clock):
+    return RetryEngine(failure_threshold=2, reset_timeout=30, clock=clock, rng=random.Random(0))
+
+
+class TestRetryPolicy:
+    """Test the RetryPolicy backoff computation"""
+
+    def test_backoff_is_bounded_by_exponential_ceiling(self):
+        """Test full jitter stays between 0 and base * 2^(attempt-1)"""
+        policy = RetryPolicy(max_attempts=5, base_delay=1.0, max_delay=100.0)
+        rng = random.Random(42)
+        for attempt, ceiling in [(1, 1.0), (2, 2.0), (3, 4.0), (4, 8.0)]:
+            delays = [policy.backoff(attempt, rng) for _ in range(50)]
+            assert all(0 <= d <= ceiling for d in delays)
+            assert max(delays) > ceiling / 2
+
+    def test_backoff_capped_at_max_delay(self):
+        """Test the delay never exceeds max_delay"""
+        policy = RetryPolicy(max_attempts=20, base_delay=1.0, max_delay=5.0)
+        assert all(policy.backoff(15) <= 5.0 for _ in range(50))
+
+
+class TestClassification:
+    """Test mapping of exceptions to error classes"""
+
+    @pytest.mark.parametrize("error, expected", [
+        (requests.exceptions.Timeout(), 'timeout'),
+        (asyncio.TimeoutError(), 'timeout'),
+        (requests.exceptions.ConnectionError(), 'connection'),
+        (aiohttp.ClientConnectionError(), 'connection'),
+        (http_error(503), 'server_error'),
+        (http_error(429), 'throttled'),
+        (http_error(404), None),
+        (ValueError("Invalid URL format"), None),
+    ])
+    def test_classify(self, error, expected):
+        """Test each exception lands in the right retry class"""
+        assert RetryEngine.classify(error) == expected
+
+    def test_classify_aiohttp_status(self):
+        """Test aiohttp response errors are classified by status"""
+        error = aiohttp.ClientResponseError(Mock(), (), status=502)
+        assert RetryEngine.classify(error) == 'server_error'
+
+
+class TestRetryEngine:
+    """Test retry decisions and metrics"""
+
+    def test_retries_until_policy_exhausted(self, engine):
+        """Test retryable errors get a delay until max_attempts is reached"""
+        error = requests.exceptions.Timeout()
+        assert engine.next_delay(error, 1) is not None
+        assert engine.next_delay(error, 2) is not None
+        assert engine.next_delay(error, 3) is None
+
+        metrics = engine.get_metrics()
+        assert metrics['retries'] == {'timeout': 2}
+        assert metrics['giveups'] == {'timeout': 1}
+
+    def test_non_retryable_error_not_retried(self, engine):
+        """Test 4xx errors are raised immediately"""
+        assert engine.next_delay(http_error(404), 1) is None
+        assert engine.get_metrics()['retries'] == {}
+
+
+class TestCircuitBreaker:
+    """Test circuit breaker state transitions"""
+
+    def test_opens_after_threshold(self, engine):
+        """Test consecutive host failures open the circuit and fail fast"""
+        for _ in range(2):
+            engine.before_request(HOST_URL)
+            engine.record_failure(HOST_URL, requests.exceptions.ConnectionError())
+
+        with pytest.raises(CircuitOpenError):
+            engine.before_request(HOST_URL)
+        engine.before_request(OTHER_HOST_URL)  # Other hosts are unaffected
+
+        metrics = engine.get_metrics()
+        assert metrics['short_circuited'] == 1
+        assert metrics['breakers']['platypus1917.org']['state'] == CircuitBreaker.OPEN
+
+    def test_client_errors_do_not_open_circuit(self, engine):
+        """Test 4xx responses prove the host is alive"""
+        for _ in range(5):
+            engine.record_failure(HOST_URL, http_error(404))
+        engine.before_request(HOST_URL)
+
+    def test_half_open_probe(self, clock):
+        """Test a single probe is let through after the reset timeout"""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+        breaker.record_failure()
+        assert not breaker.allow_request()
+
+        clock.now += 31
+        assert breaker.allow_request()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert not breaker.allow_request()  # Only one probe in flight
+
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow_request()
+
+    def test_failed_probe_reopens(self, clock):
+        """Test a failing probe opens the circuit for another timeout"""
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30, clock=clock)
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now += 31
+        assert breaker.allow_request()
+
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow_request()
+        assert breaker.times_opened == 2
+
+
+class TestFetcherWithRetry:
+    """Test Fetcher retries transient errors"""
+
+    def test_retries_timeout_then_succeeds(self, engine):
+        """Test a timeout is retried after a backoff sleep"""
+        fetcher = Fetcher(HOST_URL, retry_engine=engine)
+        response = Mock(status_code=200, headers={})
+        response.iter_content.return_value = [b"<html>ok</html>"]
+        response.raise_for_status.return_value = None
+
+        with patch.object(fetcher.session, 'get') as mock_get, \
+             patch('src.scraping.fetcher.time.sleep') as mock_sleep:
+            mock_get.side_effect = [requests.exceptions.Timeout(), response]
+            assert fetcher.fetch_page() == "<html>ok</html>"
+
+        assert mock_get.call_count == 2
+        mock_sleep.assert_called_once()
+        assert engine.get_metrics()['successes'] == 1
+
+    def test_does_not_retry_404(self, engine):
+        """Test client errors are raised without retrying"""
+        fetcher = Fetcher(HOST_URL, retry_engine=engine)
+        response = Mock(status_code=404, headers={})
+        response.raise_for_status.side_effect = http_error(404)
+
+        with patch.object(fetcher.session, 'get', return_value=response) as mock_get, \
+             patch('src.scraping.fetcher.time.sleep') as mock_sleep:
+            with pytest.raises(requests.exceptions.HTTPError):
+                fetcher.fetch_page()
+
+        assert mock_get.call_count == 1
+        mock_sleep.assert_not_called()
+
+    def test_open_circuit_fails_fast(self, engine):
+        """Test requests to a dead host stop once the circuit opens"""
+        fetcher = Fetcher(HOST_URL, retry_engine=engine)
+        with patch.object(fetcher.session, 'get') as mock_get, \
+             patch('src.scraping.fetcher.time.sleep'):
+            mock_get.side_effect = requests.exceptions.ConnectionError()
+            with pytest.raises(CircuitOpenError):
+                fetcher.fetch_page()
+
+        assert mock_get.call_count == 2
+
+
+class TestHalfOpenProbeIsSettled:
+    """Test a half-open probe ending in an error that is not retried never blocks the host"""
+
+    @staticmethod
+    def half_open(engine, clock):
+        for _ in range(2):
+            engine.record_failure(HOST_URL, requests.exceptions.ConnectionError())
+        clock.now += 31
+        return engine.get_breaker(HOST_URL)
+
+    def test_oversized_probe_response_closes_circuit(self, engine, clock):
+        """Test the host answering the probe (with a body too large) closes the circuit"""
+        breaker = self.half_open(engine, clock)
+        fetcher = Fetcher(HOST_URL, retry_engine=engine, max_bytes=4)
+        response = Mock(status_code=200, headers={})
+        response.iter_content.return_value = [b"<html>too large</html>"]
+        response.raise_for_status.return_value = None
+
+        with patch.object(fetcher.session, 'get', return_value=response):
+            with pytest.raises(ResponseTooLargeError):
+                fetcher.fetch_page()
+
+        assert (breaker.state, breaker.probe_in_flight) == (CircuitBreaker.CLOSED, False)
+        engine.before_request(HOST_URL)
+
+    async def test_cancelled_probe_frees_the_slot(self, engine, clock):
+        """Test a cancelled probe lets the next request probe the host"""
+        breaker = self.half_open(engine, clock)
+        fetcher = AsyncFetcher(HOST_URL, retry_engine=engine)
+
+        with patch.object(fetcher, '_send', side_effect=asyncio.CancelledError()):
+            with pytest.raises(asyncio.CancelledError):
+                await fetcher.fetch_page()
+
+        assert (breaker.state, breaker.probe_in_flight) == (CircuitBreaker.HALF_OPEN, False)
+        engine.before_request(HOST_URL)
+        assert breaker.probe_in_flight
+
+
+class TestAsyncFetcherWithRetry:
+    """Test AsyncFetcher retries server errors"""
+
+    @pytest.fixture
+    async def flaky_server(self):
+        state = {'requests': 0}
+
+        async def flaky(request):
+            state['requests'] += 1
+            if state['requests'] < 3:
+                return web.Response(status=500)
+            return web.Response(text="<html>recovered</html>", content_type='text/html')
+
+        app = web.Application()
+        app.router.add_get('/flaky', flaky)
+        async with TestServer(app) as server:
+            server.state = state
+            yield server
+
+    async def test_retries_server_error(self, flaky_server):
+        """Test 5xx responses are retried with backoff until the page loads"""
+        engine = RetryEngine(policies={'server_error': RetryPolicy(3, 0.01, 0.01)})
+        url = str(flaky_server.make_url('/flaky'))
+
+        async with AsyncFetcher(url, retry_engine=engine) as fetcher:
+            html = await fetcher.fetch_page()
+
+        assert html == "<html>recovered</html>"
+        assert flaky_server.state['requests'] == 3
+        assert engine.get_metrics()['retries'] == {'server_error': 2}
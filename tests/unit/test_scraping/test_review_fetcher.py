@@ -28,7 +28,9 @@ class TestFetcherDetailed:
         """Test successful page fetching"""
         # Mock successful response
         mock_response = Mock()
-        mock_response.text = "<html><body>Test content</body></html>"
+        mock_response.status_code = 200
+        mock_response.headers = {'Content-Type': 'text/html; charset=utf-8'}
+        mock_response.iter_content.return_value = [b"<html><body>Test content</body></html>"]
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
         
@@ -36,7 +38,7 @@ class TestFetcherDetailed:
         result = fetcher.fetch_page(url)
         
         assert result == "<html><body>Test content</body></html>"
-        mock_get.assert_called_once_with(url, timeout=10)
+        mock_get.assert_called_once_with(url, timeout=10, stream=True)
         mock_response.raise_for_status.assert_called_once()
     
     @patch('requests.Session.get')
@@ -44,14 +46,16 @@ class TestFetcherDetailed:
         """Test fetch_page without URL parameter uses base_url"""
         # Mock successful response
         mock_response = Mock()
-        mock_response.text = "<html><body>Base URL content</body></html>"
+        mock_response.status_code = 200
+        mock_response.headers = {'Content-Type': 'text/html; charset=utf-8'}
+        mock_response.iter_content.return_value = [b"<html><body>Base URL content</body></html>"]
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
         
         result = fetcher.fetch_page()
         
         assert result == "<html><body>Base URL content</body></html>"
-        mock_get.assert_called_once_with(fetcher.base_url, timeout=10)
+        mock_get.assert_called_once_with(fetcher.base_url, timeout=10, stream=True)
     
     def test_fetch_page_invalid_url(self, fetcher):
         """Test fetch_page with invalid URL"""
@@ -0,0 +1,66 @@
+import pytest
+from unittest.mock import patch
+
+from src.scraping.review_index_page import ReviewIndexPage
+from src.scraping.review_parser import ReviewParser
+
+ISSUE_URL = "https://platypus1917.org/category/pr/issue-179/"
+
+ISSUE_HTML = """
+<html>
+<head><title>Issue #179 | Platypus</title></head>
+<body>
+    <span class="selected">Archive for category Issue #179</span>
+    <h4><a href="/2025/09/01/first-article/">First article</a></h4>
+    <h4><a href="https://platypus1917.org/2025/09/02/second-article/">Second article</a></h4>
+    <h4><a href="/2025/09/01/first-article/">First article (duplicate)</a></h4>
+</body>
+</html>
+"""
+
+
+@pytest.fixture
+def parser():
+    return ReviewParser(ISSUE_URL)
+
+
+class TestReviewIndexPage:
+    """Test the ReviewIndexPage single-pass model"""
+
+    def test_from_html(self, parser):
+        """Test review ID, article URLs and metadata are read from one page"""
+        page = ReviewIndexPage.from_html(ISSUE_HTML, ISSUE_URL, parser)
+
+        assert page.url == ISSUE_URL
+        assert page.review_id == 179
+        assert page.article_urls == [
+            "https://platypus1917.org/2025/09/01/first-article/",
+            "https://platypus1917.org/2025/09/02/second-article/",
+        ]
+        assert page.metadata == {
+            'issue_label': "Archive for category Issue #179",
+            'page_title': "Issue #179 | Platypus",
+        }
+
+    def test_from_html_parses_once(self, parser):
+        """Test the HTML is turned into a soup exactly once"""
+        with patch.object(parser, 'create_soup', wraps=parser.create_soup) as mock_create_soup:
+            ReviewIndexPage.from_html(ISSUE_HTML, ISSUE_URL, parser)
+        mock_create_soup.assert_called_once_with(ISSUE_HTML, None)
+
+    def test_review_id_falls_back_to_url(self, parser):
+        """Test the issue number is taken from the URL when the page has no label"""
+        page = ReviewIndexPage.from_html("<html><body></body></html>", ISSUE_URL, parser)
+
+        assert page.review_id == 179
+        assert page.article_urls == []
+        assert page.metadata == {'issue_label': None, 'page_title': None}
+
+    def test_from_raw_bytes(self, parser):
+        """Test raw bytes are parsed with the detected encoding"""
+        html = ISSUE_HTML.replace("First article", "Première").encode('cp1252')
+
+        page = ReviewIndexPage.from_html(html, ISSUE_URL, parser, encoding='cp1252')
+
+        assert page.review_id == 179
+        assert len(page.article_urls) == 2
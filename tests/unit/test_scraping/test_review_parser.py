@@ -112,10 +112,12 @@ class TestReviewParser:
         
         with patch.object(review_parser, 'extract_title') as mock_title, \
              patch.object(review_parser, 'extract_content') as mock_content, \
+             patch.object(review_parser, 'extract_content_nodes') as mock_nodes, \
              patch.object(review_parser, 'extract_metadata') as mock_metadata:
             
             mock_title.return_value = "Test Article"
             mock_content.return_value = "<p>Test content</p>"
+            mock_nodes.return_value = [{'tag': 'p', 'children': ['Test content']}]
             mock_metadata.return_value = {
                 'authors': ['John Doe'],
                 'publication_date': 'January 2025',
@@ -127,6 +129,7 @@ class TestReviewParser:
             expected = {
                 'title': 'Test Article',
                 'content': '<p>Test content</p>',
+                'content_nodes': [{'tag': 'p', 'children': ['Test content']}],
                 'original_url': url,
                 'authors': ['John Doe'],
                 'publication_date': 'January 2025',
@@ -336,8 +339,8 @@ class TestReviewParserCleanContent:
         for tag in preserved_tags:
             assert tag in result
 
-    def test_remove_unwanted_elements_subfunction(self, simple_parser):
-        """Test the _remove_unwanted_elements subfunction"""
+    def test_clean_content_removes_unwanted_elements(self, simple_parser):
+        """Test that irrelevant elements are removed with their content"""
         html = """
         <div>
             <p>Keep this paragraph</p>
@@ -351,9 +354,7 @@ class TestReviewParserCleanContent:
         """
         soup = BeautifulSoup(html, 'html.parser')
         
-        simple_parser._remove_unwanted_elements(soup)
-        
-        result = str(soup)
+        result = simple_parser.clean_content_for_publishing(soup.find('div'))
         
         # Should keep the paragraph
         assert '<p>Keep this paragraph</p>' in result
@@ -365,8 +366,8 @@ class TestReviewParserCleanContent:
         assert 'style' not in result
         assert 'comments' not in result
 
-    def test_clean_disallowed_tags_subfunction(self, simple_parser):
-        """Test the _clean_disallowed_tags subfunction"""
+    def test_clean_content_unwraps_disallowed_tags(self, simple_parser):
+        """Test that disallowed tags are unwrapped while their content is kept"""
         html = """
         <div>
             <p>Allowed paragraph</p>
@@ -377,9 +378,7 @@ class TestReviewParserCleanContent:
         """
         soup = BeautifulSoup(html, 'html.parser')
         
-        simple_parser._clean_disallowed_tags(soup)
-        
-        result = str(soup)
+        result = simple_parser.clean_content_for_publishing(soup.find('div'))
         
         # Should keep allowed paragraph tag
         assert '<p>Allowed paragraph</p>' in result
@@ -1,6 +1,9 @@
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
 from src.scraping.review_scraper import ReviewScraper
+from src.scraping.review_index_page import ReviewIndexPage
+from src.scraping.fetched_page import FetchedPage
+from src.scraping.fingerprint import fingerprint
 from src.scraping.scraper import Scraper
 from src.scraping.constants import MIN_TITLE_LENGTH, MIN_CONTENT_LENGTH
 
@@ -15,14 +18,14 @@ def simple_scraper():
 
 @pytest.fixture
 def mock_fetch_and_parse_listing(review_scraper):
-    with patch.object(review_scraper.fetcher, 'fetch_page') as mock_fetch, \
-         patch.object(review_scraper.parser, 'parse_listing_page') as mock_parse:
+    with patch.object(review_scraper.fetcher, 'fetch_raw') as mock_fetch, \
+         patch.object(review_scraper.parser, 'extract_listing_urls') as mock_parse:
         yield mock_fetch, mock_parse
 
 @pytest.fixture
 def mock_validate_fetch_parse_content(review_scraper):
     with patch.object(review_scraper.fetcher, 'validate_url') as mock_validate, \
-         patch.object(review_scraper.fetcher, 'fetch_page') as mock_fetch, \
+         patch.object(review_scraper.fetcher, 'fetch_raw') as mock_fetch, \
          patch.object(review_scraper.parser, 'parse_content_page') as mock_parse:
         yield mock_validate, mock_fetch, mock_parse
 
@@ -49,25 +52,25 @@ class TestReviewScraper:
     def test_get_listing_urls_success(self, review_scraper, mock_fetch_and_parse_listing):
         """Test successful URL listing extraction"""
         mock_fetch, mock_parse = mock_fetch_and_parse_listing
-        mock_html = "<html>mock content</html>"
+        mock_html = b"<html>mock content</html>"
         expected_urls = ["https://platypus1917.org/2025/01/article1/", 
                         "https://platypus1917.org/2025/01/article2/"]
         
-        mock_fetch.return_value = mock_html
+        mock_fetch.return_value = FetchedPage("https://platypus1917.org/", mock_html)
         mock_parse.return_value = expected_urls
         
         result = review_scraper.get_listing_urls()
         
-        # fetch_page is called without arguments (uses base_url)
+        # fetch_raw is called without arguments (uses base_url)
         mock_fetch.assert_called_once_with()
-        mock_parse.assert_called_once_with(mock_html)
+        mock_parse.assert_called_once()
         assert result == expected_urls
     
     def test_get_listing_urls_error_handling(self, review_scraper, mock_handle_error):
         """Test error handling in URL listing extraction"""
         mock_error = mock_handle_error
         
-        with patch.object(review_scraper.fetcher, 'fetch_page') as mock_fetch:
+        with patch.object(review_scraper.fetcher, 'fetch_raw') as mock_fetch:
             mock_fetch.side_effect = Exception("Network error")
             
             result = review_scraper.get_listing_urls()
@@ -77,26 +80,40 @@ class TestReviewScraper:
 
     def test_get_review_id_success(self, review_scraper):
         """Test successful review ID extraction"""
-        mock_html = '<span class="selected">Archive for category Issue #173</span>'
+        mock_html = b'<span class="selected">Archive for category Issue #173</span>'
         
-        with patch.object(review_scraper.fetcher, 'fetch_page') as mock_fetch, \
-             patch.object(review_scraper.parser, 'extract_review_id') as mock_extract:
+        with patch.object(review_scraper.fetcher, 'fetch_raw') as mock_fetch, \
+             patch.object(review_scraper.parser, 'extract_review_id_from_soup') as mock_extract:
             
-            mock_fetch.return_value = mock_html
+            mock_fetch.return_value = FetchedPage("https://platypus1917.org/", mock_html)
             mock_extract.return_value = 173
             
             result = review_scraper.get_review_id()
             
-            # fetch_page is called without arguments (uses base_url)
+            # fetch_raw is called without arguments (uses base_url)
             mock_fetch.assert_called_once_with()
-            mock_extract.assert_called_once_with(mock_html)
+            mock_extract.assert_called_once()
             assert result == 173
     
+    def test_index_page_fetched_once(self, review_scraper):
+        """Test review ID and listing URLs share one fetch of the index page"""
+        mock_html = (
+            b'<span class="selected">Archive for category Issue #173</span>'
+            b'<h4><a href="/2025/01/01/article1/">Article 1</a></h4>'
+        )
+        page = FetchedPage(review_scraper.base_url, mock_html, 'utf-8')
+        
+        with patch.object(review_scraper.fetcher, 'fetch_raw', return_value=page) as mock_fetch:
+            assert review_scraper.get_review_id() == 173
+            assert review_scraper.get_listing_urls() == ["https://platypus1917.org/2025/01/01/article1/"]
+            
+            mock_fetch.assert_called_once_with()
+    
     def test_get_review_id_error_handling(self, review_scraper, mock_handle_error):
         """Test error handling in review ID extraction"""
         mock_error = mock_handle_error
         
-        with patch.object(review_scraper.fetcher, 'fetch_page') as mock_fetch:
+        with patch.object(review_scraper.fetcher, 'fetch_raw') as mock_fetch:
             mock_fetch.side_effect = Exception("Network error")
             
             result = review_scraper.get_review_id()
@@ -111,7 +128,7 @@ class TestReviewScraper:
         """Test successful content data extraction"""
         mock_validate, mock_fetch, mock_parse = mock_validate_fetch_parse_content
         article_url = "https://platypus1917.org/2025/01/article1/"
-        mock_html = "<html>article content</html>"
+        mock_html = b"<html>article content</html>"
         expected_content = {
             'title': 'Test Article',
             'content': '<p>Article content goes here</p>',
@@ -119,14 +136,14 @@ class TestReviewScraper:
         }
         
         mock_validate.return_value = True
-        mock_fetch.return_value = mock_html
+        mock_fetch.return_value = FetchedPage("https://platypus1917.org/", mock_html)
         mock_parse.return_value = expected_content
         
         result = review_scraper.get_content_data(article_url)
         
         mock_validate.assert_called_once_with(article_url)
         mock_fetch.assert_called_once_with(article_url)
-        mock_parse.assert_called_once_with(mock_html, article_url)
+        mock_parse.assert_called_once_with(mock_html, article_url, None)
         assert result == expected_content
 
     def test_get_content_data_invalid_url(self, review_scraper):
@@ -145,7 +162,7 @@ class TestReviewScraper:
         """Test successful single article scraping"""
         mock_validate, mock_fetch, mock_parse = mock_validate_fetch_parse_content
         article_url = "https://platypus1917.org/2025/01/article/"
-        mock_html = "<html>article content</html>"
+        mock_html = b"<html>article content</html>"
         expected_data = {
             'title': 'Test Article',
             'content': '<p>Content</p>',
@@ -156,7 +173,7 @@ class TestReviewScraper:
         }
         
         mock_validate.return_value = True
-        mock_fetch.return_value = mock_html
+        mock_fetch.return_value = FetchedPage("https://platypus1917.org/", mock_html)
         mock_parse.return_value = expected_data
         
         with patch.object(review_scraper, 'validate_content_data') as mock_validate_content:
@@ -166,7 +183,7 @@ class TestReviewScraper:
             
             mock_validate.assert_called_once_with(article_url)
             mock_fetch.assert_called_once_with(article_url)
-            mock_parse.assert_called_once_with(mock_html, article_url)
+            mock_parse.assert_called_once_with(mock_html, article_url, None)
             mock_validate_content.assert_called_once_with(expected_data)
             assert result == expected_data
     
@@ -186,11 +203,11 @@ class TestReviewScraper:
         """Test single article scraping with invalid content"""
         mock_validate, mock_fetch, mock_parse = mock_validate_fetch_parse_content
         article_url = "https://platypus1917.org/2025/01/article/"
-        mock_html = "<html>content</html>"
+        mock_html = b"<html>content</html>"
         content_data = {'title': '', 'content': '', 'original_url': article_url}
         
         mock_validate.return_value = True
-        mock_fetch.return_value = mock_html
+        mock_fetch.return_value = FetchedPage("https://platypus1917.org/", mock_html)
         mock_parse.return_value = content_data
         
         with patch.object(review_scraper, 'validate_content_data') as mock_validate_content:
@@ -206,7 +223,7 @@ class TestReviewScraper:
         article_url = "https://platypus1917.org/2025/01/article/"
         
         with patch.object(review_scraper.fetcher, 'validate_url') as mock_validate, \
-             patch.object(review_scraper.fetcher, 'fetch_page') as mock_fetch:
+             patch.object(review_scraper.fetcher, 'fetch_raw') as mock_fetch:
             
             mock_validate.return_value = True
             mock_fetch.side_effect = Exception("Fetch error")
@@ -234,12 +251,10 @@ class TestReviewScraper:
             'original_url': article_urls[1]
         }
         
-        with patch.object(review_scraper, 'get_review_id') as mock_get_id, \
-             patch.object(review_scraper, 'get_listing_urls') as mock_get_urls, \
+        with patch.object(review_scraper, 'get_index_page') as mock_get_index, \
              patch.object(review_scraper, 'scrape_single_article') as mock_scrape:
             
-            mock_get_id.return_value = 173
-            mock_get_urls.return_value = article_urls
+            mock_get_index.return_value = ReviewIndexPage(review_scraper.base_url, 173, article_urls)
             mock_scrape.side_effect = [article_data_1, article_data_2]
             
             result = review_scraper.scrape_review_batch()
@@ -247,11 +262,12 @@ class TestReviewScraper:
             expected = {
                 "source_url": review_scraper.base_url,
                 "articles": [article_data_1, article_data_2],
-                "review_id": 173
+                "review_id": 173,
+                "unchanged_urls": [],
+                "failed_urls": []
             }
             
-            mock_get_id.assert_called_once()
-            mock_get_urls.assert_called_once()
+            mock_get_index.assert_called_once()
             assert mock_scrape.call_count == 2
             mock_scrape.assert_any_call(article_urls[0])
             mock_scrape.assert_any_call(article_urls[1])
@@ -259,11 +275,9 @@ class TestReviewScraper:
     
     def test_scrape_review_batch_no_urls(self, review_scraper):
         """Test review batch scraping when no URLs found"""
-        with patch.object(review_scraper, 'get_review_id') as mock_get_id, \
-             patch.object(review_scraper, 'get_listing_urls') as mock_get_urls:
+        with patch.object(review_scraper, 'get_index_page') as mock_get_index:
             
-            mock_get_id.return_value = 173
-            mock_get_urls.return_value = []
+            mock_get_index.return_value = ReviewIndexPage(review_scraper.base_url, 173, [])
             
             result = review_scraper.scrape_review_batch()
             
@@ -284,12 +298,10 @@ class TestReviewScraper:
             'original_url': article_urls[0]
         }
         
-        with patch.object(review_scraper, 'get_review_id') as mock_get_id, \
-             patch.object(review_scraper, 'get_listing_urls') as mock_get_urls, \
+        with patch.object(review_scraper, 'get_index_page') as mock_get_index, \
              patch.object(review_scraper, 'scrape_single_article') as mock_scrape:
             
-            mock_get_id.return_value = 173
-            mock_get_urls.return_value = article_urls
+            mock_get_index.return_value = ReviewIndexPage(review_scraper.base_url, 173, article_urls)
             # First succeeds, second and third fail
             mock_scrape.side_effect = [article_data_1, None, None]
             
@@ -298,7 +310,9 @@ class TestReviewScraper:
             expected = {
                 "source_url": review_scraper.base_url,
                 "articles": [article_data_1],
-                "review_id": 173
+                "review_id": 173,
+                "unchanged_urls": [],
+                "failed_urls": article_urls[1:]
             }
             
             assert result == expected
@@ -307,14 +321,113 @@ class TestReviewScraper:
         """Test error handling in review batch scraping"""
         mock_error = mock_handle_error
         
-        with patch.object(review_scraper, 'get_review_id') as mock_get_id:
-            mock_get_id.side_effect = Exception("Review ID error")
+        with patch.object(review_scraper, 'get_index_page') as mock_get_index:
+            mock_get_index.side_effect = Exception("Index page error")
             
             result = review_scraper.scrape_review_batch()
             
             assert result == []
             mock_error.assert_called_once()
 
+    async def test_scrape_review_batch_async_success(self, review_scraper):
+        """Test async batch fetches the listing once and articles concurrently"""
+        article_urls = [
+            "https://platypus1917.org/2025/01/article1/",
+            "https://platypus1917.org/2025/01/article2/"
+        ]
+        article_data = {
+            'title': 'Article 1',
+            'content': '<p>Content 1</p>',
+            'original_url': article_urls[0]
+        }
+        
+        with patch.object(review_scraper.async_fetcher, 'fetch_raw', new_callable=AsyncMock) as mock_fetch, \
+             patch.object(review_scraper.async_fetcher, 'fetch_many_raw', new_callable=AsyncMock) as mock_fetch_many, \
+             patch.object(review_scraper.parser, 'extract_review_id_from_soup', return_value=173), \
+             patch.object(review_scraper.parser, 'extract_listing_urls', return_value=article_urls), \
+             patch.object(review_scraper, 'parse_article', return_value=article_data) as mock_parse:
+            
+            mock_fetch.return_value = FetchedPage(review_scraper.base_url, b"<html>listing</html>")
+            # Second article failed to fetch and is missing from the result
+            mock_fetch_many.return_value = {
+                article_urls[0]: FetchedPage(article_urls[0], b"<html>article 1</html>", 'utf-8')
+            }
+            
+            result = await review_scraper.scrape_review_batch_async()
+            
+            mock_fetch.assert_awaited_once_with()
+            mock_fetch_many.assert_awaited_once_with(article_urls)
+            mock_parse.assert_called_once_with(
+                b"<html>article 1</html>", article_urls[0], 'utf-8', fingerprint(b"<html>article 1</html>")
+            )
+            assert result == {
+                "source_url": review_scraper.base_url,
+                "articles": [article_data],
+                "review_id": 173,
+                "unchanged_urls": [],
+                "failed_urls": [article_urls[1]]
+            }
+    
+    def test_get_content_data_adds_fingerprints(self, review_scraper, mock_validate_fetch_parse_content):
+        """Test scraped article data carries HTML and content fingerprints"""
+        mock_validate, mock_fetch, mock_parse = mock_validate_fetch_parse_content
+        article_url = "https://platypus1917.org/2025/01/article1/"
+        mock_validate.return_value = True
+        mock_fetch.return_value = FetchedPage(article_url, b"<html>article</html>")
+        mock_parse.return_value = {'title': 'Test Article', 'content': '<p>Body</p>'}
+        
+        result = review_scraper.get_content_data(article_url)
+        
+        assert result['html_hash'] == fingerprint(b"<html>article</html>")
+        assert result['content_hash'] == fingerprint('<p>Body</p>')
+    
+    def test_unchanged_article_not_parsed(self, review_scraper, mock_validate_fetch_parse_content):
+        """Test an article whose HTML matches its known fingerprint is skipped before parsing"""
+        mock_validate, mock_fetch, mock_parse = mock_validate_fetch_parse_content
+        article_url = "https://platypus1917.org/2025/01/article1/"
+        mock_validate.return_value = True
+        mock_fetch.return_value = FetchedPage(article_url, b"<html>article</html>")
+        review_scraper.set_known_fingerprints({article_url: fingerprint(b"<html>article</html>")})
+        
+        result = review_scraper.scrape_single_article(article_url)
+        
+        assert result is None
+        mock_parse.assert_not_called()
+        assert review_scraper.unchanged_urls == [article_url]
+    
+    async def test_scrape_review_batch_async_skips_unchanged(self, review_scraper):
+        """Test the async batch reports unchanged articles instead of parsing them"""
+        article_urls = [
+            "https://platypus1917.org/2025/01/article1/",
+            "https://platypus1917.org/2025/01/article2/"
+        ]
+        review_scraper._index_page = ReviewIndexPage(review_scraper.base_url, 173, article_urls)
+        review_scraper.set_known_fingerprints({article_urls[0]: fingerprint(b"<html>old</html>")})
+        pages = {
+            article_urls[0]: FetchedPage(article_urls[0], b"<html>old</html>"),
+            article_urls[1]: FetchedPage(article_urls[1], b"<html>new</html>"),
+        }
+        
+        with patch.object(review_scraper.async_fetcher, 'fetch_many_raw', new_callable=AsyncMock, return_value=pages), \
+             patch.object(review_scraper, 'parse_article', return_value={'title': 'Article 2'}) as mock_parse:
+            
+            result = await review_scraper.scrape_review_batch_async()
+        
+        mock_parse.assert_called_once()
+        assert mock_parse.call_args[0][1] == article_urls[1]
+        assert result["articles"] == [{'title': 'Article 2'}]
+        assert result["unchanged_urls"] == [article_urls[0]]
+    
+    async def test_scrape_review_batch_async_error_handling(self, review_scraper, mock_handle_error):
+        """Test error handling in async review batch scraping"""
+        with patch.object(review_scraper.async_fetcher, 'fetch_raw', new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.side_effect = Exception("Network error")
+            
+            result = await review_scraper.scrape_review_batch_async()
+            
+            assert result == []
+            mock_handle_error.assert_called_once()
+
 
 class TestReviewScraperValidation:
     """Test ReviewScraper content validation"""
@@ -449,44 +562,41 @@ class TestReviewScraperAbstractMethodImplementation:
     
     def test_methods_return_correct_types(self, simple_scraper):
         """Test that methods return expected types"""
-        with patch.object(simple_scraper.fetcher, 'fetch_page') as mock_fetch, \
-             patch.object(simple_scraper.parser, 'parse_listing_page') as mock_parse:
+        with patch.object(simple_scraper.fetcher, 'fetch_raw') as mock_fetch, \
+             patch.object(simple_scraper.parser, 'extract_listing_urls') as mock_parse:
             
-            mock_fetch.return_value = "<html></html>"
+            mock_fetch.return_value = FetchedPage(simple_scraper.base_url, b"<html></html>")
             mock_parse.return_value = []
             
             # get_listing_urls should return list
             result = simple_scraper.get_listing_urls()
             assert isinstance(result, list)
         
-        with patch.object(simple_scraper, 'get_review_id') as mock_get_id, \
-             patch.object(simple_scraper, 'get_listing_urls') as mock_get_urls, \
+        with patch.object(simple_scraper, 'get_index_page') as mock_get_index, \
              patch.object(simple_scraper, 'scrape_single_article') as mock_scrape:
             
-            mock_get_id.return_value = 173
-            mock_get_urls.return_value = []
+            mock_get_index.return_value = ReviewIndexPage(simple_scraper.base_url, 173, [])
             mock_scrape.return_value = None
             
             # scrape_review_batch should return list when no URLs
             result = simple_scraper.scrape_review_batch()
             assert isinstance(result, list)
         
-        with patch.object(simple_scraper, 'get_review_id') as mock_get_id, \
-             patch.object(simple_scraper, 'get_listing_urls') as mock_get_urls, \
+        with patch.object(simple_scraper, 'get_index_page') as mock_get_index, \
              patch.object(simple_scraper, 'scrape_single_article') as mock_scrape:
             
-            mock_get_id.return_value = 173
-            mock_get_urls.return_value = ["https://example.com/article/"]
+            mock_get_index.return_value = ReviewIndexPage(simple_scraper.base_url, 173, ["https://example.com/article/"])
             mock_scrape.return_value = {"title": "Test", "content": "<p>Test</p>", "original_url": "https://example.com/article/"}
             
             # scrape_review_batch should return dict when articles found
             result = simple_scraper.scrape_review_batch()
             assert isinstance(result, dict)
         
-        with patch.object(simple_scraper.fetcher, 'fetch_page') as mock_fetch, \
-             patch.object(simple_scraper.parser, 'extract_review_id') as mock_extract:
+        simple_scraper._index_page = None
+        with patch.object(simple_scraper.fetcher, 'fetch_raw') as mock_fetch, \
+             patch.object(simple_scraper.parser, 'extract_review_id_from_soup') as mock_extract:
             
-            mock_fetch.return_value = "<html></html>"
+            mock_fetch.return_value = FetchedPage(simple_scraper.base_url, b"<html></html>")
             mock_extract.return_value = 173
             
             # get_review_id should return int or None
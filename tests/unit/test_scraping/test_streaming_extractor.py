@@ -0,0 +1,177 @@
+"""
+Unit tests for the streaming article extractor.
+Its results must equal those of ReviewParser's BeautifulSoup path.
+"""
+
+import pytest
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+from src.scraping.review_parser import ReviewParser
+from src.scraping.streaming_extractor import (
+    LayoutMismatch,
+    StreamingArticleExtractor,
+    parse_simple_selector,
+)
+
+FIXTURES_DIR = Path(__file__).parent.parent.parent / "fixtures" / "pages"
+ISSUE_URL = "https://platypus1917.org/platypus-review/"
+ARTICLE_URL = "https://platypus1917.org/2025/09/01/marxism-and-the-left-today/"
+UNDATED_URL = "https://platypus1917.org/marxism-and-the-left-today/"
+
+# Markup that exercises html.parser's tree building quirks
+QUIRKS_PAGE = (
+    '<html><head><title>t</title><script>var a = "<p>";</script></head><body>'
+    '<nav class="bpf-title">Menu</nav>'
+    '<div class="wrapper"><div class="bpf-content">'
+    '<h1>Ignored heading</h1><h2> by  Jane Doe and John Roe </h2>'
+    '<p class="has-text-align-right"><em>Platypus Review</em> 12 | May–June 2009</p>'
+    '<a href="/x">orphan</a><span>unwrapped <b>bold</b></span>\n   \n'
+    '<p>Unclosed <i>italic<p>next</i> paragraph'
+    '<pre>  keep\n   this </pre><textarea>  </textarea>'
+    '<div class="sidebar"><p>dropped</p></div><!-- note -->'
+    '<p>Entities &amp; &#150; &nbsp;<br><br></br><img src="/i.jpg" alt="a"></p>'
+    '<div class="bpf-content"><p>nested container</p></div>'
+    '<ul><li>one<li>two</ul></div></div>'
+    '<footer><p>footer</p></footer></body></html>'
+)
+
+
+@pytest.fixture
+def parser():
+    """ReviewParser pinned to html.parser, the only backend the streaming path reproduces"""
+    parser = ReviewParser(ISSUE_URL)
+    parser.backend = 'html.parser'
+    return parser
+
+
+def parse_both(parser, html, url=ARTICLE_URL, encoding=None):
+    """Results of the BeautifulSoup path and of the streaming path for one page"""
+    parser.streaming = False
+    soup_result = parser.parse_content_page(html, url, encoding)
+    parser.streaming = True
+    return soup_result, parser.parse_content_page_streaming(html, url, encoding)
+
+
+class TestStreamingEquivalence:
+    """Test that streaming extraction reproduces the BeautifulSoup path"""
+
+    @pytest.mark.parametrize("fixture", ["article.html", "article_legacy.html", "cleaning_edge_cases.html"])
+    @pytest.mark.parametrize("as_bytes", [True, False])
+    def test_fixture_pages(self, parser, fixture, as_bytes):
+        """Test that fixture articles give identical results from bytes and from text"""
+        html = (FIXTURES_DIR / fixture).read_bytes()
+        if not as_bytes:
+            html = html.decode('utf-8')
+
+        soup_result, streaming_result = parse_both(parser, html, encoding='utf-8')
+
+        assert streaming_result == soup_result
+        assert streaming_result['content']
+
+    def test_tree_building_quirks(self, parser):
+        """Test implicit end tags, whitespace, entities, removal and paragraph wrapping"""
+        soup_result, streaming_result = parse_both(parser, QUIRKS_PAGE)
+
+        assert streaming_result == soup_result
+        assert streaming_result['title'] == 'Menu'
+        assert streaming_result['authors'] == ['Jane Doe', 'John Roe']
+
+    def test_date_line_is_used_without_date_in_url(self, parser):
+        """Test that the date line gives the publication date when the URL has none"""
+        soup_result, streaming_result = parse_both(parser, QUIRKS_PAGE, url=UNDATED_URL)
+
+        assert streaming_result == soup_result
+        assert streaming_result['publication_date'] == date(2009, 5, 1)
+
+    def test_legacy_encoding(self, parser):
+        """Test that raw bytes are decoded like BeautifulSoup decodes them"""
+        html = QUIRKS_PAGE.replace('Menu', 'Café').encode('windows-1252')
+
+        soup_result, streaming_result = parse_both(parser, html, encoding='windows-1252')
+
+        assert streaming_result == soup_result
+        assert streaming_result['title'] == 'Café'
+
+    def test_removed_container(self, parser):
+        """Test that a content container matching the removal selector gives empty content"""
+        html = '<h1>Title</h1><div class="bpf-content comments"><p>Gone</p></div>'
+
+        soup_result, streaming_result = parse_both(parser, html)
+
+        assert streaming_result == soup_result
+        assert streaming_result['content'] == ''
+        assert streaming_result['content_nodes'] == []
+
+
+class TestStreamingFallback:
+    """Test choosing between the streaming and the BeautifulSoup path"""
+
+    def test_page_without_content_container_falls_back(self, parser):
+        """Test that other layouts are parsed with BeautifulSoup"""
+        html = '<html><body><h1>Plain page</h1><p>Text</p></body></html>'
+
+        with pytest.raises(LayoutMismatch):
+            parser.streaming_extractor.extract(html)
+        result = parser.parse_content_page(html, ARTICLE_URL)
+
+        assert result['title'] == 'Plain page'
+        assert '<p>Text</p>' in result['content']
+
+    def test_articles_do_not_build_a_soup(self, parser):
+        """Test that articles are parsed without creating the page tree"""
+        html = (FIXTURES_DIR / "article.html").read_bytes()
+
+        with patch.object(parser, 'create_soup') as mock_create_soup:
+            parser.parse_content_page(html, ARTICLE_URL, 'utf-8')
+
+        mock_create_soup.assert_not_called()
+
+    @pytest.mark.parametrize("backend", ["lxml", "html5lib"])
+    def test_other_backends_use_beautifulsoup(self, parser, backend):
+        """Test that streaming is only used where it reproduces the configured backend"""
+        pytest.importorskip(backend)
+        parser.backend = backend
+
+        assert not parser.use_streaming()
+
+    def test_incompatible_beautifulsoup_falls_back(self, parser):
+        """Test that a BeautifulSoup without the html.parser internals we drive is a layout mismatch, not a crash"""
+        html = (FIXTURES_DIR / "article.html").read_bytes()
+        parser.streaming = False
+        expected = parser.parse_content_page(html, ARTICLE_URL, 'utf-8')
+        parser.streaming = True
+
+        with patch('src.scraping.streaming_extractor.BeautifulSoupHTMLParser', None):
+            with pytest.raises(LayoutMismatch):
+                parser.streaming_extractor.extract(html, 'utf-8')
+            assert parser.parse_content_page(html, ARTICLE_URL, 'utf-8') == expected
+
+    def test_changed_tree_builder_callbacks_fall_back(self, parser):
+        """Test that a parser calling back into methods the sink lacks is a layout mismatch"""
+        html = (FIXTURES_DIR / "article.html").read_bytes()
+
+        with patch('src.scraping.streaming_extractor._ExtractionSink.handle_starttag', side_effect=AttributeError("reset")):
+            with pytest.raises(LayoutMismatch):
+                parser.streaming_extractor.extract(html, 'utf-8')
+
+    def test_streaming_can_be_disabled(self, parser):
+        """Test that the streaming flag switches the extractor off"""
+        parser.streaming = False
+
+        assert not parser.use_streaming()
+
+
+class TestSimpleSelectors:
+    """Test parsing of the removal selector"""
+
+    def test_tags_and_classes(self):
+        """Test splitting a selector list into tag names and classes"""
+        assert parse_simple_selector('nav, footer, .sidebar') == (frozenset({'nav', 'footer'}), frozenset({'sidebar'}))
+
+    @pytest.mark.parametrize("selector", ['div.sidebar', 'nav a', '[role=banner]', 'p:first-child'])
+    def test_complex_selectors_are_rejected(self, selector):
+        """Test that selectors needing context or attributes are not approximated"""
+        with pytest.raises(ValueError):
+            StreamingArticleExtractor(remove_selector=selector)
@@ -0,0 +1,130 @@
+"""
+Unit tests for the HTML to Telegraph Node compiler.
+The compiled nodes must match what the telegraph library builds from the
+cleaned HTML, minus the attributes Telegraph does not accept.
+"""
+
+import pytest
+from pathlib import Path
+from telegraph.utils import html_to_nodes as telegraph_html_to_nodes
+
+from src.scraping.parser_backend import make_soup
+from src.scraping.review_parser import ReviewParser
+from src.scraping.telegraph_nodes import (
+    compile_nodes,
+    html_to_nodes,
+    node_size,
+    node_text,
+    nodes_size,
+)
+
+FIXTURES_DIR = Path(__file__).parent.parent.parent / "fixtures" / "pages"
+ISSUE_URL = "https://platypus1917.org/platypus-review/"
+ARTICLE_URL = "https://platypus1917.org/2025/09/01/marxism-and-the-left-today/"
+
+
+def telegraph_reference(html, top_level=True):
+    """Nodes the telegraph library builds from HTML, reduced to href/src and without whitespace between blocks"""
+    nodes = []
+    for node in telegraph_html_to_nodes(html) if top_level else html:
+        if isinstance(node, str):
+            if not (top_level and node.isspace()):
+                nodes.append(node)
+            continue
+        reduced = {'tag': node['tag']}
+        attrs = {name: value for name, value in node.get('attrs', {}).items() if name in ('href', 'src')}
+        if attrs:
+            reduced['attrs'] = attrs
+        if 'children' in node:
+            reduced['children'] = telegraph_reference(node['children'], top_level=False)
+        nodes.append(reduced)
+    return nodes
+
+
+class TestCompileNodes:
+    """Test compiling cleaned content into Telegraph nodes"""
+
+    @pytest.mark.parametrize("fixture", ["article.html", "article_legacy.html"])
+    def test_matches_telegraph_conversion_of_cleaned_html(self, fixture):
+        """Test that nodes compiled from the cleaned tree equal the telegraph library's conversion of its HTML"""
+        parser = ReviewParser(ISSUE_URL)
+        soup = make_soup((FIXTURES_DIR / fixture).read_bytes(), 'utf-8')
+        container = soup.find('div', class_='bpf-content')
+        html = parser.clean_content_for_publishing(container)
+
+        assert compile_nodes(container) == telegraph_reference(html)
+
+    def test_element_structure(self):
+        """Test element nodes, attribute filtering and void elements"""
+        nodes = html_to_nodes(
+            '<p class="x" id="y">See <a href="/a" title="t">link</a><br/></p>'
+            '<img src="/i.jpg" alt="alt"/>'
+        )
+
+        assert nodes == [
+            {'tag': 'p', 'children': ['See ', {'tag': 'a', 'attrs': {'href': '/a'}, 'children': ['link']}, {'tag': 'br'}]},
+            {'tag': 'img', 'attrs': {'src': '/i.jpg'}},
+        ]
+
+    def test_disallowed_tags_are_replaced_by_their_children(self):
+        """Test that tags outside ALLOWED_TAGS do not appear as elements"""
+        nodes = html_to_nodes('<div><p>Text in <span>span</span></p></div>')
+
+        assert nodes == [{'tag': 'p', 'children': ['Text in span']}]
+
+    def test_whitespace_normalisation(self):
+        """Test that whitespace is collapsed outside <pre> and kept inside it"""
+        nodes = html_to_nodes('\n  <p>  several\n   spaces  </p>\n  <pre>  keep\n   this</pre>\n')
+
+        assert nodes == [
+            {'tag': 'p', 'children': ['several spaces ']},
+            {'tag': 'pre', 'children': ['  keep\n   this']},
+        ]
+
+    def test_comments_are_dropped(self):
+        """Test that comments never become text nodes"""
+        nodes = html_to_nodes('<p>Before<!-- hidden -->after</p>')
+
+        assert nodes == [{'tag': 'p', 'children': ['Beforeafter']}]
+
+    def test_empty_elements_have_no_children_key(self):
+        """Test that empty elements are emitted without a children list"""
+        assert html_to_nodes('<p></p>') == [{'tag': 'p'}]
+
+
+class TestNodeHelpers:
+    """Test text and size helpers"""
+
+    def test_node_text(self):
+        """Test that text of nested nodes is concatenated"""
+        node = {'tag': 'p', 'children': ['a ', {'tag': 'em', 'children': ['b']}, {'tag': 'br'}, ' c']}
+        assert node_text(node) == 'a b c'
+        assert node_text('plain') == 'plain'
+
+    def test_sizes_count_utf8_bytes_of_compact_json(self):
+        """Test that sizes are measured on the compact JSON encoding"""
+        node = {'tag': 'p', 'children': ['é']}
+        assert node_size(node) == len('{"tag":"p","children":["é"]}'.encode('utf-8'))
+        assert nodes_size([node, node]) == 2 * node_size(node) + 3
+
+
+class TestReviewParserContentNodes:
+    """Test that the parser emits compiled nodes with the cleaned content"""
+
+    def test_parse_content_page_includes_nodes(self):
+        """Test that content_nodes describe the same content as the cleaned HTML"""
+        parser = ReviewParser(ISSUE_URL)
+        data = parser.parse_content_page((FIXTURES_DIR / "article.html").read_bytes(), ARTICLE_URL, 'utf-8')
+
+        assert data['content_nodes'] == telegraph_reference(data['content'])
+        assert all(isinstance(node, (str, dict)) for node in data['content_nodes'])
+
+    def test_removed_container_gives_no_nodes(self):
+        """Test that a content container matching the removal selector compiles to nothing"""
+        parser = ReviewParser(ISSUE_URL)
+        html = '<html><body><div class="bpf-content comments"><p>Gone</p></div></body></html>'
+
+        data = parser.parse_content_page(html, ARTICLE_URL)
+
+        assert data['content'] == ''
+        assert data['content_nodes'] == []
@@ -0,0 +1,137 @@
+"""
+Unit tests for the asynchronous Telegraph API client, run against a local
+server that mimics the Telegraph API.
+"""
+
+import asyncio
+import json
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from telegraph.exceptions import RetryAfterError, TelegraphException
+
+from src.telegraph_client import AsyncTelegraphClient
+
+CALL_DELAY = 0.1
+
+
+@pytest.fixture
+async def server():
+    """Local Telegraph API that records every call"""
+    state = {'calls': [], 'in_flight': 0, 'max_in_flight': 0}
+
+    async def api(request):
+        method = request.match_info['method']
+        path = request.match_info['path']
+        form = dict(await request.post())
+        state['calls'].append((method, path, form))
+        state['in_flight'] += 1
+        state['max_in_flight'] = max(state['max_in_flight'], state['in_flight'])
+        await asyncio.sleep(CALL_DELAY)
+        state['in_flight'] -= 1
+
+        if form.get('title') == 'flood':
+            return web.json_response({'ok': False, 'error': 'FLOOD_WAIT_7'})
+        if form.get('title') == 'broken':
+            return web.json_response({'ok': False, 'error': 'CONTENT_TOO_BIG'})
+        if method == 'createAccount':
+            return web.json_response({'ok': True, 'result': {'short_name': form['short_name'], 'access_token': 'new_token'}})
+        if method == 'getViews':
+            return web.json_response({'ok': True, 'result': {'views': 42}})
+        result = {'path': path or 'Page-10-18', 'url': f"https://telegra.ph/{path or 'Page-10-18'}", 'title': form.get('title')}
+        if form.get('return_content') == 'true':
+            result['content'] = json.loads(form.get('content', '[{"tag":"p","children":["stored"]}]'))
+        return web.json_response({'ok': True, 'result': result})
+
+    app = web.Application()
+    app.router.add_post('/{method}/{path:.*}', api)
+
+    async with TestServer(app) as test_server:
+        test_server.state = state
+        yield test_server
+
+
+@pytest.fixture
+async def client(server):
+    async with AsyncTelegraphClient('secret', api_url=str(server.make_url(''))) as client:
+        yield client
+
+
+class TestAsyncTelegraphClient:
+    """Test the Telegraph API methods"""
+
+    def test_init_reads_pool_size_from_env(self, monkeypatch):
+        """Test the pool size is read from TELEGRAPH_MAX_CONNECTIONS"""
+        monkeypatch.setenv('TELEGRAPH_MAX_CONNECTIONS', '3')
+        client = AsyncTelegraphClient('secret')
+        assert client.max_connections == 3
+        assert client.session is None  # Created lazily inside the event loop
+
+    def test_session_of_finished_loop_is_closed(self):
+        """Test a client reused in a new event loop closes the session of the previous one"""
+        client = AsyncTelegraphClient('secret')
+
+        first = asyncio.run(client._get_session())
+        second = asyncio.run(client._get_session())
+
+        assert first.closed
+        assert second is not first and not second.closed
+        asyncio.run(client.close())
+        assert second.closed and client.session is None
+
+    async def test_create_page_sends_nodes_as_compact_json(self, client, server):
+        """Test createPage parameters: token, title, JSON content, omitted None values"""
+        nodes = [{'tag': 'p', 'children': ['Текст']}]
+
+        page = await client.create_page('Title', nodes, author_name='Platypus Review')
+
+        assert page['url'] == 'https://telegra.ph/Page-10-18'
+        method, path, form = server.state['calls'][0]
+        assert method == 'createPage'
+        assert form['access_token'] == 'secret'
+        assert form['content'] == '[{"tag":"p","children":["Текст"]}]'
+        assert form['return_content'] == 'false'
+        assert 'author_url' not in form
+
+    async def test_edit_and_get_page_use_the_path(self, client, server):
+        """Test that editPage and getPage put the page path in the URL"""
+        await client.edit_page('Part-1-10-18', 'Title', [{'tag': 'p', 'children': ['new']}])
+        page = await client.get_page('Part-1-10-18')
+
+        assert [(method, path) for method, path, _ in server.state['calls']] == [
+            ('editPage', 'Part-1-10-18'), ('getPage', 'Part-1-10-18')
+        ]
+        assert page['content'] == [{'tag': 'p', 'children': ['stored']}]
+
+    async def test_get_views(self, client, server):
+        """Test getViews with a period"""
+        views = await client.get_views('Part-1-10-18', year=2025, month=9)
+
+        assert views == {'views': 42}
+        assert server.state['calls'][0][2] == {'access_token': 'secret', 'year': '2025', 'month': '9'}
+
+    async def test_create_account_replaces_token(self, client):
+        """Test that later calls use the token of a newly created account"""
+        account = await client.create_account('platypus', author_name='Platypus Review')
+
+        assert account['access_token'] == 'new_token'
+        assert client.access_token == 'new_token'
+
+    async def test_errors_are_raised_as_telegraph_exceptions(self, client):
+        """Test FLOOD_WAIT and other API errors"""
+        with pytest.raises(RetryAfterError) as flood:
+            await client.create_page('flood', [])
+        assert flood.value.retry_after == 7
+
+        with pytest.raises(TelegraphException, match='CONTENT_TOO_BIG'):
+            await client.create_page('broken', [])
+
+    async def test_calls_run_concurrently(self, client, server):
+        """Test that calls share the pool without waiting for each other"""
+        start = asyncio.get_running_loop().time()
+
+        await asyncio.gather(*(client.create_page(f'Page {i}', []) for i in range(5)))
+
+        assert server.state['max_in_flight'] == 5
+        assert asyncio.get_running_loop().time() - start < 3 * CALL_DELAY
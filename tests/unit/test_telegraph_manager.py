@@ -1,12 +1,54 @@
 """
 Unit tests for TelegraphManager with environment variable configuration.
 """
+import asyncio
+import json
 import os
+import random
+import re
 import pytest
-from unittest.mock import patch, mock_open, MagicMock
+from pathlib import Path
+from unittest.mock import patch, mock_open, MagicMock, AsyncMock
 from datetime import datetime
 from bs4 import BeautifulSoup
-from src.telegraph_manager import TelegraphManager
+from telegraph.utils import nodes_to_html
+from src.scraping.telegraph_nodes import html_to_nodes, nodes_size
+from src.telegraph_manager import (
+    MAX_CONTENT_BYTES,
+    PLACEHOLDER_CONTENT,
+    PUBLISH_MODE_EDIT,
+    PUBLISH_MODE_RESERVE,
+    TelegraphManager,
+)
+from src.telegraph_pool import TelegraphAccount, TelegraphTokenPool
+
+GOLDEN_CHUNKS = Path(__file__).parent.parent / "fixtures" / "golden" / "chunks.json"
+
+LATIN_WORDS = ['Marxism', 'the', 'Left', 'history', 'of', 'capital', 'critique', 'social', 'freedom', 'and']
+CYRILLIC_WORDS = ['марксизм', 'левые', 'история', 'капитал', 'критика', 'свобода', 'и']
+
+
+def synthetic_article(seed, paragraphs, words=LATIN_WORDS):
+    """Deterministic article nodes with every kind of top-level block"""
+    rng = random.Random(seed)
+    
+    def text(count):
+        return ' '.join(rng.choice(words) for _ in range(count))
+    
+    nodes = []
+    for index in range(paragraphs):
+        kind = rng.randrange(10)
+        if kind < 6:
+            nodes.append({'tag': 'p', 'children': [text(rng.randrange(5, 400)), {'tag': 'em', 'children': [text(3)]}, '.']})
+        elif kind == 6:
+            nodes.append({'tag': 'blockquote', 'children': [text(rng.randrange(20, 200))]})
+        elif kind == 7:
+            nodes.append({'tag': 'ul', 'children': [{'tag': 'li', 'children': [text(10)]} for _ in range(rng.randrange(1, 8))]})
+        elif kind == 8:
+            nodes.append({'tag': 'img', 'attrs': {'src': f'/wp-content/uploads/{index}.jpg'}})
+        else:
+            nodes.append(f'  {text(rng.randrange(1, 60))}  ')
+    return nodes
 
 
 @pytest.fixture(autouse=True)
@@ -120,14 +162,14 @@ class TestTelegraphManager:
         manager = TelegraphManager(access_token='test_token')
         
         # Test with small content that doesn't need splitting
-        small_content = '<p>Small content</p>'
+        small_content = html_to_nodes('<p>Small content</p>')
         chunks = manager.split_content(small_content)
         assert len(chunks) == 1
         assert chunks[0] == small_content
         
         # Test with large content that needs splitting
         large_block = '<p>' + 'A' * 25000 + '</p>'
-        large_content = large_block + large_block + large_block  # Total > 50000 chars
+        large_content = html_to_nodes(large_block + large_block + large_block)  # Total > 50000 chars
         chunks = manager.split_content(large_content)
         assert len(chunks) > 1
     
@@ -164,13 +206,13 @@ class TestTelegraphManager:
         <p>Text with <s>strikethrough</s> and line<br>break.</p>
         '''
         
-        chunks = manager.split_content(complex_content)
+        chunks = manager.split_content(html_to_nodes(complex_content))
         
         # Should have at least one chunk
         assert len(chunks) >= 1
         
         # Combine all chunks to verify no content is lost
-        combined_content = ''.join(chunks)
+        combined_content = ''.join(nodes_to_html(chunk) for chunk in chunks)
         soup = BeautifulSoup(combined_content, 'html.parser')
         
         # Verify key elements are preserved
@@ -217,13 +259,13 @@ class TestTelegraphManager:
         <em>Standalone italic text</em>
         '''
         
-        chunks = manager.split_content(mixed_content)
+        chunks = manager.split_content(html_to_nodes(mixed_content))
         
         # Should have at least one chunk
         assert len(chunks) >= 1
         
         # Verify content preservation
-        combined_content = ''.join(chunks)
+        combined_content = ''.join(nodes_to_html(chunk) for chunk in chunks)
         soup = BeautifulSoup(combined_content, 'html.parser')
         
         # Check that standalone elements are preserved
@@ -236,8 +278,8 @@ class TestTelegraphManager:
     @patch('src.telegraph_manager.Telegraph')
     @patch('os.path.exists')
     @patch('builtins.open', mock_open())
-    def test_split_content_with_navigation_reservation(self, mock_exists, mock_telegraph):
-        """Test that split_content reserves space for navigation links when requested."""
+    def test_split_content_packs_up_to_the_exact_limit(self, mock_exists, mock_telegraph):
+        """Test that parts are filled up to Telegraph's 64 KB content limit, navigation links included."""
         mock_telegraph_instance = MagicMock()
         mock_telegraph_instance.create_account.return_value = {
             'access_token': 'test_token',
@@ -249,16 +291,25 @@ class TestTelegraphManager:
         
         manager = TelegraphManager(access_token='test_token')
         
-        # Test with small content - should not change behavior significantly
-        small_content = '<p>Small content</p>'
-        chunks_without_nav = manager.split_content(small_content, "Test Title", reserve_space_for_nav=False)
-        chunks_with_nav = manager.split_content(small_content, "Test Title", reserve_space_for_nav=True)
-        
-        # Both should have same number of chunks for small content
-        assert len(chunks_without_nav) == len(chunks_with_nav) == 1
-        
-        # Content should be the same
-        assert chunks_without_nav[0] == chunks_with_nav[0]
+        # A single part uses the whole limit; the fixed budgets stopped at about 62000 bytes
+        block = {'tag': 'p', 'children': ['A' * 1000]}
+        single = [block] * (MAX_CONTENT_BYTES // (nodes_size([block]) - 1) - 1)
+        assert nodes_size(single) > 63000
+        assert manager.split_content(single, "Test Title") == [single]
+        
+        # Parts of a multipart article stay within the limit once navigation links are added
+        content = [block] * 200
+        chunks = manager.split_content(content, "Test Title")
+        urls = [manager._page_url_bound("Test Title", i) for i in range(len(chunks))]
+        for i, chunk in enumerate(chunks):
+            nav_links = manager._create_navigation_links(i, len(chunks), urls, "Test Title")
+            final = manager._add_nav_to_content(chunk, nav_links, i == 0)
+            assert nodes_size(final) <= MAX_CONTENT_BYTES
+            if i < len(chunks) - 1:
+                # The next block would not have fitted
+                assert nodes_size(manager._add_nav_to_content(chunk + [block], nav_links, i == 0)) > MAX_CONTENT_BYTES
+        assert len(chunks) == 4
+        assert manager.get_split_stats() == {'articles': 2, 'parts': 5, 'parts_saved': 2}
     
     @patch('src.telegraph_manager.Telegraph')
     @patch('os.path.exists')
@@ -277,14 +328,14 @@ class TestTelegraphManager:
         manager = TelegraphManager(access_token='test_token')
         
         # Test with small content
-        small_content = '<p>Small content</p>'
+        small_content = html_to_nodes('<p>Small content</p>')
         estimate = manager._estimate_chunks_count(small_content, "Test Title")
         assert estimate == 1
         
         # Test with large content
-        large_content = '<p>' + 'A' * 70000 + '</p>'
+        large_content = html_to_nodes(('<p>' + 'A' * 35000 + '</p>') * 2)
         estimate = manager._estimate_chunks_count(large_content, "Test Title")
-        assert estimate > 1
+        assert estimate == len(manager.split_content(large_content, "Test Title")) == 2
     
     @patch('src.telegraph_manager.Telegraph')
     @patch('os.path.exists')
@@ -307,19 +358,23 @@ class TestTelegraphManager:
         
         # Test first part (index 0)
         nav = manager._create_navigation_links(0, 3, urls, title)
-        assert 'Next:' in nav['top']
-        assert 'Previous' not in nav['top']
-        assert nav['bottom'] == f"<hr>{nav['top']}"
+        assert 'Next:' in nodes_to_html(nav['top'])
+        assert 'Previous' not in nodes_to_html(nav['top'])
+        assert nav['top'][-1] == {'tag': 'hr'}
+        assert nav['bottom'] == [{'tag': 'hr'}, nav['top'][0]]
         
         # Test middle part (index 1)
         nav = manager._create_navigation_links(1, 3, urls, title)
-        assert 'Previous:' in nav['top']
-        assert 'Next:' in nav['top']
+        assert 'Previous:' in nodes_to_html(nav['top'])
+        assert 'Next:' in nodes_to_html(nav['top'])
         
         # Test last part (index 2)
         nav = manager._create_navigation_links(2, 3, urls, title)
-        assert 'Previous:' in nav['top']
-        assert 'Next' not in nav['top']
+        assert 'Previous:' in nodes_to_html(nav['top'])
+        assert 'Next' not in nodes_to_html(nav['top'])
+        
+        # Test single part (no navigation)
+        assert manager._create_navigation_links(0, 1, urls[:1], title) == {'top': [], 'bottom': []}
     
     @patch('src.telegraph_manager.Telegraph')
     @patch('os.path.exists')
@@ -337,29 +392,33 @@ class TestTelegraphManager:
         
         manager = TelegraphManager(access_token='test_token')
         
-        content = '''
-        <p class="has-text-align-right">Publication info</p>
+        content = html_to_nodes('''
+        <p>Byline</p>
+        <p><a href="https://platypus1917.org/category/pr/issue-179/"><em>Platypus Review</em> 179</a> | September 2025</p>
         <p>Article content</p>
-        '''
+        ''')
         
+        nav_paragraph = {'tag': 'p', 'children': [
+            {'tag': 'strong', 'children': ['Navigation:']}, ' ', {'tag': 'a', 'attrs': {'href': 'test'}, 'children': ['Next']}
+        ]}
         nav_links = {
-            'top': '<p><strong>Navigation:</strong> <a href="test">Next</a></p><hr>',
-            'bottom': '<hr><p><strong>Navigation:</strong> <a href="test">Next</a></p><hr>'
+            'top': [nav_paragraph, {'tag': 'hr'}],
+            'bottom': [{'tag': 'hr'}, nav_paragraph]
         }
         
         # Test first part (should insert after publication info)
         result = manager._add_nav_to_content(content, nav_links, is_first_part=True)
+        assert result == content[:2] + nav_links['top'] + content[2:] + nav_links['bottom']
+        
+        # Test later part (should insert at the very beginning)
+        result = manager._add_nav_to_content(content, nav_links, is_first_part=False)
+        assert result == nav_links['top'] + content + nav_links['bottom']
         
-        # Navigation should be added at least once
-        assert '<strong>Navigation:</strong>' in result
-        # Check that content is preserved
-        assert 'Article content' in result
-        assert 'Publication info' in result
-        # Should have navigation elements
-        from bs4 import BeautifulSoup
-        result_soup = BeautifulSoup(result, 'html.parser')
-        nav_elements = result_soup.find_all(string='Navigation:')
-        assert len(nav_elements) >= 1  # At least top navigation should be there
+        # Content passed in is not modified
+        assert len(content) == 3
+        
+        # Without navigation the content is returned unchanged
+        assert manager._add_nav_to_content(content, {'top': [], 'bottom': []}, is_first_part=True) == content
 
 
 class TestTelegraphManagerRepostingDate:
@@ -405,6 +464,16 @@ class TestTelegraphManagerRepostingDate:
             
             yield mock_dt
     
+    @staticmethod
+    def repost(manager, html):
+        """Run _add_reposting_date on the nodes of an HTML fragment and parse the result."""
+        return BeautifulSoup(nodes_to_html(manager._add_reposting_date(html_to_nodes(html))), 'html.parser')
+    
+    @staticmethod
+    def find_reposted_paragraphs(soup):
+        """Paragraphs carrying a repost date."""
+        return [p for p in soup.find_all('p') if 'Reposted on' in p.get_text()]
+    
     def test_add_reposting_date_with_existing_publication_info(self, manager, mock_datetime):
         """Test adding repost date to existing publication info paragraph."""
         content = '''
@@ -419,15 +488,16 @@ class TestTelegraphManagerRepostingDate:
         </div>
         '''
         
-        result = manager._add_reposting_date(content)
-        soup = BeautifulSoup(result, 'html.parser')
+        soup = self.repost(manager, content)
         
-        # Check that the publication paragraph exists and contains repost date
-        pub_paragraph = soup.find('p', class_='has-text-align-right')
-        assert pub_paragraph is not None
+        # The existing publication paragraph carries the repost date; no new one is added
+        paragraphs = soup.find_all('p')
+        assert len(paragraphs) == 3
+        pub_paragraph = paragraphs[1]
         assert 'Platypus Review' in pub_paragraph.get_text()
         assert 'Reposted on: 2025-09-15' in pub_paragraph.get_text()
         assert 'September 2025' in pub_paragraph.get_text()
+        assert pub_paragraph.find_all('em')[-1].get_text() == '(Reposted on: 2025-09-15)'
     
     def test_add_reposting_date_without_existing_publication_info(self, manager, mock_datetime):
         """Test creating new publication info when none exists."""
@@ -438,44 +508,36 @@ class TestTelegraphManagerRepostingDate:
         </div>
         '''
         
-        result = manager._add_reposting_date(content)
-        soup = BeautifulSoup(result, 'html.parser')
+        soup = self.repost(manager, content)
         
-        # Check that a new publication paragraph was created
-        pub_paragraph = soup.find('p', class_='has-text-align-right')
-        assert pub_paragraph is not None
+        # Check that a new publication paragraph was created at the beginning
+        pub_paragraph = soup.find('p')
         assert 'Platypus Review' in pub_paragraph.get_text()
         assert 'Reposted on: 2025-09-15' in pub_paragraph.get_text()
         assert 'September 2025' in pub_paragraph.get_text()
         assert 'issue-179' in str(pub_paragraph)
+        assert len(soup.find_all('p')) == 3
     
-    def test_add_reposting_date_with_wrong_class_paragraph(self, manager, mock_datetime):
-        """Test when paragraph exists but without the correct class."""
+    def test_add_reposting_date_with_paragraph_mentioning_platypus_review(self, manager, mock_datetime):
+        """Test that a paragraph mentioning the Review without an issue/date line is not publication info."""
         content = '''
         <div>
             <p>Some intro text</p>
-            <p class="different-class">
-                <a href="https://platypus1917.org/category/pr/issue-179/">
-                    <em>Platypus Review</em> 179
-                </a> | September 2025
-            </p>
+            <p>This article first appeared in the <em>Platypus Review</em>.</p>
             <p>Article content here</p>
         </div>
         '''
         
-        result = manager._add_reposting_date(content)
-        soup = BeautifulSoup(result, 'html.parser')
-        
-        # Should create a new publication paragraph since the existing one doesn't have the right class
-        pub_paragraphs = soup.find_all('p', class_='has-text-align-right')
-        assert len(pub_paragraphs) == 1  # Should have created a new one
+        soup = self.repost(manager, content)
         
-        new_pub_paragraph = pub_paragraphs[0]
-        assert 'Platypus Review' in new_pub_paragraph.get_text()
-        assert 'Reposted on: 2025-09-15' in new_pub_paragraph.get_text()
+        # Should create a new publication paragraph instead of stamping the mention
+        reposted = self.find_reposted_paragraphs(soup)
+        assert len(reposted) == 1
+        assert reposted[0] is soup.find('p')
+        assert 'issue-179' in str(reposted[0])
     
     def test_add_reposting_date_with_paragraph_without_platypus_review(self, manager, mock_datetime):
-        """Test when correct class exists but doesn't contain 'Platypus Review'."""
+        """Test when a date line exists but doesn't contain 'Platypus Review'."""
         content = '''
         <div>
             <p>Some intro text</p>
@@ -486,23 +548,14 @@ class TestTelegraphManagerRepostingDate:
         </div>
         '''
         
-        result = manager._add_reposting_date(content)
-        soup = BeautifulSoup(result, 'html.parser')
+        soup = self.repost(manager, content)
         
-        # Should create a new publication paragraph since existing one doesn't contain "Platypus Review"
-        pub_paragraphs = soup.find_all('p', class_='has-text-align-right')
-        # Should have both the original and the new one
-        assert len(pub_paragraphs) >= 1
-        
-        # Check that at least one paragraph contains Platypus Review and repost date
-        platypus_paragraph = None
-        for p in pub_paragraphs:
-            if 'Platypus Review' in p.get_text():
-                platypus_paragraph = p
-                break
-        
-        assert platypus_paragraph is not None
-        assert 'Reposted on: 2025-09-15' in platypus_paragraph.get_text()
+        # Should create a new publication paragraph since the existing one doesn't contain "Platypus Review"
+        reposted = self.find_reposted_paragraphs(soup)
+        assert len(reposted) == 1
+        assert 'Platypus Review' in reposted[0].get_text()
+        assert 'Reposted on: 2025-09-15' in reposted[0].get_text()
+        assert 'Some Other Publication' in soup.get_text()
     
     @pytest.mark.parametrize("test_date,expected_format", [
         (datetime(2025, 9, 15), "2025-09-15"),
@@ -527,30 +580,27 @@ class TestTelegraphManagerRepostingDate:
             mock_now.strftime.return_value = expected_format
             mock_dt.now.return_value = mock_now
             
-            result = manager._add_reposting_date(content)
-            soup = BeautifulSoup(result, 'html.parser')
+            soup = self.repost(manager, content)
             
-            pub_paragraph = soup.find('p', class_='has-text-align-right')
+            pub_paragraph = soup.find('p')
             assert f'Reposted on: {expected_format}' in pub_paragraph.get_text()
     
     def test_add_reposting_date_empty_content(self, manager, mock_datetime):
         """Test handling of empty content."""
-        content = ''
-        
-        result = manager._add_reposting_date(content)
-        soup = BeautifulSoup(result, 'html.parser')
+        result = manager._add_reposting_date([])
+        soup = BeautifulSoup(nodes_to_html(result), 'html.parser')
         
         # Should create a new publication paragraph
-        pub_paragraph = soup.find('p', class_='has-text-align-right')
+        assert len(result) == 1
+        pub_paragraph = soup.find('p')
         assert pub_paragraph is not None
         assert 'Platypus Review' in pub_paragraph.get_text()
         assert 'Reposted on: 2025-09-15' in pub_paragraph.get_text()
     
     def test_add_reposting_date_preserves_original_content(self, manager, mock_datetime):
         """Test that original content is preserved when adding repost date."""
-        original_content = '''
+        original_content = html_to_nodes('''
         <div>
-            <h1>Article Title</h1>
             <p>First paragraph</p>
             <p class="has-text-align-right">
                 <a href="https://platypus1917.org/category/pr/issue-179/">
@@ -559,16 +609,193 @@ class TestTelegraphManagerRepostingDate:
             </p>
             <p>Last paragraph</p>
         </div>
-        '''
+        ''')
+        snapshot = html_to_nodes(nodes_to_html(original_content))
         
         result = manager._add_reposting_date(original_content)
-        soup = BeautifulSoup(result, 'html.parser')
+        soup = BeautifulSoup(nodes_to_html(result), 'html.parser')
         
         # Check that all original content is still there
-        assert soup.find('h1', string='Article Title') is not None
         assert soup.find('p', string='First paragraph') is not None
         assert soup.find('p', string='Last paragraph') is not None
+        assert result[0] == original_content[0]
+        assert result[2] == original_content[2]
         
         # And repost date was added
-        pub_paragraph = soup.find('p', class_='has-text-align-right')
-        assert 'Reposted on: 2025-09-15' in pub_paragraph.get_text()
\ No newline at end of file
+        assert 'Reposted on: 2025-09-15' in soup.find_all('p')[1].get_text()
+        
+        # The input nodes (e.g. an article's stored nodes) are not modified
+        assert original_content == snapshot
+
+
+class TestTelegraphManagerContentNodes:
+    """Test publishing articles from compiled Telegraph nodes."""
+    
+    @pytest.fixture
+    def client(self):
+        """Mocked Telegraph client; parts get URLs by part number."""
+        async def create_page(title, **kwargs):
+            match = re.search(r'\(part (\d+)\)$', title)
+            return {'url': f"https://telegra.ph/Part-{match.group(1) if match else 1}"}
+        
+        client = MagicMock()
+        client.create_page = AsyncMock(side_effect=create_page)
+        client.edit_page = AsyncMock()
+        return client
+    
+    @pytest.fixture
+    def manager(self, client):
+        """Create a TelegraphManager publishing through the mocked client."""
+        with patch('src.telegraph_manager.Telegraph') as mock_telegraph_class:
+            mock_telegraph_class.return_value = MagicMock()
+            manager = TelegraphManager(access_token='env_token')
+        manager.pool = TelegraphTokenPool([TelegraphAccount('env_token', client=client)])
+        return manager
+    
+    @staticmethod
+    def make_article(content_nodes, content='<p>Stored HTML</p>'):
+        article = MagicMock()
+        article.title = 'Test Article'
+        article.original_url = 'https://platypus1917.org/2025/09/01/test/'
+        article.content = content
+        article.content_nodes = content_nodes
+        return article
+    
+    async def test_pages_are_sent_as_nodes(self, manager, client):
+        """Test that create_page receives the stored nodes (plus repost date) as content."""
+        nodes = [{'tag': 'p', 'children': ['Compiled content']}]
+        
+        with patch('src.telegraph_manager.html_to_nodes') as mock_html_to_nodes:
+            urls = await manager.create_telegraph_articles(self.make_article(nodes))
+        
+        assert urls == ['https://telegra.ph/Part-1']
+        mock_html_to_nodes.assert_not_called()
+        kwargs = client.create_page.call_args.kwargs
+        assert 'html_content' not in kwargs
+        assert kwargs['content'][1:] == nodes
+        assert 'Reposted on' in nodes_to_html(kwargs['content'][:1])
+    
+    async def test_articles_without_nodes_are_compiled_from_html(self, manager, client):
+        """Test the fallback for articles stored before nodes were compiled at parse time."""
+        await manager.create_telegraph_articles(self.make_article(None))
+        
+        content = client.create_page.call_args.kwargs['content']
+        assert content[1:] == [{'tag': 'p', 'children': ['Stored HTML']}]
+    
+    async def test_navigation_is_added_as_nodes(self, manager, client):
+        """Test that multipart articles are sent once per part, with navigation as node content."""
+        block = {'tag': 'p', 'children': ['A' * 40000]}
+        
+        urls = await manager.create_telegraph_articles(self.make_article([block, block]))
+        
+        assert urls == ['https://telegra.ph/Part-1', 'https://telegra.ph/Part-2']
+        placeholder, first = client.create_page.call_args_list
+        assert placeholder.kwargs['title'] == 'Test Article (part 2)'
+        assert placeholder.kwargs['content'] == PLACEHOLDER_CONTENT
+        assert first.kwargs['title'] == 'Test Article'
+        assert 'href="https://telegra.ph/Part-2">Next:' in nodes_to_html(first.kwargs['content'])
+        second = client.edit_page.call_args
+        assert second.kwargs['path'] == 'Part-2'
+        assert 'href="https://telegra.ph/Part-1">← Previous:' in nodes_to_html(second.kwargs['content'])
+        assert second.kwargs['content'][-1]['tag'] == 'p'
+    
+    async def test_publish_modes_report_calls_per_article(self, manager):
+        """Test that reserving pages takes 2N-1 calls and sends the content once, against 2N calls and twice."""
+        block = {'tag': 'p', 'children': ['A' * 40000]}
+        article = self.make_article([block] * 4)
+        
+        manager.publish_mode = PUBLISH_MODE_EDIT
+        edit_urls = await manager.create_telegraph_articles(article)
+        edit_stats = manager.get_publish_stats()
+        manager.publish_mode = PUBLISH_MODE_RESERVE
+        reserve_urls = await manager.create_telegraph_articles(article)
+        reserve_stats = manager.get_publish_stats()
+        
+        assert reserve_urls == edit_urls == [f'https://telegra.ph/Part-{n}' for n in range(1, 5)]
+        assert edit_stats['calls'] == 8
+        assert reserve_stats['calls'] - edit_stats['calls'] == 7
+        assert reserve_stats['articles'] == 2
+        reserve_bytes = reserve_stats['bytes_sent'] - edit_stats['bytes_sent']
+        assert reserve_bytes < 0.55 * edit_stats['bytes_sent']
+
+    async def test_articles_publish_concurrently(self, manager, client):
+        """Test that page calls do not block the event loop, so articles publish in parallel."""
+        in_flight = {'now': 0, 'max': 0}
+        
+        async def slow_create_page(title, **kwargs):
+            in_flight['now'] += 1
+            in_flight['max'] = max(in_flight['max'], in_flight['now'])
+            await asyncio.sleep(0.05)
+            in_flight['now'] -= 1
+            return {'url': f'https://telegra.ph/{title}'}
+        
+        client.create_page = AsyncMock(side_effect=slow_create_page)
+        articles = [self.make_article([{'tag': 'p', 'children': [f'Article {i}']}]) for i in range(3)]
+        
+        results = await asyncio.gather(*(manager.create_telegraph_articles(article) for article in articles))
+        
+        assert results == [['https://telegra.ph/Test Article']] * 3
+        assert in_flight['max'] == 3
+    
+    async def test_articles_are_sharded_over_accounts(self, manager):
+        """Test that concurrent articles use different accounts and edits go to the page's owner."""
+        clients = []
+        for name in ('a', 'b'):
+            async def create_page(title, name=name, **kwargs):
+                await asyncio.sleep(0.01)
+                return {'url': f'https://telegra.ph/{name}-{title.replace(" ", "-")}'}
+            client = MagicMock()
+            client.create_page = AsyncMock(side_effect=create_page)
+            client.edit_page = AsyncMock(return_value={})
+            clients.append(client)
+        manager.pool = TelegraphTokenPool([TelegraphAccount(f'token-{n}', client=c) for n, c in zip('ab', clients)])
+        articles = [self.make_article([{'tag': 'p', 'children': ['Text']}]) for _ in range(2)]
+        
+        results = await asyncio.gather(*(manager.create_telegraph_articles(article) for article in articles))
+        await manager.edit_telegraph_page(results[1][0], 'Test Article', [])
+        
+        assert sorted(results) == [['https://telegra.ph/a-Test-Article'], ['https://telegra.ph/b-Test-Article']]
+        owner = clients[0] if results[1][0].startswith('https://telegra.ph/a-') else clients[1]
+        other = clients[1] if owner is clients[0] else clients[0]
+        owner.edit_page.assert_awaited_once()
+        assert owner.edit_page.call_args.kwargs['path'] == results[1][0].rsplit('/', 1)[-1]
+        other.edit_page.assert_not_called()
+        assert {stats['pages'] for stats in manager.get_pool_stats().values()} == {1}
+
+class TestSplitContentGolden:
+    """Test that chunk boundaries stay exactly where the splitter puts them."""
+    
+    # name: (seed, paragraphs, words, title)
+    CASES = {
+        'latin': (1, 600, LATIN_WORDS, 'Marxism and the Left today'),
+        'cyrillic': (2, 400, CYRILLIC_WORDS, 'Марксизм и левые сегодня'),
+        'single_part': (4, 65, LATIN_WORDS, 'Short article'),
+    }
+    
+    @pytest.fixture
+    def manager(self):
+        with patch('src.telegraph_manager.Telegraph'):
+            return TelegraphManager(access_token='env_token')
+    
+    @pytest.mark.parametrize("case", sorted(CASES))
+    def test_chunk_boundaries_match_golden(self, manager, case):
+        """Test block count and size of every chunk against the golden file."""
+        seed, paragraphs, words, title = self.CASES[case]
+        expected = json.loads(GOLDEN_CHUNKS.read_text(encoding='utf-8'))[case]
+        
+        chunks = manager.split_content(synthetic_article(seed, paragraphs, words), title)
+        
+        assert [[len(chunk), nodes_size(chunk)] for chunk in chunks] == expected
+    
+    def test_chunks_keep_document_order(self, manager):
+        """Test that concatenated chunks give back every block in its original order."""
+        content = synthetic_article(3, 300)
+        blocks = [
+            {'tag': 'p', 'children': [node.strip()]} if isinstance(node, str) else node
+            for node in content if not (isinstance(node, str) and not node.strip())
+        ]
+        
+        chunks = manager.split_content(content, 'Title')
+        
+        assert len(chunks) > 1
+        assert [block for chunk in chunks for block in chunk] == blocks
@@ -0,0 +1,209 @@
+"""
+Unit tests for the Telegraph account pool.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from telegraph.exceptions import RetryAfterError, TelegraphException
+
+from src.scraping.retry import CircuitBreaker, CircuitOpenError
+from src.telegraph_pool import TelegraphAccount, TelegraphTokenPool, page_path
+from src.telegraph_scheduler import TelegraphScheduler
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def make_account(token, clock):
+    client = MagicMock()
+    client.edit_page = AsyncMock(return_value={'path': 'Page-10-18'})
+    client.close = AsyncMock()
+    return TelegraphAccount(
+        token,
+        client=client,
+        scheduler=TelegraphScheduler(rate=50.0, clock=clock),
+        breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60.0, clock=clock),
+    )
+
+
+@pytest.fixture
+def pool(clock):
+    return TelegraphTokenPool([make_account(token, clock) for token in ('token-a', 'token-b', 'token-c')])
+
+
+class TestAccountSelection:
+    """Test least-loaded selection of accounts"""
+
+    def test_concurrent_work_is_spread_over_accounts(self, pool):
+        """Test that each account gets work before any gets a second article"""
+        held = [pool.acquire() for _ in range(3)]
+
+        assert len({account.account_id for account in held}) == 3
+        pool.release(held[1])
+        assert pool.acquire() is held[1]
+
+    def test_parked_account_is_avoided(self, pool, clock):
+        """Test that an account parked by FLOOD_WAIT is chosen last"""
+        first, second, third = pool.accounts
+        first.scheduler.blocked_until = clock.now + 30
+        second.pages = 5
+
+        assert pool.acquire() is third
+        assert pool.acquire() is second
+
+    def test_account_ids_do_not_reveal_tokens(self, pool):
+        """Test that account ids are short fingerprints of the tokens"""
+        for account in pool.accounts:
+            assert len(account.account_id) == 8
+            assert account.access_token not in account.account_id
+
+    def test_from_env(self, monkeypatch):
+        """Test that TELEGRAPH_ACCESS_TOKENS gives one account per distinct token"""
+        monkeypatch.setenv('TELEGRAPH_ACCESS_TOKENS', 'token-a, token-b,,token-a')
+        assert len(TelegraphTokenPool.from_env('default').accounts) == 2
+
+        monkeypatch.delenv('TELEGRAPH_ACCESS_TOKENS')
+        assert [a.access_token for a in TelegraphTokenPool.from_env('default').accounts] == ['default']
+
+
+class TestAccountHealth:
+    """Test taking failing accounts out of rotation"""
+
+    async def test_failing_account_leaves_rotation_until_reset(self, clock):
+        """Test that account errors open its breaker and the account returns after the reset timeout"""
+        pool = TelegraphTokenPool([make_account('token-a', clock), make_account('token-b', clock)])
+        bad, good = pool.accounts
+
+        for _ in range(2):
+            with pytest.raises(TelegraphException):
+                async with pool.account() as account:
+                    assert account is bad
+                    raise TelegraphException('ACCESS_TOKEN_INVALID')
+
+        assert bad.breaker.state == CircuitBreaker.OPEN
+        assert [pool.acquire() for _ in range(2)] == [good, good]
+
+        clock.now += 61
+        assert pool.acquire() is bad
+        assert pool.get_stats()[bad.account_id]['failures'] == 2
+
+    async def test_page_errors_do_not_count(self, pool):
+        """Test that errors caused by the page leave the account healthy"""
+        for _ in range(3):
+            with pytest.raises(TelegraphException):
+                async with pool.account():
+                    raise TelegraphException('CONTENT_TOO_BIG')
+
+        assert all(account.breaker.state == CircuitBreaker.CLOSED for account in pool.accounts)
+        assert all(account.in_flight == 0 for account in pool.accounts)
+
+    async def test_cancelled_probe_is_not_a_success(self, clock):
+        """Test that cancelled work frees the account without closing its half-open breaker"""
+        pool = TelegraphTokenPool([make_account('token-a', clock)])
+        (account,) = pool.accounts
+        for _ in range(2):
+            pool.release(pool.acquire(), RetryAfterError(3600))
+        clock.now += 61
+
+        with pytest.raises(asyncio.CancelledError):
+            async with pool.account():
+                assert account.breaker.state == CircuitBreaker.HALF_OPEN
+                raise asyncio.CancelledError()
+
+        assert account.in_flight == 0
+        assert (account.breaker.state, account.breaker.probe_in_flight) == (CircuitBreaker.HALF_OPEN, False)
+        assert pool.acquire() is account
+
+    def test_all_accounts_out_of_rotation(self, clock):
+        """Test that the pool fails fast when no account can publish"""
+        pool = TelegraphTokenPool([make_account('token-a', clock)])
+        for _ in range(2):
+            pool.release(pool.acquire(), RetryAfterError(3600))
+
+        with pytest.raises(CircuitOpenError):
+            pool.acquire()
+
+
+class TestPageOwnership:
+    """Test routing edits to the account that created the page"""
+
+    async def test_edit_goes_to_owner(self, pool):
+        """Test that a recorded page is edited with its owner's token only"""
+        owner = pool.accounts[2]
+        pool.record_page(owner, 'https://telegra.ph/Page-10-18')
+
+        await pool.edit_page('https://telegra.ph/Page-10-18', 'Title', [])
+
+        owner.client.edit_page.assert_awaited_once_with(path='Page-10-18', title='Title', content=[])
+        assert not pool.accounts[0].client.edit_page.called
+        assert owner.pages == 1
+
+    async def test_unknown_page_is_tried_with_each_account(self, pool):
+        """Test that the owner of a page from an earlier run is found and recorded"""
+        first, second, third = pool.accounts
+        first.client.edit_page.side_effect = TelegraphException('PAGE_ACCESS_DENIED')
+
+        await pool.edit_page('https://telegra.ph/Old-10-18', 'Title', [])
+
+        assert pool.owner_of('Old-10-18') is second
+        assert not third.client.edit_page.called
+
+    async def test_owner_recorded_in_ledger_is_used(self, pool):
+        """Test that the owner of a page from an earlier run is taken from the ledger without probing"""
+        first, second, third = pool.accounts
+        ledger = MagicMock()
+        ledger.get_account_for_url = AsyncMock(return_value=third.account_id)
+
+        await pool.edit_page('https://telegra.ph/Old-10-18', 'Title', [], ledger=ledger)
+
+        ledger.get_account_for_url.assert_awaited_once_with('https://telegra.ph/Old-10-18')
+        third.client.edit_page.assert_awaited_once_with(path='Old-10-18', title='Title', content=[])
+        assert not first.client.edit_page.called and not second.client.edit_page.called
+        assert pool.owner_of('Old-10-18') is third
+
+    async def test_page_unknown_to_ledger_is_probed(self, pool):
+        """Test that accounts are tried in turn when the ledger does not know the page"""
+        ledger = MagicMock()
+        ledger.get_account_for_url = AsyncMock(return_value=None)
+
+        await pool.edit_page('https://telegra.ph/Old-10-18', 'Title', [], ledger=ledger)
+
+        assert pool.owner_of('Old-10-18') is pool.accounts[0]
+
+    async def test_unknown_page_no_account_can_edit(self, pool):
+        """Test that the last error is raised when no account owns the page"""
+        for account in pool.accounts:
+            account.client.edit_page.side_effect = TelegraphException('PAGE_ACCESS_DENIED')
+
+        with pytest.raises(TelegraphException, match='PAGE_ACCESS_DENIED'):
+            await pool.edit_page('Old-10-18', 'Title', [])
+
+    def test_page_path(self):
+        """Test that URLs and paths give the same key"""
+        assert page_path('https://telegra.ph/Page-10-18') == page_path('Page-10-18') == 'Page-10-18'
+
+
+class TestPoolShutdown:
+    """Test releasing the connections of the pool"""
+
+    async def test_close_closes_every_client(self, pool):
+        """Test that closing the pool closes each account's client, even if one fails"""
+        pool.accounts[0].client.close.side_effect = RuntimeError('Event loop is closed')
+
+        await pool.close()
+
+        assert all(account.client.close.await_count == 1 for account in pool.accounts)
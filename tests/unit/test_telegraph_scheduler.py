@@ -0,0 +1,162 @@
+"""
+Unit tests for the Telegraph API call scheduler.
+"""
+
+import asyncio
+import time
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from telegraph.exceptions import RetryAfterError, TelegraphException
+
+from src.telegraph_client import AsyncTelegraphClient
+from src.telegraph_scheduler import TelegraphScheduler
+
+
+class NoJitter:
+    """Random source whose backoff is always zero"""
+
+    @staticmethod
+    def uniform(low, high):
+        return low
+
+
+def failing(*errors, result='ok'):
+    """Coroutine function raising the given errors in turn, then returning result"""
+    state = {'attempts': 0}
+
+    async def send():
+        state['attempts'] += 1
+        if state['attempts'] <= len(errors):
+            raise errors[state['attempts'] - 1]
+        return result
+
+    send.state = state
+    return send
+
+
+class TestTelegraphScheduler:
+    """Test pacing, FLOOD_WAIT handling and retries"""
+
+    async def test_calls_are_paced(self):
+        """Test calls beyond the burst wait for the configured rate"""
+        scheduler = TelegraphScheduler(rate=20.0, burst=1)
+
+        await scheduler.call('createPage', failing())
+        await scheduler.call('createPage', failing())
+
+        stats = scheduler.get_stats()['createPage']
+        assert stats['calls'] == 2
+        assert stats['max_wait'] == pytest.approx(0.05, abs=0.03)
+
+    async def test_flood_wait_parks_the_queue_and_retries(self):
+        """Test a FLOOD_WAIT holds back every call and the throttled call is sent again"""
+        scheduler = TelegraphScheduler(rate=50.0)
+        throttled = failing(RetryAfterError(1))
+        start = time.perf_counter()
+
+        async def queued_call():
+            # Sent while the queue is parked by the first call's FLOOD_WAIT
+            await asyncio.sleep(0.1)
+            await scheduler.call('editPage', failing())
+            return time.perf_counter() - start
+
+        result, queued_after = await asyncio.gather(scheduler.call('createPage', throttled), queued_call())
+
+        assert result == 'ok'
+        assert throttled.state['attempts'] == 2
+        assert queued_after >= 0.9
+        stats = scheduler.get_stats()
+        assert stats['createPage']['flood_waits'] == 1
+        assert stats['createPage']['retries'] == 1
+        assert stats['createPage']['max_wait'] >= 0.9
+        assert stats['editPage']['max_wait'] >= 0.8
+
+    async def test_flood_wait_lowers_rate_and_success_recovers(self):
+        """Test AIMD: the rate halves on FLOOD_WAIT and creeps back on success"""
+        scheduler = TelegraphScheduler(rate=2.0, burst=50)
+        scheduler.park = lambda seconds: None
+
+        await scheduler.call('createPage', failing(RetryAfterError(1)))
+        assert scheduler.bucket.rate == pytest.approx(1.1)
+
+        for _ in range(20):
+            await scheduler.call('getViews', failing())
+        assert scheduler.bucket.rate == pytest.approx(2.0)
+
+    async def test_long_flood_wait_is_raised(self):
+        """Test a FLOOD_WAIT longer than max_flood_wait is raised without waiting"""
+        scheduler = TelegraphScheduler(rate=50.0, max_flood_wait=5)
+        send = failing(RetryAfterError(3600))
+
+        with pytest.raises(RetryAfterError):
+            await scheduler.call('createPage', send)
+
+        assert send.state['attempts'] == 1
+        assert scheduler.blocked_until == 0.0
+
+    async def test_transport_errors_are_retried_for_idempotent_calls_only(self):
+        """Test a timed out editPage is sent again but a timed out createPage is not"""
+        scheduler = TelegraphScheduler(rate=50.0, rng=NoJitter())
+        edit = failing(asyncio.TimeoutError(), asyncio.TimeoutError())
+        create = failing(asyncio.TimeoutError())
+
+        assert await scheduler.call('editPage', edit) == 'ok'
+        with pytest.raises(asyncio.TimeoutError):
+            await scheduler.call('createPage', create)
+
+        assert edit.state['attempts'] == 3
+        assert create.state['attempts'] == 1
+
+    async def test_api_errors_are_not_retried(self):
+        """Test errors other than FLOOD_WAIT and transport failures are raised at once"""
+        scheduler = TelegraphScheduler(rate=50.0)
+        send = failing(TelegraphException('PAGE_NOT_FOUND'))
+
+        with pytest.raises(TelegraphException):
+            await scheduler.call('getPage', send)
+
+        assert send.state['attempts'] == 1
+
+    async def test_gives_up_after_max_attempts(self):
+        """Test a call throttled on every attempt is eventually raised"""
+        scheduler = TelegraphScheduler(rate=50.0, max_attempts=2)
+        scheduler.park = lambda seconds: None
+        send = failing(RetryAfterError(1), RetryAfterError(1))
+
+        with pytest.raises(RetryAfterError):
+            await scheduler.call('createPage', send)
+
+        assert send.state['attempts'] == 2
+
+
+class TestAsyncTelegraphClientWithScheduler:
+    """Test the client sends its calls through the scheduler"""
+
+    @pytest.fixture
+    async def flooding_server(self):
+        state = {'calls': 0}
+
+        async def api(request):
+            state['calls'] += 1
+            if state['calls'] == 1:
+                return web.json_response({'ok': False, 'error': 'FLOOD_WAIT_1'})
+            return web.json_response({'ok': True, 'result': {'url': 'https://telegra.ph/Page-10-18'}})
+
+        app = web.Application()
+        app.router.add_post('/{method}/{path:.*}', api)
+        async with TestServer(app) as server:
+            server.state = state
+            yield server
+
+    async def test_flood_wait_is_retried(self, flooding_server):
+        """Test a FLOOD_WAIT answer no longer loses the page"""
+        scheduler = TelegraphScheduler(rate=50.0)
+
+        async with AsyncTelegraphClient('secret', api_url=str(flooding_server.make_url('')), scheduler=scheduler) as client:
+            page = await client.create_page('Title', [{'tag': 'p', 'children': ['text']}])
+
+        assert page['url'] == 'https://telegra.ph/Page-10-18'
+        assert flooding_server.state['calls'] == 2
+        assert scheduler.get_stats()['createPage']['flood_waits'] == 1